@@ -1,8 +1,9 @@
 SERVICE_NAME                             = 'mgraph_ai_service_github'
 FAST_API__TITLE                          = "MGraph-AI Service GitHub"
 FAST_API__DESCRIPTION                    = "Base template for MGraph-AI microservices"
-LAMBDA_DEPENDENCIES__SERVICE__GITHUB     = ['osbot-fast-api-serverless==v1.32.0',
-                                            'pynacl==1.6.1']
+LAMBDA_DEPENDENCIES__SERVICE__GITHUB     = ['httpx==0.28.1'                    ,
+                                            'osbot-fast-api-serverless==v1.32.0',
+                                            'pynacl==1.6.1'                    ]
 
 DEPLOY__GITHUB__REPO__OWNER              = 'the-cyber-boardroom'
 DEPLOY__GITHUB__REPO__NAME               = 'MGraph-AI__Service__GitHub'
@@ -12,4 +13,40 @@ ENV_VAR__TESTS__GITHUB__REPO_NAME        = 'TESTS__GITHUB__REPO_NAME'
 ENV_VAR__TESTS__GITHUB__REPO_OWNER       = 'TESTS__GITHUB__REPO_OWNER'
 ENV_VAR__SERVICE__AUTH__PRIVATE_KEY      = 'SERVICE__AUTH__PRIVATE_KEY'
 ENV_VAR__SERVICE__AUTH__PUBLIC_KEY       = 'SERVICE__AUTH__PUBLIC_KEY'
+ENV_VAR__SERVICE__AUTH__SESSION_KEY      = 'SERVICE__AUTH__SESSION_KEY'
+ENV_VAR__SERVICE__AUTH__PREVIOUS_PRIVATE_KEYS = 'SERVICE__AUTH__PREVIOUS_PRIVATE_KEYS'        # comma separated, newest first (still accepted for decryption)
 
+GITHUB_API__POOL_CONNECTIONS             = 10                                       # number of host pools kept by the shared HTTPAdapter
+GITHUB_API__POOL_MAXSIZE                 = 50                                       # max keep-alive connections per host pool
+GITHUB_API__POOL_BLOCK                   = False                                    # when True, callers wait for a free connection instead of opening extra ones
+GITHUB_API__KEEP_ALIVE                   = True                                     # when False, 'Connection: close' is sent and sockets are not reused
+GITHUB_API__PER_PAGE                     = 100                                      # page size used by the paginator (GitHub's maximum, default is 30)
+GITHUB_API__RESPONSE_CACHE__MAX_ENTRIES  = 1024                                     # LRU bound for the ETag / Last-Modified response cache
+GITHUB_API__RESPONSE_CACHE__TTL          = 300                                      # seconds an entry may be revalidated before it is dropped
+GITHUB_API__PUBLIC_KEY_CACHE__MAX_ENTRIES= 4096                                     # LRU bound for cached repo/env/org public keys
+GITHUB_API__PUBLIC_KEY_CACHE__TTL        = 3600                                     # seconds before a public key is refetched (rotations are also caught on 422)
+GITHUB_API__BULK_WRITE__MAX_WORKERS      = 8                                        # concurrent PUTs per bulk secrets write (GitHub discourages heavy concurrency)
+GITHUB_API__BULK_WRITE__MAX_SECRETS      = 100                                      # max secrets accepted by a single bulk-set request
+GITHUB_API__FAN_OUT__MAX_TARGETS         = 500                                      # max repos/environments accepted by a single fan-out request
+GITHUB_API__FAN_OUT__MAX_WORKERS         = 8                                        # concurrent writes per fan-out (also the number of targets in flight)
+GITHUB_API__RATE_LIMIT_TRACKER__MAX_ENTRIES = 4096                                 # LRU bound for per-token rate-limit snapshots
+GITHUB_API__FAN_OUT__RATE_LIMIT_RESERVE  = 100                                      # fan-out stops writing when X-RateLimit-Remaining drops to this
+GITHUB_API__FAN_OUT__MEDIA_TYPE          = 'application/x-ndjson'                   # fan-out streams one JSON result per line
+GITHUB_API__SYNC__MAX_SCOPES             = 50                                       # max repos/environments in a single sync desired-state document
+GITHUB_API__SYNC__FINGERPRINTS__MAX_ENTRIES = 100_000                               # LRU bound for last-written value fingerprints
+GITHUB_API__INVENTORY__MAX_WORKERS       = 4                                        # repos crawled concurrently by the secrets inventory
+GITHUB_API__INVENTORY__RATE_LIMIT_RESERVE= 100                                      # inventory stops (and returns a checkpoint) when X-RateLimit-Remaining drops to this
+SERVICE_AUTH__PAT_CACHE__MAX_ENTRIES     = 1024                                     # LRU bound for decrypted PATs (keyed by a digest of the encrypted PAT)
+SERVICE_AUTH__PAT_CACHE__TTL             = 300                                      # seconds a decrypted PAT is kept before the SealedBox decrypt runs again
+SERVICE_AUTH__SESSION__TTL               = 900                                      # seconds a session token (SecretBox-sealed PAT) stays valid
+SERVICE_AUTH__VALIDATION_CACHE__TTL      = 60                                       # seconds a successful PAT validation (/user + /rate_limit) is served locally
+SERVICE_AUTH__VALIDATION_CACHE__MAX_ENTRIES = 1024                                  # LRU bound for cached validations (keyed by a digest of the PAT)
+NACL__SEALED_BOX_CACHE__MAX_ENTRIES      = 256                                      # LRU bound for prebuilt SealedBox objects (service keypair + client public keys)
+ENCRYPTION__BATCH__MAX_ITEMS             = 1000                                     # max values accepted by a single encrypt-batch / decrypt-batch request
+ENCRYPTION__BATCH__MAX_BYTES             = 1_048_576                                # max total size of the values in a single encrypt-batch / decrypt-batch request
+ENCRYPTION__BATCH__PROCESS_POOL_THRESHOLD= 256                                      # batches at least this large are fanned out across a process pool
+ENCRYPTION__BATCH__MAX_WORKERS           = 4                                        # worker processes used for large batches
+ENCRYPTION__RAW__MAX_BYTES               = 1_048_576                                # max body accepted by encrypt-raw / decrypt-raw (application/octet-stream)
+ENCRYPTION__STREAM__CHUNK_SIZE           = 65_536                                   # plaintext bytes per secretstream chunk (bounds memory for encrypt-stream / decrypt-stream)
+ENCRYPTION__TRANSCRYPT__MAX_ITEMS        = 100                                      # max values re-sealed to a GitHub scope key by a single transcrypt request
+ENCRYPTION__KEYRING__MAX_PREVIOUS_KEYS   = 2                                        # previous deploys' keys kept alive on rotation (old tokens keep working)
@@ -7,6 +7,8 @@ from mgraph_ai_service_github.fast_api.routes.Routes__Encryption import Routes__
 from mgraph_ai_service_github.fast_api.routes.Routes__GitHub__Secrets__Env import Routes__GitHub__Secrets__Env
 from mgraph_ai_service_github.fast_api.routes.Routes__GitHub__Secrets__Org import Routes__GitHub__Secrets__Org
 from mgraph_ai_service_github.fast_api.routes.Routes__GitHub__Secrets__Repo import Routes__GitHub__Secrets__Repo
+from mgraph_ai_service_github.fast_api.routes.Routes__GitHub__Secrets__Sync import Routes__GitHub__Secrets__Sync
+from mgraph_ai_service_github.fast_api.routes.Routes__GitHub__Secrets__Inventory import Routes__GitHub__Secrets__Inventory
 from mgraph_ai_service_github.utils.Version                      import version__mgraph_ai_service_github
 
 
@@ -31,6 +33,8 @@ class GitHub__Service__Fast_API(Serverless__Fast_API):
         self.add_routes(Routes__GitHub__Secrets__Repo)
         self.add_routes(Routes__GitHub__Secrets__Env )
         self.add_routes(Routes__GitHub__Secrets__Org )
+        self.add_routes(Routes__GitHub__Secrets__Sync)
+        self.add_routes(Routes__GitHub__Secrets__Inventory)
         self.add_routes(Routes__Auth                 )
         self.add_routes(Routes__Encryption           )
         self.add_routes(Routes__Info                 )
@@ -0,0 +1,46 @@
+from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text             import Safe_Str__Text
+from mgraph_ai_service_github.schemas.base.Enum__HTTP__Status                            import Enum__HTTP__Status
+from mgraph_ai_service_github.schemas.base.Enum__Error__Type                             import Enum__Error__Type
+from mgraph_ai_service_github.schemas.github.base.Schema__GitHub__Response__Context      import Schema__GitHub__Response__Context
+
+
+def populate_rate_limit(github_api                                      ,       # Populate rate limit info (snapshot from response headers, /rate_limit only if none or refresh)
+                        response_context : Schema__GitHub__Response__Context,
+                        refresh          : bool = False
+                        ) -> None:
+    try:
+        response_context.rate_limit = github_api.rate_limit(refresh=refresh)
+    except Exception:
+        pass                                                                    # Rate limit fetch is best-effort
+
+
+async def populate_rate_limit_async(github_api                                      ,   # Same as populate_rate_limit, for GitHub__API__Async
+                                    response_context : Schema__GitHub__Response__Context,
+                                    refresh          : bool = False
+                                    ) -> None:
+    try:
+        response_context.rate_limit = await github_api.rate_limit(refresh=refresh)
+    except Exception:
+        pass                                                                    # Rate limit fetch is best-effort
+
+
+def handle_github_error(error                                           ,       # Map GitHub errors to response context
+                        response_context : Schema__GitHub__Response__Context
+                        ) -> None:
+    error_str = str(error)
+    if "401" in error_str:
+        response_context.status_code = Enum__HTTP__Status.UNAUTHORIZED_401
+        response_context.error_type  = Enum__Error__Type.INVALID_PAT
+    elif "403" in error_str and "rate limit" in error_str.lower():
+        response_context.status_code = Enum__HTTP__Status.RATE_LIMITED_429
+        response_context.error_type  = Enum__Error__Type.RATE_LIMITED
+    elif "403" in error_str:
+        response_context.status_code = Enum__HTTP__Status.FORBIDDEN_403
+        response_context.error_type  = Enum__Error__Type.FORBIDDEN
+    elif "404" in error_str:
+        response_context.status_code = Enum__HTTP__Status.NOT_FOUND_404
+        response_context.error_type  = Enum__Error__Type.NOT_FOUND
+    else:
+        response_context.status_code = Enum__HTTP__Status.SERVER_ERROR_500
+        response_context.error_type  = Enum__Error__Type.GITHUB_API_ERROR
+    response_context.errors.append(Safe_Str__Text(f"GitHub API error: {error_str}"))
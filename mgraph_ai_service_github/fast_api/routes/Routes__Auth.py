@@ -9,7 +9,9 @@ ROUTES_PATHS__AUTH = [ f'/{TAG__ROUTES_AUTH}/public-key'       ,
                        f'/{TAG__ROUTES_AUTH}/token-create'     ,
                        f'/{TAG__ROUTES_AUTH}/token-validate'   ,
                        f'/{TAG__ROUTES_AUTH}/test'             ,
-                       f'/{TAG__ROUTES_AUTH}/test-api-key'     ]
+                       f'/{TAG__ROUTES_AUTH}/test-api-key'     ,
+                       f'/{TAG__ROUTES_AUTH}/pat-cache-stats'  ,
+                       f'/{TAG__ROUTES_AUTH}/session-create'   ]
 
 class Routes__Auth(Fast_API__Routes):
     tag          : str           = TAG__ROUTES_AUTH
@@ -72,9 +74,31 @@ class Routes__Auth(Fast_API__Routes):
         """
         return self.service_auth.test_api_key()
 
+    def session_create(self, x_osbot_github_pat : str = Header(None, alias="X-OSBot-GitHub-PAT")   # Exchange an encrypted PAT for a short-lived session token
+                       ) -> Dict:                                                                    # Returns the session token and its expiry
+        """
+        Decrypts the PAT once and returns it sealed with the server's symmetric session key.
+        The session token is accepted wherever an encrypted PAT is, until it expires.
+        """
+        if not x_osbot_github_pat:
+            return { "success"    : False                              ,
+                     "error"      : "Missing X-OSBot-GitHub-PAT header" ,
+                     "error_type" : "MISSING_HEADER"                   }
+        try:
+            return { "success" : True, **self.service_auth.session_create(x_osbot_github_pat) }
+        except Exception as e:
+            return { "success"    : False               ,
+                     "error"      : str(e)              ,
+                     "error_type" : "DECRYPTION_FAILED" }
+
+    def pat_cache_stats(self) -> Dict:                                                         # Decrypted PAT cache size and hit/miss counters
+        return self.service_auth.pat_cache.stats()
+
     def setup_routes(self):
         self.add_route_get (self.public_key     )
         self.add_route_post(self.token_create   )
         self.add_route_post(self.token_validate )
         self.add_route_get (self.test           )
-        self.add_route_get (self.test_api_key   )
\ No newline at end of file
+        self.add_route_get (self.test_api_key   )
+        self.add_route_get (self.pat_cache_stats)
+        self.add_route_post(self.session_create )
\ No newline at end of file
@@ -1,22 +1,57 @@
+from typing                                                                             import AsyncIterator, Callable
+from fastapi                                                                            import Request, Response
+from fastapi.responses                                                                  import JSONResponse, StreamingResponse
+from nacl.exceptions                                                                    import CryptoError
 from osbot_fast_api.api.routes.Fast_API__Routes                                         import Fast_API__Routes
+from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text            import Safe_Str__Text
+from mgraph_ai_service_github.config                                                    import ENCRYPTION__RAW__MAX_BYTES
+from mgraph_ai_service_github.fast_api.dependencies.GitHub__API__From__Header           import GitHub__API__From__Header
+from mgraph_ai_service_github.schemas.base.Enum__HTTP__Status                           import Enum__HTTP__Status
 from mgraph_ai_service_github.service.encryption.Service__Encryption                    import Service__Encryption
+from mgraph_ai_service_github.service.encryption.Service__Encryption__Batch             import Service__Encryption__Batch
+from mgraph_ai_service_github.service.encryption.Service__Encryption__Stream            import Service__Encryption__Stream, ENCRYPTION_STREAM__MEDIA_TYPE
+from mgraph_ai_service_github.service.encryption.Service__Encryption__Transcrypt        import Service__Encryption__Transcrypt
 from mgraph_ai_service_github.schemas.encryption.Schema__Encryption__Request            import Schema__Encryption__Request
 from mgraph_ai_service_github.schemas.encryption.Schema__Encryption__Response           import Schema__Encryption__Response
 from mgraph_ai_service_github.schemas.encryption.Schema__Decryption__Request            import Schema__Decryption__Request
 from mgraph_ai_service_github.schemas.encryption.Schema__Decryption__Response           import Schema__Decryption__Response
 from mgraph_ai_service_github.schemas.encryption.Schema__Decryption__Validate__Request  import Schema__Decryption__Validate__Request
 from mgraph_ai_service_github.schemas.encryption.Schema__Decryption__Validate__Response import Schema__Decryption__Validate__Response
+from mgraph_ai_service_github.schemas.encryption.Schema__Encryption__Batch__Request     import Schema__Encryption__Batch__Request
+from mgraph_ai_service_github.schemas.encryption.Schema__Encryption__Batch__Response    import Schema__Encryption__Batch__Response
+from mgraph_ai_service_github.schemas.encryption.Schema__Decryption__Batch__Request     import Schema__Decryption__Batch__Request
+from mgraph_ai_service_github.schemas.encryption.Schema__Decryption__Batch__Response    import Schema__Decryption__Batch__Response
+from mgraph_ai_service_github.schemas.encryption.Schema__Encryption__Transcrypt__Request  import Schema__Encryption__Transcrypt__Request
+from mgraph_ai_service_github.schemas.encryption.Schema__Encryption__Transcrypt__Response import Schema__Encryption__Transcrypt__Response
 
 TAG__ROUTES_ENCRYPTION   = 'encryption'
 ROUTES_PATHS__ENCRYPTION = [ f'/{TAG__ROUTES_ENCRYPTION}/public-key'        ,
                              f'/{TAG__ROUTES_ENCRYPTION}/generate-keys'     ,
                              f'/{TAG__ROUTES_ENCRYPTION}/encrypt'           ,
                              f'/{TAG__ROUTES_ENCRYPTION}/decrypt'           ,
-                             f'/{TAG__ROUTES_ENCRYPTION}/validate'          ]
+                             f'/{TAG__ROUTES_ENCRYPTION}/validate'          ,
+                             f'/{TAG__ROUTES_ENCRYPTION}/encrypt-batch'     ,
+                             f'/{TAG__ROUTES_ENCRYPTION}/decrypt-batch'     ,
+                             f'/{TAG__ROUTES_ENCRYPTION}/encrypt-raw'       ,
+                             f'/{TAG__ROUTES_ENCRYPTION}/decrypt-raw'       ,
+                             f'/{TAG__ROUTES_ENCRYPTION}/encrypt-stream'    ,
+                             f'/{TAG__ROUTES_ENCRYPTION}/decrypt-stream'    ,
+                             f'/{TAG__ROUTES_ENCRYPTION}/transcrypt'        ]
+RAW__MEDIA_TYPE          = 'application/octet-stream'
 
 class Routes__Encryption(Fast_API__Routes):
     tag                : str                  = TAG__ROUTES_ENCRYPTION
     service_encryption : Service__Encryption
+    github_api_factory : GitHub__API__From__Header
+
+    def encryption_batch(self) -> Service__Encryption__Batch:                                                           # Batch service sharing this route's keys
+        return Service__Encryption__Batch(service_encryption = self.service_encryption)
+
+    def encryption_stream(self) -> Service__Encryption__Stream:                                                         # Streaming service sharing this route's keys
+        return Service__Encryption__Stream(service_encryption = self.service_encryption)
+
+    def encryption_transcrypt(self) -> Service__Encryption__Transcrypt:                                                 # Transcrypt service sharing this route's keys
+        return Service__Encryption__Transcrypt(service_encryption = self.service_encryption)
 
     #def public_key(self) -> Schema__Public_Key__Response:                                                               # Get public key for encryption
     def public_key(self):                                                                                                # BUG: OSBot_Fast_API doesn't support Type_Safe on GET return values
@@ -35,9 +70,103 @@ class Routes__Encryption(Fast_API__Routes):
     def validate(self, request : Schema__Decryption__Validate__Request) -> Schema__Decryption__Validate__Response:      # Validate encrypted data can be decrypted, Returns validation result
         return self.service_encryption.validate(request)
 
+    def encrypt_batch(self, request  : Schema__Encryption__Batch__Request ,                                            # Encrypt many values in one call, results in request order with per-item errors
+                            response : Response
+                      ) -> Schema__Encryption__Batch__Response:
+        result               = self.encryption_batch().encrypt_batch(request)
+        response.status_code = result.status_code.value                                                                 # 200 even with per-item failures, 4xx/5xx only when the whole batch was rejected
+        return result
+
+    def decrypt_batch(self, request  : Schema__Decryption__Batch__Request ,                                            # Decrypt many values in one call, results in request order with per-item errors
+                            response : Response
+                      ) -> Schema__Decryption__Batch__Response:
+        result               = self.encryption_batch().decrypt_batch(request)
+        response.status_code = result.status_code.value
+        return result
+
+    async def encrypt_raw(self, request : Request):                                                                     # application/octet-stream in, sealed bytes out (no base64 / JSON either way)
+        return await self._raw_response(request, self.service_encryption.encrypt_raw)
+
+    async def decrypt_raw(self, request : Request):                                                                     # sealed bytes in, application/octet-stream plaintext out
+        return await self._raw_response(request, self.service_encryption.decrypt_raw)
+
+    async def _raw_response(self, request   : Request                          ,                                        # Body is read once into a bytearray and handed to NaCl as a memoryview,
+                                  operation : Callable[[memoryview], memoryview]                                         # so the crypto output buffer is the only other copy
+                            ):
+        content_length = request.headers.get('content-length', '')
+        if content_length.isdigit() and int(content_length) > ENCRYPTION__RAW__MAX_BYTES:                               # reject before reading anything
+            return self._raw_error(Enum__HTTP__Status.PAYLOAD_TOO_LARGE_413, f"Request body too large (max {ENCRYPTION__RAW__MAX_BYTES} bytes)")
+        body = bytearray()
+        async for chunk in request.stream():
+            body += chunk
+            if len(body) > ENCRYPTION__RAW__MAX_BYTES:
+                return self._raw_error(Enum__HTTP__Status.PAYLOAD_TOO_LARGE_413, f"Request body too large (max {ENCRYPTION__RAW__MAX_BYTES} bytes)")
+        if not body:
+            return self._raw_error(Enum__HTTP__Status.BAD_REQUEST_400, "Empty request body")
+        try:
+            with memoryview(body) as data:
+                result = operation(data)
+        except CryptoError as e:
+            return self._raw_error(Enum__HTTP__Status.BAD_REQUEST_400, str(e))
+        except ValueError as e:                                                                                         # keys not configured / invalid
+            return self._raw_error(Enum__HTTP__Status.SERVER_ERROR_500, str(e))
+        return Response(content=result, media_type=RAW__MEDIA_TYPE)
+
+    async def encrypt_stream(self, request : Request):                                                                  # Any size body in, secretstream-chunked ciphertext out (constant memory)
+        return await self._stream_response(self.encryption_stream().encrypt_async(request.stream()))
+
+    async def decrypt_stream(self, request : Request):                                                                  # Output of encrypt-stream in, plaintext out (aborts the response on tampering / truncation)
+        return await self._stream_response(self.encryption_stream().decrypt_async(request.stream()))
+
+    async def _stream_response(self, chunks : AsyncIterator[bytes]):                                                    # Pulls the first chunk before answering, so bad headers / keys still get a status code
+        try:
+            first = await chunks.__anext__()
+        except StopAsyncIteration:
+            first = b''
+        except CryptoError as e:
+            return self._raw_error(Enum__HTTP__Status.BAD_REQUEST_400, str(e))
+        except ValueError as e:                                                                                         # keys not configured / invalid
+            return self._raw_error(Enum__HTTP__Status.SERVER_ERROR_500, str(e))
+
+        async def body():
+            yield first
+            async for chunk in chunks:
+                yield chunk
+        return StreamingResponse(body(), media_type=ENCRYPTION_STREAM__MEDIA_TYPE)
+
+    def transcrypt(self, request  : Schema__Encryption__Transcrypt__Request ,                                          # Re-seal service-encrypted values to a repo / environment / org secrets key,
+                         response : Response                                                                             # returns GitHub-ready encrypted_value + key_id (plaintext only lives in a wiped buffer)
+                   ) -> Schema__Encryption__Transcrypt__Response:
+        try:
+            github_api = self.github_api_factory.get_api(request.encrypted_pat)
+        except ValueError as e:                                                                                         # PAT decryption errors
+            return self._transcrypt_error(response, Enum__HTTP__Status.UNAUTHORIZED_401, str(e))
+        try:
+            return self.encryption_transcrypt().transcrypt_request(github_api, request)
+        except ValueError as e:                                                                                         # bad scope / too many values / keys not configured
+            return self._transcrypt_error(response, Enum__HTTP__Status.BAD_REQUEST_400, str(e))
+        except Exception as e:                                                                                          # fetching the scope public key failed
+            status_code = getattr(getattr(e, 'response', None), 'status_code', None)
+            status      = Enum__HTTP__Status(status_code) if status_code in (401, 403, 404) else Enum__HTTP__Status.SERVER_ERROR_500
+            return self._transcrypt_error(response, status, f"GitHub API error: {e}")
+
+    def _transcrypt_error(self, response : Response, status : Enum__HTTP__Status, error : str) -> Schema__Encryption__Transcrypt__Response:
+        response.status_code = status.value
+        return Schema__Encryption__Transcrypt__Response(error=Safe_Str__Text(error))
+
+    def _raw_error(self, status : Enum__HTTP__Status, error : str) -> JSONResponse:
+        return JSONResponse(status_code=status.value, content=dict(success=False, error=error))
+
     def setup_routes(self):
         self.add_route_get (self.public_key    )
         self.add_route_get (self.generate_keys )
         self.add_route_post(self.encrypt       )
         self.add_route_post(self.decrypt       )
-        self.add_route_post(self.validate      )
\ No newline at end of file
+        self.add_route_post(self.validate      )
+        self.add_route_post(self.encrypt_batch )
+        self.add_route_post(self.decrypt_batch )
+        self.add_route_post(self.encrypt_raw   )
+        self.add_route_post(self.decrypt_raw   )
+        self.add_route_post(self.encrypt_stream)
+        self.add_route_post(self.decrypt_stream)
+        self.add_route_post(self.transcrypt    )
\ No newline at end of file
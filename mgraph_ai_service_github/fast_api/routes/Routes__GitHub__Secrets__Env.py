@@ -2,10 +2,11 @@ from fastapi
 from osbot_utils.helpers.duration.decorators.capture_duration                            import capture_duration
 from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text             import Safe_Str__Text
 from osbot_fast_api.api.routes.Fast_API__Routes                                          import Fast_API__Routes
+from mgraph_ai_service_github.config                                                     import GITHUB_API__PER_PAGE
 from mgraph_ai_service_github.fast_api.dependencies.GitHub__API__From__Header            import GitHub__API__From__Header
+from mgraph_ai_service_github.fast_api.routes.GitHub__Response__Context__Helpers     import handle_github_error, populate_rate_limit
 from mgraph_ai_service_github.schemas.base.Enum__HTTP__Status                            import Enum__HTTP__Status
 from mgraph_ai_service_github.schemas.base.Enum__Error__Type                             import Enum__Error__Type
-from mgraph_ai_service_github.schemas.github.base.Schema__GitHub__Rate_Limit             import Schema__GitHub__Rate_Limit
 from mgraph_ai_service_github.schemas.github.base.Schema__GitHub__Response__Context      import Schema__GitHub__Response__Context
 from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Secret__Metadata    import Schema__GitHub__Secret__Metadata
 from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Data__Env__Secret__Operations import (
@@ -56,20 +57,24 @@ class Routes__GitHub__Secrets__Env(Fast_API__Routes):
                 request_data   = request.request_data
                 repo_full_name = f"{request_data.owner}/{request_data.repo}"
                 github_secrets = GitHub__Secrets(api_token = github_api.api_token ,
-                                                 repo_name = repo_full_name       )
+                                                 repo_name = repo_full_name       ,
+                                                 api       = github_api           )
+                page     = max(1, request_data.page)                            # one page per call, the caller follows next_page
+                per_page = max(1, min(request_data.per_page, GITHUB_API__PER_PAGE))
                 if request_data.environment:
-                    secrets_list = github_secrets.list_environment_secrets(request_data.environment)
+                    secrets_list, more = github_secrets.environment_secrets_page(request_data.environment, page=page, per_page=per_page)
                 else:
-                    secrets_list = github_secrets.list_secrets()
-
+                    secrets_list, more = github_secrets.secrets_page(page=page, per_page=per_page)
 
                 for secret in secrets_list:
                     metadata = Schema__GitHub__Secret__Metadata(name       = secret.get('name'      ) ,
                                                                 created_at = secret.get('created_at') ,
                                                                 updated_at = secret.get('updated_at') )
                     response_data.secrets.append(metadata)
+                response_data.page      = page
+                response_data.next_page = page + 1 if more else None
 
-                self._populate_rate_limit(github_api, response_context)
+                populate_rate_limit(github_api, response_context, request.refresh_rate_limit)
 
                 response_context.success     = True
                 response_context.status_code = Enum__HTTP__Status.OK_200
@@ -80,7 +85,7 @@ class Routes__GitHub__Secrets__Env(Fast_API__Routes):
                 response_context.errors.append(e)
 
             except Exception as e:
-                self._handle_github_error(e, response_context)
+                handle_github_error(e, response_context)
 
 
         response_context.duration = duration.seconds        # we can't do this in finally since the capture_duration needs to be completed before this value is available
@@ -105,7 +110,8 @@ class Routes__GitHub__Secrets__Env(Fast_API__Routes):
                 environment  = str(request_data.environment) if request_data.environment else None
 
                 github_secrets = GitHub__Secrets(api_token = github_api.api_token ,
-                                                 repo_name = f"{owner}/{repo}"    )
+                                                 repo_name = f"{owner}/{repo}"    ,
+                                                 api       = github_api           )
                 secret = github_secrets.get_secret_by_scope(secret_name, environment)
 
                 if secret:
@@ -118,7 +124,7 @@ class Routes__GitHub__Secrets__Env(Fast_API__Routes):
                     response_context.status_code = Enum__HTTP__Status.NOT_FOUND_404
                     response_context.error_type  = Enum__Error__Type.NOT_FOUND
 
-                self._populate_rate_limit(github_api, response_context)
+                populate_rate_limit(github_api, response_context, request.refresh_rate_limit)
 
             except ValueError as e:
                 response_context.status_code = Enum__HTTP__Status.UNAUTHORIZED_401
@@ -126,7 +132,7 @@ class Routes__GitHub__Secrets__Env(Fast_API__Routes):
                 response_context.errors.append(Safe_Str__Text(str(e)))
 
             except Exception as e:
-                self._handle_github_error(e, response_context)
+                handle_github_error(e, response_context)
 
             finally:
                 response_context.duration = duration.seconds
@@ -148,7 +154,8 @@ class Routes__GitHub__Secrets__Env(Fast_API__Routes):
                 request_data   = request.request_data
                 repo_full_name = f"{request_data.owner}/{request_data.repo}"
                 github_secrets = GitHub__Secrets(api_token = github_api.api_token ,
-                                                 repo_name = repo_full_name       )
+                                                 repo_name = repo_full_name       ,
+                                                 api       = github_api           )
 
                 decrypted_value = self._decrypt_secret_value(request_data.encrypted_value)
 
@@ -168,7 +175,7 @@ class Routes__GitHub__Secrets__Env(Fast_API__Routes):
                     response_context.error_type  = Enum__Error__Type.GITHUB_API_ERROR
                     response_context.errors.append(Safe_Str__Text("Failed to create env secret"))
 
-                self._populate_rate_limit(github_api, response_context)
+                populate_rate_limit(github_api, response_context, request.refresh_rate_limit)
 
             except ValueError as e:
                 response_context.status_code = Enum__HTTP__Status.UNAUTHORIZED_401
@@ -176,7 +183,7 @@ class Routes__GitHub__Secrets__Env(Fast_API__Routes):
                 response_context.errors.append(Safe_Str__Text(str(e)))
 
             except Exception as e:
-                self._handle_github_error(e, response_context)
+                handle_github_error(e, response_context)
 
             finally:
                 response_context.duration = duration.seconds
@@ -199,7 +206,8 @@ class Routes__GitHub__Secrets__Env(Fast_API__Routes):
                 repo_full_name = f"{request_data.owner}/{request_data.repo}"
                 environment    = str(request_data.environment) if request_data.environment else None
                 github_secrets = GitHub__Secrets(api_token = github_api.api_token ,
-                                                 repo_name = repo_full_name       )
+                                                 repo_name = repo_full_name       ,
+                                                 api       = github_api           )
 
                 decrypted_value = self._decrypt_secret_value(request_data.encrypted_value)
 
@@ -219,7 +227,7 @@ class Routes__GitHub__Secrets__Env(Fast_API__Routes):
                     response_context.error_type  = Enum__Error__Type.GITHUB_API_ERROR
                     response_context.errors.append(Safe_Str__Text("Failed to update env secret"))
 
-                self._populate_rate_limit(github_api, response_context)
+                populate_rate_limit(github_api, response_context, request.refresh_rate_limit)
 
             except ValueError as e:
                 response_context.status_code = Enum__HTTP__Status.UNAUTHORIZED_401
@@ -227,7 +235,7 @@ class Routes__GitHub__Secrets__Env(Fast_API__Routes):
                 response_context.errors.append(Safe_Str__Text(str(e)))
 
             except Exception as e:
-                self._handle_github_error(e, response_context)
+                handle_github_error(e, response_context)
 
             finally:
                 response_context.duration = duration.seconds
@@ -253,7 +261,8 @@ class Routes__GitHub__Secrets__Env(Fast_API__Routes):
                 environment  = str(request_data.environment) if request_data.environment else None
 
                 github_secrets = GitHub__Secrets(api_token = github_api.api_token ,
-                                                 repo_name = f"{owner}/{repo}"    )
+                                                 repo_name = f"{owner}/{repo}"    ,
+                                                 api       = github_api           )
                 deleted = github_secrets.delete_secret_by_scope(secret_name, environment)
 
                 response_data.deleted = deleted
@@ -264,7 +273,7 @@ class Routes__GitHub__Secrets__Env(Fast_API__Routes):
                     response_context.status_code = Enum__HTTP__Status.NOT_FOUND_404
                     response_context.error_type  = Enum__Error__Type.NOT_FOUND
 
-                self._populate_rate_limit(github_api, response_context)
+                populate_rate_limit(github_api, response_context, request.refresh_rate_limit)
 
             except ValueError as e:
                 response_context.status_code = Enum__HTTP__Status.UNAUTHORIZED_401
@@ -272,7 +281,7 @@ class Routes__GitHub__Secrets__Env(Fast_API__Routes):
                 response_context.errors.append(Safe_Str__Text(str(e)))
 
             except Exception as e:
-                self._handle_github_error(e, response_context)
+                handle_github_error(e, response_context)
 
             finally:
                 response_context.duration = duration.seconds
@@ -293,33 +302,3 @@ class Routes__GitHub__Secrets__Env(Fast_API__Routes):
         if not result.success:
             raise ValueError("Failed to decrypt secret value")
         return str(result.decrypted)
-
-    def _populate_rate_limit(self, github_api, response_context: Schema__GitHub__Response__Context) -> None:
-        try:
-            rate_limit_data = github_api.get('/rate_limit')
-            rate_info       = rate_limit_data.get('rate', {})
-            response_context.rate_limit = Schema__GitHub__Rate_Limit(limit     = rate_info.get('limit'    ) ,
-                                                                     remaining = rate_info.get('remaining') ,
-                                                                     reset     = rate_info.get('reset'    ) ,
-                                                                     used      = rate_info.get('used'     ) )
-        except Exception:
-            pass
-
-    def _handle_github_error(self, error, response_context: Schema__GitHub__Response__Context) -> None:
-        error_str = str(error)
-        if "401" in error_str:
-            response_context.status_code = Enum__HTTP__Status.UNAUTHORIZED_401
-            response_context.error_type  = Enum__Error__Type.INVALID_PAT
-        elif "403" in error_str and "rate limit" in error_str.lower():
-            response_context.status_code = Enum__HTTP__Status.RATE_LIMITED_429
-            response_context.error_type  = Enum__Error__Type.RATE_LIMITED
-        elif "403" in error_str:
-            response_context.status_code = Enum__HTTP__Status.FORBIDDEN_403
-            response_context.error_type  = Enum__Error__Type.FORBIDDEN
-        elif "404" in error_str:
-            response_context.status_code = Enum__HTTP__Status.NOT_FOUND_404
-            response_context.error_type  = Enum__Error__Type.NOT_FOUND
-        else:
-            response_context.status_code = Enum__HTTP__Status.SERVER_ERROR_500
-            response_context.error_type  = Enum__Error__Type.GITHUB_API_ERROR
-        response_context.errors.append(f"GitHub API error: {error_str}")
@@ -0,0 +1,94 @@
+import json
+from fastapi.responses                                                                   import JSONResponse, StreamingResponse
+from osbot_utils.helpers.duration.decorators.capture_duration                            import capture_duration
+from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text             import Safe_Str__Text
+from osbot_fast_api.api.routes.Fast_API__Routes                                          import Fast_API__Routes
+from mgraph_ai_service_github.config                                                     import GITHUB_API__INVENTORY__MAX_WORKERS
+from mgraph_ai_service_github.fast_api.dependencies.GitHub__API__From__Header            import GitHub__API__From__Header
+from mgraph_ai_service_github.fast_api.routes.GitHub__Response__Context__Helpers     import handle_github_error
+from mgraph_ai_service_github.schemas.base.Enum__HTTP__Status                            import Enum__HTTP__Status
+from mgraph_ai_service_github.schemas.base.Enum__Error__Type                             import Enum__Error__Type
+from mgraph_ai_service_github.schemas.github.base.Schema__GitHub__Response               import Schema__GitHub__Response
+from mgraph_ai_service_github.schemas.github.base.Schema__GitHub__Response__Context      import Schema__GitHub__Response__Context
+from mgraph_ai_service_github.schemas.github.inventory.Schema__GitHub__Request__Secrets__Inventory  import Schema__GitHub__Request__Secrets__Inventory
+from mgraph_ai_service_github.schemas.github.inventory.Schema__GitHub__Secrets__Inventory__Summary  import Schema__GitHub__Secrets__Inventory__Summary
+from mgraph_ai_service_github.service.github.inventory.GitHub__Secrets__Inventory        import GitHub__Secrets__Inventory, decode_inventory_checkpoint, INVENTORY__RECORD__CHECKPOINT, INVENTORY__RECORD__ERROR, INVENTORY__RECORD__ORG_SECRET, INVENTORY__RECORD__REPO, INVENTORY__RECORD__REPO_SECRET, INVENTORY__RECORD__ENVIRONMENT_SECRET
+
+INVENTORY__MEDIA_TYPE                  = 'application/x-ndjson'
+TAG__ROUTES_GITHUB_SECRETS_INVENTORY   = 'github-secrets-inventory'
+ROUTES_PATHS__GITHUB_SECRETS_INVENTORY = [ f'/{TAG__ROUTES_GITHUB_SECRETS_INVENTORY}/crawl' ]
+
+
+class Routes__GitHub__Secrets__Inventory(Fast_API__Routes):                     # Org-wide secrets inventory (streamed as NDJSON)
+    tag               : str                       = TAG__ROUTES_GITHUB_SECRETS_INVENTORY
+    github_api_factory: GitHub__API__From__Header
+
+    def crawl(self, request : Schema__GitHub__Request__Secrets__Inventory):     # Every org / repo / environment secret, one JSON line each, then a summary line
+        response_context = Schema__GitHub__Response__Context()                  # no return annotation: the route returns its own (streaming) response
+        request_data     = request.request_data
+        org              = str(request_data.org)
+        try:
+            checkpoint = str(request_data.checkpoint) if request_data.checkpoint else None
+            if checkpoint and self._checkpoint_org(checkpoint) != org:
+                response_context.status_code = Enum__HTTP__Status.BAD_REQUEST_400
+                response_context.error_type  = Enum__Error__Type.INVALID_INPUT
+                response_context.errors.append(Safe_Str__Text("Invalid inventory checkpoint for this org"))
+            else:
+                github_api = self.github_api_factory.get_api(request.encrypted_pat)
+                inventory  = GitHub__Secrets__Inventory(api_token            = github_api.api_token                                               ,
+                                                        api                  = github_api                                                         ,
+                                                        max_workers          = max(1, min(request_data.max_workers, GITHUB_API__INVENTORY__MAX_WORKERS)),
+                                                        rate_limit_reserve   = request_data.rate_limit_reserve                                    ,
+                                                        include_environments = request_data.include_environments                                  )
+                return StreamingResponse(self._crawl_lines(inventory, org, checkpoint),
+                                         media_type = INVENTORY__MEDIA_TYPE)
+
+        except ValueError as e:
+            response_context.status_code = Enum__HTTP__Status.UNAUTHORIZED_401
+            response_context.error_type  = Enum__Error__Type.DECRYPTION_FAILED
+            response_context.errors.append(Safe_Str__Text(str(e)))
+
+        except Exception as e:
+            handle_github_error(e, response_context)
+
+        return JSONResponse(status_code = response_context.status_code.value                          ,
+                            content     = Schema__GitHub__Response(response_context=response_context).json())
+
+    def _crawl_lines(self, inventory  : GitHub__Secrets__Inventory ,            # One JSON line per record, then a summary line
+                           org        : str                        ,
+                           checkpoint : str
+                     ):
+        summary  = Schema__GitHub__Secrets__Inventory__Summary(org=org)
+        counters = { INVENTORY__RECORD__ORG_SECRET         : 'org_secrets'         ,
+                     INVENTORY__RECORD__REPO               : 'repos'               ,
+                     INVENTORY__RECORD__REPO_SECRET        : 'repo_secrets'        ,
+                     INVENTORY__RECORD__ENVIRONMENT_SECRET : 'environment_secrets' ,
+                     INVENTORY__RECORD__ERROR              : 'errors'              }
+        with capture_duration() as duration:
+            try:
+                for record in inventory.crawl(org, checkpoint=checkpoint):
+                    if record['type'] == INVENTORY__RECORD__CHECKPOINT:
+                        summary.checkpoint = record['checkpoint']
+                    else:
+                        field = counters[record['type']]
+                        setattr(summary, field, getattr(summary, field) + 1)
+                    yield json.dumps(record) + '\n'
+                summary.complete = summary.checkpoint is None
+            except Exception as e:                                              # e.g. the org itself can't be listed (headers are already sent)
+                summary.errors += 1
+                yield json.dumps(dict(type=INVENTORY__RECORD__ERROR, org=org, error=str(e))) + '\n'
+        summary.duration = duration.seconds
+        try:
+            summary.rate_limit = inventory.api.rate_limit()
+        except Exception:
+            pass                                                                # Rate limit fetch is best-effort
+        yield json.dumps({'summary': summary.json()}) + '\n'
+
+    def _checkpoint_org(self, checkpoint : str) -> str:                         # Org a checkpoint was issued for (None if it can't be decoded)
+        try:
+            return decode_inventory_checkpoint(checkpoint).get('org')
+        except ValueError:
+            return None
+
+    def setup_routes(self):                                                     # Register all route methods
+        self.add_route_post(self.crawl)
@@ -3,10 +3,11 @@ from fastapi
 from osbot_utils.helpers.duration.decorators.capture_duration                            import capture_duration
 from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text             import Safe_Str__Text
 from osbot_fast_api.api.routes.Fast_API__Routes                                          import Fast_API__Routes
+from mgraph_ai_service_github.config                                                     import GITHUB_API__PER_PAGE
 from mgraph_ai_service_github.fast_api.dependencies.GitHub__API__From__Header            import GitHub__API__From__Header
+from mgraph_ai_service_github.fast_api.routes.GitHub__Response__Context__Helpers     import handle_github_error, populate_rate_limit
 from mgraph_ai_service_github.schemas.base.Enum__HTTP__Status                            import Enum__HTTP__Status
 from mgraph_ai_service_github.schemas.base.Enum__Error__Type                             import Enum__Error__Type
-from mgraph_ai_service_github.schemas.github.base.Schema__GitHub__Rate_Limit             import Schema__GitHub__Rate_Limit
 from mgraph_ai_service_github.schemas.github.base.Schema__GitHub__Response__Context      import Schema__GitHub__Response__Context
 from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Org__Secret__Metadata import Schema__GitHub__Org__Secret__Metadata
 from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Data__Org__Secrets__List import Schema__GitHub__Data__Org__Secrets__List
@@ -56,9 +57,12 @@ class Routes__GitHub__Secrets__Org(Fast_API__Routes):
                 github_api     = self.github_api_factory.get_api(request.encrypted_pat)
                 request_data   = request.request_data
                 github_secrets = GitHub__Secrets(api_token = github_api.api_token    ,
-                                                 repo_name = "placeholder/placeholder")  # Org secrets don't need repo
+                                                 repo_name = "placeholder/placeholder",
+                                                 api       = github_api               )  # Org secrets don't need repo
 
-                secrets_list = github_secrets.list_org_secrets(str(request_data.org))
+                page               = max(1, request_data.page)                  # one page per call, the caller follows next_page
+                per_page           = max(1, min(request_data.per_page, GITHUB_API__PER_PAGE))
+                secrets_list, more = github_secrets.org_secrets_page(str(request_data.org), page=page, per_page=per_page)
 
                 for secret in secrets_list:
                     metadata = Schema__GitHub__Org__Secret__Metadata(
@@ -68,8 +72,10 @@ class Routes__GitHub__Secrets__Org(Fast_API__Routes):
                         visibility                = secret.get('visibility'               ) ,
                         selected_repositories_url = secret.get('selected_repositories_url') )
                     response_data.secrets.append(metadata)
+                response_data.page      = page
+                response_data.next_page = page + 1 if more else None
 
-                self._populate_rate_limit(github_api, response_context)
+                populate_rate_limit(github_api, response_context, request.refresh_rate_limit)
 
                 response_context.success     = True
                 response_context.status_code = Enum__HTTP__Status.OK_200
@@ -80,7 +86,7 @@ class Routes__GitHub__Secrets__Org(Fast_API__Routes):
                 response_context.errors.append(Safe_Str__Text(str(e)))
 
             except Exception as e:
-                self._handle_github_error(e, response_context)
+                handle_github_error(e, response_context)
 
         response_context.duration = duration.seconds
 
@@ -102,7 +108,8 @@ class Routes__GitHub__Secrets__Org(Fast_API__Routes):
                 org_name       = str(request_data.org)
                 secret_name    = str(request_data.secret_name)
                 github_secrets = GitHub__Secrets(api_token = github_api.api_token     ,
-                                                 repo_name = "placeholder/placeholder")
+                                                 repo_name = "placeholder/placeholder",
+                                                 api       = github_api               )
 
                 secret = github_secrets.get_org_secret(org_name, secret_name)
 
@@ -119,7 +126,7 @@ class Routes__GitHub__Secrets__Org(Fast_API__Routes):
                     response_context.status_code = Enum__HTTP__Status.NOT_FOUND_404
                     response_context.error_type  = Enum__Error__Type.NOT_FOUND
 
-                self._populate_rate_limit(github_api, response_context)
+                populate_rate_limit(github_api, response_context, request.refresh_rate_limit)
 
             except ValueError as e:
                 response_context.status_code = Enum__HTTP__Status.UNAUTHORIZED_401
@@ -127,7 +134,7 @@ class Routes__GitHub__Secrets__Org(Fast_API__Routes):
                 response_context.errors.append(Safe_Str__Text(str(e)))
 
             except Exception as e:
-                self._handle_github_error(e, response_context)
+                handle_github_error(e, response_context)
 
             finally:
                 response_context.duration = duration.seconds
@@ -148,7 +155,8 @@ class Routes__GitHub__Secrets__Org(Fast_API__Routes):
                 github_api     = self.github_api_factory.get_api(request.encrypted_pat)
                 request_data   = request.request_data
                 github_secrets = GitHub__Secrets(api_token = github_api.api_token    ,
-                                                 repo_name = "placeholder/placeholder")
+                                                 repo_name = "placeholder/placeholder",
+                                                 api       = github_api               )
 
                 decrypted_value = self._decrypt_secret_value(request_data.encrypted_value)
 
@@ -170,7 +178,7 @@ class Routes__GitHub__Secrets__Org(Fast_API__Routes):
                     response_context.error_type  = Enum__Error__Type.GITHUB_API_ERROR
                     response_context.errors.append(Safe_Str__Text("Failed to create org secret"))
 
-                self._populate_rate_limit(github_api, response_context)
+                populate_rate_limit(github_api, response_context, request.refresh_rate_limit)
 
             except ValueError as e:
                 response_context.status_code = Enum__HTTP__Status.UNAUTHORIZED_401
@@ -178,7 +186,7 @@ class Routes__GitHub__Secrets__Org(Fast_API__Routes):
                 response_context.errors.append(Safe_Str__Text(str(e)))
 
             except Exception as e:
-                self._handle_github_error(e, response_context)
+                handle_github_error(e, response_context)
 
             finally:
                 response_context.duration = duration.seconds
@@ -199,7 +207,8 @@ class Routes__GitHub__Secrets__Org(Fast_API__Routes):
                 github_api     = self.github_api_factory.get_api(request.encrypted_pat)
                 request_data   = request.request_data
                 github_secrets = GitHub__Secrets(api_token = github_api.api_token    ,
-                                                 repo_name = "placeholder/placeholder")
+                                                 repo_name = "placeholder/placeholder",
+                                                 api       = github_api               )
 
                 decrypted_value = self._decrypt_secret_value(request_data.encrypted_value)
 
@@ -221,7 +230,7 @@ class Routes__GitHub__Secrets__Org(Fast_API__Routes):
                     response_context.error_type  = Enum__Error__Type.GITHUB_API_ERROR
                     response_context.errors.append(Safe_Str__Text("Failed to update org secret"))
 
-                self._populate_rate_limit(github_api, response_context)
+                populate_rate_limit(github_api, response_context, request.refresh_rate_limit)
 
             except ValueError as e:
                 response_context.status_code = Enum__HTTP__Status.UNAUTHORIZED_401
@@ -229,7 +238,7 @@ class Routes__GitHub__Secrets__Org(Fast_API__Routes):
                 response_context.errors.append(Safe_Str__Text(str(e)))
 
             except Exception as e:
-                self._handle_github_error(e, response_context)
+                handle_github_error(e, response_context)
 
             finally:
                 response_context.duration = duration.seconds
@@ -252,7 +261,8 @@ class Routes__GitHub__Secrets__Org(Fast_API__Routes):
                 org_name       = str(request_data.org)
                 secret_name    = str(request_data.secret_name)
                 github_secrets = GitHub__Secrets(api_token = github_api.api_token     ,
-                                                 repo_name = "placeholder/placeholder")
+                                                 repo_name = "placeholder/placeholder",
+                                                 api       = github_api               )
 
                 deleted = github_secrets.delete_org_secret(org_name, secret_name)
 
@@ -267,7 +277,7 @@ class Routes__GitHub__Secrets__Org(Fast_API__Routes):
                     response_context.error_type  = Enum__Error__Type.NOT_FOUND
                     response_context.errors.append(Safe_Str__Text(f"Org secret '{secret_name}' not found"))
 
-                self._populate_rate_limit(github_api, response_context)
+                populate_rate_limit(github_api, response_context, request.refresh_rate_limit)
 
             except ValueError as e:
                 response_context.status_code = Enum__HTTP__Status.UNAUTHORIZED_401
@@ -275,7 +285,7 @@ class Routes__GitHub__Secrets__Org(Fast_API__Routes):
                 response_context.errors.append(Safe_Str__Text(str(e)))
 
             except Exception as e:
-                self._handle_github_error(e, response_context)
+                handle_github_error(e, response_context)
 
             finally:
                 response_context.duration = duration.seconds
@@ -296,33 +306,3 @@ class Routes__GitHub__Secrets__Org(Fast_API__Routes):
         if not result.success:
             raise ValueError("Failed to decrypt secret value")
         return str(result.decrypted)
-
-    def _populate_rate_limit(self, github_api, response_context: Schema__GitHub__Response__Context) -> None:
-        try:
-            rate_limit_data = github_api.get('/rate_limit')
-            rate_info       = rate_limit_data.get('rate', {})
-            response_context.rate_limit = Schema__GitHub__Rate_Limit(limit     = rate_info.get('limit'    ) ,
-                                                                     remaining = rate_info.get('remaining') ,
-                                                                     reset     = rate_info.get('reset'    ) ,
-                                                                     used      = rate_info.get('used'     ) )
-        except Exception:
-            pass
-
-    def _handle_github_error(self, error, response_context: Schema__GitHub__Response__Context) -> None:
-        error_str = str(error)
-        if "401" in error_str:
-            response_context.status_code = Enum__HTTP__Status.UNAUTHORIZED_401
-            response_context.error_type  = Enum__Error__Type.INVALID_PAT
-        elif "403" in error_str and "rate limit" in error_str.lower():
-            response_context.status_code = Enum__HTTP__Status.RATE_LIMITED_429
-            response_context.error_type  = Enum__Error__Type.RATE_LIMITED
-        elif "403" in error_str:
-            response_context.status_code = Enum__HTTP__Status.FORBIDDEN_403
-            response_context.error_type  = Enum__Error__Type.FORBIDDEN
-        elif "404" in error_str:
-            response_context.status_code = Enum__HTTP__Status.NOT_FOUND_404
-            response_context.error_type  = Enum__Error__Type.NOT_FOUND
-        else:
-            response_context.status_code = Enum__HTTP__Status.SERVER_ERROR_500
-            response_context.error_type  = Enum__Error__Type.GITHUB_API_ERROR
-        response_context.errors.append(Safe_Str__Text(f"GitHub API error: {error_str}"))
@@ -1,12 +1,14 @@
+import json
 from typing                                                                              import List
-from fastapi                                                                             import Response
+from fastapi                                                                             import Request, Response
+from fastapi.responses                                                                   import JSONResponse, StreamingResponse
 from osbot_utils.helpers.duration.decorators.capture_duration                            import capture_duration
 from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text             import Safe_Str__Text
 from osbot_fast_api.api.routes.Fast_API__Routes                                          import Fast_API__Routes
 from mgraph_ai_service_github.fast_api.dependencies.GitHub__API__From__Header            import GitHub__API__From__Header
+from mgraph_ai_service_github.fast_api.routes.GitHub__Response__Context__Helpers     import handle_github_error, populate_rate_limit, populate_rate_limit_async
 from mgraph_ai_service_github.schemas.base.Enum__HTTP__Status                            import Enum__HTTP__Status
 from mgraph_ai_service_github.schemas.base.Enum__Error__Type                             import Enum__Error__Type
-from mgraph_ai_service_github.schemas.github.base.Schema__GitHub__Rate_Limit             import Schema__GitHub__Rate_Limit
 from mgraph_ai_service_github.schemas.github.base.Schema__GitHub__Response__Context      import Schema__GitHub__Response__Context
 from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Secret__Metadata    import Schema__GitHub__Secret__Metadata
 from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Data__Secrets__List import Schema__GitHub__Data__Secrets__List
@@ -24,7 +26,18 @@ from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Request__Se
 from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Response__Secret__Update import Schema__GitHub__Response__Secret__Update
 from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Request__Secret__Delete import Schema__GitHub__Request__Secret__Delete
 from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Response__Secret__Delete import Schema__GitHub__Response__Secret__Delete
+from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Secret__Bulk_Result    import Schema__GitHub__Secret__Bulk_Result
+from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Data__Secrets__Bulk_Set import Schema__GitHub__Data__Secrets__Bulk_Set
+from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Request__Secrets__Bulk_Set  import Schema__GitHub__Request__Secrets__Bulk_Set
+from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Response__Secrets__Bulk_Set import Schema__GitHub__Response__Secrets__Bulk_Set
+from mgraph_ai_service_github.schemas.github.base.Schema__GitHub__Response             import Schema__GitHub__Response
+from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Request__Secret__Fan_Out  import Schema__GitHub__Request__Secret__Fan_Out
+from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Secret__Fan_Out__Result   import Schema__GitHub__Secret__Fan_Out__Result
+from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Secret__Fan_Out__Summary  import Schema__GitHub__Secret__Fan_Out__Summary
 from mgraph_ai_service_github.service.github.GitHub__Secrets                             import GitHub__Secrets
+from mgraph_ai_service_github.service.github.GitHub__Secrets__Async                      import GitHub__Secrets__Async
+from mgraph_ai_service_github.service.github.GitHub__Secrets__Fan_Out                    import GitHub__Secrets__Fan_Out
+from mgraph_ai_service_github.config                                                     import GITHUB_API__BULK_WRITE__MAX_WORKERS, GITHUB_API__BULK_WRITE__MAX_SECRETS, GITHUB_API__PER_PAGE, GITHUB_API__FAN_OUT__MAX_TARGETS, GITHUB_API__FAN_OUT__MAX_WORKERS, GITHUB_API__FAN_OUT__MEDIA_TYPE
 from mgraph_ai_service_github.service.encryption.Service__Encryption                     import Service__Encryption
 
 TAG__ROUTES_GITHUB_SECRETS_REPO   = 'github-secrets-repo'
@@ -32,7 +45,9 @@ ROUTES_PATHS__GITHUB_SECRETS_REPO = [ f'/{TAG__ROUTES_GITHUB_SECRETS_REPO}/list'
                                       f'/{TAG__ROUTES_GITHUB_SECRETS_REPO}/get'    ,
                                       f'/{TAG__ROUTES_GITHUB_SECRETS_REPO}/create' ,
                                       f'/{TAG__ROUTES_GITHUB_SECRETS_REPO}/update' ,
-                                      f'/{TAG__ROUTES_GITHUB_SECRETS_REPO}/delete' ]
+                                      f'/{TAG__ROUTES_GITHUB_SECRETS_REPO}/delete' ,
+                                      f'/{TAG__ROUTES_GITHUB_SECRETS_REPO}/bulk-set',
+                                      f'/{TAG__ROUTES_GITHUB_SECRETS_REPO}/fan-out' ]
 
 
 # todo: refactor these classes so that we don't have any logic here (just FastAPI response handling code)
@@ -42,30 +57,38 @@ class Routes__GitHub__Secrets__Repo(Fast_API__Routes):
     github_api_factory: GitHub__API__From__Header
     service_encryption: Service__Encryption
 
-    def list(self, request : Schema__GitHub__Request__Secrets__List ,           # List all secrets in a repository
-                   response: Response
-             ) -> Schema__GitHub__Response__Secrets__List:
+    async def list(self, request : Request):                                    # List all secrets in a repository (async GitHub client, body parsed here)
+        return await self._json_route(request, Schema__GitHub__Request__Secrets__List, self.list_secrets)
+
+    async def list_secrets(self, request : Schema__GitHub__Request__Secrets__List ,
+                                 response: Response
+                            ) -> Schema__GitHub__Response__Secrets__List:
 
         with capture_duration() as duration:
             response_context = Schema__GitHub__Response__Context()
             response_data    = Schema__GitHub__Data__Secrets__List()
 
             try:
-                github_api     = self.github_api_factory.get_api(request.encrypted_pat)
+                github_api     = self.github_api_factory.get_async_api(request.encrypted_pat)
                 request_data   = request.request_data
                 repo_full_name = f"{request_data.owner}/{request_data.repo}"
-                github_secrets = GitHub__Secrets(api_token = github_api.api_token ,
-                                                 repo_name = repo_full_name       )
+                github_secrets = GitHub__Secrets__Async(api_token = github_api.api_token ,
+                                                        repo_name = repo_full_name       ,
+                                                        api       = github_api           )
 
-                secrets_list = github_secrets.list_secrets()                    # Call existing service method
+                page               = max(1, request_data.page)                  # one page per call, the caller follows next_page
+                per_page           = max(1, min(request_data.per_page, GITHUB_API__PER_PAGE))
+                secrets_list, more = await github_secrets.secrets_page(page=page, per_page=per_page)
 
                 for secret in secrets_list:                                     # Convert to schema objects
                     metadata = Schema__GitHub__Secret__Metadata(name       = secret.get('name'      ) ,
                                                                 created_at = secret.get('created_at') ,
                                                                 updated_at = secret.get('updated_at') )
                     response_data.secrets.append(metadata)
+                response_data.page      = page
+                response_data.next_page = page + 1 if more else None
 
-                self._populate_rate_limit(github_api, response_context)         # Capture rate limit info
+                await populate_rate_limit_async(github_api, response_context, request.refresh_rate_limit)   # Capture rate limit info
 
                 response_context.success     = True
                 response_context.status_code = Enum__HTTP__Status.OK_200
@@ -76,7 +99,7 @@ class Routes__GitHub__Secrets__Repo(Fast_API__Routes):
                 response_context.errors.append(Safe_Str__Text(str(e)))
 
             except Exception as e:
-                self._handle_github_error(e, response_context)
+                handle_github_error(e, response_context)
 
         response_context.duration = duration.seconds
         response.status_code = response_context.status_code.value
@@ -96,7 +119,8 @@ class Routes__GitHub__Secrets__Repo(Fast_API__Routes):
                 request_data   = request.request_data
                 repo_full_name = f"{request_data.owner}/{request_data.repo}"
                 github_secrets = GitHub__Secrets(api_token = github_api.api_token ,
-                                                 repo_name = repo_full_name       )
+                                                 repo_name = repo_full_name       ,
+                                                 api       = github_api           )
 
                 secret = github_secrets.get_secret(str(request_data.secret_name))
 
@@ -111,7 +135,7 @@ class Routes__GitHub__Secrets__Repo(Fast_API__Routes):
                     response_context.error_type  = Enum__Error__Type.NOT_FOUND
                     response_context.errors.append(Safe_Str__Text(f"Secret '{request_data.secret_name}' not found"))
 
-                self._populate_rate_limit(github_api, response_context)
+                populate_rate_limit(github_api, response_context, request.refresh_rate_limit)
 
             except ValueError as e:
                 response_context.status_code = Enum__HTTP__Status.UNAUTHORIZED_401
@@ -119,7 +143,7 @@ class Routes__GitHub__Secrets__Repo(Fast_API__Routes):
                 response_context.errors.append(Safe_Str__Text(str(e)))
 
             except Exception as e:
-                self._handle_github_error(e, response_context)
+                handle_github_error(e, response_context)
 
             finally:
                 response_context.duration = duration.seconds
@@ -128,37 +152,35 @@ class Routes__GitHub__Secrets__Repo(Fast_API__Routes):
         return Schema__GitHub__Response__Secret__Get(response_context = response_context ,
                                                      response_data    = response_data    )
 
-    def create(self, request : Schema__GitHub__Request__Secret__Create ,        # Create a new repository secret
-                     response: Response
-               ) -> Schema__GitHub__Response__Secret__Create:
+    async def create(self, request : Request):                                  # Create a new repository secret (async GitHub client, body parsed here)
+        return await self._json_route(request, Schema__GitHub__Request__Secret__Create, self.create_secret)
+
+    async def create_secret(self, request : Schema__GitHub__Request__Secret__Create ,
+                                  response: Response
+                             ) -> Schema__GitHub__Response__Secret__Create:
 
         with capture_duration() as duration:
             response_context = Schema__GitHub__Response__Context()
             response_data    = Schema__GitHub__Data__Secret__Create()
 
             try:
-                github_api     = self.github_api_factory.get_api(request.encrypted_pat)
+                github_api     = self.github_api_factory.get_async_api(request.encrypted_pat)
                 request_data   = request.request_data
                 repo_full_name = f"{request_data.owner}/{request_data.repo}"
-                github_secrets = GitHub__Secrets(api_token = github_api.api_token ,
-                                                 repo_name = repo_full_name       )
+                github_secrets = GitHub__Secrets__Async(api_token = github_api.api_token ,
+                                                        repo_name = repo_full_name       ,
+                                                        api       = github_api           )
 
                 decrypted_value = self._decrypt_secret_value(request_data.encrypted_value)   # Decrypt the secret value
 
-                created = github_secrets.create_or_update_secret(secret_name  = str(request_data.secret_name) ,
-                                                                 secret_value = decrypted_value               )
-                response_data.created = created
-
-                if created:
-                    response_context.success     = True
-                    response_context.status_code = Enum__HTTP__Status.CREATED_201
-                    response_context.messages.append(Safe_Str__Text(f"Secret '{request_data.secret_name}' created"))
-                else:
-                    response_context.status_code = Enum__HTTP__Status.SERVER_ERROR_500
-                    response_context.error_type  = Enum__Error__Type.GITHUB_API_ERROR
-                    response_context.errors.append(Safe_Str__Text("Failed to create secret"))
+                await github_secrets.write_secret(secret_name  = str(request_data.secret_name) ,   # GitHub errors raise and are mapped below
+                                                  secret_value = decrypted_value               )
+                response_data.created        = True
+                response_context.success     = True
+                response_context.status_code = Enum__HTTP__Status.CREATED_201
+                response_context.messages.append(Safe_Str__Text(f"Secret '{request_data.secret_name}' created"))
 
-                self._populate_rate_limit(github_api, response_context)
+                await populate_rate_limit_async(github_api, response_context, request.refresh_rate_limit)
 
             except ValueError as e:
                 response_context.status_code = Enum__HTTP__Status.UNAUTHORIZED_401
@@ -166,7 +188,7 @@ class Routes__GitHub__Secrets__Repo(Fast_API__Routes):
                 response_context.errors.append(Safe_Str__Text(str(e)))
 
             except Exception as e:
-                self._handle_github_error(e, response_context)
+                handle_github_error(e, response_context)
 
             finally:
                 response_context.duration = duration.seconds
@@ -188,7 +210,8 @@ class Routes__GitHub__Secrets__Repo(Fast_API__Routes):
                 request_data   = request.request_data
                 repo_full_name = f"{request_data.owner}/{request_data.repo}"
                 github_secrets = GitHub__Secrets(api_token = github_api.api_token ,
-                                                 repo_name = repo_full_name       )
+                                                 repo_name = repo_full_name       ,
+                                                 api       = github_api           )
 
                 decrypted_value = self._decrypt_secret_value(request_data.encrypted_value)
 
@@ -205,7 +228,7 @@ class Routes__GitHub__Secrets__Repo(Fast_API__Routes):
                     response_context.error_type  = Enum__Error__Type.GITHUB_API_ERROR
                     response_context.errors.append(Safe_Str__Text("Failed to update secret"))
 
-                self._populate_rate_limit(github_api, response_context)
+                populate_rate_limit(github_api, response_context, request.refresh_rate_limit)
 
             except ValueError as e:
                 response_context.status_code = Enum__HTTP__Status.UNAUTHORIZED_401
@@ -213,7 +236,7 @@ class Routes__GitHub__Secrets__Repo(Fast_API__Routes):
                 response_context.errors.append(Safe_Str__Text(str(e)))
 
             except Exception as e:
-                self._handle_github_error(e, response_context)
+                handle_github_error(e, response_context)
 
             finally:
                 response_context.duration = duration.seconds
@@ -235,7 +258,8 @@ class Routes__GitHub__Secrets__Repo(Fast_API__Routes):
                 request_data   = request.request_data
                 repo_full_name = f"{request_data.owner}/{request_data.repo}"
                 github_secrets = GitHub__Secrets(api_token = github_api.api_token ,
-                                                 repo_name = repo_full_name       )
+                                                 repo_name = repo_full_name       ,
+                                                 api       = github_api           )
 
                 deleted = github_secrets.delete_secret(str(request_data.secret_name))
                 response_data.deleted = deleted
@@ -249,7 +273,7 @@ class Routes__GitHub__Secrets__Repo(Fast_API__Routes):
                     response_context.error_type  = Enum__Error__Type.NOT_FOUND
                     response_context.errors.append(Safe_Str__Text(f"Secret '{request_data.secret_name}' not found or could not be deleted"))
 
-                self._populate_rate_limit(github_api, response_context)
+                populate_rate_limit(github_api, response_context, request.refresh_rate_limit)
 
             except ValueError as e:
                 response_context.status_code = Enum__HTTP__Status.UNAUTHORIZED_401
@@ -257,7 +281,7 @@ class Routes__GitHub__Secrets__Repo(Fast_API__Routes):
                 response_context.errors.append(Safe_Str__Text(str(e)))
 
             except Exception as e:
-                self._handle_github_error(e, response_context)
+                handle_github_error(e, response_context)
 
             finally:
                 response_context.duration = duration.seconds
@@ -266,12 +290,172 @@ class Routes__GitHub__Secrets__Repo(Fast_API__Routes):
         return Schema__GitHub__Response__Secret__Delete(response_context = response_context ,
                                                         response_data    = response_data    )
 
+    def bulk_set(self, request : Schema__GitHub__Request__Secrets__Bulk_Set ,    # Create or update many secrets (one key fetch, concurrent PUTs)
+                       response: Response
+                 ) -> Schema__GitHub__Response__Secrets__Bulk_Set:
+
+        with capture_duration() as duration:
+            response_context = Schema__GitHub__Response__Context()
+            response_data    = Schema__GitHub__Data__Secrets__Bulk_Set()
+
+            try:
+                request_data = request.request_data
+                if len(request_data.secrets) > GITHUB_API__BULK_WRITE__MAX_SECRETS:
+                    response_context.status_code = Enum__HTTP__Status.BAD_REQUEST_400
+                    response_context.error_type  = Enum__Error__Type.INVALID_INPUT
+                    response_context.errors.append(Safe_Str__Text(f"Too many secrets: {len(request_data.secrets)} (max {GITHUB_API__BULK_WRITE__MAX_SECRETS})"))
+                elif duplicates := self._duplicate_secret_names(request_data.secrets):
+                    response_context.status_code = Enum__HTTP__Status.BAD_REQUEST_400
+                    response_context.error_type  = Enum__Error__Type.INVALID_INPUT
+                    response_context.errors.append(Safe_Str__Text(f"Duplicate secrets: {', '.join(duplicates)}"))
+                else:
+                    github_api     = self.github_api_factory.get_api(request.encrypted_pat)
+                    repo_full_name = f"{request_data.owner}/{request_data.repo}"
+                    github_secrets = GitHub__Secrets(api_token = github_api.api_token ,
+                                                     repo_name = repo_full_name       ,
+                                                     api       = github_api           )
+
+                    decrypted = {}                                              # decrypt everything up front, GitHub is only called for valid values
+                    results   = {}
+                    for item in request_data.secrets:
+                        secret_name = str(item.secret_name)
+                        try:
+                            decrypted[secret_name] = self._decrypt_secret_value(item.encrypted_value)
+                        except ValueError as e:
+                            results[secret_name] = {'success': False, 'duration': 0.0, 'error': str(e)}
+
+                    if decrypted:
+                        max_workers = max(1, min(request_data.max_workers, GITHUB_API__BULK_WRITE__MAX_WORKERS))
+                        results.update(github_secrets.create_or_update_secrets(decrypted, max_workers=max_workers))
+
+                    for item in request_data.secrets:                           # keep request order in the response
+                        secret_name = str(item.secret_name)
+                        result      = results[secret_name]
+                        response_data.results.append(Schema__GitHub__Secret__Bulk_Result(secret_name = secret_name         ,
+                                                                                         success     = result['success']   ,
+                                                                                         duration    = result['duration']  ,
+                                                                                         error       = result['error']     ))
+                        if result['success']:
+                            response_data.succeeded += 1
+                        else:
+                            response_data.failed    += 1
+                            response_context.errors.append(Safe_Str__Text(f"Secret '{secret_name}': {result['error']}"))
+
+                    if response_data.failed == 0:
+                        response_context.success     = True
+                        response_context.status_code = Enum__HTTP__Status.OK_200
+                        response_context.messages.append(Safe_Str__Text(f"{response_data.succeeded} secrets set"))
+                    elif response_data.succeeded:                               # partial success: per-secret results tell the caller what to retry
+                        response_context.status_code = Enum__HTTP__Status.OK_200
+                        response_context.error_type  = Enum__Error__Type.GITHUB_API_ERROR
+                    elif not decrypted:                                         # nothing decrypted: the request itself is bad, GitHub was never called
+                        response_context.status_code = Enum__HTTP__Status.BAD_REQUEST_400
+                        response_context.error_type  = Enum__Error__Type.DECRYPTION_FAILED
+                    else:
+                        response_context.status_code = Enum__HTTP__Status.SERVER_ERROR_500
+                        response_context.error_type  = Enum__Error__Type.GITHUB_API_ERROR
+
+                    populate_rate_limit(github_api, response_context, request.refresh_rate_limit)
+
+            except ValueError as e:
+                response_context.status_code = Enum__HTTP__Status.UNAUTHORIZED_401
+                response_context.error_type  = Enum__Error__Type.DECRYPTION_FAILED
+                response_context.errors.append(Safe_Str__Text(str(e)))
+
+            except Exception as e:
+                handle_github_error(e, response_context)
+
+            finally:
+                response_context.duration = duration.seconds
+
+        response.status_code = response_context.status_code.value
+        return Schema__GitHub__Response__Secrets__Bulk_Set(response_context = response_context ,
+                                                           response_data    = response_data    )
+
+    async def fan_out(self, request : Request):                                 # Write one secret to many repos / environments, streaming NDJSON results
+        return await self._json_route(request, Schema__GitHub__Request__Secret__Fan_Out, self.fan_out_secret)
+
+    async def fan_out_secret(self, request : Schema__GitHub__Request__Secret__Fan_Out ,
+                                   response: Response                                   # unused: the route returns its own (streaming) response
+                              ):
+        response_context = Schema__GitHub__Response__Context()
+        try:
+            request_data = request.request_data
+            if len(request_data.targets) > GITHUB_API__FAN_OUT__MAX_TARGETS:
+                response_context.status_code = Enum__HTTP__Status.BAD_REQUEST_400
+                response_context.error_type  = Enum__Error__Type.INVALID_INPUT
+                response_context.errors.append(Safe_Str__Text(f"Too many targets: {len(request_data.targets)} (max {GITHUB_API__FAN_OUT__MAX_TARGETS})"))
+            else:
+                github_api      = self.github_api_factory.get_async_api(request.encrypted_pat)     # PAT and value are decrypted once for every target
+                decrypted_value = self._decrypt_secret_value(request_data.encrypted_value)
+                fan_out         = GitHub__Secrets__Fan_Out(api_token          = github_api.api_token                                                ,
+                                                           api                = github_api                                                          ,
+                                                           max_workers        = max(1, min(request_data.max_workers, GITHUB_API__FAN_OUT__MAX_WORKERS))   ,
+                                                           rate_limit_reserve = request_data.rate_limit_reserve                                     )
+                targets         = [dict(owner       = str(target.owner)                                   ,
+                                        repo        = str(target.repo)                                    ,
+                                        environment = str(target.environment) if target.environment else None)
+                                   for target in request_data.targets]
+                return StreamingResponse(self._fan_out_lines(fan_out, str(request_data.secret_name), decrypted_value, targets),
+                                         media_type = GITHUB_API__FAN_OUT__MEDIA_TYPE)
+
+        except ValueError as e:
+            response_context.status_code = Enum__HTTP__Status.UNAUTHORIZED_401
+            response_context.error_type  = Enum__Error__Type.DECRYPTION_FAILED
+            response_context.errors.append(Safe_Str__Text(str(e)))
+
+        except Exception as e:
+            handle_github_error(e, response_context)
+
+        return JSONResponse(status_code = response_context.status_code.value                          ,
+                            content     = Schema__GitHub__Response(response_context=response_context).json())
+
+    async def _fan_out_lines(self, fan_out      : GitHub__Secrets__Fan_Out ,      # One JSON line per target (completion order), then a summary line
+                                   secret_name  : str                      ,
+                                   secret_value : str                      ,
+                                   targets      : list
+                             ):
+        summary = Schema__GitHub__Secret__Fan_Out__Summary(targets=len(targets))
+        with capture_duration() as duration:
+            async for result in fan_out.iter_fan_out(secret_name, secret_value, targets):
+                if   result['success']: summary.succeeded += 1
+                elif result['skipped']: summary.skipped   += 1
+                else                  : summary.failed    += 1
+                yield json.dumps(Schema__GitHub__Secret__Fan_Out__Result(**result).json()) + '\n'
+        summary.duration = duration.seconds
+        try:
+            summary.rate_limit = await fan_out.api.rate_limit()
+        except Exception:
+            pass                                                                # Rate limit fetch is best-effort
+        yield json.dumps({'summary': summary.json()}) + '\n'
+
     def setup_routes(self):                                                     # Register all route methods
-        self.add_route_post  (self.list  )
-        self.add_route_post  (self.get   )
-        self.add_route_post  (self.create)
-        self.add_route_put   (self.update)
-        self.add_route_delete(self.delete)
+        self.add_route_post  (self.list    )
+        self.add_route_post  (self.get     )
+        self.add_route_post  (self.create  )
+        self.add_route_put   (self.update  )
+        self.add_route_delete(self.delete  )
+        self.add_route_post  (self.bulk_set)
+        self.add_route_post  (self.fan_out )
+
+    async def _json_route(self, request      : Request ,                        # Parse the JSON body into request_type and hand it to handler,
+                                request_type : type    ,                        # so async handlers work on a Request-typed route (as in Routes__Encryption)
+                                handler
+                           ):
+        try:
+            route_request = request_type.from_json(await request.json())
+        except Exception as e:                                                  # bad JSON or a field that fails its Type_Safe check
+            response_context = Schema__GitHub__Response__Context(status_code = Enum__HTTP__Status.BAD_REQUEST_400 ,
+                                                                 error_type  = Enum__Error__Type.INVALID_INPUT    )
+            response_context.errors.append(Safe_Str__Text(f"Invalid request body: {e}"))
+            return JSONResponse(status_code = response_context.status_code.value                          ,
+                                content     = Schema__GitHub__Response(response_context=response_context).json())
+        response = Response()
+        result   = await handler(route_request, response)
+        if isinstance(result, Response):                                        # fan-out answers with its own streaming / error response
+            return result
+        return JSONResponse(status_code = response.status_code ,
+                            content     = result.json()        )
 
     def _decrypt_secret_value(self, encrypted_value: str                        # Decrypt a secret value using service encryption
                               ) -> str:                                         # Returns decrypted plaintext
@@ -280,36 +464,12 @@ class Routes__GitHub__Secrets__Repo(Fast_API__Routes):
             raise ValueError("Failed to decrypt secret value")
         return str(result.decrypted)
 
-    def _populate_rate_limit(self, github_api                            ,      # Populate rate limit info from GitHub API
-                                   response_context: Schema__GitHub__Response__Context
-                             ) -> None:
-        try:
-            rate_limit_data = github_api.get('/rate_limit')
-            rate_info       = rate_limit_data.get('rate', {})
-            response_context.rate_limit = Schema__GitHub__Rate_Limit(limit     = rate_info.get('limit'    ) ,
-                                                                     remaining = rate_info.get('remaining') ,
-                                                                     reset     = rate_info.get('reset'    ) ,
-                                                                     used      = rate_info.get('used'     ) )
-        except Exception:
-            pass                                                                # Rate limit fetch is best-effort
-
-    def _handle_github_error(self, error                                 ,      # Map GitHub errors to response context
-                                   response_context: Schema__GitHub__Response__Context
-                             ) -> None:
-        error_str = str(error)
-        if "401" in error_str:
-            response_context.status_code = Enum__HTTP__Status.UNAUTHORIZED_401
-            response_context.error_type  = Enum__Error__Type.INVALID_PAT
-        elif "403" in error_str and "rate limit" in error_str.lower():
-            response_context.status_code = Enum__HTTP__Status.RATE_LIMITED_429
-            response_context.error_type  = Enum__Error__Type.RATE_LIMITED
-        elif "403" in error_str:
-            response_context.status_code = Enum__HTTP__Status.FORBIDDEN_403
-            response_context.error_type  = Enum__Error__Type.FORBIDDEN
-        elif "404" in error_str:
-            response_context.status_code = Enum__HTTP__Status.NOT_FOUND_404
-            response_context.error_type  = Enum__Error__Type.NOT_FOUND
-        else:
-            response_context.status_code = Enum__HTTP__Status.SERVER_ERROR_500
-            response_context.error_type  = Enum__Error__Type.GITHUB_API_ERROR
-        response_context.errors.append(Safe_Str__Text(f"GitHub API error: {error_str}"))
+    def _duplicate_secret_names(self, items : List                              # Bulk items whose name is repeated (GitHub secret names are case-insensitive)
+                                ) -> List[str]:
+        seen, duplicates = set(), []
+        for item in items:
+            secret_name = str(item.secret_name)
+            if secret_name.upper() in seen and secret_name not in duplicates:
+                duplicates.append(secret_name)
+            seen.add(secret_name.upper())
+        return duplicates
@@ -0,0 +1,126 @@
+from fastapi                                                                             import Response
+from osbot_utils.helpers.duration.decorators.capture_duration                            import capture_duration
+from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text             import Safe_Str__Text
+from osbot_fast_api.api.routes.Fast_API__Routes                                          import Fast_API__Routes
+from mgraph_ai_service_github.config                                                     import GITHUB_API__BULK_WRITE__MAX_WORKERS, GITHUB_API__SYNC__MAX_SCOPES
+from mgraph_ai_service_github.fast_api.dependencies.GitHub__API__From__Header            import GitHub__API__From__Header
+from mgraph_ai_service_github.fast_api.routes.GitHub__Response__Context__Helpers     import handle_github_error, populate_rate_limit
+from mgraph_ai_service_github.schemas.base.Enum__HTTP__Status                            import Enum__HTTP__Status
+from mgraph_ai_service_github.schemas.base.Enum__Error__Type                             import Enum__Error__Type
+from mgraph_ai_service_github.schemas.github.base.Schema__GitHub__Response__Context      import Schema__GitHub__Response__Context
+from mgraph_ai_service_github.schemas.github.sync.Enum__GitHub__Secrets__Sync__Action    import Enum__GitHub__Secrets__Sync__Action
+from mgraph_ai_service_github.schemas.github.sync.Schema__GitHub__Data__Secrets__Sync    import Schema__GitHub__Data__Secrets__Sync
+from mgraph_ai_service_github.schemas.github.sync.Schema__GitHub__Request__Secrets__Sync import Schema__GitHub__Request__Secrets__Sync
+from mgraph_ai_service_github.schemas.github.sync.Schema__GitHub__Response__Secrets__Sync import Schema__GitHub__Response__Secrets__Sync
+from mgraph_ai_service_github.schemas.github.sync.Schema__GitHub__Secrets__Sync__Action  import Schema__GitHub__Secrets__Sync__Action
+from mgraph_ai_service_github.service.github.sync.GitHub__Secrets__Sync                  import GitHub__Secrets__Sync, sync_scope_id, duplicate_scope_ids
+from mgraph_ai_service_github.service.encryption.Service__Encryption                     import Service__Encryption
+
+TAG__ROUTES_GITHUB_SECRETS_SYNC   = 'github-secrets-sync'
+ROUTES_PATHS__GITHUB_SECRETS_SYNC = [ f'/{TAG__ROUTES_GITHUB_SECRETS_SYNC}/plan'  ,
+                                      f'/{TAG__ROUTES_GITHUB_SECRETS_SYNC}/apply' ]
+
+
+class Routes__GitHub__Secrets__Sync(Fast_API__Routes):                          # Declarative secrets sync (plan / apply a desired-state document)
+    tag               : str                       = TAG__ROUTES_GITHUB_SECRETS_SYNC
+    github_api_factory: GitHub__API__From__Header
+    service_encryption: Service__Encryption
+
+    def plan(self, request : Schema__GitHub__Request__Secrets__Sync ,           # Show creates / updates / deletes without writing anything
+                   response: Response
+             ) -> Schema__GitHub__Response__Secrets__Sync:
+        return self._sync(request, response, apply=False)
+
+    def apply(self, request : Schema__GitHub__Request__Secrets__Sync ,          # Compute the plan and apply it (unchanged secrets are not written)
+                    response: Response
+              ) -> Schema__GitHub__Response__Secrets__Sync:
+        return self._sync(request, response, apply=True)
+
+    def setup_routes(self):                                                     # Register all route methods
+        self.add_route_post(self.plan )
+        self.add_route_post(self.apply)
+
+    def _sync(self, request : Schema__GitHub__Request__Secrets__Sync ,
+                    response: Response                               ,
+                    apply   : bool
+              ) -> Schema__GitHub__Response__Secrets__Sync:
+
+        with capture_duration() as duration:
+            response_context = Schema__GitHub__Response__Context()
+            response_data    = Schema__GitHub__Data__Secrets__Sync(applied=apply)
+
+            try:
+                request_data = request.request_data
+                if len(request_data.scopes) > GITHUB_API__SYNC__MAX_SCOPES:
+                    response_context.status_code = Enum__HTTP__Status.BAD_REQUEST_400
+                    response_context.error_type  = Enum__Error__Type.INVALID_INPUT
+                    response_context.errors.append(Safe_Str__Text(f"Too many scopes: {len(request_data.scopes)} (max {GITHUB_API__SYNC__MAX_SCOPES})"))
+                elif self._duplicate_scopes(request_data):
+                    response_context.status_code = Enum__HTTP__Status.BAD_REQUEST_400
+                    response_context.error_type  = Enum__Error__Type.INVALID_INPUT
+                    response_context.errors.append(Safe_Str__Text(f"Duplicate scopes: {', '.join(scope_id.replace('/', ':') for scope_id in self._duplicate_scopes(request_data))}"))     # ':' since Safe_Str__Text drops '/'
+                else:
+                    github_api   = self.github_api_factory.get_api(request.encrypted_pat)
+                    scopes       = self._scopes(request_data)                   # every value is decrypted before anything is listed or written
+                    github_sync  = GitHub__Secrets__Sync(api_token   = github_api.api_token                                                ,
+                                                         api         = github_api                                                          ,
+                                                         max_workers = max(1, min(request_data.max_workers, GITHUB_API__BULK_WRITE__MAX_WORKERS)))
+                    actions      = github_sync.apply(scopes) if apply else github_sync.plan(scopes)
+
+                    for entry in actions:
+                        response_data.actions.append(Schema__GitHub__Secrets__Sync__Action(**entry))
+                        if entry.get('success') is False:
+                            response_data.failed += 1
+                        if   entry['action'] == Enum__GitHub__Secrets__Sync__Action.CREATE   : response_data.creates   += 1
+                        elif entry['action'] == Enum__GitHub__Secrets__Sync__Action.UPDATE   : response_data.updates   += 1
+                        elif entry['action'] == Enum__GitHub__Secrets__Sync__Action.DELETE   : response_data.deletes   += 1
+                        else                                                                 : response_data.unchanged += 1
+
+                    if response_data.failed:
+                        response_context.status_code = Enum__HTTP__Status.SERVER_ERROR_500
+                        response_context.error_type  = Enum__Error__Type.GITHUB_API_ERROR
+                        response_context.errors.append(Safe_Str__Text(f"{response_data.failed} sync actions failed"))
+                    else:
+                        response_context.success     = True
+                        response_context.status_code = Enum__HTTP__Status.OK_200
+                        response_context.messages.append(Safe_Str__Text(f"{response_data.creates} to create, {response_data.updates} to update, "
+                                                                        f"{response_data.deletes} to delete, {response_data.unchanged} unchanged"))
+
+                    populate_rate_limit(github_api, response_context, request.refresh_rate_limit)
+
+            except ValueError as e:
+                response_context.status_code = Enum__HTTP__Status.UNAUTHORIZED_401
+                response_context.error_type  = Enum__Error__Type.DECRYPTION_FAILED
+                response_context.errors.append(Safe_Str__Text(str(e)))
+
+            except Exception as e:
+                handle_github_error(e, response_context)
+
+            finally:
+                response_context.duration = duration.seconds
+
+        response.status_code = response_context.status_code.value
+        return Schema__GitHub__Response__Secrets__Sync(response_context = response_context ,
+                                                       response_data    = response_data    )
+
+    def _scopes(self, request_data) -> list:                                    # Desired-state schemas -> service scopes (plain values)
+        scopes = []
+        for scope in request_data.scopes:
+            scopes.append(dict(owner         = str(scope.owner)                                  ,
+                               repo          = str(scope.repo)                                   ,
+                               environment   = str(scope.environment) if scope.environment else None,
+                               delete_extras = scope.delete_extras                               ,
+                               fingerprints  = {str(name): str(fingerprint) for name, fingerprint in scope.fingerprints.items()},
+                               secrets       = {str(item.secret_name): self._decrypt_secret_value(item.encrypted_value)
+                                                for item in scope.secrets}                       ))
+        return scopes
+
+    def _duplicate_scopes(self, request_data) -> list:                          # Scope ids listed more than once (their desired states would conflict)
+        return duplicate_scope_ids([sync_scope_id(str(scope.owner), str(scope.repo), str(scope.environment) if scope.environment else None)
+                                    for scope in request_data.scopes])
+
+    def _decrypt_secret_value(self, encrypted_value: str) -> str:
+        result = self.service_encryption.decrypt_text(encrypted_value)
+        if not result.success:
+            raise ValueError("Failed to decrypt secret value")
+        return str(result.decrypted)
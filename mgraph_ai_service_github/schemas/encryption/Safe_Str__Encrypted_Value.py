@@ -23,7 +23,10 @@ class Safe_Str__Encrypted_Value(Type_Safe__Primitive, str):
     trim_whitespace = True
 
     def __new__(cls, value):
-        if value:
+        decoded = b''
+        if isinstance(value, Safe_Str__Encrypted_Value):                                    # already validated: keep its decoded bytes
+            decoded = value.decoded_bytes()
+        elif value:
             try:
                 decoded = base64.b64decode(value, validate=True)                            # Check if it's valid base64 by trying to decode
 
@@ -33,4 +36,19 @@ class Safe_Str__Encrypted_Value(Type_Safe__Primitive, str):
             except Exception as e:
                 raise ValueError(f"Invalid base64 encoded encrypted data: {str(e)}")
 
-        return super().__new__(cls, value)
\ No newline at end of file
+        instance          = super().__new__(cls, value)
+        instance._decoded = decoded                                                         # kept so decryption doesn't base64 decode a second time
+        return instance
+
+    def decoded_bytes(self) -> bytes:                                                       # Raw encrypted bytes (decoded once, at validation)
+        decoded = self.__dict__.get('_decoded')
+        if decoded is None:                                                                 # e.g. instance rebuilt without going through __new__
+            decoded = self._decoded = base64.b64decode(str(self))
+        return decoded
+
+
+def decode_encrypted_value(encrypted_value : str                                            # Safe_Str__Encrypted_Value or plain base64 str
+                           ) -> bytes:                                                      # Returns the encrypted bytes (no second decode for validated values)
+    if isinstance(encrypted_value, Safe_Str__Encrypted_Value):
+        return encrypted_value.decoded_bytes()
+    return base64.b64decode(encrypted_value)
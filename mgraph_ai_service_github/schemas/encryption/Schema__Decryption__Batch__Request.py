@@ -0,0 +1,7 @@
+from typing                                                                 import List
+from osbot_utils.type_safe.Type_Safe                                        import Type_Safe
+from mgraph_ai_service_github.schemas.encryption.Schema__Decryption__Request import Schema__Decryption__Request
+
+
+class Schema__Decryption__Batch__Request(Type_Safe):                            # Schema for batch decryption request
+    items : List[Schema__Decryption__Request]                                   # Values to decrypt (results are returned in the same order)
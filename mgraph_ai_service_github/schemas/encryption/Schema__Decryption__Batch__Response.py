@@ -0,0 +1,16 @@
+from typing                                                                         import List, Optional
+from osbot_utils.type_safe.Type_Safe                                                import Type_Safe
+from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text        import Safe_Str__Text
+from osbot_utils.type_safe.primitives.domains.identifiers.safe_int.Timestamp_Now    import Timestamp_Now
+from mgraph_ai_service_github.schemas.base.Enum__HTTP__Status                       import Enum__HTTP__Status
+from mgraph_ai_service_github.schemas.encryption.Schema__Decryption__Batch__Result  import Schema__Decryption__Batch__Result
+
+
+class Schema__Decryption__Batch__Response(Type_Safe):                                   # Schema for batch decryption response
+    results   : List[Schema__Decryption__Batch__Result]                                  # One result per request item, in request order
+    succeeded : int
+    failed    : int
+    error     : Optional[Safe_Str__Text]                = None                          # Set when the whole batch was rejected
+    success   : bool                                    = False                         # True when the batch ran and every item succeeded
+    status_code : Enum__HTTP__Status                    = Enum__HTTP__Status.OK_200     # 400 / 413 / 500 when the whole batch was rejected (per-item errors stay 200)
+    timestamp : Timestamp_Now
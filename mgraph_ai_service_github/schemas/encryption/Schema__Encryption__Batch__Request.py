@@ -0,0 +1,7 @@
+from typing                                                                 import List
+from osbot_utils.type_safe.Type_Safe                                        import Type_Safe
+from mgraph_ai_service_github.schemas.encryption.Schema__Encryption__Request import Schema__Encryption__Request
+
+
+class Schema__Encryption__Batch__Request(Type_Safe):                            # Schema for batch encryption request
+    items : List[Schema__Encryption__Request]                                   # Values to encrypt (results are returned in the same order)
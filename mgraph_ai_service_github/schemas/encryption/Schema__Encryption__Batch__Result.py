@@ -0,0 +1,11 @@
+from typing                                                                     import Optional
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text    import Safe_Str__Text
+from mgraph_ai_service_github.schemas.encryption.Safe_Str__Encrypted_Value      import Safe_Str__Encrypted_Value
+
+
+class Schema__Encryption__Batch__Result(Type_Safe):                             # Outcome of one item in a batch encryption
+    index     : int                                                             # Position of the item in the request
+    success   : bool                                = False
+    encrypted : Optional[Safe_Str__Encrypted_Value] = None                      # Base64 encoded encrypted data
+    error     : Optional[Safe_Str__Text]            = None                      # Why this item failed (other items are unaffected)
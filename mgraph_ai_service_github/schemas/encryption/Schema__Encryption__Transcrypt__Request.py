@@ -0,0 +1,15 @@
+from typing                                                                                    import List, Optional
+from osbot_utils.type_safe.Type_Safe                                                           import Type_Safe
+from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text                   import Safe_Str__Text
+from osbot_utils.type_safe.primitives.domains.git.github.safe_str.Safe_Str__GitHub__Repo_Owner import Safe_Str__GitHub__Repo_Owner
+from osbot_utils.type_safe.primitives.domains.git.github.safe_str.Safe_Str__GitHub__Repo_Name  import Safe_Str__GitHub__Repo_Name
+from mgraph_ai_service_github.schemas.encryption.Safe_Str__Encrypted_Value                     import Safe_Str__Encrypted_Value
+
+
+class Schema__Encryption__Transcrypt__Request(Type_Safe):                       # Re-seal service-encrypted values to a GitHub secrets scope key
+    encrypted_pat    : Safe_Str__Encrypted_Value                                # NaCl-encrypted GitHub PAT (used to fetch the scope public key)
+    owner            : Optional[Safe_Str__GitHub__Repo_Owner] = None            # Repository owner (repo / environment scope)
+    repo             : Optional[Safe_Str__GitHub__Repo_Name ] = None            # Repository name  (repo / environment scope)
+    environment      : Optional[Safe_Str__Text              ] = None            # Environment name (environment scope)
+    org              : Optional[Safe_Str__GitHub__Repo_Owner] = None            # Organization name (org scope, without owner / repo)
+    encrypted_values : List[Safe_Str__Encrypted_Value]                          # Values encrypted with the server's public key
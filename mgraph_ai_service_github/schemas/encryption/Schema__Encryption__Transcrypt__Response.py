@@ -0,0 +1,16 @@
+from typing                                                                             import List, Optional
+from osbot_utils.type_safe.Type_Safe                                                    import Type_Safe
+from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text            import Safe_Str__Text
+from osbot_utils.type_safe.primitives.domains.identifiers.safe_int.Timestamp_Now        import Timestamp_Now
+from mgraph_ai_service_github.schemas.encryption.Schema__Encryption__Transcrypt__Result import Schema__Encryption__Transcrypt__Result
+
+
+class Schema__Encryption__Transcrypt__Response(Type_Safe):                              # Schema for transcrypt response
+    scope     : Optional[str]                           = None                          # repo:/env:/org: scope the values were sealed to (plain str: Safe_Str__Text rewrites '/')
+    key_id    : Optional[Safe_Str__Text]                = None                          # GitHub key_id of that scope's public key
+    results   : List[Schema__Encryption__Transcrypt__Result]                             # One result per value, in request order
+    succeeded : int
+    failed    : int
+    error     : Optional[Safe_Str__Text]                = None                          # Set when the whole request was rejected
+    success   : bool                                    = False
+    timestamp : Timestamp_Now
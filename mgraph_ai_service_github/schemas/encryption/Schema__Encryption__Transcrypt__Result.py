@@ -0,0 +1,12 @@
+from typing                                                                     import Optional
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text    import Safe_Str__Text
+from mgraph_ai_service_github.schemas.encryption.Safe_Str__Encrypted_Value      import Safe_Str__Encrypted_Value
+
+
+class Schema__Encryption__Transcrypt__Result(Type_Safe):                        # Outcome of one transcrypted value
+    index           : int                                                       # Position of the value in the request
+    success         : bool                                = False
+    encrypted_value : Optional[Safe_Str__Encrypted_Value] = None                # Sealed to the scope key: ready for GitHub's PUT body
+    key_id          : Optional[Safe_Str__Text]            = None                # GitHub key_id to send alongside encrypted_value
+    error           : Optional[Safe_Str__Text]            = None
@@ -6,5 +6,6 @@ from mgraph_ai_service_github.schemas.encryption.Const__Encryption
 
 class Schema__Public_Key__Response(Type_Safe):
     public_key : Optional[Safe_Str__NaCl__Public_Key] = None
+    key_id     : Optional[str]                        = None                    # hex fingerprint that prefixes envelopes sealed to this key
     algorithm  : str                                  = NCCL__ALGORITHM
     timestamp  : Timestamp_Now
\ No newline at end of file
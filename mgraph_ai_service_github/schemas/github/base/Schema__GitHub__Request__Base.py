@@ -5,5 +5,6 @@ from mgraph_ai_service_github.schemas.encryption.Safe_Str__Encrypted_Value  impo
 
 
 class Schema__GitHub__Request__Base(Type_Safe):                                 # Base request schema for all GitHub operations
-    encrypted_pat: Safe_Str__Encrypted_Value                                    # NaCl-encrypted GitHub PAT (base64 encoded)
-    request_data : Optional[Schema__Request__Data] = None                       # Operation-specific request data
+    encrypted_pat      : Safe_Str__Encrypted_Value                              # NaCl-encrypted GitHub PAT (base64 encoded)
+    request_data       : Optional[Schema__Request__Data] = None                 # Operation-specific request data
+    refresh_rate_limit : bool                            = False                # Force a fresh GET /rate_limit (default: snapshot from response headers)
@@ -0,0 +1,13 @@
+from typing                                                                                    import Optional
+from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text                   import Safe_Str__Text
+from osbot_utils.type_safe.primitives.domains.git.github.safe_str.Safe_Str__GitHub__Repo_Owner import Safe_Str__GitHub__Repo_Owner
+from mgraph_ai_service_github.config                                                           import GITHUB_API__INVENTORY__MAX_WORKERS, GITHUB_API__INVENTORY__RATE_LIMIT_RESERVE
+from mgraph_ai_service_github.schemas.base.Schema__Request__Data                               import Schema__Request__Data
+
+
+class Schema__GitHub__Data__Request__Secrets__Inventory(Schema__Request__Data): # Request data for an org-wide secrets inventory
+    org                 : Safe_Str__GitHub__Repo_Owner                          # Organisation (or user) to crawl
+    checkpoint          : Optional[Safe_Str__Text] = None                       # Resume point returned by an interrupted crawl
+    include_environments: bool = True                                           # Also list environments and their secrets
+    max_workers         : int  = GITHUB_API__INVENTORY__MAX_WORKERS             # Repos crawled concurrently (capped by the service)
+    rate_limit_reserve  : int  = GITHUB_API__INVENTORY__RATE_LIMIT_RESERVE      # Remaining requests to leave untouched
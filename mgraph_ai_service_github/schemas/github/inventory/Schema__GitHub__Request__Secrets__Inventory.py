@@ -0,0 +1,6 @@
+from mgraph_ai_service_github.schemas.github.base.Schema__GitHub__Request__Base                        import Schema__GitHub__Request__Base
+from mgraph_ai_service_github.schemas.github.inventory.Schema__GitHub__Data__Request__Secrets__Inventory import Schema__GitHub__Data__Request__Secrets__Inventory
+
+
+class Schema__GitHub__Request__Secrets__Inventory(Schema__GitHub__Request__Base):   # Request schema for an org-wide secrets inventory
+    request_data: Schema__GitHub__Data__Request__Secrets__Inventory                 # Org, checkpoint and crawl options
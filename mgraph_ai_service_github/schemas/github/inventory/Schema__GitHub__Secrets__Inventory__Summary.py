@@ -0,0 +1,16 @@
+from typing                                                                  import Optional
+from osbot_utils.type_safe.Type_Safe                                         import Type_Safe
+from mgraph_ai_service_github.schemas.github.base.Schema__GitHub__Rate_Limit import Schema__GitHub__Rate_Limit
+
+
+class Schema__GitHub__Secrets__Inventory__Summary(Type_Safe):                   # Last NDJSON line of an inventory stream
+    org                 : str                                                   # Organisation crawled
+    repos               : int                                                   # Repos inventoried by this request
+    org_secrets         : int                                                   # Org secrets found
+    repo_secrets        : int                                                   # Repository secrets found
+    environment_secrets : int                                                   # Environment secrets found
+    errors              : int                                                   # Scopes that could not be read
+    complete            : bool          = False                                 # True when every repo was crawled
+    checkpoint          : Optional[str] = None                                  # Pass back as request_data.checkpoint to resume
+    duration            : float         = 0.0                                   # Total seconds
+    rate_limit          : Optional[Schema__GitHub__Rate_Limit] = None           # Snapshot after the last call
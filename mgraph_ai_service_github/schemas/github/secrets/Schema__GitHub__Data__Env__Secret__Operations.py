@@ -4,7 +4,9 @@ from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Secret__Met
 
 
 class Schema__GitHub__Data__Env__Secrets__List(Schema__Response__Data):         # Response data for listing env secrets
-    secrets: List[Schema__GitHub__Secret__Metadata]
+    secrets  : List[Schema__GitHub__Secret__Metadata]
+    page     : int           = 1                                                # Page returned
+    next_page: Optional[int] = None                                             # Page to ask for next (None on the last page)
 
 
 class Schema__GitHub__Data__Env__Secret__Get(Schema__Response__Data):           # Response data for getting an env secret
@@ -1,6 +1,7 @@
 from osbot_utils.type_safe.primitives.domains.git.github.safe_str.Safe_Str__GitHub__Repo_Owner import Safe_Str__GitHub__Repo_Owner
 from osbot_utils.type_safe.primitives.domains.git.github.safe_str.Safe_Str__GitHub__Repo_Name  import Safe_Str__GitHub__Repo_Name
 from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text                   import Safe_Str__Text
+from mgraph_ai_service_github.config                                                           import GITHUB_API__PER_PAGE
 from mgraph_ai_service_github.schemas.base.Schema__Request__Data                               import Schema__Request__Data
 
 
@@ -8,3 +9,5 @@ class Schema__GitHub__Data__Request__Env__Secrets__List(Schema__Request__Data):
     owner      : Safe_Str__GitHub__Repo_Owner                                   # Repository owner
     repo       : Safe_Str__GitHub__Repo_Name                                    # Repository name
     environment: Safe_Str__Text                   = None                        # Environment name  # todo: see what better Schema we shouldbe using here
+    page       : int                              = 1                           # 1-based page to return
+    per_page   : int                              = GITHUB_API__PER_PAGE        # Secrets per page (capped at GitHub's maximum of 100)
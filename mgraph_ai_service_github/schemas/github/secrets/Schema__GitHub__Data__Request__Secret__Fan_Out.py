@@ -0,0 +1,14 @@
+from typing                                                                                 import List
+from mgraph_ai_service_github.config                                                        import GITHUB_API__FAN_OUT__MAX_WORKERS, GITHUB_API__FAN_OUT__RATE_LIMIT_RESERVE
+from mgraph_ai_service_github.schemas.base.Schema__Request__Data                            import Schema__Request__Data
+from mgraph_ai_service_github.schemas.encryption.Safe_Str__Encrypted_Value                  import Safe_Str__Encrypted_Value
+from mgraph_ai_service_github.schemas.github.safe_str.Safe_Str__GitHub__Secret_Name         import Safe_Str__GitHub__Secret_Name
+from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Secret__Fan_Out__Target import Schema__GitHub__Secret__Fan_Out__Target
+
+
+class Schema__GitHub__Data__Request__Secret__Fan_Out(Schema__Request__Data):    # Request data for writing one secret to many repos / environments
+    secret_name       : Safe_Str__GitHub__Secret_Name                           # Name of the secret (same in every target)
+    encrypted_value   : Safe_Str__Encrypted_Value                               # Secret value encrypted with server's public key
+    targets           : List[Schema__GitHub__Secret__Fan_Out__Target]           # Destinations
+    max_workers       : int = GITHUB_API__FAN_OUT__MAX_WORKERS                  # Concurrent writes (capped by the service)
+    rate_limit_reserve: int = GITHUB_API__FAN_OUT__RATE_LIMIT_RESERVE           # Remaining requests to leave untouched
@@ -0,0 +1,13 @@
+from typing                                                                             import List
+from osbot_utils.type_safe.primitives.domains.git.github.safe_str.Safe_Str__GitHub__Repo_Owner import Safe_Str__GitHub__Repo_Owner
+from osbot_utils.type_safe.primitives.domains.git.github.safe_str.Safe_Str__GitHub__Repo_Name  import Safe_Str__GitHub__Repo_Name
+from mgraph_ai_service_github.config                                                    import GITHUB_API__BULK_WRITE__MAX_WORKERS
+from mgraph_ai_service_github.schemas.base.Schema__Request__Data                        import Schema__Request__Data
+from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Secret__Bulk_Item  import Schema__GitHub__Secret__Bulk_Item
+
+
+class Schema__GitHub__Data__Request__Secrets__Bulk_Set(Schema__Request__Data):  # Request data for setting many repository secrets at once
+    owner      : Safe_Str__GitHub__Repo_Owner                                   # Repository owner
+    repo       : Safe_Str__GitHub__Repo_Name                                    # Repository name
+    secrets    : List[Schema__GitHub__Secret__Bulk_Item]                        # Secrets to create or update
+    max_workers: int = GITHUB_API__BULK_WRITE__MAX_WORKERS                      # Concurrent PUTs (capped by the service)
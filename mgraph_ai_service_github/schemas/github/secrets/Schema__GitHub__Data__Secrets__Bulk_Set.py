@@ -0,0 +1,9 @@
+from typing                                                                              import List
+from mgraph_ai_service_github.schemas.base.Schema__Response__Data                        import Schema__Response__Data
+from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Secret__Bulk_Result import Schema__GitHub__Secret__Bulk_Result
+
+
+class Schema__GitHub__Data__Secrets__Bulk_Set(Schema__Response__Data):          # Response data for a bulk secrets write
+    results  : List[Schema__GitHub__Secret__Bulk_Result]                        # Per-secret outcome, in request order
+    succeeded: int                                                              # Number of secrets written
+    failed   : int                                                              # Number of secrets that failed
@@ -0,0 +1,6 @@
+from mgraph_ai_service_github.schemas.github.base.Schema__GitHub__Request__Base                      import Schema__GitHub__Request__Base
+from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Data__Request__Secret__Fan_Out import Schema__GitHub__Data__Request__Secret__Fan_Out
+
+
+class Schema__GitHub__Request__Secret__Fan_Out(Schema__GitHub__Request__Base):  # Request schema for writing one secret to many repos / environments
+    request_data: Schema__GitHub__Data__Request__Secret__Fan_Out                # Secret name, encrypted value and targets
@@ -0,0 +1,6 @@
+from mgraph_ai_service_github.schemas.github.base.Schema__GitHub__Request__Base                       import Schema__GitHub__Request__Base
+from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Data__Request__Secrets__Bulk_Set import Schema__GitHub__Data__Request__Secrets__Bulk_Set
+
+
+class Schema__GitHub__Request__Secrets__Bulk_Set(Schema__GitHub__Request__Base): # Request schema for setting many repository secrets at once
+    request_data: Schema__GitHub__Data__Request__Secrets__Bulk_Set              # Owner, repo and the encrypted secrets
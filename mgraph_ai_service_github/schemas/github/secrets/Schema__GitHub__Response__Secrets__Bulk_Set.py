@@ -0,0 +1,7 @@
+from typing                                                                              import Optional
+from mgraph_ai_service_github.schemas.github.base.Schema__GitHub__Response               import Schema__GitHub__Response
+from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Data__Secrets__Bulk_Set import Schema__GitHub__Data__Secrets__Bulk_Set
+
+
+class Schema__GitHub__Response__Secrets__Bulk_Set(Schema__GitHub__Response):    # Response schema for a bulk secrets write
+    response_data: Optional[Schema__GitHub__Data__Secrets__Bulk_Set] = None     # Per-secret results or None on failure
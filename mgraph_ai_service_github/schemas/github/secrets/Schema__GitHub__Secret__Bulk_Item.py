@@ -0,0 +1,8 @@
+from osbot_utils.type_safe.Type_Safe                                                import Type_Safe
+from mgraph_ai_service_github.schemas.encryption.Safe_Str__Encrypted_Value          import Safe_Str__Encrypted_Value
+from mgraph_ai_service_github.schemas.github.safe_str.Safe_Str__GitHub__Secret_Name import Safe_Str__GitHub__Secret_Name
+
+
+class Schema__GitHub__Secret__Bulk_Item(Type_Safe):                             # One secret in a bulk-set request
+    secret_name    : Safe_Str__GitHub__Secret_Name                              # Name of the secret
+    encrypted_value: Safe_Str__Encrypted_Value                                  # Secret value encrypted with server's public key
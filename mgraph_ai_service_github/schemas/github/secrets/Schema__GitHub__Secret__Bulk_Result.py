@@ -0,0 +1,11 @@
+from typing                                                                         import Optional
+from osbot_utils.type_safe.Type_Safe                                                import Type_Safe
+from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text        import Safe_Str__Text
+from mgraph_ai_service_github.schemas.github.safe_str.Safe_Str__GitHub__Secret_Name import Safe_Str__GitHub__Secret_Name
+
+
+class Schema__GitHub__Secret__Bulk_Result(Type_Safe):                           # Outcome of one secret in a bulk-set request
+    secret_name: Optional[Safe_Str__GitHub__Secret_Name] = None                 # Name of the secret
+    success    : bool                                    = False                # Whether the PUT succeeded
+    duration   : float                                   = 0.0                  # Seconds spent on this secret's PUT
+    error      : Optional[Safe_Str__Text]                = None                 # Failure reason (None on success)
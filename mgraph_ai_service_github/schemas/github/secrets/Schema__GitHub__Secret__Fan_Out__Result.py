@@ -0,0 +1,13 @@
+from typing                                                                  import Optional
+from osbot_utils.type_safe.Type_Safe                                         import Type_Safe
+from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text import Safe_Str__Text
+
+
+class Schema__GitHub__Secret__Fan_Out__Result(Type_Safe):                       # Outcome for one fan-out target (one NDJSON line)
+    owner      : Optional[Safe_Str__Text] = None
+    repo       : Optional[Safe_Str__Text] = None
+    environment: Optional[Safe_Str__Text] = None
+    success    : bool                     = False                               # Whether the PUT succeeded
+    skipped    : bool                     = False                               # Not attempted (rate limit reserve reached)
+    duration   : float                    = 0.0                                 # Seconds spent on this target
+    error      : Optional[Safe_Str__Text] = None                                # Failure reason (None on success)
@@ -0,0 +1,12 @@
+from typing                                                                  import Optional
+from osbot_utils.type_safe.Type_Safe                                         import Type_Safe
+from mgraph_ai_service_github.schemas.github.base.Schema__GitHub__Rate_Limit import Schema__GitHub__Rate_Limit
+
+
+class Schema__GitHub__Secret__Fan_Out__Summary(Type_Safe):                      # Last NDJSON line of a fan-out stream
+    targets   : int                                                             # Number of targets requested
+    succeeded : int                                                             # Targets written
+    failed    : int                                                             # Targets that failed
+    skipped   : int                                                             # Targets not attempted (rate limit reserve)
+    duration  : float = 0.0                                                     # Total seconds
+    rate_limit: Optional[Schema__GitHub__Rate_Limit] = None                     # Snapshot after the last write
@@ -0,0 +1,11 @@
+from typing                                                                                    import Optional
+from osbot_utils.type_safe.Type_Safe                                                           import Type_Safe
+from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text                   import Safe_Str__Text
+from osbot_utils.type_safe.primitives.domains.git.github.safe_str.Safe_Str__GitHub__Repo_Owner import Safe_Str__GitHub__Repo_Owner
+from osbot_utils.type_safe.primitives.domains.git.github.safe_str.Safe_Str__GitHub__Repo_Name  import Safe_Str__GitHub__Repo_Name
+
+
+class Schema__GitHub__Secret__Fan_Out__Target(Type_Safe):                       # One destination of a fan-out write
+    owner      : Safe_Str__GitHub__Repo_Owner                                   # Repository owner
+    repo       : Safe_Str__GitHub__Repo_Name                                    # Repository name
+    environment: Optional[Safe_Str__Text] = None                                # Environment name (None for a repository secret)
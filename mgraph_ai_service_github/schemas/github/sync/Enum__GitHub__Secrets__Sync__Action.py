@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class Enum__GitHub__Secrets__Sync__Action(Enum):                                # What a sync plan does with one secret
+    CREATE    = "create"                                                        # desired, missing on GitHub
+    UPDATE    = "update"                                                        # desired, exists, value changed (or unknown)
+    DELETE    = "delete"                                                        # exists, not desired (only when delete_extras)
+    UNCHANGED = "unchanged"                                                     # last value we wrote, untouched since
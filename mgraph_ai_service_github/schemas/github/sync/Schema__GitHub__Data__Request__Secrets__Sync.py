@@ -0,0 +1,9 @@
+from typing                                                                         import List
+from mgraph_ai_service_github.config                                                import GITHUB_API__BULK_WRITE__MAX_WORKERS
+from mgraph_ai_service_github.schemas.base.Schema__Request__Data                    import Schema__Request__Data
+from mgraph_ai_service_github.schemas.github.sync.Schema__GitHub__Secrets__Sync__Scope import Schema__GitHub__Secrets__Sync__Scope
+
+
+class Schema__GitHub__Data__Request__Secrets__Sync(Schema__Request__Data):      # Request data for sync plan / apply
+    scopes     : List[Schema__GitHub__Secrets__Sync__Scope]                     # Desired-state document
+    max_workers: int = GITHUB_API__BULK_WRITE__MAX_WORKERS                      # Concurrent listings / writes (capped by the service)
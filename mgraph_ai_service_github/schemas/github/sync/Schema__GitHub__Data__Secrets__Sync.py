@@ -0,0 +1,13 @@
+from typing                                                                            import List
+from mgraph_ai_service_github.schemas.base.Schema__Response__Data                      import Schema__Response__Data
+from mgraph_ai_service_github.schemas.github.sync.Schema__GitHub__Secrets__Sync__Action import Schema__GitHub__Secrets__Sync__Action
+
+
+class Schema__GitHub__Data__Secrets__Sync(Schema__Response__Data):              # Response data for sync plan / apply
+    actions  : List[Schema__GitHub__Secrets__Sync__Action]                      # One entry per desired or extra secret
+    applied  : bool = False                                                     # False for plan, True for apply
+    creates  : int
+    updates  : int
+    deletes  : int
+    unchanged: int
+    failed   : int                                                              # Entries whose apply failed
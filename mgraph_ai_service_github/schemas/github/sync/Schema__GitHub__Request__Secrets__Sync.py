@@ -0,0 +1,6 @@
+from mgraph_ai_service_github.schemas.github.base.Schema__GitHub__Request__Base                 import Schema__GitHub__Request__Base
+from mgraph_ai_service_github.schemas.github.sync.Schema__GitHub__Data__Request__Secrets__Sync import Schema__GitHub__Data__Request__Secrets__Sync
+
+
+class Schema__GitHub__Request__Secrets__Sync(Schema__GitHub__Request__Base):    # Request schema for sync plan / apply
+    request_data: Schema__GitHub__Data__Request__Secrets__Sync                  # Desired-state document
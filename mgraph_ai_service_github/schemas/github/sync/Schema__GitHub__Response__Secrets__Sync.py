@@ -0,0 +1,7 @@
+from typing                                                                          import Optional
+from mgraph_ai_service_github.schemas.github.base.Schema__GitHub__Response           import Schema__GitHub__Response
+from mgraph_ai_service_github.schemas.github.sync.Schema__GitHub__Data__Secrets__Sync import Schema__GitHub__Data__Secrets__Sync
+
+
+class Schema__GitHub__Response__Secrets__Sync(Schema__GitHub__Response):        # Response schema for sync plan / apply
+    response_data: Optional[Schema__GitHub__Data__Secrets__Sync] = None         # Plan (and results) or None on failure
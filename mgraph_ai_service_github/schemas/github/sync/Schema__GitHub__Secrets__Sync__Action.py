@@ -0,0 +1,18 @@
+from typing                                                                          import Optional
+from osbot_utils.type_safe.Type_Safe                                                 import Type_Safe
+from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text         import Safe_Str__Text
+from mgraph_ai_service_github.schemas.github.safe_str.Safe_Str__GitHub__Secret_Name  import Safe_Str__GitHub__Secret_Name
+from mgraph_ai_service_github.schemas.github.sync.Enum__GitHub__Secrets__Sync__Action import Enum__GitHub__Secrets__Sync__Action
+
+
+class Schema__GitHub__Secrets__Sync__Action(Type_Safe):                         # One plan entry (and its outcome after apply)
+    owner      : Optional[Safe_Str__Text]                = None
+    repo       : Optional[Safe_Str__Text]                = None
+    environment: Optional[Safe_Str__Text]                = None
+    secret_name: Optional[Safe_Str__GitHub__Secret_Name] = None
+    action     : Enum__GitHub__Secrets__Sync__Action     = Enum__GitHub__Secrets__Sync__Action.UNCHANGED
+    success    : Optional[bool]                          = None                 # None in a plan, set by apply
+    duration   : float                                   = 0.0                  # Seconds spent applying this entry
+    error      : Optional[Safe_Str__Text]                = None                 # Failure reason (None on success)
+    fingerprint: Optional[Safe_Str__Text]                = None                 # Unchanged / written secrets: send back in the scope's fingerprints so any instance can skip it next time
+    updated_at : Optional[Safe_Str__Text]                = None                 # GitHub's updated_at when planned (after apply: once the write is confirmed)
@@ -0,0 +1,16 @@
+from typing                                                                                    import Dict, List, Optional
+from osbot_utils.type_safe.Type_Safe                                                           import Type_Safe
+from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text                   import Safe_Str__Text
+from osbot_utils.type_safe.primitives.domains.git.github.safe_str.Safe_Str__GitHub__Repo_Owner import Safe_Str__GitHub__Repo_Owner
+from osbot_utils.type_safe.primitives.domains.git.github.safe_str.Safe_Str__GitHub__Repo_Name  import Safe_Str__GitHub__Repo_Name
+from mgraph_ai_service_github.schemas.github.safe_str.Safe_Str__GitHub__Secret_Name            import Safe_Str__GitHub__Secret_Name
+from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Secret__Bulk_Item         import Schema__GitHub__Secret__Bulk_Item
+
+
+class Schema__GitHub__Secrets__Sync__Scope(Type_Safe):                          # Desired state of one repository (or environment)
+    owner        : Safe_Str__GitHub__Repo_Owner                                 # Repository owner
+    repo         : Safe_Str__GitHub__Repo_Name                                  # Repository name
+    environment  : Optional[Safe_Str__Text] = None                              # Environment name (None for repository secrets)
+    secrets      : List[Schema__GitHub__Secret__Bulk_Item]                      # Desired secrets (encrypted with server's public key)
+    delete_extras: bool = False                                                 # Delete secrets that exist on GitHub but are not listed
+    fingerprints : Dict[Safe_Str__GitHub__Secret_Name, Safe_Str__Text]          # Fingerprints returned by an earlier plan / apply (optional)
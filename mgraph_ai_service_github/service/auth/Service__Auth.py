@@ -1,26 +1,45 @@
 import base64
 import nacl.utils
 import nacl.exceptions
-from typing                                              import Dict
+from typing                                              import Dict, Tuple
 from nacl.public                                         import PrivateKey, PublicKey, SealedBox
 from osbot_utils.decorators.methods.cache_on_self        import cache_on_self
 from osbot_utils.type_safe.Type_Safe                     import Type_Safe
 from osbot_utils.utils.Env                               import get_env
-from mgraph_ai_service_github.config import ENV_VAR__SERVICE__AUTH__PRIVATE_KEY, ENV_VAR__SERVICE__AUTH__PUBLIC_KEY, SERVICE_NAME
+from mgraph_ai_service_github.config import ENV_VAR__SERVICE__AUTH__PRIVATE_KEY, ENV_VAR__SERVICE__AUTH__PUBLIC_KEY, ENV_VAR__SERVICE__AUTH__PREVIOUS_PRIVATE_KEYS, SERVICE_NAME
+from mgraph_ai_service_github.schemas.encryption.Safe_Str__Encrypted_Value import decode_encrypted_value
+from mgraph_ai_service_github.service.encryption.NaCl__Keyring import NaCl__Keyring, envelope, key_fingerprint
+from mgraph_ai_service_github.service.encryption.NaCl__Sealed_Box__Cache import nacl_sealed_box_cache
 from mgraph_ai_service_github.service.github.GitHub__API import GitHub__API
+from mgraph_ai_service_github.service.auth.Service__Auth__PAT__Cache import Service__Auth__PAT__Cache, Service__Auth__PAT__Cache__Entry, service_auth_pat_cache
+from mgraph_ai_service_github.service.auth.Service__Auth__Session   import Service__Auth__Session
+from mgraph_ai_service_github.service.auth.Service__Auth__Validation__Cache import Service__Auth__Validation__Cache, service_auth_validation_cache
+from mgraph_ai_service_github.service.github.rate_limit.GitHub__Rate_Limit__Tracker import rate_limit_from_headers
 from mgraph_ai_service_github.utils.Version import version__mgraph_ai_service_github
 
 
 class Service__Auth(Type_Safe):
-    private_key_hex : str = None
-    public_key_hex  : str = None
+    private_key_hex       : str = None
+    public_key_hex        : str = None
+    previous_private_keys : str = None                                          # comma separated keys from earlier deploys (decrypt only)
+    pat_cache       : Service__Auth__PAT__Cache = None                          # process-wide by default, shared across requests
+    validation_cache: Service__Auth__Validation__Cache = None                   # successful /user + /rate_limit lookups, per PAT (process-wide by default)
+    session         : Service__Auth__Session                                    # SecretBox session tokens (accepted wherever an encrypted PAT is)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        if not self.pat_cache:
+            self.pat_cache = service_auth_pat_cache
+        if not self.validation_cache:
+            self.validation_cache = service_auth_validation_cache
         if not self.private_key_hex:
             self.private_key_hex = get_env(ENV_VAR__SERVICE__AUTH__PRIVATE_KEY, '')
         if not self.public_key_hex:
             self.public_key_hex = get_env(ENV_VAR__SERVICE__AUTH__PUBLIC_KEY, '')
+        if self.previous_private_keys is None:
+            self.previous_private_keys = get_env(ENV_VAR__SERVICE__AUTH__PREVIOUS_PRIVATE_KEYS, '')
+        if self.private_key_hex:
+            self.session.private_key_hex = self.private_key_hex                 # session key derives from this service's key (unless one is provisioned)
 
     @cache_on_self
     def private_key(self) -> PrivateKey:                                        # Load and cache the private key object
@@ -49,15 +68,51 @@ class Service__Auth(Type_Safe):
             raise ValueError("Public key not configured - SERVICE__AUTH__PUBLIC_KEY environment variable is missing")
         return self.public_key_hex
 
-    def decrypt_pat(self, encrypted_pat : str                                   # Base64 encoded encrypted PAT
+    @cache_on_self
+    def keyring(self) -> NaCl__Keyring:                                         # Current key + previous deploys' keys (tokens survive key rotation)
+        current_public_key = bytes(self.private_key().public_key).hex()
+        return NaCl__Keyring().add(self.private_key_hex, current_public_key).add_previous(self.previous_private_keys)
+
+    @cache_on_self
+    def key_id(self) -> bytes:                                                  # Identity of the private key (part of every PAT cache key)
+        return bytes(self.private_key().public_key)
+
+    def decrypt_pat(self, encrypted_pat : str                                   # Base64 encoded encrypted PAT (or session token)
                     ) -> str:                                                    # Returns the decrypted PAT
+        if encrypted_pat and self.session.is_session_token(encrypted_pat):
+            return self.session.open(encrypted_pat)
+        return self.github_api(encrypted_pat).api_token
+
+    def github_api(self, encrypted_pat : str                                    # Base64 encoded encrypted PAT (or session token)
+                   ) -> GitHub__API:                                            # Returns the GitHub__API cached with the decrypted PAT
+        if encrypted_pat and self.session.is_session_token(encrypted_pat):      # SecretBox open is cheap and checks the expiry, so these skip the PAT cache
+            return GitHub__API(api_token=self.session.open(encrypted_pat))
+        github_api = self.pat_entry(encrypted_pat).github_api
+        if github_api is None:                                                  # entry was evicted between the lookup and here
+            github_api = GitHub__API(api_token=self._decrypt_pat(encrypted_pat))
+        return github_api
+
+    def pat_entry(self, encrypted_pat : str                                     # Base64 encoded encrypted PAT
+                  ) -> Service__Auth__PAT__Cache__Entry:                        # Cached entry (SealedBox decrypt only on a miss)
         if not encrypted_pat:
             raise ValueError("Missing encrypted PAT")
-
+        return self.pat_cache.get_or_decrypt(self.key_id(), encrypted_pat, self._decrypt_pat)
+
+    def session_create(self, encrypted_pat : str                                # Base64 encoded encrypted PAT (session tokens are not renewable)
+                       ) -> Dict:                                               # Returns the session token and its expiry
+        if encrypted_pat and self.session.is_session_token(encrypted_pat):
+            raise ValueError("Session tokens can only be created from an encrypted PAT")
+        session_token, expires_at = self.session.create(self.github_api(encrypted_pat).api_token)
+        return { "session_token" : session_token     ,
+                 "expires_at"    : expires_at        ,
+                 "expires_in"    : self.session.ttl  }
+
+    def _decrypt_pat(self, encrypted_pat : str                                  # Base64 encoded encrypted PAT
+                     ) -> str:                                                  # Returns the decrypted PAT (no cache)
         try:
-            encrypted_bytes = base64.b64decode(encrypted_pat)
-            sealed_box      = SealedBox(self.private_key())
-            decrypted_pat   = sealed_box.decrypt(encrypted_bytes)
+            encrypted_bytes = decode_encrypted_value(encrypted_pat)                  # no second decode when the PAT came in as a Safe_Str__Encrypted_Value
+            decrypted_pat   = self.keyring().open(encrypted_bytes,                      # key picked by the envelope's fingerprint
+                                                  lambda keys, sealed: nacl_sealed_box_cache.for_private_key(keys.private_key).decrypt(sealed))
 
             return decrypted_pat.decode('utf-8')
 
@@ -89,52 +144,7 @@ class Service__Auth(Type_Safe):
             response["error_type"] = "DECRYPTION_FAILED"
             return response
 
-        try:
-            github_api      = GitHub__API(api_token=decrypted_pat)
-            user_data       = github_api.get('/user')
-            rate_limit_data = github_api.get('/rate_limit')
-
-            response["success"] = True
-            response["user"]    = { "login"                     : user_data.get("login")                      ,
-                                    "id"                        : user_data.get("id")                          ,
-                                    "name"                      : user_data.get("name")                        ,
-                                    "email"                     : user_data.get("email")                       ,
-                                    "company"                   : user_data.get("company")                    ,
-                                    "created_at"                : user_data.get("created_at")                 ,
-                                    "public_repos"              : user_data.get("public_repos")               ,
-                                    "total_private_repos"       : user_data.get("total_private_repos")        ,
-                                    "owned_private_repos"       : user_data.get("owned_private_repos")        ,
-                                    "collaborators"             : user_data.get("collaborators")              ,
-                                    "two_factor_authentication" : user_data.get("two_factor_authentication")  ,
-                                    "plan"                      : { "name"          : user_data.get("plan", {}).get("name")         ,
-                                                                    "space"         : user_data.get("plan", {}).get("space")        ,
-                                                                    "private_repos" : user_data.get("plan", {}).get("private_repos")} if user_data.get("plan") else None}
-
-            response["rate_limit"] = { "limit"     : rate_limit_data.get("rate", {}).get("limit")     ,
-                                       "remaining" : rate_limit_data.get("rate", {}).get("remaining") ,
-                                       "reset"     : rate_limit_data.get("rate", {}).get("reset")     ,
-                                       "used"      : rate_limit_data.get("rate", {}).get("used")      }
-
-        except Exception as e:
-            error_message = str(e)
-
-            if "401" in error_message:
-                response["error"]      = "GitHub API error: Bad credentials (401)"
-                response["error_type"] = "INVALID_PAT"
-            elif "403" in error_message and "rate limit" in error_message.lower():
-                response["error"]      = "GitHub API error: Rate limit exceeded"
-                response["error_type"] = "RATE_LIMIT"
-            elif "403" in error_message:
-                response["error"]      = "GitHub API error: Forbidden - PAT may lack required scopes"
-                response["error_type"] = "INVALID_PAT"
-            elif "404" in error_message:
-                response["error"]      = "GitHub API error: Resource not found (404)"
-                response["error_type"] = "GITHUB_ERROR"
-            else:
-                response["error"]      = f"GitHub API error: {error_message}"
-                response["error_type"] = "GITHUB_ERROR"
-
-        return response
+        return self.validation_cache.get_or_validate(decrypted_pat, self.validate_github_pat)
 
     def test_api_key(self) -> Dict:                                             # Test that the service is running and accessible
         print()
@@ -160,8 +170,9 @@ class Service__Auth(Type_Safe):
             public_key      = self.public_key_object()
             sealed_box      = SealedBox(public_key)
             encrypted_bytes = sealed_box.encrypt(pat_bytes)
+            tagged_bytes    = envelope(key_fingerprint(self.public_key_hex), encrypted_bytes)     # fingerprint lets decrypt pick the key after a rotation
 
-            return base64.b64encode(encrypted_bytes).decode('utf-8')
+            return base64.b64encode(tagged_bytes).decode('utf-8')
 
         except Exception as e:
             raise ValueError(f"Failed to encrypt PAT: {str(e)}")
@@ -184,31 +195,38 @@ class Service__Auth(Type_Safe):
             response["error_type"] = "INVALID_INPUT"
             return response
 
+        return self.validation_cache.get_or_validate(github_pat, self.validate_github_pat)
+
+    def validate_github_pat(self, github_pat : str                              # Plain text GitHub PAT (no cache)
+                            ) -> Dict:                                          # Returns user info and rate limit, or the mapped GitHub error
+        response = { "success"    : False ,
+                     "error"      : None  ,
+                     "error_type" : None  ,
+                     "user"       : None  ,
+                     "rate_limit" : None  }
         try:
-            github_api      = GitHub__API(api_token=github_pat)
-            user_data       = github_api.get('/user')
-            rate_limit_data = github_api.get('/rate_limit')
+            user_data, rate_limit = self.github_user_and_rate_limit(github_pat)
 
             response["success"] = True
             response["user"]    = { "login"                     : user_data.get("login")                      ,
-                                   "id"                        : user_data.get("id")                          ,
-                                   "name"                      : user_data.get("name")                        ,
-                                   "email"                     : user_data.get("email")                       ,
-                                   "company"                   : user_data.get("company")                    ,
-                                   "created_at"                : user_data.get("created_at")                 ,
-                                   "public_repos"              : user_data.get("public_repos")               ,
-                                   "total_private_repos"       : user_data.get("total_private_repos")        ,
-                                   "owned_private_repos"       : user_data.get("owned_private_repos")        ,
-                                   "collaborators"             : user_data.get("collaborators")              ,
-                                   "two_factor_authentication" : user_data.get("two_factor_authentication")  ,
-                                   "plan"                      : { "name"          : user_data.get("plan", {}).get("name")         ,
-                                                                  "space"         : user_data.get("plan", {}).get("space")        ,
-                                                                  "private_repos" : user_data.get("plan", {}).get("private_repos")} if user_data.get("plan") else None}
-
-            response["rate_limit"] = { "limit"     : rate_limit_data.get("rate", {}).get("limit")     ,
-                                      "remaining" : rate_limit_data.get("rate", {}).get("remaining") ,
-                                      "reset"     : rate_limit_data.get("rate", {}).get("reset")     ,
-                                      "used"      : rate_limit_data.get("rate", {}).get("used")      }
+                                    "id"                        : user_data.get("id")                          ,
+                                    "name"                      : user_data.get("name")                        ,
+                                    "email"                     : user_data.get("email")                       ,
+                                    "company"                   : user_data.get("company")                    ,
+                                    "created_at"                : user_data.get("created_at")                 ,
+                                    "public_repos"              : user_data.get("public_repos")               ,
+                                    "total_private_repos"       : user_data.get("total_private_repos")        ,
+                                    "owned_private_repos"       : user_data.get("owned_private_repos")        ,
+                                    "collaborators"             : user_data.get("collaborators")              ,
+                                    "two_factor_authentication" : user_data.get("two_factor_authentication")  ,
+                                    "plan"                      : { "name"          : user_data.get("plan", {}).get("name")         ,
+                                                                    "space"         : user_data.get("plan", {}).get("space")        ,
+                                                                    "private_repos" : user_data.get("plan", {}).get("private_repos")} if user_data.get("plan") else None}
+
+            response["rate_limit"] = { "limit"     : rate_limit.get("limit")     ,
+                                       "remaining" : rate_limit.get("remaining") ,
+                                       "reset"     : rate_limit.get("reset")     ,
+                                       "used"      : rate_limit.get("used")      }
 
         except Exception as e:
             error_message = str(e)
@@ -229,4 +247,13 @@ class Service__Auth(Type_Safe):
                 response["error"]      = f"GitHub API error: {error_message}"
                 response["error_type"] = "GITHUB_ERROR"
 
-        return response
\ No newline at end of file
+        return response
+
+    def github_user_and_rate_limit(self, github_pat : str                       # Plain text GitHub PAT
+                                   ) -> Tuple[Dict, Dict]:                      # (/user body, rate limit values)
+        github_api    = GitHub__API(api_token=github_pat)
+        user_response = github_api.get_response('/user')                        # raises the /user error (401/403/...)
+        rate_limit    = rate_limit_from_headers(getattr(user_response, 'headers', None))
+        if rate_limit is None:                                                  # no X-RateLimit-* headers: only then spend a /rate_limit call
+            rate_limit = github_api.get('/rate_limit').get("rate", {})
+        return user_response.json(), rate_limit
@@ -0,0 +1,104 @@
+import hashlib
+import os
+import threading
+import time
+from collections                                         import OrderedDict
+from typing                                              import Callable, Dict, Optional
+from osbot_utils.type_safe.Type_Safe                     import Type_Safe
+from mgraph_ai_service_github.config                     import SERVICE_AUTH__PAT_CACHE__MAX_ENTRIES, SERVICE_AUTH__PAT_CACHE__TTL
+from mgraph_ai_service_github.service.github.GitHub__API import GitHub__API
+
+PAT_CACHE__DIGEST_SIZE = 32                                                     # bytes of keyed BLAKE2b per cache key
+
+
+class Service__Auth__PAT__Cache__Entry(Type_Safe):                              # The GitHub__API built for one decrypted PAT
+    github_api : GitHub__API = None
+    stored_at  : float       = 0.0
+
+    def release(self) -> None:                                                  # Drop the cache's reference (memory hygiene only: the PAT is an immutable str in GitHub__API.api_token, so nothing is zeroed)
+        self.github_api = None
+
+
+class Service__Auth__PAT__Cache(Type_Safe):                                     # Process-wide TTL + LRU cache of decrypted PATs
+    max_entries : int = SERVICE_AUTH__PAT_CACHE__MAX_ENTRIES
+    ttl         : int = SERVICE_AUTH__PAT_CACHE__TTL                            # seconds
+    hits        : int
+    misses      : int
+    evictions   : int                                                           # entries dropped because of TTL, LRU bound or purge
+    _hash_key   : bytes                                                         # random per process: cache keys can't be precomputed from a captured ciphertext
+    _entries    : OrderedDict                                                   # digest -> Service__Auth__PAT__Cache__Entry
+    _lock       : object = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._hash_key = os.urandom(32)
+        self._lock     = threading.Lock()
+
+    def cache_key(self, key_id        : bytes ,                                 # Identity of the private key (a ciphertext only decrypts under one key)
+                        encrypted_pat : str
+                  ) -> bytes:
+        digest = hashlib.blake2b(key=self._hash_key, digest_size=PAT_CACHE__DIGEST_SIZE)
+        digest.update(key_id)
+        digest.update(encrypted_pat.encode('utf-8'))
+        return digest.digest()
+
+    def get(self, key_id : bytes, encrypted_pat : str                           # Live entry, or None
+             ) -> Optional[Service__Auth__PAT__Cache__Entry]:
+        key = self.cache_key(key_id, encrypted_pat)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry.stored_at > self.ttl:
+                self._evict(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key_id : bytes, encrypted_pat : str, api_token : str          # Store a decrypted PAT (builds its GitHub__API once)
+             ) -> Service__Auth__PAT__Cache__Entry:
+        entry = Service__Auth__PAT__Cache__Entry(github_api = GitHub__API(api_token=api_token) ,
+                                                 stored_at  = time.monotonic()                 )
+        key   = self.cache_key(key_id, encrypted_pat)
+        with self._lock:
+            if key in self._entries:
+                self._evict(key)
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._evict(next(iter(self._entries)))
+        return entry
+
+    def get_or_decrypt(self, key_id        : bytes                ,             # Identity of the private key
+                             encrypted_pat : str                  ,             # Base64 encoded encrypted PAT
+                             decrypt       : Callable[[str], str]               # Called on a miss (raises on bad input, nothing is cached then)
+                       ) -> Service__Auth__PAT__Cache__Entry:
+        return self.get(key_id, encrypted_pat) or self.put(key_id, encrypted_pat, decrypt(encrypted_pat))
+
+    def purge(self) -> int:                                                     # Drop every entry (counters are kept), returns how many were dropped
+        with self._lock:
+            purged = len(self._entries)
+            while self._entries:
+                self._evict(next(iter(self._entries)))
+            return purged
+
+    def stats(self) -> Dict[str, int]:
+        return dict(entries   = len(self._entries) ,
+                    hits      = self.hits          ,
+                    misses    = self.misses        ,
+                    evictions = self.evictions     )
+
+    def clear(self) -> 'Service__Auth__PAT__Cache':
+        self.purge()
+        with self._lock:
+            self.hits = self.misses = self.evictions = 0
+        return self
+
+    def _evict(self, key : bytes) -> None:                                      # caller holds the lock
+        entry = self._entries.pop(key)
+        entry.release()
+        self.evictions += 1
+
+
+service_auth_pat_cache = Service__Auth__PAT__Cache()                            # module-level singleton used by Service__Auth
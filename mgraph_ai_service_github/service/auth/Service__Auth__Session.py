@@ -0,0 +1,75 @@
+import base64
+import binascii
+import hashlib
+import struct
+import time
+import nacl.exceptions
+from typing                                              import Tuple
+from nacl.secret                                         import SecretBox
+from osbot_utils.decorators.methods.cache_on_self        import cache_on_self
+from osbot_utils.type_safe.Type_Safe                     import Type_Safe
+from osbot_utils.utils.Env                               import get_env
+from mgraph_ai_service_github.config                     import ENV_VAR__SERVICE__AUTH__SESSION_KEY, ENV_VAR__SERVICE__AUTH__PRIVATE_KEY, SERVICE_AUTH__SESSION__TTL
+
+SESSION_TOKEN__MAGIC   = b'OSBS\x01'                                            # prefix of the decoded token (a SealedBox starts with a random ephemeral key: 2^-40 chance of a clash)
+SESSION_TOKEN__EXPIRES = struct.Struct('>Q')                                    # expiry (unix seconds) packed in front of the PAT
+SESSION_KEY__CONTEXT   = b'osbot-github/session-key/v1'                         # domain separation for the key derived from the service private key
+
+
+def derive_session_key(private_key_hex : str) -> str:                          # SecretBox key derived from the service private key (keyed BLAKE2b, one-way)
+    return hashlib.blake2b(SESSION_KEY__CONTEXT, key=bytes.fromhex(private_key_hex), digest_size=SecretBox.KEY_SIZE).hexdigest()
+
+
+class Service__Auth__Session(Type_Safe):                                        # Short-lived session tokens: the PAT sealed with a server-side SecretBox key
+    session_key_hex : str = None                                                # 32 bytes hex, shared by every instance of the service (provisioned by Deploy__Service)
+    private_key_hex : str = None                                                # service private key, the session key is derived from it when none is provisioned
+    ttl             : int = SERVICE_AUTH__SESSION__TTL                          # seconds
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if not self.session_key_hex:
+            self.session_key_hex = get_env(ENV_VAR__SERVICE__AUTH__SESSION_KEY, '')
+        if not self.private_key_hex:
+            self.private_key_hex = get_env(ENV_VAR__SERVICE__AUTH__PRIVATE_KEY, '')
+
+    @cache_on_self
+    def secret_box(self) -> SecretBox:                                          # Fails closed: no per-process fallback (its tokens wouldn't open on any other instance)
+        if not self.session_key_hex and not self.private_key_hex:
+            raise ValueError("Session key not configured - SERVICE__AUTH__SESSION_KEY or SERVICE__AUTH__PRIVATE_KEY environment variable required")
+        try:
+            return SecretBox(bytes.fromhex(self.session_key_hex or derive_session_key(self.private_key_hex)))
+        except Exception as e:
+            raise ValueError(f"Failed to load session key: {str(e)}")
+
+    def is_session_token(self, token : str) -> bool:                            # Cheap check on the first bytes (no decryption)
+        try:
+            prefix = base64.b64decode(token[:8])                                # 8 base64 chars -> the 6 leading bytes
+        except (binascii.Error, ValueError, TypeError):
+            return False
+        return prefix.startswith(SESSION_TOKEN__MAGIC)
+
+    def create(self, api_token : str                                            # Decrypted PAT
+               ) -> Tuple[str, int]:                                            # (base64 session token, expires_at unix seconds)
+        if not api_token:
+            raise ValueError("GitHub PAT cannot be empty")
+        expires_at = int(time.time()) + self.ttl
+        payload    = SESSION_TOKEN__EXPIRES.pack(expires_at) + api_token.encode('utf-8')
+        sealed     = self.secret_box().encrypt(payload)                         # random nonce + ciphertext + MAC
+        return base64.b64encode(SESSION_TOKEN__MAGIC + bytes(sealed)).decode('utf-8'), expires_at
+
+    def open(self, token : str                                                  # Value returned by create
+             ) -> str:                                                          # Returns the PAT (raises ValueError if invalid or expired)
+        try:
+            decoded = base64.b64decode(token, validate=True)
+        except binascii.Error as e:
+            raise ValueError(f"Invalid base64 encoding: {str(e)}")
+        if not decoded.startswith(SESSION_TOKEN__MAGIC):
+            raise ValueError("Not a session token")
+        try:
+            payload = self.secret_box().decrypt(decoded[len(SESSION_TOKEN__MAGIC):])
+        except nacl.exceptions.CryptoError:
+            raise ValueError("Session token decryption failed: invalid token or wrong key")
+        (expires_at,) = SESSION_TOKEN__EXPIRES.unpack_from(payload)
+        if expires_at < time.time():
+            raise ValueError("Session token expired")
+        return payload[SESSION_TOKEN__EXPIRES.size:].decode('utf-8')
@@ -0,0 +1,73 @@
+import copy
+import hashlib
+import os
+import threading
+import time
+from collections                                         import OrderedDict
+from typing                                              import Callable, Dict, Optional
+from osbot_utils.type_safe.Type_Safe                     import Type_Safe
+from mgraph_ai_service_github.config                     import SERVICE_AUTH__VALIDATION_CACHE__MAX_ENTRIES, SERVICE_AUTH__VALIDATION_CACHE__TTL
+
+VALIDATION_CACHE__DIGEST_SIZE = 32                                              # bytes of keyed BLAKE2b per cache key
+
+
+class Service__Auth__Validation__Cache(Type_Safe):                              # Process-wide TTL + LRU cache of successful PAT validations
+    max_entries : int = SERVICE_AUTH__VALIDATION_CACHE__MAX_ENTRIES
+    ttl         : int = SERVICE_AUTH__VALIDATION_CACHE__TTL                     # seconds (0 disables the cache)
+    hits        : int
+    misses      : int
+    _hash_key   : bytes                                                         # random per process: PATs never appear as keys, not even hashed predictably
+    _entries    : OrderedDict                                                   # digest -> (stored_at, validation result)
+    _lock       : object = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._hash_key = os.urandom(32)
+        self._lock     = threading.Lock()
+
+    def cache_key(self, github_pat : str) -> bytes:
+        return hashlib.blake2b(github_pat.encode('utf-8'), key=self._hash_key, digest_size=VALIDATION_CACHE__DIGEST_SIZE).digest()
+
+    def get(self, github_pat : str                                              # Plain text PAT
+             ) -> Optional[Dict]:                                               # Copy of the cached result, or None
+        key = self.cache_key(github_pat)
+        with self._lock:
+            item = self._entries.get(key)
+            if item is not None and time.monotonic() - item[0] > self.ttl:
+                del self._entries[key]
+                item = None
+            if item is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return copy.deepcopy(item[1])                                       # callers may mutate their response
+
+    def put(self, github_pat : str, result : Dict) -> Dict:                     # Store a successful result (failures are never cached)
+        if self.ttl > 0 and result.get("success"):
+            key = self.cache_key(github_pat)
+            with self._lock:
+                self._entries[key] = (time.monotonic(), copy.deepcopy(result))
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return result
+
+    def get_or_validate(self, github_pat : str                     ,            # Plain text PAT
+                              validate   : Callable[[str], Dict]                # Called on a miss (returns the validation result)
+                        ) -> Dict:
+        return self.get(github_pat) or self.put(github_pat, validate(github_pat))
+
+    def stats(self) -> Dict[str, int]:
+        return dict(entries = len(self._entries) ,
+                    hits    = self.hits          ,
+                    misses  = self.misses        )
+
+    def clear(self) -> 'Service__Auth__Validation__Cache':
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+        return self
+
+
+service_auth_validation_cache = Service__Auth__Validation__Cache()              # module-level singleton used by Service__Auth
@@ -1,12 +1,23 @@
 import base64
-from nacl.public                                                                                import PrivateKey, PublicKey, SealedBox
+from nacl._sodium                                                                               import ffi, lib
+from nacl.bindings                                                                              import crypto_box_SEALBYTES
+from nacl.exceptions                                                                            import CryptoError
+from nacl.public                                                                                import PrivateKey, PublicKey
 from osbot_utils.type_safe.Type_Safe                                                            import Type_Safe
 from osbot_utils.type_safe.primitives.domains.cryptography.safe_str.Safe_Str__NaCl__Private_Key import Safe_Str__NaCl__Private_Key
 from osbot_utils.type_safe.primitives.domains.cryptography.safe_str.Safe_Str__NaCl__Public_Key  import Safe_Str__NaCl__Public_Key
 from osbot_utils.type_safe.primitives.domains.cryptography.schemas.Schema__NaCl__Keys           import Schema__NaCl__Keys
+from mgraph_ai_service_github.schemas.encryption.Safe_Str__Encrypted_Value                      import decode_encrypted_value
+from mgraph_ai_service_github.service.encryption.NaCl__Sealed_Box__Cache                        import NaCl__Sealed_Box__Cache, nacl_sealed_box_cache
 
 
 class NaCl__Key_Management(Type_Safe):
+    sealed_box_cache : NaCl__Sealed_Box__Cache = None                           # process-wide by default, shared by every instance
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if not self.sealed_box_cache:
+            self.sealed_box_cache = nacl_sealed_box_cache
 
     def generate_nacl_keys(self) -> Schema__NaCl__Keys:                         # Generate a new NaCl key pair for SealedBox encryption/decryption
         nacl__private_key = PrivateKey.generate()
@@ -30,9 +41,7 @@ class NaCl__Key_Management(Type_Safe):
     def encrypt_with_public_key(self, message        : bytes                      ,     # Encrypt message with public key
                                       public_key_hex : Safe_Str__NaCl__Public_Key       # Public key in hex format
                                  ) -> bytes:                                            # Returns encrypted bytes
-        public_key = self.public_key_from_hex(public_key_hex)
-        sealed_box = SealedBox(public_key)
-        return sealed_box.encrypt(message)
+        return self.sealed_box_cache.for_public_key(public_key_hex).encrypt(message)
     
     def encrypt_with_public_key_base64(self, message        : bytes                      ,  # Encrypt and base64 encode
                                              public_key_hex : Safe_Str__NaCl__Public_Key    # Public key in hex format
@@ -43,16 +52,64 @@ class NaCl__Key_Management(Type_Safe):
     def decrypt_with_private_key(self, encrypted_data  : bytes                       ,      # Decrypt with private key
                                        private_key_hex : Safe_Str__NaCl__Private_Key        # Private key in hex format
                                   ) -> bytes:                                               # Returns decrypted bytes
-        private_key = self.private_key_from_hex(private_key_hex)
-        sealed_box  = SealedBox(private_key)
-        return sealed_box.decrypt(encrypted_data)
+        return self.sealed_box_cache.for_private_key(private_key_hex).decrypt(encrypted_data)
     
     def decrypt_with_private_key_base64(self, encrypted_base64 : str                        ,   # Decrypt base64 encoded data
                                               private_key_hex  : Safe_Str__NaCl__Private_Key    # Private key in hex format
                                          ) -> bytes:                                            # Returns decrypted bytes
-        encrypted_data = base64.b64decode(encrypted_base64)
+        encrypted_data = decode_encrypted_value(encrypted_base64)                                 # validated values carry their decoded bytes
         return self.decrypt_with_private_key(encrypted_data, private_key_hex)
     
+    def encrypt_with_public_key_raw(self, message        : memoryview                 ,     # Seal straight from the caller's buffer (no bytes() copy of the input)
+                                          public_key_hex : Safe_Str__NaCl__Public_Key ,     # Public key in hex format
+                                          prefix         : bytes = b''                      # Written in front of the ciphertext (e.g. a keyring envelope header)
+                                     ) -> memoryview:                                       # Returns view over the ciphertext buffer (the only copy made)
+        return self.seal_raw(message, bytes.fromhex(public_key_hex), prefix)
+
+    def seal_raw(self, message    : memoryview  ,                                          # Plaintext buffer (bytes, bytearray or a view over either)
+                       public_key : bytes       ,                                          # Raw 32 byte public key
+                       prefix     : bytes = b''                                             # Written in front of the ciphertext, in the same buffer
+                 ) -> memoryview:                                                           # Returns view over prefix + ciphertext
+        if len(public_key) != lib.crypto_box_publickeybytes():
+            raise ValueError("Invalid public key")
+        ciphertext = ffi.new("unsigned char[]", len(prefix) + crypto_box_SEALBYTES + len(message))
+        ffi.memmove(ciphertext, prefix, len(prefix))
+        if lib.crypto_box_seal(ciphertext + len(prefix), ffi.from_buffer(message), len(message), public_key) != 0:
+            raise CryptoError("An error occurred trying to encrypt the message")
+        return memoryview(ffi.buffer(ciphertext))
+
+    def decrypt_with_private_key_raw(self, encrypted_data  : memoryview                  ,     # Open straight from the caller's buffer
+                                           private_key_hex : Safe_Str__NaCl__Private_Key ,     # Private key in hex format
+                                           public_key_hex  : Safe_Str__NaCl__Public_Key        # Matching public key (saves deriving it from the private key)
+                                      ) -> memoryview:                                         # Returns view over the plaintext buffer (the only copy made)
+        plaintext = bytearray(max(0, len(encrypted_data) - crypto_box_SEALBYTES))
+        length    = self.decrypt_with_private_key_into(encrypted_data, private_key_hex, public_key_hex, plaintext)
+        return memoryview(plaintext)[:length]
+
+    def decrypt_with_private_key_into(self, encrypted_data  : memoryview                  ,    # Open into a caller-owned (reusable) buffer
+                                            private_key_hex : Safe_Str__NaCl__Private_Key ,
+                                            public_key_hex  : Safe_Str__NaCl__Public_Key  ,
+                                            output          : bytearray                        # Must hold len(encrypted_data) - 48 bytes
+                                       ) -> int:                                               # Returns the plaintext length written to output
+        private_key = bytes.fromhex(private_key_hex)
+        public_key  = bytes.fromhex(public_key_hex )
+        if len(private_key) != lib.crypto_box_secretkeybytes() or len(public_key) != lib.crypto_box_publickeybytes():
+            raise ValueError("Invalid key pair")
+        if len(encrypted_data) < crypto_box_SEALBYTES:
+            raise CryptoError("Encrypted data too short to be valid NaCl encryption")
+        length = len(encrypted_data) - crypto_box_SEALBYTES
+        if length > len(output):
+            raise ValueError(f"Decrypted value too large: {length} bytes (max {len(output)})")
+        if lib.crypto_box_seal_open(ffi.from_buffer(output, require_writable=True) if output else ffi.new("unsigned char[]", 1),
+                                    ffi.from_buffer(encrypted_data), len(encrypted_data), public_key, private_key) != 0:
+            raise CryptoError("An error occurred trying to decrypt the message")
+        return length
+
+    def memzero(self, buffer : bytearray                                                    # Wipe a plaintext buffer in place (sodium_memzero isn't optimised away)
+                ) -> None:                                                                  # (also accepts a writable memoryview, e.g. the used part of a buffer)
+        if len(buffer):
+            lib.sodium_memzero(ffi.from_buffer(buffer, require_writable=True), len(buffer))
+
     def validate_key_pair(self, nacl_keys : Schema__NaCl__Keys                                  # Validate that a key pair works correctly
                            ) -> bool:                                                           # Returns True if keys are valid pair
         try:
@@ -0,0 +1,110 @@
+import hashlib
+from typing                                                                                     import Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+from nacl.bindings                                                                              import crypto_box_SEALBYTES
+from nacl.exceptions                                                                            import CryptoError
+from nacl.public                                                                                import PrivateKey
+from osbot_utils.type_safe.Type_Safe                                                            import Type_Safe
+from osbot_utils.type_safe.primitives.domains.cryptography.safe_str.Safe_Str__NaCl__Private_Key import Safe_Str__NaCl__Private_Key
+from osbot_utils.type_safe.primitives.domains.cryptography.safe_str.Safe_Str__NaCl__Public_Key  import Safe_Str__NaCl__Public_Key
+from osbot_utils.type_safe.primitives.domains.cryptography.schemas.Schema__NaCl__Keys           import Schema__NaCl__Keys
+from mgraph_ai_service_github.config                                                            import ENCRYPTION__KEYRING__MAX_PREVIOUS_KEYS
+
+ENCRYPTION_ENVELOPE__MAGIC            = b'K\x01'                                # envelope marker + version
+ENCRYPTION_ENVELOPE__FINGERPRINT_SIZE = 4                                       # bytes of blake2b(public key) identifying the key a value was sealed to
+ENCRYPTION_ENVELOPE__HEADER_SIZE      = len(ENCRYPTION_ENVELOPE__MAGIC) + ENCRYPTION_ENVELOPE__FINGERPRINT_SIZE
+
+# Envelope layout:   MAGIC | fingerprint | SealedBox ciphertext   (base64 encoded as a whole, so envelopes are still valid base64)
+# Untagged SealedBox values (pre-keyring clients / tokens) are still accepted and tried against every key in the ring
+
+T = TypeVar('T')
+
+
+def key_fingerprint(public_key_hex : str) -> bytes:                             # Short, stable id of a public key
+    return hashlib.blake2b(bytes.fromhex(public_key_hex), digest_size=ENCRYPTION_ENVELOPE__FINGERPRINT_SIZE).digest()
+
+
+def envelope(fingerprint : bytes, sealed : bytes) -> bytes:                    # Tag a SealedBox ciphertext with the fingerprint of the key it was sealed to
+    return ENCRYPTION_ENVELOPE__MAGIC + fingerprint + sealed
+
+
+def envelope_split(data : bytes                                                 # Encrypted bytes (tagged envelope or plain SealedBox)
+                   ) -> Tuple[Optional[bytes], bytes]:                          # Returns (fingerprint or None, SealedBox ciphertext)
+    if data[:len(ENCRYPTION_ENVELOPE__MAGIC)] == ENCRYPTION_ENVELOPE__MAGIC and len(data) >= ENCRYPTION_ENVELOPE__HEADER_SIZE + crypto_box_SEALBYTES:
+        return bytes(data[len(ENCRYPTION_ENVELOPE__MAGIC):ENCRYPTION_ENVELOPE__HEADER_SIZE]), data[ENCRYPTION_ENVELOPE__HEADER_SIZE:]     # bytes: memoryview fingerprints aren't hashable
+    return None, data
+
+
+def parse_private_keys(value : Optional[str]) -> List[str]:                     # Comma separated private keys (hex) -> list, newest first
+    return [key.strip() for key in (value or '').split(',') if key.strip()]
+
+
+def rotated_previous_private_keys(current_private_key   : Optional[str]                          ,  # Key being replaced by a deploy
+                                  previous_private_keys : Optional[str]                          ,  # Keys it already kept alive (comma separated)
+                                  max_previous_keys     : int = ENCRYPTION__KEYRING__MAX_PREVIOUS_KEYS
+                             ) -> str:                                                              # Returns the new comma separated previous keys
+    keys = parse_private_keys(current_private_key) + parse_private_keys(previous_private_keys)
+    keys = list(dict.fromkeys(keys))                                            # dedupe, keep order
+    return ','.join(keys[:max_previous_keys])
+
+
+class NaCl__Keyring(Type_Safe):                                                 # Current + previous service keys, indexed by fingerprint
+    current : bytes = None                                                      # fingerprint new envelopes are tagged with
+    _keys   : Dict[bytes, Schema__NaCl__Keys]                                   # fingerprint -> keys (current first, then previous newest first)
+
+    def add(self, private_key_hex : str                ,                        # Adds a key pair (the first one added becomes current)
+                  public_key_hex  : Optional[str] = None                        # Derived from the private key when not given
+            ) -> 'NaCl__Keyring':
+        if not public_key_hex:
+            public_key_hex = bytes(PrivateKey(bytes.fromhex(private_key_hex)).public_key).hex()
+        fingerprint = key_fingerprint(public_key_hex)
+        if fingerprint not in self._keys:
+            self._keys[fingerprint] = Schema__NaCl__Keys(public_key  = Safe_Str__NaCl__Public_Key (public_key_hex ) ,
+                                                         private_key = Safe_Str__NaCl__Private_Key(private_key_hex) )
+        if self.current is None:
+            self.current = fingerprint
+        return self
+
+    def add_previous(self, previous_private_keys : Optional[str]                # Comma separated private keys (hex), newest first
+                     ) -> 'NaCl__Keyring':
+        for private_key_hex in parse_private_keys(previous_private_keys):
+            self.add(private_key_hex)
+        return self
+
+    def current_keys(self) -> Schema__NaCl__Keys:
+        if self.current is None:
+            raise ValueError("Keyring is empty")
+        return self._keys[self.current]
+
+    def fingerprints(self) -> List[str]:                                        # hex fingerprints, current first
+        return [fingerprint.hex() for fingerprint in self._keys]
+
+    def keys_for(self, fingerprint : bytes) -> Optional[Schema__NaCl__Keys]:
+        return self._keys.get(fingerprint)
+
+    def envelope(self, sealed : bytes) -> bytes:                                # Tag a SealedBox ciphertext with the current key's fingerprint
+        return envelope(self.current, sealed)
+
+    def envelope_header(self) -> bytes:                                         # MAGIC + current fingerprint (for callers sealing straight into their own buffer)
+        return envelope(self.current, b'')
+
+    def candidates(self, data : bytes                                           # Keys to try for one value: O(1) for tagged envelopes,
+                   ) -> Iterator[Tuple[Schema__NaCl__Keys, bytes]]:             # every key (current first) for untagged ones
+        fingerprint, sealed = envelope_split(data)
+        if fingerprint is not None:
+            keys = self._keys.get(fingerprint)
+            if keys is not None:
+                yield keys, sealed
+                return
+        for keys in self._keys.values():                                        # untagged (or a plain SealedBox that happens to start with the magic)
+            yield keys, data
+
+    def open(self, data   : bytes                                    ,          # Run opener with the right key (raises the last CryptoError if none fits)
+                   opener : Callable[[Schema__NaCl__Keys, bytes], T]
+             ) -> T:
+        error = CryptoError("No keys in keyring")
+        for keys, sealed in self.candidates(data):
+            try:
+                return opener(keys, sealed)
+            except CryptoError as e:
+                error = e
+        raise error
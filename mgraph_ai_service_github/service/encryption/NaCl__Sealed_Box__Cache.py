@@ -0,0 +1,70 @@
+import hashlib
+import threading
+from collections                                import OrderedDict
+from typing                                     import Callable, Dict, Tuple
+from nacl.public                                import PrivateKey, PublicKey, SealedBox
+from osbot_utils.type_safe.Type_Safe            import Type_Safe
+from mgraph_ai_service_github.config            import NACL__SEALED_BOX_CACHE__MAX_ENTRIES
+
+SEALED_BOX__KIND__PUBLIC  = 'public'                                            # encrypt-only box
+SEALED_BOX__KIND__PRIVATE = 'private'                                           # decrypt box (holds the private key)
+
+
+class NaCl__Sealed_Box__Cache(Type_Safe):                                       # Process-wide LRU of prebuilt SealedBox objects, keyed by key material
+    max_entries : int = NACL__SEALED_BOX_CACHE__MAX_ENTRIES
+    hits        : int
+    misses      : int
+    evictions   : int
+    _entries    : OrderedDict                                                   # (kind, key digest) -> SealedBox
+    _lock       : object = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._lock = threading.Lock()
+
+    def cache_key(self, kind : str, key_hex : str) -> Tuple[str, bytes]:        # Digest, so private key hex is never kept as a dict key
+        return kind, hashlib.blake2b(key_hex.encode('utf-8'), digest_size=32).digest()
+
+    def sealed_box(self, kind    : str                     ,                    # SEALED_BOX__KIND__PUBLIC or SEALED_BOX__KIND__PRIVATE
+                         key_hex : str                     ,                    # Key in hex format
+                         build   : Callable[[], SealedBox]                      # Called on a miss
+                   ) -> SealedBox:
+        key = self.cache_key(kind, key_hex)
+        with self._lock:
+            sealed_box = self._entries.get(key)
+            if sealed_box is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return sealed_box
+            self.misses += 1
+        sealed_box = build()                                                    # built outside the lock (invalid keys raise here and are not cached)
+        with self._lock:
+            self._entries[key] = sealed_box
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return sealed_box
+
+    def for_public_key(self, public_key_hex : str) -> SealedBox:                # Encrypt-only box for a public key
+        return self.sealed_box(SEALED_BOX__KIND__PUBLIC, public_key_hex,
+                               lambda: SealedBox(PublicKey(bytes.fromhex(public_key_hex))))
+
+    def for_private_key(self, private_key_hex : str) -> SealedBox:              # Decrypt box for a private key
+        return self.sealed_box(SEALED_BOX__KIND__PRIVATE, private_key_hex,
+                               lambda: SealedBox(PrivateKey(bytes.fromhex(private_key_hex))))
+
+    def stats(self) -> Dict[str, int]:
+        return dict(entries   = len(self._entries) ,
+                    hits      = self.hits          ,
+                    misses    = self.misses        ,
+                    evictions = self.evictions     )
+
+    def clear(self) -> 'NaCl__Sealed_Box__Cache':
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+        return self
+
+
+nacl_sealed_box_cache = NaCl__Sealed_Box__Cache()                               # module-level singleton used by NaCl__Key_Management
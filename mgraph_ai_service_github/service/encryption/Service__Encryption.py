@@ -8,11 +8,11 @@ from osbot_utils.type_safe.primitives.domains.cryptography.safe_str.Safe_Str__Na
 from osbot_utils.type_safe.primitives.domains.cryptography.safe_str.Safe_Str__NaCl__Public_Key  import Safe_Str__NaCl__Public_Key
 from osbot_utils.type_safe.primitives.domains.cryptography.schemas.Schema__NaCl__Keys           import Schema__NaCl__Keys
 from osbot_utils.utils.Env                                                                      import get_env
-from mgraph_ai_service_github.config                                                            import ENV_VAR__SERVICE__AUTH__PRIVATE_KEY, ENV_VAR__SERVICE__AUTH__PUBLIC_KEY
+from mgraph_ai_service_github.config                                                            import ENV_VAR__SERVICE__AUTH__PRIVATE_KEY, ENV_VAR__SERVICE__AUTH__PUBLIC_KEY, ENV_VAR__SERVICE__AUTH__PREVIOUS_PRIVATE_KEYS
 from mgraph_ai_service_github.schemas.encryption.Const__Encryption                              import NCCL__ALGORITHM
 from mgraph_ai_service_github.schemas.encryption.Enum__Encryption_Type                          import Enum__Encryption_Type
 from mgraph_ai_service_github.schemas.encryption.Safe_Str__Decrypted_Value                      import Safe_Str__Decrypted_Value
-from mgraph_ai_service_github.schemas.encryption.Safe_Str__Encrypted_Value                      import Safe_Str__Encrypted_Value
+from mgraph_ai_service_github.schemas.encryption.Safe_Str__Encrypted_Value                      import Safe_Str__Encrypted_Value, decode_encrypted_value
 from mgraph_ai_service_github.schemas.encryption.Schema__Decryption__Request                    import Schema__Decryption__Request
 from mgraph_ai_service_github.schemas.encryption.Schema__Decryption__Response                   import Schema__Decryption__Response
 from mgraph_ai_service_github.schemas.encryption.Schema__Decryption__Validate__Request          import Schema__Decryption__Validate__Request
@@ -22,11 +22,13 @@ from mgraph_ai_service_github.schemas.encryption.Schema__Encryption__Response
 from mgraph_ai_service_github.schemas.encryption.Schema__Key_Generation__Response               import Schema__Key_Generation__Response
 from mgraph_ai_service_github.schemas.encryption.Schema__Public_Key__Response                   import Schema__Public_Key__Response
 from mgraph_ai_service_github.service.encryption.NaCl__Key_Management                           import NaCl__Key_Management
+from mgraph_ai_service_github.service.encryption.NaCl__Keyring                                  import NaCl__Keyring
 
 class Service__Encryption(Type_Safe):
-    nacl_manager    : NaCl__Key_Management
-    private_key_hex : str                  = None
-    public_key_hex  : str                  = None
+    nacl_manager          : NaCl__Key_Management
+    private_key_hex       : str                  = None
+    public_key_hex        : str                  = None
+    previous_private_keys : str                  = None                        # comma separated keys from earlier deploys (decrypt only)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -36,6 +38,8 @@ class Service__Encryption(Type_Safe):
             self.private_key_hex = get_env(ENV_VAR__SERVICE__AUTH__PRIVATE_KEY, '')
         if not self.public_key_hex:
             self.public_key_hex = get_env(ENV_VAR__SERVICE__AUTH__PUBLIC_KEY  , '')
+        if self.previous_private_keys is None:
+            self.previous_private_keys = get_env(ENV_VAR__SERVICE__AUTH__PREVIOUS_PRIVATE_KEYS, '')
 
     @cache_on_self
     def nacl_keys(self) -> Schema__NaCl__Keys:                                  # Get configured NaCl keys
@@ -45,9 +49,15 @@ class Service__Encryption(Type_Safe):
         return Schema__NaCl__Keys(public_key  = Safe_Str__NaCl__Public_Key (self.public_key_hex ) ,
                                   private_key = Safe_Str__NaCl__Private_Key(self.private_key_hex) )
 
+    @cache_on_self
+    def keyring(self) -> NaCl__Keyring:                                         # Current key + previous deploys' keys, indexed by fingerprint
+        nacl_keys = self.nacl_keys()
+        return NaCl__Keyring().add(nacl_keys.private_key, nacl_keys.public_key).add_previous(self.previous_private_keys)
+
     def public_key(self) -> Schema__Public_Key__Response:                       # Get public key for encryption
         nacl_keys = self.nacl_keys()
-        return Schema__Public_Key__Response(public_key = nacl_keys.public_key)
+        return Schema__Public_Key__Response(public_key = nacl_keys.public_key       ,
+                                            key_id     = self.keyring().current.hex())
 
     def generate_keys(self) -> Schema__Key_Generation__Response:                # Generate new NaCl key pair
         try:
@@ -63,20 +73,7 @@ class Service__Encryption(Type_Safe):
     def encrypt(self, request : Schema__Encryption__Request                         # Encrypt data based on type
                  ) -> Schema__Encryption__Response:                                 # Returns encrypted response
         try:
-            nacl_keys = self.nacl_keys()
-
-            if request.encryption_type == Enum__Encryption_Type.TEXT:                                               # Convert value to bytes based on type
-                data_bytes = request.value.encode('utf-8')
-            elif request.encryption_type == Enum__Encryption_Type.JSON:
-                json_obj   = json.loads(request.value)                                                              # Parse and re-stringify to validate JSON
-                json_str   = json.dumps(json_obj, separators=(',', ':'))                                            # Compact JSON
-                data_bytes = json_str.encode('utf-8')
-            elif request.encryption_type == Enum__Encryption_Type.DATA:
-                data_bytes = base64.b64decode(request.value)                                                        # Assume value is already base64 encoded binary data
-            else:
-                raise ValueError(f"Unknown encryption type: {request.encryption_type}")
-
-            encrypted_base64 = self.nacl_manager.encrypt_with_public_key_base64(data_bytes, nacl_keys.public_key)   # Encrypt the data
+            encrypted_base64 = self.encrypt_value(request.encryption_type, request.value)
 
             return Schema__Encryption__Response(success   = True                                         ,
                                                 encrypted = Safe_Str__Encrypted_Value(encrypted_base64)  )
@@ -93,22 +90,7 @@ class Service__Encryption(Type_Safe):
     def decrypt(self, request : Schema__Decryption__Request                     # Decrypt data based on type
                 ) -> Schema__Decryption__Response:                              # Returns decrypted response
         try:
-            nacl_keys = self.nacl_keys()
-
-            # Decrypt the data
-            decrypted_bytes = self.nacl_manager.decrypt_with_private_key_base64(request.encrypted, nacl_keys.private_key)
-
-            # Convert bytes to appropriate format based on type
-            if request.encryption_type == Enum__Encryption_Type.TEXT:
-                decrypted_value = decrypted_bytes.decode('utf-8')
-            elif request.encryption_type == Enum__Encryption_Type.JSON:
-                json_str        = decrypted_bytes.decode('utf-8')
-                json_obj        = json.loads(json_str)                          # Validate JSON
-                decrypted_value = json.dumps(json_obj, separators=(',', ':'))   # Re-stringify compactly
-            elif request.encryption_type == Enum__Encryption_Type.DATA:
-                decrypted_value = base64.b64encode(decrypted_bytes).decode('utf-8')
-            else:
-                raise ValueError(f"Unknown encryption type: {request.encryption_type}")
+            decrypted_value = self.decrypt_value(request.encryption_type, request.encrypted)
 
             return Schema__Decryption__Response(success   = True                                     ,
                                                decrypted = Safe_Str__Decrypted_Value(decrypted_value))
@@ -120,14 +102,65 @@ class Service__Encryption(Type_Safe):
             return Schema__Decryption__Response(success   = False                                    ,
                                                decrypted = None                                      )
 
+    def encrypt_value(self, encryption_type : Enum__Encryption_Type ,            # Encrypt one value (raises on failure)
+                            value           : str
+                      ) -> str:                                                 # Returns base64 encrypted value
+        nacl_keys = self.nacl_keys()
+        if value is None:
+            raise ValueError("Missing value to encrypt")
+
+        if encryption_type == Enum__Encryption_Type.TEXT:                                                           # Convert value to bytes based on type
+            data_bytes = value.encode('utf-8')
+        elif encryption_type == Enum__Encryption_Type.JSON:
+            json_obj   = json.loads(value)                                                                          # Parse and re-stringify to validate JSON
+            json_str   = json.dumps(json_obj, separators=(',', ':'))                                                # Compact JSON
+            data_bytes = json_str.encode('utf-8')
+        elif encryption_type == Enum__Encryption_Type.DATA:
+            data_bytes = base64.b64decode(value)                                                                    # Assume value is already base64 encoded binary data
+        else:
+            raise ValueError(f"Unknown encryption type: {encryption_type}")
+
+        sealed = self.nacl_manager.encrypt_with_public_key(data_bytes, nacl_keys.public_key)                       # Encrypt the data
+        return base64.b64encode(self.keyring().envelope(sealed)).decode('utf-8')                                   # tagged with the key's fingerprint (survives key rotation)
+
+    def decrypt_bytes(self, encrypted : str                                     # Base64 envelope (or untagged SealedBox) value
+                      ) -> bytes:                                               # Returns the decrypted bytes (raises CryptoError on bad / foreign data)
+        return self.keyring().open(decode_encrypted_value(encrypted),
+                                   lambda keys, sealed: self.nacl_manager.decrypt_with_private_key(sealed, keys.private_key))
+
+    def decrypt_value(self, encryption_type : Enum__Encryption_Type ,            # Decrypt one value (raises on failure)
+                            encrypted       : str                                # Base64 encrypted value
+                      ) -> str:                                                 # Returns decrypted value in the requested format
+        decrypted_bytes = self.decrypt_bytes(encrypted)
+
+        if encryption_type == Enum__Encryption_Type.TEXT:                       # Convert bytes to appropriate format based on type
+            return decrypted_bytes.decode('utf-8')
+        elif encryption_type == Enum__Encryption_Type.JSON:
+            json_str = decrypted_bytes.decode('utf-8')
+            json_obj = json.loads(json_str)                                     # Validate JSON
+            return json.dumps(json_obj, separators=(',', ':'))                  # Re-stringify compactly
+        elif encryption_type == Enum__Encryption_Type.DATA:
+            return base64.b64encode(decrypted_bytes).decode('utf-8')
+        raise ValueError(f"Unknown encryption type: {encryption_type}")
+
+    def encrypt_raw(self, data : memoryview                                     # Encrypt raw bytes (no base64 on the way in or out)
+                    ) -> memoryview:                                            # Returns view over the sealed bytes (same envelope as encrypt_value, before base64)
+        keyring = self.keyring()
+        return self.nacl_manager.encrypt_with_public_key_raw(data, keyring.current_keys().public_key, prefix=keyring.envelope_header())
+
+    def decrypt_raw(self, encrypted : memoryview                                # Decrypt raw sealed bytes (raises CryptoError on bad / foreign data)
+                    ) -> memoryview:                                            # Returns view over the plaintext bytes
+        return self.keyring().open(memoryview(encrypted),
+                                   lambda keys, sealed: self.nacl_manager.decrypt_with_private_key_raw(sealed, keys.private_key, keys.public_key))
+
     def validate(self, request : Schema__Decryption__Validate__Request          # Validate encrypted data
                   ) -> Schema__Decryption__Validate__Response:                   # Returns validation result
         try:
-            nacl_keys  = self.nacl_keys()
+            self.nacl_keys()
             start_time = time.time()
 
             # Try to decrypt
-            decrypted_bytes = self.nacl_manager.decrypt_with_private_key_base64(request.encrypted, nacl_keys.private_key)
+            decrypted_bytes = self.decrypt_bytes(request.encrypted)
 
             # Validate based on expected type
             if request.encryption_type == Enum__Encryption_Type.TEXT:
@@ -0,0 +1,148 @@
+import multiprocessing
+import threading
+from concurrent.futures                                                                 import ProcessPoolExecutor
+from concurrent.futures.process                                                         import BrokenProcessPool
+from typing                                                                             import List, Optional, Tuple
+from osbot_utils.type_safe.Type_Safe                                                    import Type_Safe
+from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text            import Safe_Str__Text
+from mgraph_ai_service_github.config                                                    import ENCRYPTION__BATCH__MAX_ITEMS, ENCRYPTION__BATCH__MAX_BYTES, ENCRYPTION__BATCH__PROCESS_POOL_THRESHOLD, ENCRYPTION__BATCH__MAX_WORKERS
+from mgraph_ai_service_github.schemas.base.Enum__HTTP__Status                           import Enum__HTTP__Status
+from mgraph_ai_service_github.schemas.encryption.Enum__Encryption_Type                  import Enum__Encryption_Type
+from mgraph_ai_service_github.schemas.encryption.Safe_Str__Decrypted_Value              import Safe_Str__Decrypted_Value
+from mgraph_ai_service_github.schemas.encryption.Safe_Str__Encrypted_Value              import Safe_Str__Encrypted_Value
+from mgraph_ai_service_github.schemas.encryption.Schema__Decryption__Batch__Request     import Schema__Decryption__Batch__Request
+from mgraph_ai_service_github.schemas.encryption.Schema__Decryption__Batch__Response    import Schema__Decryption__Batch__Response
+from mgraph_ai_service_github.schemas.encryption.Schema__Decryption__Batch__Result      import Schema__Decryption__Batch__Result
+from mgraph_ai_service_github.schemas.encryption.Schema__Encryption__Batch__Request     import Schema__Encryption__Batch__Request
+from mgraph_ai_service_github.schemas.encryption.Schema__Encryption__Batch__Response    import Schema__Encryption__Batch__Response
+from mgraph_ai_service_github.schemas.encryption.Schema__Encryption__Batch__Result      import Schema__Encryption__Batch__Result
+from mgraph_ai_service_github.service.encryption.Service__Encryption                    import Service__Encryption
+
+BATCH__OPERATION__ENCRYPT = 'encrypt'
+BATCH__OPERATION__DECRYPT = 'decrypt'
+
+# Module-level process pool - started on the first large batch and reused by later ones
+_process_pool      : Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+def encryption_batch_process_pool(max_workers : int) -> ProcessPoolExecutor:    # Shared pool ('spawn': forking a threaded server can deadlock)
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(max_workers = max_workers                        ,
+                                                mp_context  = multiprocessing.get_context('spawn'))
+        return _process_pool
+
+
+def shutdown_encryption_batch_process_pool():                                   # Stop the worker processes (the next large batch starts a new pool)
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=True)
+            _process_pool = None
+
+
+def run_batch_chunk(private_key_hex       : str                   ,             # Runs in the worker process (plain values in, plain values out)
+                    public_key_hex        : str                   ,
+                    operation             : str                   ,             # BATCH__OPERATION__ENCRYPT or BATCH__OPERATION__DECRYPT
+                    items                 : List[Tuple[str, str]] ,             # (encryption_type value, value)
+                    previous_private_keys : str = ''                            # keyring keys from earlier deploys (comma separated)
+                    ) -> List[Tuple[Optional[str], Optional[str]]]:             # (result, error) per item
+    service_encryption = Service__Encryption(private_key_hex       = private_key_hex      ,
+                                             public_key_hex        = public_key_hex       ,
+                                             previous_private_keys = previous_private_keys)
+    return [run_batch_item(service_encryption, operation, encryption_type, value) for encryption_type, value in items]
+
+
+def run_batch_item(service_encryption : Service__Encryption ,
+                   operation          : str                 ,
+                   encryption_type    : str                 ,
+                   value              : Optional[str]
+                   ) -> Tuple[Optional[str], Optional[str]]:                    # (result, error) - errors never abort the batch
+    try:
+        if operation == BATCH__OPERATION__ENCRYPT:
+            return service_encryption.encrypt_value(Enum__Encryption_Type(encryption_type), value), None
+        return service_encryption.decrypt_value(Enum__Encryption_Type(encryption_type), value), None
+    except Exception as e:
+        return None, str(e) or type(e).__name__
+
+
+class Service__Encryption__Batch(Type_Safe):                                    # Encrypt / decrypt many values in one call, in-process or across a process pool
+    service_encryption     : Service__Encryption
+    max_items              : int = ENCRYPTION__BATCH__MAX_ITEMS
+    max_bytes              : int = ENCRYPTION__BATCH__MAX_BYTES
+    process_pool_threshold : int = ENCRYPTION__BATCH__PROCESS_POOL_THRESHOLD
+    max_workers            : int = ENCRYPTION__BATCH__MAX_WORKERS
+
+    def encrypt_batch(self, request : Schema__Encryption__Batch__Request        # Encrypt every item, per-item errors
+                      ) -> Schema__Encryption__Batch__Response:
+        response = Schema__Encryption__Batch__Response()
+        items    = [(item.encryption_type.value, None if item.value is None else str(item.value)) for item in request.items]
+        outcomes = self._run_batch(BATCH__OPERATION__ENCRYPT, items, response)
+        for index, (encrypted, error) in enumerate(outcomes):
+            if error is None:
+                response.results.append(Schema__Encryption__Batch__Result(index=index, success=True, encrypted=Safe_Str__Encrypted_Value(encrypted)))
+                response.succeeded += 1
+            else:
+                response.results.append(Schema__Encryption__Batch__Result(index=index, error=Safe_Str__Text(error)))
+                response.failed    += 1
+        response.success = response.error is None and response.failed == 0
+        return response
+
+    def decrypt_batch(self, request : Schema__Decryption__Batch__Request        # Decrypt every item, per-item errors
+                      ) -> Schema__Decryption__Batch__Response:
+        response = Schema__Decryption__Batch__Response()
+        items    = [(item.encryption_type.value, item.encrypted) for item in request.items]       # in-process decrypts reuse each value's decoded bytes
+        outcomes = self._run_batch(BATCH__OPERATION__DECRYPT, items, response)
+        for index, (decrypted, error) in enumerate(outcomes):
+            if error is None:
+                response.results.append(Schema__Decryption__Batch__Result(index=index, success=True, decrypted=Safe_Str__Decrypted_Value(decrypted)))
+                response.succeeded += 1
+            else:
+                response.results.append(Schema__Decryption__Batch__Result(index=index, error=Safe_Str__Text(error)))
+                response.failed    += 1
+        response.success = response.error is None and response.failed == 0
+        return response
+
+    def use_process_pool(self, item_count : int) -> bool:
+        return self.max_workers > 1 and item_count >= self.process_pool_threshold
+
+    def _run_batch(self, operation : str   ,
+                         items     : list  ,
+                         response          # batch response (error is set when the whole batch is rejected)
+                   ) -> list:
+        if len(items) > self.max_items:
+            return self._reject(response, Enum__HTTP__Status.BAD_REQUEST_400, f"Too many items: {len(items)} (max {self.max_items})")
+        total_bytes = sum(len(value.encode('utf-8')) for _, value in items if value is not None)
+        if total_bytes > self.max_bytes:
+            return self._reject(response, Enum__HTTP__Status.PAYLOAD_TOO_LARGE_413, f"Batch too large: {total_bytes} bytes (max {self.max_bytes})")
+        try:
+            self.service_encryption.nacl_keys()                                 # fail once, not once per item
+        except ValueError as e:
+            return self._reject(response, Enum__HTTP__Status.SERVER_ERROR_500, str(e))
+        if self.use_process_pool(len(items)):
+            try:
+                return self._run_in_process_pool(operation, items)
+            except (OSError, NotImplementedError, BrokenProcessPool):           # e.g. no /dev/shm (AWS Lambda): fall back to in-process
+                shutdown_encryption_batch_process_pool()
+        return [run_batch_item(self.service_encryption, operation, encryption_type, value) for encryption_type, value in items]
+
+    def _reject(self, response, status_code : Enum__HTTP__Status, error : str) -> list:      # Whole batch rejected: no results
+        response.error       = Safe_Str__Text(error)
+        response.status_code = status_code
+        return []
+
+    def _run_in_process_pool(self, operation : str, items : list) -> list:     # One chunk per worker, results re-joined in request order
+        items      = [(encryption_type, None if value is None else str(value)) for encryption_type, value in items]      # plain str across the process boundary
+        chunk_size = -(-len(items) // self.max_workers)
+        chunks     = [items[start:start + chunk_size] for start in range(0, len(items), chunk_size)]
+        pool       = encryption_batch_process_pool(self.max_workers)
+        results    = []
+        for chunk_results in pool.map(run_batch_chunk,
+                                      [self.service_encryption.private_key_hex] * len(chunks),
+                                      [self.service_encryption.public_key_hex ] * len(chunks),
+                                      [operation                              ] * len(chunks),
+                                      chunks                                                 ,
+                                      [self.service_encryption.previous_private_keys] * len(chunks)):
+            results.extend(chunk_results)
+        return results
@@ -0,0 +1,150 @@
+import struct
+from typing                                                     import AsyncIterable, AsyncIterator, Iterable, Iterator
+from nacl                                                       import bindings
+from nacl.exceptions                                            import CryptoError
+from osbot_utils.type_safe.Type_Safe                            import Type_Safe
+from mgraph_ai_service_github.config                            import ENCRYPTION__STREAM__CHUNK_SIZE
+from mgraph_ai_service_github.service.encryption.NaCl__Keyring       import ENCRYPTION_ENVELOPE__HEADER_SIZE
+from mgraph_ai_service_github.service.encryption.Service__Encryption import Service__Encryption
+
+STREAM__ABYTES                  = bindings.crypto_secretstream_xchacha20poly1305_ABYTES          # MAC + tag added to every chunk
+STREAM__HEADERBYTES             = bindings.crypto_secretstream_xchacha20poly1305_HEADERBYTES
+STREAM__TAG_MESSAGE             = bindings.crypto_secretstream_xchacha20poly1305_TAG_MESSAGE
+STREAM__TAG_FINAL               = bindings.crypto_secretstream_xchacha20poly1305_TAG_FINAL
+
+ENCRYPTION_STREAM__MAGIC        = b'OSBE\x02'                                   # format marker + version (2: stream key in a keyring envelope)
+ENCRYPTION_STREAM__SEALED_KEY   = ENCRYPTION_ENVELOPE__HEADER_SIZE + bindings.crypto_box_SEALBYTES + bindings.crypto_secretstream_xchacha20poly1305_KEYBYTES    # ephemeral stream key, SealedBox'ed to the service public key and tagged with its fingerprint
+ENCRYPTION_STREAM__HEADER_SIZE  = len(ENCRYPTION_STREAM__MAGIC) + ENCRYPTION_STREAM__SEALED_KEY + STREAM__HEADERBYTES
+ENCRYPTION_STREAM__CHUNK_LENGTH = struct.Struct('>I')                           # ciphertext length in front of every chunk
+ENCRYPTION_STREAM__MEDIA_TYPE   = 'application/octet-stream'
+
+# Stream layout:   MAGIC | envelope(SealedBox(stream key)) | secretstream header | ( length | secretstream chunk )* ; the last chunk carries TAG_FINAL
+
+
+class Encryption__Stream__Encryptor(Type_Safe):                                 # Incremental encryptor: memory bounded by chunk_size whatever the payload size
+    service_encryption : Service__Encryption
+    chunk_size         : int    = ENCRYPTION__STREAM__CHUNK_SIZE
+    _state             : object = None
+    _buffer            : bytearray
+    _started           : bool
+    _finished          : bool
+
+    def _header(self) -> bytes:                                                 # MAGIC + sealed ephemeral key + secretstream header
+        keyring       = self.service_encryption.keyring()
+        stream_key    = bindings.crypto_secretstream_xchacha20poly1305_keygen()
+        sealed_key    = keyring.envelope(self.service_encryption.nacl_manager.encrypt_with_public_key(stream_key, keyring.current_keys().public_key))
+        self._state   = bindings.crypto_secretstream_xchacha20poly1305_state()
+        header        = bindings.crypto_secretstream_xchacha20poly1305_init_push(self._state, stream_key)
+        self._started = True
+        return ENCRYPTION_STREAM__MAGIC + sealed_key + header
+
+    def update(self, data : bytes) -> bytes:                                    # Returns whatever can be emitted so far (one chunk is always held back for TAG_FINAL)
+        output = bytearray() if self._started else bytearray(self._header())
+        self._buffer += data
+        while len(self._buffer) > self.chunk_size:
+            output += self._push(bytes(self._buffer[:self.chunk_size]), STREAM__TAG_MESSAGE)
+            del self._buffer[:self.chunk_size]
+        return bytes(output)
+
+    def finalize(self) -> bytes:                                                # Emits the last (possibly empty) chunk tagged FINAL
+        if self._finished:
+            raise ValueError("Encryption stream already finalized")
+        output = bytearray() if self._started else bytearray(self._header())
+        output += self._push(bytes(self._buffer), STREAM__TAG_FINAL)
+        self._buffer.clear()
+        self._finished = True
+        return bytes(output)
+
+    def _push(self, chunk : bytes, tag : int) -> bytes:
+        encrypted = bindings.crypto_secretstream_xchacha20poly1305_push(self._state, chunk, tag=tag)
+        return ENCRYPTION_STREAM__CHUNK_LENGTH.pack(len(encrypted)) + encrypted
+
+
+class Encryption__Stream__Decryptor(Type_Safe):                                 # Incremental decryptor: authenticates every chunk and refuses truncated streams
+    service_encryption : Service__Encryption
+    chunk_size         : int    = ENCRYPTION__STREAM__CHUNK_SIZE                 # largest chunk accepted (bounds memory)
+    _state             : object = None
+    _buffer            : bytearray
+    _finished          : bool
+
+    def update(self, data : bytes) -> bytes:                                    # Returns the plaintext of every complete chunk received so far
+        self._buffer += data
+        output = bytearray()
+        if self._state is None:
+            if len(self._buffer) < ENCRYPTION_STREAM__HEADER_SIZE:
+                return b''
+            self._open_header(bytes(self._buffer[:ENCRYPTION_STREAM__HEADER_SIZE]))
+            del self._buffer[:ENCRYPTION_STREAM__HEADER_SIZE]
+        while len(self._buffer) >= ENCRYPTION_STREAM__CHUNK_LENGTH.size:
+            if self._finished:
+                raise CryptoError("Unexpected data after the final chunk")
+            (length,) = ENCRYPTION_STREAM__CHUNK_LENGTH.unpack_from(self._buffer)
+            if length < STREAM__ABYTES or length > self.chunk_size + STREAM__ABYTES:
+                raise CryptoError(f"Invalid chunk length: {length}")
+            end = ENCRYPTION_STREAM__CHUNK_LENGTH.size + length
+            if len(self._buffer) < end:
+                break
+            chunk, tag = bindings.crypto_secretstream_xchacha20poly1305_pull(self._state, bytes(self._buffer[ENCRYPTION_STREAM__CHUNK_LENGTH.size:end]))
+            del self._buffer[:end]
+            output += chunk
+            if tag == STREAM__TAG_FINAL:
+                self._finished = True
+        return bytes(output)
+
+    def finalize(self) -> None:                                                 # Raises unless the FINAL chunk was seen and nothing is left over
+        if self._state is None:
+            raise CryptoError("Encrypted stream too short")
+        if not self._finished or self._buffer:
+            raise CryptoError("Encrypted stream truncated")
+
+    def _open_header(self, header : bytes) -> None:
+        if not header.startswith(ENCRYPTION_STREAM__MAGIC):
+            raise CryptoError("Not an encrypted stream")
+        nacl_manager = self.service_encryption.nacl_manager
+        sealed_key   = header[len(ENCRYPTION_STREAM__MAGIC):len(ENCRYPTION_STREAM__MAGIC) + ENCRYPTION_STREAM__SEALED_KEY]
+        stream_key   = self.service_encryption.keyring().open(sealed_key, lambda keys, sealed: nacl_manager.decrypt_with_private_key(sealed, keys.private_key))
+        self._state = bindings.crypto_secretstream_xchacha20poly1305_state()
+        bindings.crypto_secretstream_xchacha20poly1305_init_pull(self._state, header[-STREAM__HEADERBYTES:], stream_key)
+
+
+class Service__Encryption__Stream(Type_Safe):                                   # Encrypt / decrypt payloads of any size with constant memory (small values stay on Service__Encryption)
+    service_encryption : Service__Encryption
+    chunk_size         : int = ENCRYPTION__STREAM__CHUNK_SIZE
+
+    def encryptor(self) -> Encryption__Stream__Encryptor:
+        return Encryption__Stream__Encryptor(service_encryption=self.service_encryption, chunk_size=self.chunk_size)
+
+    def decryptor(self) -> Encryption__Stream__Decryptor:
+        return Encryption__Stream__Decryptor(service_encryption=self.service_encryption, chunk_size=self.chunk_size)
+
+    def encrypt(self, chunks : Iterable[bytes]) -> Iterator[bytes]:             # Plaintext chunks in, encrypted stream out
+        encryptor = self.encryptor()
+        for data in chunks:
+            output = encryptor.update(data)
+            if output:
+                yield output
+        yield encryptor.finalize()
+
+    def decrypt(self, chunks : Iterable[bytes]) -> Iterator[bytes]:             # Encrypted stream in, plaintext chunks out (raises CryptoError on tampering / truncation)
+        decryptor = self.decryptor()
+        for data in chunks:
+            output = decryptor.update(data)
+            if output:
+                yield output
+        decryptor.finalize()
+
+    async def encrypt_async(self, chunks : AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+        encryptor = self.encryptor()
+        async for data in chunks:
+            output = encryptor.update(data)
+            if output:
+                yield output
+        yield encryptor.finalize()
+
+    async def decrypt_async(self, chunks : AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+        decryptor = self.decryptor()
+        async for data in chunks:
+            output = decryptor.update(data)
+            if output:
+                yield output
+        decryptor.finalize()
@@ -0,0 +1,108 @@
+import base64
+import threading
+from typing                                                                             import List, Optional, Tuple
+from osbot_utils.type_safe.Type_Safe                                                    import Type_Safe
+from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text            import Safe_Str__Text
+from mgraph_ai_service_github.config                                                    import ENCRYPTION__TRANSCRYPT__MAX_ITEMS
+from mgraph_ai_service_github.schemas.encryption.Const__Encryption                      import TYPE_SAFE_STR__DECRYPTED_DATA__MAX_LENGTH
+from mgraph_ai_service_github.schemas.encryption.Safe_Str__Encrypted_Value              import Safe_Str__Encrypted_Value, decode_encrypted_value
+from mgraph_ai_service_github.schemas.encryption.Schema__Encryption__Transcrypt__Request  import Schema__Encryption__Transcrypt__Request
+from mgraph_ai_service_github.schemas.encryption.Schema__Encryption__Transcrypt__Response import Schema__Encryption__Transcrypt__Response
+from mgraph_ai_service_github.schemas.encryption.Schema__Encryption__Transcrypt__Result   import Schema__Encryption__Transcrypt__Result
+from mgraph_ai_service_github.service.encryption.Service__Encryption                    import Service__Encryption
+from mgraph_ai_service_github.service.github.GitHub__API                                import GitHub__API
+from mgraph_ai_service_github.service.github.cache.GitHub__Public_Key__Cache            import GitHub__Public_Key__Cache, GitHub__Public_Key__Cache__Entry, github_public_key_cache
+
+TRANSCRYPT__BUFFER_SIZE = TYPE_SAFE_STR__DECRYPTED_DATA__MAX_LENGTH             # largest plaintext a transcrypted value may hold
+
+_transcrypt_buffers = threading.local()                                         # one reusable plaintext buffer per worker thread
+
+
+def transcrypt_buffer() -> bytearray:                                           # This thread's plaintext buffer (allocated once, wiped after every use)
+    buffer = getattr(_transcrypt_buffers, 'buffer', None)
+    if buffer is None:
+        buffer = _transcrypt_buffers.buffer = bytearray(TRANSCRYPT__BUFFER_SIZE)
+    return buffer
+
+
+class Service__Encryption__Transcrypt(Type_Safe):                               # Service-encrypted values -> GitHub scope ciphertext, plaintext never leaves a wiped buffer
+    service_encryption : Service__Encryption
+    public_key_cache   : GitHub__Public_Key__Cache = None
+    max_items          : int                       = ENCRYPTION__TRANSCRYPT__MAX_ITEMS
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if self.public_key_cache is None:
+            self.public_key_cache = github_public_key_cache
+
+    def scope(self, owner       : Optional[str] = None ,                        # Returns (cache scope id, public-key endpoint)
+                    repo        : Optional[str] = None ,
+                    environment : Optional[str] = None ,
+                    org         : Optional[str] = None
+              ) -> Tuple[str, str]:
+        cache = self.public_key_cache
+        if org and not (owner or repo or environment):
+            return cache.scope_org(org), f"/orgs/{org}/actions/secrets/public-key"
+        if owner and repo and not org:
+            if environment:
+                return cache.scope_env(owner, repo, environment), f"/repos/{owner}/{repo}/environments/{environment}/secrets/public-key"
+            return cache.scope_repo(owner, repo), f"/repos/{owner}/{repo}/actions/secrets/public-key"
+        raise ValueError("Transcrypt needs either org, or owner and repo (with an optional environment)")
+
+    def scope_public_key(self, github_api : GitHub__API ,                       # Cached scope key (fetched from GitHub on a miss)
+                               scope      : str         ,
+                               endpoint   : str
+                         ) -> GitHub__Public_Key__Cache__Entry:
+        return self.public_key_cache.get_or_fetch(github_api.api_url, scope, lambda: github_api.get(endpoint))
+
+    def transcrypt(self, encrypted_value : Safe_Str__Encrypted_Value       ,    # Value sealed to the service public key
+                         entry           : GitHub__Public_Key__Cache__Entry     # Scope key to re-seal it to
+                   ) -> str:                                                    # base64 ciphertext, ready for GitHub's PUT body
+        keyring      = self.service_encryption.keyring()
+        nacl_manager = self.service_encryption.nacl_manager
+        buffer       = transcrypt_buffer()
+        length       = 0
+        try:
+            length = keyring.open(decode_encrypted_value(encrypted_value),                    # picks the key by the envelope's fingerprint
+                                  lambda keys, sealed: nacl_manager.decrypt_with_private_key_into(memoryview(sealed), keys.private_key, keys.public_key, buffer))
+            sealed = nacl_manager.seal_raw(memoryview(buffer)[:length], entry.public_key)
+            return base64.b64encode(sealed).decode('ascii')
+        finally:
+            nacl_manager.memzero(memoryview(buffer)[:length])
+
+    def transcrypt_values(self, encrypted_values : List[Safe_Str__Encrypted_Value] ,
+                                entry            : GitHub__Public_Key__Cache__Entry
+                          ) -> List[Tuple[Optional[str], Optional[str]]]:      # (encrypted_value, error) per value - errors never abort the batch
+        outcomes = []
+        for encrypted_value in encrypted_values:
+            try:
+                outcomes.append((self.transcrypt(encrypted_value, entry), None))
+            except Exception as e:
+                outcomes.append((None, str(e) or type(e).__name__))
+        return outcomes
+
+    def transcrypt_request(self, github_api : GitHub__API                            ,    # Raises ValueError for a bad request, GitHub errors propagate
+                                 request    : Schema__Encryption__Transcrypt__Request
+                           ) -> Schema__Encryption__Transcrypt__Response:
+        if len(request.encrypted_values) > self.max_items:
+            raise ValueError(f"Too many values: {len(request.encrypted_values)} (max {self.max_items})")
+        self.service_encryption.nacl_keys()                                     # fail once, not once per value
+        scope, endpoint = self.scope(owner       = request.owner       ,
+                                     repo        = request.repo        ,
+                                     environment = request.environment ,
+                                     org         = request.org         )
+        entry    = self.scope_public_key(github_api, scope, endpoint)
+        response = Schema__Encryption__Transcrypt__Response(scope  = scope                       ,
+                                                            key_id = Safe_Str__Text(entry.key_id))
+        for index, (encrypted_value, error) in enumerate(self.transcrypt_values(request.encrypted_values, entry)):
+            if error is None:
+                response.results.append(Schema__Encryption__Transcrypt__Result(index           = index                                     ,
+                                                                               success         = True                                      ,
+                                                                               encrypted_value = Safe_Str__Encrypted_Value(encrypted_value),
+                                                                               key_id          = Safe_Str__Text(entry.key_id)              ))
+                response.succeeded += 1
+            else:
+                response.results.append(Schema__Encryption__Transcrypt__Result(index=index, error=Safe_Str__Text(error)))
+                response.failed    += 1
+        response.success = response.failed == 0
+        return response
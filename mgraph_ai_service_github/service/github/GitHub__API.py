@@ -1,8 +1,15 @@
-from typing                                                                    import Dict, Optional, Any, Callable, Type
+from typing                                                                    import Dict, Optional, Any, Callable, Type, Iterator, List, Tuple
+from urllib.parse                                                              import urlencode
+from requests.utils                                                            import parse_header_links
 from osbot_utils.decorators.methods.cache_on_self                              import cache_on_self
 from osbot_utils.type_safe.Type_Safe                                           import Type_Safe
 from osbot_utils.utils.Env                                                     import get_env
+from mgraph_ai_service_github.config                                           import GITHUB_API__PER_PAGE
+from mgraph_ai_service_github.schemas.github.base.Schema__GitHub__Rate_Limit   import Schema__GitHub__Rate_Limit
+from mgraph_ai_service_github.service.github.cache.GitHub__API__Response_Cache import GitHub__API__Response_Cache, github_api_response_cache
+from mgraph_ai_service_github.service.github.rate_limit.GitHub__Rate_Limit__Tracker import github_rate_limit_tracker, rate_limit_from_headers, RATE_LIMIT__DEFAULT_RESOURCE
 from mgraph_ai_service_github.service.github.session.Requests__Session         import Requests__Session
+from mgraph_ai_service_github.service.github.session.Requests__Session__Response import Requests__Session__Response
 from mgraph_ai_service_github.service.github.session.Requests__Session__Github import Requests__Session__Github
 
 # todo see if can do this in a better way
@@ -19,14 +26,31 @@ def clear_session_factory():
     _session_factory = None
 
 
+def get_session_factory() -> Optional[Callable[[str], Requests__Session]]:      # Current custom session factory (so callers can restore it)
+    return _session_factory
+
+
+def next_page_url(headers : Dict[str, str]                                      # Response headers
+                  ) -> Optional[str]:                                           # Returns the Link rel="next" url (None on last page)
+    link_header = (headers or {}).get('Link')
+    if link_header:
+        for link in parse_header_links(link_header):
+            if link.get('rel') == 'next':
+                return link.get('url')
+    return None
+
+
 class GitHub__API(Type_Safe):
-    api_token : str = None
-    api_url   : str = 'https://api.github.com'
+    api_token      : str                         = None
+    api_url        : str                         = 'https://api.github.com'
+    response_cache : GitHub__API__Response_Cache = None                         # conditional GET cache (None disables it)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         if not self.api_token:
             self.api_token = get_env('GIT_HUB__ACCESS_TOKEN')
+        if 'response_cache' not in kwargs:
+            self.response_cache = github_api_response_cache
 
     @cache_on_self
     def session(self) -> Requests__Session:                                     # Get session (real or surrogate)
@@ -34,18 +58,69 @@ class GitHub__API(Type_Safe):
             return _session_factory(self.api_token)
         return Requests__Session__Github(api_token=self.api_token)
 
-    def get(self, endpoint : str                                                # API endpoint path
+    def get(self, endpoint : str                 ,                              # API endpoint path
+                  params   : Dict[str, Any] = None                              # Optional query string parameters
              ) -> Dict:                                                         # Returns JSON response
+        return self.get_response(endpoint, params).json()
+
+    def get_response(self, endpoint : str                 ,                     # API endpoint path
+                           params   : Dict[str, Any] = None                     # Optional query string parameters
+                      ) -> Requests__Session__Response:                         # Successful response (callers that also need the headers)
         url      = f"{self.api_url}{endpoint}"
-        response = self.session().get(url)
+        response = self.conditional_get(url, params)
         response.raise_for_status()
-        return response.json()
+        return response
+
+    def conditional_get(self, url    : str                 ,                   # Full url
+                              params : Dict[str, Any] = None                   # Optional query string parameters
+                         ) -> Requests__Session__Response:                     # GET revalidated with ETag / Last-Modified (304s don't count against the rate limit)
+        kwargs    = dict(params=params) if params else {}
+        cache     = self.response_cache
+        if cache is None:
+            return self.track_rate_limit(self.session().get(url, **kwargs))
+        cache_url = f'{url}?{urlencode(params)}' if params else url
+        entry     = cache.lookup(self.api_token, cache_url)
+        headers   = cache.conditional_headers(entry)
+        if headers:
+            kwargs['headers'] = headers
+        response  = self.track_rate_limit(self.session().get(url, **kwargs))
+        if response.status_code == 304 and entry is not None:
+            return cache.not_modified(entry)
+        if response.status_code == 200:
+            cache.store(self.api_token, cache_url, response)
+        return response
+
+    def paginate(self, endpoint  : str                                  ,       # API endpoint path
+                       items_key : str            = None                ,       # Key holding the items (None when the page is a JSON list)
+                       per_page  : int            = GITHUB_API__PER_PAGE,       # Page size requested from GitHub
+                       params    : Dict[str, Any] = None                        # Extra query string parameters
+                  ) -> Iterator[Dict]:                                          # Yields items lazily, one page in memory at a time
+        url    = f"{self.api_url}{endpoint}"
+        params = {**(params or {}), 'per_page': per_page}
+        while url:
+            response = self.conditional_get(url, params)
+            response.raise_for_status()
+            page     = response.json()
+            yield from (page.get(items_key) or []) if items_key else page
+            url      = next_page_url(response.headers)
+            params   = None                                                     # the next link already carries the query string
+
+    def get_page(self, endpoint  : str                                  ,       # API endpoint path
+                       items_key : str            = None                ,       # Key holding the items (None when the page is a JSON list)
+                       page      : int            = 1                   ,       # 1-based page number
+                       per_page  : int            = GITHUB_API__PER_PAGE,       # Page size requested from GitHub
+                       params    : Dict[str, Any] = None                        # Extra query string parameters
+                  ) -> Tuple[List[Dict], bool]:                                 # One page of items, and whether another page follows
+        response = self.get_response(endpoint, {**(params or {}), 'per_page': per_page, 'page': page})
+        data     = response.json()
+        items    = (data.get(items_key) or []) if items_key else data
+        return items, next_page_url(response.headers) is not None
 
     def put(self, endpoint : str              ,                                 # API endpoint path
                   data     : Dict[str, Any]                                     # Data to send
              ) -> Optional[Dict]:                                               # Returns JSON response if any
         url      = f"{self.api_url}{endpoint}"
-        response = self.session().put(url, json=data)
+        response = self.track_rate_limit(self.session().put(url, json=data))
         response.raise_for_status()
 
         if response.content:
@@ -55,6 +130,24 @@ class GitHub__API(Type_Safe):
     def delete(self, endpoint : str                                             # API endpoint path
                 ) -> bool:                                                      # Returns True if successful
         url      = f"{self.api_url}{endpoint}"
-        response = self.session().delete(url)
+        response = self.track_rate_limit(self.session().delete(url))
         response.raise_for_status()
-        return response.status_code == 204
\ No newline at end of file
+        return response.status_code == 204
+
+    def track_rate_limit(self, response : Requests__Session__Response           # Response to read X-RateLimit-* headers from
+                          ) -> Requests__Session__Response:                     # Returns the same response (so calls can be chained)
+        try:
+            github_rate_limit_tracker.update(self.api_token, rate_limit_from_headers(response.headers))
+        except (AttributeError, NotImplementedError, ValueError):               # sessions without headers / malformed values
+            pass
+        return response
+
+    def rate_limit(self, refresh  : bool = False                        ,       # When True, always fetch a fresh /rate_limit
+                         resource : str  = RATE_LIMIT__DEFAULT_RESOURCE         # Rate limit bucket
+                    ) -> Optional[Schema__GitHub__Rate_Limit]:                  # Snapshot from the last response (free) or from /rate_limit
+        snapshot = None if refresh else github_rate_limit_tracker.get(self.api_token, resource)
+        if snapshot is None:
+            rate_limit_data = self.get('/rate_limit')
+            rate_info       = rate_limit_data.get('resources', {}).get(resource) or rate_limit_data.get('rate', {})
+            snapshot        = github_rate_limit_tracker.update(self.api_token, {**rate_info, 'resource': resource})
+        return snapshot
@@ -0,0 +1,136 @@
+from typing                                                                          import Dict, List, Optional, Any, Callable, AsyncIterator, Tuple
+from urllib.parse                                                                    import urlencode
+from osbot_utils.decorators.methods.cache_on_self                                    import cache_on_self
+from osbot_utils.type_safe.Type_Safe                                                 import Type_Safe
+from osbot_utils.utils.Env                                                           import get_env
+from mgraph_ai_service_github.config                                                 import GITHUB_API__PER_PAGE
+from mgraph_ai_service_github.schemas.github.base.Schema__GitHub__Rate_Limit         import Schema__GitHub__Rate_Limit
+from mgraph_ai_service_github.service.github.GitHub__API                             import next_page_url
+from mgraph_ai_service_github.service.github.cache.GitHub__API__Response_Cache       import GitHub__API__Response_Cache, github_api_response_cache
+from mgraph_ai_service_github.service.github.rate_limit.GitHub__Rate_Limit__Tracker  import github_rate_limit_tracker, rate_limit_from_headers, RATE_LIMIT__DEFAULT_RESOURCE
+from mgraph_ai_service_github.service.github.session.Requests__Session__Response     import Requests__Session__Response
+from mgraph_ai_service_github.service.github.session.Requests__Session__Async        import Requests__Session__Async
+from mgraph_ai_service_github.service.github.session.Requests__Session__Github__Async import Requests__Session__Github__Async
+
+# Module-level async session factory - can be swapped for testing (mirrors GitHub__API.set_session_factory)
+_async_session_factory: Callable[[str], Requests__Session__Async] = None
+
+def set_async_session_factory(factory: Callable[[str], Requests__Session__Async]):     # Set custom async session factory
+    global _async_session_factory
+    _async_session_factory = factory
+
+
+def clear_async_session_factory():                                              # Clear custom async session factory
+    global _async_session_factory
+    _async_session_factory = None
+
+
+class GitHub__API__Async(Type_Safe):                                            # Non-blocking twin of GitHub__API (same endpoints, awaitable calls)
+    api_token      : str                         = None
+    api_url        : str                         = 'https://api.github.com'
+    response_cache : GitHub__API__Response_Cache = None                         # conditional GET cache (shared with GitHub__API, None disables it)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if not self.api_token:
+            self.api_token = get_env('GIT_HUB__ACCESS_TOKEN')
+        if 'response_cache' not in kwargs:
+            self.response_cache = github_api_response_cache
+
+    @cache_on_self
+    def session(self) -> Requests__Session__Async:                              # Get async session (real or surrogate)
+        if _async_session_factory is not None:
+            return _async_session_factory(self.api_token)
+        return Requests__Session__Github__Async(api_token=self.api_token)
+
+    async def get(self, endpoint : str                 ,                        # API endpoint path
+                        params   : Dict[str, Any] = None                        # Optional query string parameters
+                   ) -> Dict:                                                   # Returns JSON response
+        url      = f"{self.api_url}{endpoint}"
+        response = await self.conditional_get(url, params)
+        response.raise_for_status()
+        return response.json()
+
+    async def conditional_get(self, url    : str                 ,             # Full url
+                                    params : Dict[str, Any] = None             # Optional query string parameters
+                               ) -> Requests__Session__Response:               # GET revalidated with ETag / Last-Modified
+        kwargs    = dict(params=params) if params else {}
+        cache     = self.response_cache
+        if cache is None:
+            return self.track_rate_limit(await self.session().get(url, **kwargs))
+        cache_url = f'{url}?{urlencode(params)}' if params else url
+        entry     = cache.lookup(self.api_token, cache_url)
+        headers   = cache.conditional_headers(entry)
+        if headers:
+            kwargs['headers'] = headers
+        response  = self.track_rate_limit(await self.session().get(url, **kwargs))
+        if response.status_code == 304 and entry is not None:
+            return cache.not_modified(entry)
+        if response.status_code == 200:
+            cache.store(self.api_token, cache_url, response)
+        return response
+
+    async def paginate(self, endpoint  : str                                  , # API endpoint path
+                             items_key : str            = None                , # Key holding the items (None when the page is a JSON list)
+                             per_page  : int            = GITHUB_API__PER_PAGE, # Page size requested from GitHub
+                             params    : Dict[str, Any] = None                  # Extra query string parameters
+                        ) -> AsyncIterator[Dict]:                               # Yields items lazily, following Link rel="next"
+        url    = f"{self.api_url}{endpoint}"
+        params = {**(params or {}), 'per_page': per_page}
+        while url:
+            response = await self.conditional_get(url, params)
+            response.raise_for_status()
+            page     = response.json()
+            for item in ((page.get(items_key) or []) if items_key else page):
+                yield item
+            url      = next_page_url(response.headers)
+            params   = None
+
+    async def get_page(self, endpoint  : str                                  , # API endpoint path
+                             items_key : str            = None                , # Key holding the items (None when the page is a JSON list)
+                             page      : int            = 1                   , # 1-based page number
+                             per_page  : int            = GITHUB_API__PER_PAGE, # Page size requested from GitHub
+                             params    : Dict[str, Any] = None                  # Extra query string parameters
+                        ) -> Tuple[List[Dict], bool]:                           # One page of items, and whether another page follows
+        url      = f"{self.api_url}{endpoint}"
+        response = await self.conditional_get(url, {**(params or {}), 'per_page': per_page, 'page': page})
+        response.raise_for_status()
+        data     = response.json()
+        items    = (data.get(items_key) or []) if items_key else data
+        return items, next_page_url(response.headers) is not None
+
+    async def put(self, endpoint : str              ,                           # API endpoint path
+                        data     : Dict[str, Any]                               # Data to send
+                   ) -> Optional[Dict]:                                         # Returns JSON response if any
+        url      = f"{self.api_url}{endpoint}"
+        response = self.track_rate_limit(await self.session().put(url, json=data))
+        response.raise_for_status()
+
+        if response.content:
+            return response.json()
+        return None
+
+    async def delete(self, endpoint : str                                       # API endpoint path
+                      ) -> bool:                                                # Returns True if successful
+        url      = f"{self.api_url}{endpoint}"
+        response = self.track_rate_limit(await self.session().delete(url))
+        response.raise_for_status()
+        return response.status_code == 204
+
+    def track_rate_limit(self, response : Requests__Session__Response           # Response to read X-RateLimit-* headers from
+                          ) -> Requests__Session__Response:
+        try:
+            github_rate_limit_tracker.update(self.api_token, rate_limit_from_headers(response.headers))
+        except (AttributeError, NotImplementedError, ValueError):
+            pass
+        return response
+
+    async def rate_limit(self, refresh  : bool = False                        , # When True, always fetch a fresh /rate_limit
+                               resource : str  = RATE_LIMIT__DEFAULT_RESOURCE   # Rate limit bucket
+                          ) -> Optional[Schema__GitHub__Rate_Limit]:
+        snapshot = None if refresh else github_rate_limit_tracker.get(self.api_token, resource)
+        if snapshot is None:
+            rate_limit_data = await self.get('/rate_limit')
+            rate_info       = rate_limit_data.get('resources', {}).get(resource) or rate_limit_data.get('rate', {})
+            snapshot        = github_rate_limit_tracker.update(self.api_token, {**rate_info, 'resource': resource})
+        return snapshot
@@ -1,20 +1,43 @@
 import base64
-from typing                                              import Dict, List, Any, Optional
+import time
+from concurrent.futures                                  import ThreadPoolExecutor
+from typing                                              import Dict, List, Any, Optional, Iterator, Tuple
 from nacl                                                import public
-from osbot_utils.decorators.methods.cache_on_self        import cache_on_self
+from requests.exceptions                                 import HTTPError
 from osbot_utils.type_safe.Type_Safe                     import Type_Safe
+from mgraph_ai_service_github.config                     import GITHUB_API__BULK_WRITE__MAX_WORKERS, GITHUB_API__PER_PAGE
 from mgraph_ai_service_github.service.github.GitHub__API import GitHub__API
+from mgraph_ai_service_github.service.github.cache.GitHub__Public_Key__Cache import GitHub__Public_Key__Cache, GitHub__Public_Key__Cache__Entry, github_public_key_cache
+
+PUBLIC_KEY__REJECTED__STATUS_CODES = (400, 422)                                     # GitHub's answer when a write uses a rotated / unknown key_id
+
+
+def secret_metadata(secret : Dict[str, Any]                                         # Raw repo / environment secret from GitHub
+                    ) -> Dict[str, Any]:                                            # Just the fields the service exposes
+    return { 'name'       : secret.get('name')       ,
+             'created_at' : secret.get('created_at') ,
+             'updated_at' : secret.get('updated_at') }
+
+
+def org_secret_metadata(secret : Dict[str, Any]                                     # Raw org secret from GitHub
+                        ) -> Dict[str, Any]:                                        # Just the fields the service exposes
+    return { **secret_metadata(secret)                                            ,
+             'visibility'                : secret.get('visibility')                ,
+             'selected_repositories_url' : secret.get('selected_repositories_url') }
 
 # todo: this class needs to be split in two: one focused only on the REST calls and one that provides an easy api to access and manipulate the secrets
 class GitHub__Secrets(Type_Safe):
-    api_token : str
-    repo_name : str             # BUG refactor to repo_owner and github_name (and use type_safe vars)
-    api       : GitHub__API = None
+    api_token        : str
+    repo_name        : str             # BUG refactor to repo_owner and github_name (and use type_safe vars)
+    api              : GitHub__API               = None
+    public_key_cache : GitHub__Public_Key__Cache = None                             # process-wide by default, shared across requests
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         if not self.api:
             self.api = GitHub__API(api_token=self.api_token)
+        if not self.public_key_cache:
+            self.public_key_cache = github_public_key_cache
 
         # Parse repo name into owner and repo
         if '/' in self.repo_name:
@@ -30,24 +53,53 @@ class GitHub__Secrets(Type_Safe):
         encrypted        = sealed_box.encrypt(secret_value.encode("utf-8"))
         return base64.b64encode(encrypted).decode("utf-8")
 
-    @cache_on_self
-    def get_public_key(self) -> Dict[str, str]:                                    # Get repository's public key for encryption
+    def get_public_key(self) -> Dict[str, str]:                                    # Get repository's public key for encryption (cached across requests)
+        scope    = self.public_key_cache.scope_repo(self.owner, self.repo)
         endpoint = f"/repos/{self.owner}/{self.repo}/actions/secrets/public-key"
-        response = self.api.get(endpoint)
-        return { 'key_id' : response.get('key_id') ,
-                 'key'    : response.get('key')    }
-
-    def list_secrets(self) -> List[Dict[str, Any]]:                                # List all secrets in the repository
+        return self._public_key_entry(scope, endpoint)[0].public_key_data()
+
+    def _public_key_entry(self, scope    : str ,                                   # repo:/env:/org: scope id
+                                endpoint : str                                      # public-key endpoint for that scope
+                          ) -> Tuple[GitHub__Public_Key__Cache__Entry, bool]:       # Returns (entry, True if it came from the cache)
+        entry = self.public_key_cache.get(self.api.api_url, scope)
+        if entry is not None:
+            return entry, True
+        return self.public_key_cache.put(self.api.api_url, scope, self.api.get(endpoint)), False
+
+    def _put_encrypted_secret(self, scope        : str         ,                   # Scope whose public key encrypts the value
+                                    key_endpoint : str         ,                   # public-key endpoint for that scope
+                                    endpoint     : str         ,                   # secret endpoint to PUT to
+                                    secret_value : str         ,                   # Plain text secret value
+                                    extra_data   : Dict = None                     # Extra PUT fields (e.g. org visibility)
+                              ) -> Optional[Dict]:
+        while True:
+            entry, from_cache = self._public_key_entry(scope, key_endpoint)
+            data              = { 'encrypted_value' : entry.encrypt(secret_value) ,
+                                  'key_id'          : entry.key_id                ,
+                                  **(extra_data or {})                            }
+            try:
+                return self.api.put(endpoint, data)
+            except HTTPError as error:
+                status_code = getattr(error.response, 'status_code', None)
+                if from_cache and status_code in PUBLIC_KEY__REJECTED__STATUS_CODES:    # key rotated since we cached it: refetch once and retry
+                    self.public_key_cache.invalidate(self.api.api_url, scope)
+                    continue
+                raise
+
+    def iter_secrets(self) -> Iterator[Dict[str, Any]]:                            # Yield all repository secrets, following pagination
         endpoint = f"/repos/{self.owner}/{self.repo}/actions/secrets"
-        response = self.api.get(endpoint)
+        for secret in self.api.paginate(endpoint, items_key='secrets'):
+            yield secret_metadata(secret)
 
-        secrets = []
-        for secret in response.get('secrets', []):
-            secrets.append({ 'name'       : secret.get('name')       ,
-                            'created_at' : secret.get('created_at') ,
-                            'updated_at' : secret.get('updated_at') })
+    def secrets_page(self, page     : int = 1                    ,                  # 1-based page number
+                           per_page : int = GITHUB_API__PER_PAGE                    # Page size (GitHub caps it at 100)
+                      ) -> Tuple[List[Dict[str, Any]], bool]:                       # One page of repository secrets, and whether another page follows
+        endpoint       = f"/repos/{self.owner}/{self.repo}/actions/secrets"
+        secrets, more = self.api.get_page(endpoint, items_key='secrets', page=page, per_page=per_page)
+        return [secret_metadata(secret) for secret in secrets], more
 
-        return secrets
+    def list_secrets(self) -> List[Dict[str, Any]]:                                # List all secrets in the repository
+        return list(self.iter_secrets())
 
     def get_secret(self, secret_name : str                                         # Name of the secret
                    ) -> Optional[Dict[str, str]]:                                  # Returns secret metadata (not the value)
@@ -98,20 +150,55 @@ class GitHub__Secrets(Type_Safe):
                                       secret_value : str                            # Value of the secret
                                 ) -> bool:                                          # Returns True if successful
         try:
-            public_key_data = self.get_public_key()
-            encrypted_value = self._encrypt_secret(public_key_data['key'], secret_value)
-
-            endpoint = f"/repos/{self.owner}/{self.repo}/actions/secrets/{secret_name}"
-            data     = { 'encrypted_value' : encrypted_value               ,
-                        'key_id'          : public_key_data['key_id']     }
-
-            self.api.put(endpoint, data)
+            self.write_secret(secret_name, secret_value)
             return True
 
         except Exception as e:
             print(f"Error creating/updating secret '{secret_name}': {e}")
             return False
 
+    def write_secret(self, secret_name  : str        ,                             # Name of the secret
+                           secret_value : str        ,                             # Value of the secret
+                           environment  : str = None                               # Environment name (None for a repository secret)
+                     ) -> None:                                                     # Raises on failure (create_or_update_* return False instead)
+        if environment:
+            scope    = self.public_key_cache.scope_env(self.owner, self.repo, environment)
+            base_url = f"/repos/{self.owner}/{self.repo}/environments/{environment}/secrets"
+        else:
+            scope    = self.public_key_cache.scope_repo(self.owner, self.repo)
+            base_url = f"/repos/{self.owner}/{self.repo}/actions/secrets"
+        self._put_encrypted_secret(scope        = scope                         ,
+                                   key_endpoint = f"{base_url}/public-key"      ,
+                                   endpoint     = f"{base_url}/{secret_name}"   ,
+                                   secret_value = secret_value                  )
+
+    def create_or_update_secrets(self, secrets     : Dict[str, str]                              ,   # secret_name -> plain text value
+                                       max_workers : int = GITHUB_API__BULK_WRITE__MAX_WORKERS       # Bound on concurrent PUTs
+                                 ) -> Dict[str, Dict[str, Any]]:                   # secret_name -> {success, duration, error}
+        scope        = self.public_key_cache.scope_repo(self.owner, self.repo)
+        key_endpoint = f"/repos/{self.owner}/{self.repo}/actions/secrets/public-key"
+        results      = {}
+        if not secrets:
+            return results
+        self._public_key_entry(scope, key_endpoint)                                 # fetch (or reuse) the key once before fanning out (auth errors raise here)
+
+        def put_secret(item):
+            secret_name, secret_value = item
+            start = time.perf_counter()
+            try:
+                self.write_secret(secret_name, secret_value)
+                error = None
+            except Exception as e:
+                error = str(e)
+            return secret_name, {'success'  : error is None                  ,
+                                 'duration' : time.perf_counter() - start    ,
+                                 'error'    : error                          }
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(secrets)))) as executor:
+            for secret_name, result in executor.map(put_secret, secrets.items()):
+                results[secret_name] = result
+        return results
+
     def delete_secret(self, secret_name : str                                      # Name of the secret to delete
                       ) -> bool:                                                    # Returns True if successful
         try:
@@ -157,12 +244,11 @@ class GitHub__Secrets(Type_Safe):
         results = {}
 
         # Get existing secrets
-        existing_secrets = {s['name'] for s in self.list_secrets()}
+        existing_secrets = {s['name'] for s in self.iter_secrets()}
 
-        # Create/update provided secrets
-        for secret_name, secret_value in secrets.items():
-            success                        = self.create_or_update_secret(secret_name, secret_value)
-            results[f"set_{secret_name}"] = success
+        # Create/update provided secrets (concurrently, one public key fetch)
+        for secret_name, result in self.create_or_update_secrets(secrets).items():
+            results[f"set_{secret_name}"] = result['success']
 
         # Delete secrets not in the provided list if replace_all is True
         if replace_all:
@@ -179,9 +265,9 @@ class GitHub__Secrets(Type_Safe):
 
     def secrets_names(self, environment=None) -> List[str]:
         if environment:
-            secrets = self.list_environment_secrets(environment=environment)
+            secrets = self.iter_environment_secrets(environment=environment)
         else:
-            secrets = self.list_secrets()
+            secrets = self.iter_secrets()
         return [secret.get('name') for secret in secrets]
 
     def configure_from_env_vars(self, env_mapping : Dict[str, str]                 # Maps secret_name to env_var_name
@@ -206,20 +292,23 @@ class GitHub__Secrets(Type_Safe):
         return results
 
     # Organization secrets management (requires org admin access)
-    def list_org_secrets(self, org_name : str                                      # Organization name
-                         ) -> List[Dict[str, Any]]:                                 # Returns list of org secrets
+    def iter_org_secrets(self, org_name : str                                      # Organization name
+                         ) -> Iterator[Dict[str, Any]]:                             # Yield org secrets, following pagination
         endpoint = f"/orgs/{org_name}/actions/secrets"
-        response = self.api.get(endpoint)
+        for secret in self.api.paginate(endpoint, items_key='secrets'):
+            yield org_secret_metadata(secret)
 
-        secrets = []
-        for secret in response.get('secrets', []):
-            secrets.append({ 'name'       : secret.get('name')       ,
-                            'created_at' : secret.get('created_at') ,
-                            'updated_at' : secret.get('updated_at') ,
-                            'visibility' : secret.get('visibility') ,
-                            'selected_repositories_url' : secret.get('selected_repositories_url') })
+    def org_secrets_page(self, org_name : str                        ,              # Organization name
+                               page     : int = 1                    ,              # 1-based page number
+                               per_page : int = GITHUB_API__PER_PAGE                # Page size (GitHub caps it at 100)
+                          ) -> Tuple[List[Dict[str, Any]], bool]:                   # One page of org secrets, and whether another page follows
+        endpoint      = f"/orgs/{org_name}/actions/secrets"
+        secrets, more = self.api.get_page(endpoint, items_key='secrets', page=page, per_page=per_page)
+        return [org_secret_metadata(secret) for secret in secrets], more
 
-        return secrets
+    def list_org_secrets(self, org_name : str                                      # Organization name
+                         ) -> List[Dict[str, Any]]:                                 # Returns list of org secrets
+        return list(self.iter_org_secrets(org_name))
 
     def create_or_update_org_secret(self, org_name     : str              ,        # Organization name
                                           secret_name  : str              ,        # Name of the secret
@@ -228,21 +317,15 @@ class GitHub__Secrets(Type_Safe):
                                           repo_ids     : List[int] = None          # List of repository IDs if visibility is 'selected'
                                     ) -> bool:                                      # Returns True if successful
         try:
-            # Get org public key
-            endpoint        = f"/orgs/{org_name}/actions/secrets/public-key"
-            public_key_data = self.api.get(endpoint)
-            encrypted_value = self._encrypt_secret(public_key_data['key'], secret_value)
-
-            # Create/update the secret
-            endpoint = f"/orgs/{org_name}/actions/secrets/{secret_name}"
-            data     = { 'encrypted_value' : encrypted_value               ,
-                        'key_id'          : public_key_data['key_id']     ,
-                        'visibility'      : visibility                    }
-
+            extra_data = {'visibility': visibility}
             if visibility == 'selected' and repo_ids:
-                data['selected_repository_ids'] = repo_ids
+                extra_data['selected_repository_ids'] = repo_ids
 
-            self.api.put(endpoint, data)
+            self._put_encrypted_secret(scope        = self.public_key_cache.scope_org(org_name)           ,
+                                       key_endpoint = f"/orgs/{org_name}/actions/secrets/public-key"     ,
+                                       endpoint     = f"/orgs/{org_name}/actions/secrets/{secret_name}"  ,
+                                       secret_value = secret_value                                       ,
+                                       extra_data   = extra_data                                         )
             return True
 
         except Exception as e:
@@ -250,35 +333,30 @@ class GitHub__Secrets(Type_Safe):
             return False
 
     # Environment secrets management
-    def list_environment_secrets(self, environment : str                           # Environment name
-                                ) -> List[Dict[str, Any]]:                         # Returns list of environment secrets
+    def iter_environment_secrets(self, environment : str                           # Environment name
+                                ) -> Iterator[Dict[str, Any]]:                     # Yield environment secrets, following pagination
         endpoint = f"/repos/{self.owner}/{self.repo}/environments/{environment}/secrets"
-        response = self.api.get(endpoint)
+        for secret in self.api.paginate(endpoint, items_key='secrets'):
+            yield secret_metadata(secret)
 
-        secrets = []
-        for secret in response.get('secrets', []):
-            secrets.append({ 'name'       : secret.get('name')       ,
-                             'created_at' : secret.get('created_at') ,
-                             'updated_at' : secret.get('updated_at') })
+    def environment_secrets_page(self, environment : str                        ,   # Environment name
+                                       page        : int = 1                    ,   # 1-based page number
+                                       per_page    : int = GITHUB_API__PER_PAGE     # Page size (GitHub caps it at 100)
+                                  ) -> Tuple[List[Dict[str, Any]], bool]:           # One page of environment secrets, and whether another page follows
+        endpoint      = f"/repos/{self.owner}/{self.repo}/environments/{environment}/secrets"
+        secrets, more = self.api.get_page(endpoint, items_key='secrets', page=page, per_page=per_page)
+        return [secret_metadata(secret) for secret in secrets], more
 
-        return secrets
+    def list_environment_secrets(self, environment : str                           # Environment name
+                                ) -> List[Dict[str, Any]]:                         # Returns list of environment secrets
+        return list(self.iter_environment_secrets(environment))
 
     def create_or_update_environment_secret(self, environment  : str ,             # Environment name
                                                   secret_name  : str ,             # Name of the secret
                                                   secret_value : str               # Value of the secret
                                             ) -> bool:                              # Returns True if successful
         try:
-            # Get environment public key
-            endpoint        = f"/repos/{self.owner}/{self.repo}/environments/{environment}/secrets/public-key"
-            public_key_data = self.api.get(endpoint)
-            encrypted_value = self._encrypt_secret(public_key_data['key'], secret_value)
-
-            # Create/update the secret
-            endpoint = f"/repos/{self.owner}/{self.repo}/environments/{environment}/secrets/{secret_name}"
-            data     = { 'encrypted_value' : encrypted_value               ,
-                        'key_id'          : public_key_data['key_id']     }
-
-            self.api.put(endpoint, data)
+            self.write_secret(secret_name, secret_value, environment=environment)
             return True
 
         except Exception as e:
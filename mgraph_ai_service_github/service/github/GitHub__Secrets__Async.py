@@ -0,0 +1,176 @@
+import asyncio
+from typing                                                     import Dict, List, Any, Optional, AsyncIterator, Tuple
+from requests.exceptions                                        import HTTPError
+from osbot_utils.type_safe.Type_Safe                            import Type_Safe
+from mgraph_ai_service_github.config                            import GITHUB_API__PER_PAGE
+from mgraph_ai_service_github.service.github.GitHub__API__Async import GitHub__API__Async
+from mgraph_ai_service_github.service.github.GitHub__Secrets    import PUBLIC_KEY__REJECTED__STATUS_CODES, secret_metadata, org_secret_metadata
+from mgraph_ai_service_github.service.github.cache.GitHub__Public_Key__Cache import GitHub__Public_Key__Cache, GitHub__Public_Key__Cache__Entry, github_public_key_cache
+
+
+class GitHub__Secrets__Async(Type_Safe):                                            # Non-blocking twin of GitHub__Secrets (REST calls only)
+    api_token        : str
+    repo_name        : str
+    api              : GitHub__API__Async        = None
+    public_key_cache : GitHub__Public_Key__Cache = None                             # shared with GitHub__Secrets by default
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if not self.api:
+            self.api = GitHub__API__Async(api_token=self.api_token)
+        if not self.public_key_cache:
+            self.public_key_cache = github_public_key_cache
+
+        if '/' in self.repo_name:
+            self.owner, self.repo = self.repo_name.split('/', 1)
+        else:
+            raise ValueError("repo_name must be in format 'owner/repo'")
+
+    async def get_public_key(self) -> Dict[str, str]:                               # Get repository's public key for encryption (cached across requests)
+        scope    = self.public_key_cache.scope_repo(self.owner, self.repo)
+        endpoint = f"/repos/{self.owner}/{self.repo}/actions/secrets/public-key"
+        entry, _ = await self._public_key_entry(scope, endpoint)
+        return entry.public_key_data()
+
+    async def _public_key_entry(self, scope    : str ,                              # repo:/env:/org: scope id
+                                      endpoint : str                                # public-key endpoint for that scope
+                                 ) -> Tuple[GitHub__Public_Key__Cache__Entry, bool]:
+        entry = self.public_key_cache.get(self.api.api_url, scope)
+        if entry is not None:
+            return entry, True
+        return self.public_key_cache.put(self.api.api_url, scope, await self.api.get(endpoint)), False
+
+    async def _put_encrypted_secret(self, scope        : str         ,              # Scope whose public key encrypts the value
+                                          key_endpoint : str         ,
+                                          endpoint     : str         ,
+                                          secret_value : str         ,
+                                          extra_data   : Dict = None
+                                     ) -> Optional[Dict]:                           # Retries once with a fresh key if a cached key_id is rejected
+        while True:
+            entry, from_cache = await self._public_key_entry(scope, key_endpoint)
+            data              = { 'encrypted_value' : entry.encrypt(secret_value) ,
+                                  'key_id'          : entry.key_id                ,
+                                  **(extra_data or {})                            }
+            try:
+                return await self.api.put(endpoint, data)
+            except HTTPError as error:
+                status_code = getattr(error.response, 'status_code', None)
+                if from_cache and status_code in PUBLIC_KEY__REJECTED__STATUS_CODES:
+                    self.public_key_cache.invalidate(self.api.api_url, scope)
+                    continue
+                raise
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # List / get
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    async def iter_secrets(self) -> AsyncIterator[Dict[str, Any]]:                  # Yield all repository secrets, following pagination
+        async for secret in self.api.paginate(f"/repos/{self.owner}/{self.repo}/actions/secrets", items_key='secrets'):
+            yield secret_metadata(secret)
+
+    async def iter_environment_secrets(self, environment : str                      # Environment name
+                                        ) -> AsyncIterator[Dict[str, Any]]:
+        async for secret in self.api.paginate(f"/repos/{self.owner}/{self.repo}/environments/{environment}/secrets", items_key='secrets'):
+            yield secret_metadata(secret)
+
+    async def iter_org_secrets(self, org_name : str                                 # Organization name
+                                ) -> AsyncIterator[Dict[str, Any]]:
+        async for secret in self.api.paginate(f"/orgs/{org_name}/actions/secrets", items_key='secrets'):
+            yield org_secret_metadata(secret)
+
+    async def secrets_page(self, page     : int = 1                    ,            # 1-based page number
+                                 per_page : int = GITHUB_API__PER_PAGE              # Page size (GitHub caps it at 100)
+                            ) -> Tuple[List[Dict[str, Any]], bool]:                 # One page of repository secrets, and whether another page follows
+        endpoint      = f"/repos/{self.owner}/{self.repo}/actions/secrets"
+        secrets, more = await self.api.get_page(endpoint, items_key='secrets', page=page, per_page=per_page)
+        return [secret_metadata(secret) for secret in secrets], more
+
+    async def list_secrets(self) -> List[Dict[str, Any]]:                           # List all secrets in the repository
+        return [secret async for secret in self.iter_secrets()]
+
+    async def list_environment_secrets(self, environment : str                      # Environment name
+                                        ) -> List[Dict[str, Any]]:
+        return [secret async for secret in self.iter_environment_secrets(environment)]
+
+    async def list_org_secrets(self, org_name : str                                 # Organization name
+                                ) -> List[Dict[str, Any]]:
+        return [secret async for secret in self.iter_org_secrets(org_name)]
+
+    async def get_secret(self, secret_name : str                                    # Name of the secret
+                          ) -> Optional[Dict[str, str]]:                            # Returns secret metadata (not the value)
+        try:
+            response = await self.api.get(f"/repos/{self.owner}/{self.repo}/actions/secrets/{secret_name}")
+            return secret_metadata(response)
+        except Exception:
+            return None
+
+    async def get_environment_secret(self, environment : str ,                      # Environment name
+                                           secret_name : str                        # Name of the secret
+                                      ) -> Optional[Dict[str, str]]:
+        try:
+            response = await self.api.get(f"/repos/{self.owner}/{self.repo}/environments/{environment}/secrets/{secret_name}")
+            return secret_metadata(response)
+        except Exception:
+            return None
+
+    async def get_org_secret(self, org_name    : str ,                              # Organization name
+                                   secret_name : str                                # Name of the secret
+                              ) -> Optional[Dict[str, str]]:
+        try:
+            response = await self.api.get(f"/orgs/{org_name}/actions/secrets/{secret_name}")
+            return org_secret_metadata(response)
+        except Exception:
+            return None
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Create / update / delete
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    async def write_secret(self, secret_name  : str        ,                        # Name of the secret
+                                 secret_value : str        ,                        # Value of the secret
+                                 environment  : str = None                          # Environment name (None for a repository secret)
+                            ) -> None:                                              # Raises on failure, callers map the error
+        if environment:
+            scope    = self.public_key_cache.scope_env(self.owner, self.repo, environment)
+            base_url = f"/repos/{self.owner}/{self.repo}/environments/{environment}/secrets"
+        else:
+            scope    = self.public_key_cache.scope_repo(self.owner, self.repo)
+            base_url = f"/repos/{self.owner}/{self.repo}/actions/secrets"
+        await self._put_encrypted_secret(scope        = scope                       ,
+                                         key_endpoint = f"{base_url}/public-key"    ,
+                                         endpoint     = f"{base_url}/{secret_name}" ,
+                                         secret_value = secret_value                )
+
+    async def write_org_secret(self, org_name     : str              ,              # Organization name
+                                     secret_name  : str              ,              # Name of the secret
+                                     secret_value : str              ,              # Value of the secret
+                                     visibility   : str = 'selected' ,              # 'all', 'private', or 'selected'
+                                     repo_ids     : List[int] = None                # List of repository IDs if visibility is 'selected'
+                                ) -> None:                                          # Raises on failure
+        extra_data = {'visibility': visibility}
+        if visibility == 'selected' and repo_ids:
+            extra_data['selected_repository_ids'] = repo_ids
+        await self._put_encrypted_secret(scope        = self.public_key_cache.scope_org(org_name)          ,
+                                         key_endpoint = f"/orgs/{org_name}/actions/secrets/public-key"    ,
+                                         endpoint     = f"/orgs/{org_name}/actions/secrets/{secret_name}" ,
+                                         secret_value = secret_value                                      ,
+                                         extra_data   = extra_data                                        )
+
+    async def delete_secret(self, secret_name : str        ,                        # Name of the secret
+                                  environment : str = None                          # Environment name (None for a repository secret)
+                             ) -> bool:                                             # True once deleted, raises on failure
+        if environment:
+            return await self.api.delete(f"/repos/{self.owner}/{self.repo}/environments/{environment}/secrets/{secret_name}")
+        return await self.api.delete(f"/repos/{self.owner}/{self.repo}/actions/secrets/{secret_name}")
+
+    async def delete_org_secret(self, org_name    : str ,                           # Organization name
+                                      secret_name : str                             # Name of the secret
+                                 ) -> bool:                                         # True once deleted, raises on failure
+        return await self.api.delete(f"/orgs/{org_name}/actions/secrets/{secret_name}")
+
+    async def configure_secrets(self, secrets : Dict[str, str]                      # Dictionary of secret_name: secret_value pairs
+                                 ) -> Dict[str, bool]:                              # Writes run concurrently on the event loop
+        await self.get_public_key()                                                 # fetch key once before fanning out (auth errors raise here)
+        names   = list(secrets.keys())
+        results = await asyncio.gather(*[self.write_secret(name, secrets[name]) for name in names], return_exceptions=True)
+        return {f"set_{name}": not isinstance(result, BaseException) for name, result in zip(names, results)}
@@ -0,0 +1,86 @@
+import asyncio
+import time
+from typing                                                                     import Dict, Any, AsyncIterator, List
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from mgraph_ai_service_github.config                                            import GITHUB_API__FAN_OUT__MAX_WORKERS, GITHUB_API__FAN_OUT__RATE_LIMIT_RESERVE
+from mgraph_ai_service_github.service.github.GitHub__API__Async                 import GitHub__API__Async
+from mgraph_ai_service_github.service.github.GitHub__Secrets__Async             import GitHub__Secrets__Async
+from mgraph_ai_service_github.service.github.rate_limit.GitHub__Rate_Limit__Tracker import github_rate_limit_tracker
+
+FAN_OUT__ERROR__RATE_LIMIT_RESERVE = 'skipped: rate limit reserve reached'
+
+
+class GitHub__Secrets__Fan_Out(Type_Safe):                                      # Writes one secret value to many repositories / environments (on the event loop)
+    api_token          : str
+    api                : GitHub__API__Async = None                              # shared by every target (one pooled client, one rate limit snapshot)
+    max_workers        : int                = GITHUB_API__FAN_OUT__MAX_WORKERS  # writes in flight at once
+    rate_limit_reserve : int                = GITHUB_API__FAN_OUT__RATE_LIMIT_RESERVE
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if not self.api:
+            self.api = GitHub__API__Async(api_token=self.api_token)
+
+    def rate_limit_exhausted(self) -> bool:                                     # True when the last seen X-RateLimit-Remaining is at or below the reserve
+        snapshot = github_rate_limit_tracker.get(self.api_token)
+        return bool(snapshot and snapshot.remaining is not None and snapshot.remaining <= self.rate_limit_reserve)
+
+    async def write_target(self, target       : Dict[str, str] ,                      # {owner, repo, environment (optional)}
+                                 secret_name  : str            ,
+                                 secret_value : str
+                            ) -> Dict[str, Any]:                                # Per-target result (never raises)
+        start  = time.perf_counter()
+        result = { 'owner'       : target.get('owner')       ,
+                   'repo'        : target.get('repo')        ,
+                   'environment' : target.get('environment') ,
+                   'success'     : False                     ,
+                   'skipped'     : False                     ,
+                   'error'       : None                      }
+        if self.rate_limit_exhausted():
+            result['skipped'] = True
+            result['error'  ] = FAN_OUT__ERROR__RATE_LIMIT_RESERVE
+        else:
+            try:
+                github_secrets = GitHub__Secrets__Async(api_token = self.api_token                              ,
+                                                        repo_name = f"{target.get('owner')}/{target.get('repo')}",
+                                                        api       = self.api                                    )
+                await github_secrets.write_secret(secret_name, secret_value, environment=target.get('environment'))   # public key comes from the shared cache
+                result['success'] = True
+            except Exception as e:
+                result['error'] = str(e)
+        result['duration'] = time.perf_counter() - start
+        return result
+
+    async def iter_fan_out(self, secret_name  : str                  ,          # Name of the secret
+                                 secret_value : str                  ,          # Plain text value (already decrypted once by the caller)
+                                 targets      : List[Dict[str, str]]            # [{owner, repo, environment (optional)}]
+                            ) -> AsyncIterator[Dict[str, Any]]:                 # Yields per-target results as each write completes
+        if not targets:
+            return
+        max_workers = max(1, min(self.max_workers, len(targets)))
+        remaining   = iter(targets)
+        pending     = set()
+
+        def submit_next():                                                      # bounded window: a target is only started when a slot frees up
+            target = next(remaining, None)
+            if target is not None:
+                pending.add(asyncio.ensure_future(self.write_target(target, secret_name, secret_value)))
+
+        try:
+            for _ in range(max_workers):
+                submit_next()
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    pending.discard(task)
+                    submit_next()
+                    yield task.result()
+        finally:                                                                # consumer gone (e.g. client disconnect → aclose()): no further writes
+            for task in pending:
+                task.cancel()
+
+    async def fan_out(self, secret_name  : str                  ,
+                            secret_value : str                  ,
+                            targets      : List[Dict[str, str]]
+                       ) -> List[Dict[str, Any]]:                               # All results (completion order)
+        return [result async for result in self.iter_fan_out(secret_name, secret_value, targets)]
@@ -0,0 +1,111 @@
+import threading
+import time
+from collections                                                                import OrderedDict
+from typing                                                                     import Dict, Optional, Tuple
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from mgraph_ai_service_github.config                                            import GITHUB_API__RESPONSE_CACHE__MAX_ENTRIES, GITHUB_API__RESPONSE_CACHE__TTL
+from mgraph_ai_service_github.service.github.session.Requests__Session__Response        import Requests__Session__Response
+from mgraph_ai_service_github.service.github.session.Requests__Session__Response__Cached import Requests__Session__Response__Cached
+from mgraph_ai_service_github.utils.Token__Fingerprint                          import token_fingerprint
+
+RESPONSE_CACHE__KEPT_HEADERS = ('Link', 'Content-Type')                         # headers replayed on a 304 (Link keeps pagination working)
+
+
+class GitHub__API__Response_Cache__Entry(Type_Safe):                            # One cached GET response
+    etag          : str   = None
+    last_modified : str   = None
+    content       : bytes = b''
+    headers       : dict
+    stored_at     : float = 0.0
+
+
+class GitHub__API__Response_Cache(Type_Safe):                                   # Bounded LRU + TTL cache of GET responses, revalidated with If-None-Match / If-Modified-Since
+    max_entries   : int   = GITHUB_API__RESPONSE_CACHE__MAX_ENTRIES
+    ttl           : int   = GITHUB_API__RESPONSE_CACHE__TTL                     # seconds
+    hits          : int                                                         # 304s answered from the cache
+    misses        : int                                                         # lookups with no (live) entry
+    stores        : int
+    evictions     : int                                                         # dropped because the cache was full
+    expirations   : int                                                         # dropped because the ttl had passed
+    _entries      : OrderedDict
+    _lock         : object = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._lock = threading.Lock()
+
+    def cache_key(self, api_token : str, url : str) -> Tuple[str, str]:         # Responses are per token (visibility differs between PATs)
+        return token_fingerprint(api_token), url
+
+    def lookup(self, api_token : str, url : str                                 # Live entry for (token, url), or None
+                ) -> Optional[GitHub__API__Response_Cache__Entry]:
+        key = self.cache_key(api_token, url)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry.stored_at > self.ttl:
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def conditional_headers(self, entry : Optional[GitHub__API__Response_Cache__Entry]) -> Dict[str, str]:
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers['If-None-Match'    ] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    def store(self, api_token : str                         ,                   # Cache a 200 response (only if it carries a validator)
+                    url       : str                         ,
+                    response  : Requests__Session__Response
+               ) -> Optional[GitHub__API__Response_Cache__Entry]:
+        headers       = response.headers or {}
+        etag          = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return None
+        entry = GitHub__API__Response_Cache__Entry(etag          = etag                ,
+                                                   last_modified = last_modified       ,
+                                                   content       = response.content    ,
+                                                   headers       = {name: headers.get(name) for name in RESPONSE_CACHE__KEPT_HEADERS if headers.get(name)},
+                                                   stored_at     = time.monotonic()    )
+        key = self.cache_key(api_token, url)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self.stores += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return entry
+
+    def not_modified(self, entry : GitHub__API__Response_Cache__Entry           # Serve the cached body for a 304 (and refresh its ttl)
+                      ) -> Requests__Session__Response__Cached:
+        with self._lock:
+            self.hits       += 1
+            entry.stored_at  = time.monotonic()
+        return Requests__Session__Response__Cached(content=entry.content, headers=entry.headers)
+
+    def stats(self) -> Dict[str, int]:
+        return dict(entries     = len(self._entries) ,
+                    max_entries = self.max_entries   ,
+                    hits        = self.hits          ,
+                    misses      = self.misses        ,
+                    stores      = self.stores        ,
+                    evictions   = self.evictions     ,
+                    expirations = self.expirations   )
+
+    def clear(self) -> 'GitHub__API__Response_Cache':
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.stores = self.evictions = self.expirations = 0
+        return self
+
+
+github_api_response_cache = GitHub__API__Response_Cache()                       # module-level singleton used by GitHub__API
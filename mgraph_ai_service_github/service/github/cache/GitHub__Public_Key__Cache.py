@@ -0,0 +1,108 @@
+import base64
+import threading
+import time
+from collections                                import OrderedDict
+from typing                                     import Callable, Dict, Optional, Tuple
+from nacl.public                                import PublicKey, SealedBox
+from osbot_utils.type_safe.Type_Safe            import Type_Safe
+from mgraph_ai_service_github.config            import GITHUB_API__PUBLIC_KEY_CACHE__MAX_ENTRIES, GITHUB_API__PUBLIC_KEY_CACHE__TTL
+
+
+class GitHub__Public_Key__Cache__Entry(Type_Safe):                              # Public key of one secrets scope, with its SealedBox built once
+    key_id     : str       = None
+    key        : str       = None                                               # base64 public key (as returned by GitHub)
+    public_key : bytes     = None                                               # raw 32 byte key (for sealing straight from a buffer)
+    sealed_box : SealedBox = None
+    stored_at  : float     = 0.0
+
+    def encrypt(self, secret_value : str) -> str:                               # base64 sealed-box ciphertext, ready for the PUT body
+        return base64.b64encode(self.sealed_box.encrypt(secret_value.encode('utf-8'))).decode('utf-8')
+
+    def public_key_data(self) -> Dict[str, str]:
+        return {'key_id': self.key_id, 'key': self.key}
+
+
+class GitHub__Public_Key__Cache(Type_Safe):                                     # Process-wide TTL cache of repo / environment / org public keys
+    max_entries   : int = GITHUB_API__PUBLIC_KEY_CACHE__MAX_ENTRIES
+    ttl           : int = GITHUB_API__PUBLIC_KEY_CACHE__TTL                     # seconds
+    hits          : int
+    misses        : int
+    invalidations : int
+    _entries      : OrderedDict
+    _lock         : object = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._lock = threading.Lock()
+
+    def scope_repo(self, owner: str, repo: str) -> str:                         # Scope ids (same shape as the surrogate uses)
+        return f'repo:{owner}/{repo}'
+
+    def scope_env(self, owner: str, repo: str, environment: str) -> str:
+        return f'env:{owner}/{repo}/{environment}'
+
+    def scope_org(self, org: str) -> str:
+        return f'org:{org}'
+
+    def cache_key(self, api_url : str, scope : str) -> Tuple[str, str]:         # Keys are public, so they're shared across tokens (per GitHub host)
+        return api_url, scope
+
+    def get(self, api_url : str, scope : str                                    # Live entry, or None
+             ) -> Optional[GitHub__Public_Key__Cache__Entry]:
+        key = self.cache_key(api_url, scope)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry.stored_at > self.ttl:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, api_url : str, scope : str, public_key_data : Dict[str, str]  # Store {key_id, key} (builds the SealedBox once)
+             ) -> GitHub__Public_Key__Cache__Entry:
+        public_key = base64.b64decode(public_key_data['key'])
+        sealed_box = SealedBox(PublicKey(public_key))
+        entry      = GitHub__Public_Key__Cache__Entry(key_id     = str(public_key_data['key_id']) ,
+                                                      key        = public_key_data['key']         ,
+                                                      public_key = public_key                     ,
+                                                      sealed_box = sealed_box                     ,
+                                                      stored_at  = time.monotonic()               )
+        key = self.cache_key(api_url, scope)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def get_or_fetch(self, api_url : str                             ,          # GitHub host the key belongs to
+                           scope   : str                             ,          # repo:/env:/org: scope id
+                           fetch   : Callable[[], Dict[str, str]]               # Called on a miss, returns {key_id, key}
+                      ) -> GitHub__Public_Key__Cache__Entry:
+        return self.get(api_url, scope) or self.put(api_url, scope, fetch())
+
+    def invalidate(self, api_url : str, scope : str) -> bool:                   # Drop a key (e.g. GitHub rejected its key_id after a rotation)
+        with self._lock:
+            removed = self._entries.pop(self.cache_key(api_url, scope), None) is not None
+            if removed:
+                self.invalidations += 1
+            return removed
+
+    def stats(self) -> Dict[str, int]:
+        return dict(entries       = len(self._entries) ,
+                    hits          = self.hits          ,
+                    misses        = self.misses        ,
+                    invalidations = self.invalidations )
+
+    def clear(self) -> 'GitHub__Public_Key__Cache':
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.invalidations = 0
+        return self
+
+
+github_public_key_cache = GitHub__Public_Key__Cache()                           # module-level singleton used by GitHub__Secrets / GitHub__Secrets__Async
@@ -0,0 +1,171 @@
+import base64
+import binascii
+import json
+from concurrent.futures                                                         import ThreadPoolExecutor
+from typing                                                                     import Dict, Any, Iterator, List, Optional
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from mgraph_ai_service_github.config                                            import GITHUB_API__INVENTORY__MAX_WORKERS, GITHUB_API__INVENTORY__RATE_LIMIT_RESERVE
+from mgraph_ai_service_github.service.github.GitHub__API                        import GitHub__API
+from mgraph_ai_service_github.service.github.GitHub__Secrets                    import GitHub__Secrets
+from mgraph_ai_service_github.service.github.rate_limit.GitHub__Rate_Limit__Tracker import github_rate_limit_tracker
+
+INVENTORY__RECORD__ORG_SECRET         = 'org_secret'
+INVENTORY__RECORD__REPO               = 'repo'
+INVENTORY__RECORD__REPO_SECRET        = 'repo_secret'
+INVENTORY__RECORD__ENVIRONMENT_SECRET = 'environment_secret'
+INVENTORY__RECORD__ERROR              = 'error'
+INVENTORY__RECORD__CHECKPOINT         = 'checkpoint'
+
+
+def encode_inventory_checkpoint(org              : str           ,             # Opaque resume token: base64url of a small JSON document
+                                after_repo       : Optional[str] ,             # Last repo whose records were fully emitted (repos are crawled in name order)
+                                org_secrets_done : bool
+                                ) -> str:
+    state = dict(org=org, after_repo=after_repo, org_secrets_done=org_secrets_done)
+    return base64.urlsafe_b64encode(json.dumps(state).encode('utf-8')).decode('ascii')
+
+
+def decode_inventory_checkpoint(checkpoint : str                                # Value returned by encode_inventory_checkpoint
+                                ) -> Dict[str, Any]:
+    try:
+        state = json.loads(base64.urlsafe_b64decode(checkpoint.encode('ascii')))
+    except (binascii.Error, ValueError, UnicodeError) as e:
+        raise ValueError(f"Invalid inventory checkpoint: {e}")
+    if not isinstance(state, dict) or set(state) != {'org', 'after_repo', 'org_secrets_done'}:
+        raise ValueError("Invalid inventory checkpoint")
+    return state
+
+
+class GitHub__Secrets__Inventory__Rate_Limited(Exception):                      # Raised inside a repo crawl when GitHub (or the reserve) says stop
+    pass
+
+
+class GitHub__Secrets__Inventory(Type_Safe):                                    # Crawls every secret (org, repo, environment) of an organisation
+    api_token            : str
+    api                  : GitHub__API = None                                   # shared by every repo crawl (one pooled transport, one rate limit snapshot)
+    max_workers          : int         = GITHUB_API__INVENTORY__MAX_WORKERS
+    rate_limit_reserve   : int         = GITHUB_API__INVENTORY__RATE_LIMIT_RESERVE
+    include_environments : bool        = True
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if not self.api:
+            self.api = GitHub__API(api_token=self.api_token)
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Rate limit handling
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def rate_limit_exhausted(self) -> bool:                                     # True when the last seen X-RateLimit-Remaining is at or below the reserve
+        snapshot = github_rate_limit_tracker.get(self.api_token)
+        return bool(snapshot and snapshot.remaining is not None and snapshot.remaining <= self.rate_limit_reserve)
+
+    def is_rate_limit_error(self, error : Exception) -> bool:                   # 429, or GitHub's 403 "API rate limit exceeded"
+        response = getattr(error, 'response', None)
+        status   = getattr(response, 'status_code', None)
+        if status == 429:
+            return True
+        return status == 403 and 'rate limit' in str(error).lower() + (getattr(response, 'text', '') or '').lower()
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Listings
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def iter_org_repos(self, org : str) -> Iterator[Dict[str, Any]]:            # Org repos in full_name order (makes 'after_repo' checkpoints stable)
+        params = dict(sort='full_name', direction='asc')
+        yield from self.api.paginate(f"/orgs/{org}/repos", params=params)
+
+    def iter_repo_environments(self, owner : str, repo : str) -> Iterator[str]: # Environment names of a repo
+        for environment in self.api.paginate(f"/repos/{owner}/{repo}/environments", items_key='environments'):
+            yield environment.get('name')
+
+    def secret_record(self, record_type : str            ,                      # Inventory line for one secret (metadata only, GitHub never returns values)
+                            secret      : Dict[str, Any] ,
+                            **scope
+                      ) -> Dict[str, Any]:
+        record = dict(type=record_type, **scope, name=secret.get('name'), created_at=secret.get('created_at'), updated_at=secret.get('updated_at'))
+        if 'visibility' in secret:
+            record['visibility'] = secret.get('visibility')
+        return record
+
+    def error_record(self, error : Exception, **scope) -> Dict[str, Any]:
+        return dict(type=INVENTORY__RECORD__ERROR, **scope, error=str(error))
+
+    def org_secret_records(self, org : str) -> List[Dict[str, Any]]:            # Org secrets (an error record when the PAT can't read them)
+        try:
+            github_secrets = GitHub__Secrets(api_token=self.api_token, repo_name=f"{org}/placeholder", api=self.api)   # org secrets don't need a repo
+            return [self.secret_record(INVENTORY__RECORD__ORG_SECRET, secret, org=org)
+                    for secret in github_secrets.iter_org_secrets(org)]
+        except Exception as e:
+            if self.is_rate_limit_error(e):
+                raise GitHub__Secrets__Inventory__Rate_Limited(str(e))
+            return [self.error_record(e, org=org)]
+
+    def repo_records(self, owner : str, repo : Dict[str, Any]                   # All records of one repo (repo, repo secrets, environment secrets)
+                     ) -> List[Dict[str, Any]]:
+        repo_name = repo.get('name')
+        if self.rate_limit_exhausted():
+            raise GitHub__Secrets__Inventory__Rate_Limited('rate limit reserve reached')
+        try:
+            github_secrets = GitHub__Secrets(api_token=self.api_token, repo_name=f"{owner}/{repo_name}", api=self.api)
+            environments   = list(self.iter_repo_environments(owner, repo_name)) if self.include_environments else []
+            records        = [dict(type=INVENTORY__RECORD__REPO, owner=owner, repo=repo_name, private=repo.get('private'), environments=environments)]
+            records.extend(self.secret_record(INVENTORY__RECORD__REPO_SECRET, secret, owner=owner, repo=repo_name)
+                           for secret in github_secrets.iter_secrets())
+            for environment in environments:
+                records.extend(self.secret_record(INVENTORY__RECORD__ENVIRONMENT_SECRET, secret, owner=owner, repo=repo_name, environment=environment)
+                               for secret in github_secrets.iter_environment_secrets(environment))
+            return records
+        except Exception as e:
+            if self.is_rate_limit_error(e):
+                raise GitHub__Secrets__Inventory__Rate_Limited(str(e))
+            return [self.error_record(e, owner=owner, repo=repo_name)]
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Crawl
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def crawl(self, org        : str                  ,                         # Organisation (or user) to inventory
+                    checkpoint : Optional[str] = None                           # Resume point from a previous interrupted crawl
+              ) -> Iterator[Dict[str, Any]]:                                    # Yields records; the last one is a checkpoint record if the crawl was interrupted
+        state = decode_inventory_checkpoint(checkpoint) if checkpoint else dict(org=org, after_repo=None, org_secrets_done=False)
+        if state['org'] != org:
+            raise ValueError("Inventory checkpoint belongs to a different org")
+
+        def interrupted(reason):
+            return dict(type       = INVENTORY__RECORD__CHECKPOINT                                                    ,
+                        reason     = reason                                                                          ,
+                        checkpoint = encode_inventory_checkpoint(org, state['after_repo'], state['org_secrets_done']))
+
+        try:
+            if not state['org_secrets_done']:
+                yield from self.org_secret_records(org)
+                state['org_secrets_done'] = True
+
+            with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+                for batch in self.iter_repo_batches(org, state['after_repo']):  # memory holds one batch of repos, never the whole org
+                    futures = [executor.submit(self.repo_records, org, repo) for repo in batch]
+                    results = [future.result() for future in futures]           # a rate limited batch is dropped whole and re-crawled on resume
+                    for records in results:
+                        yield from records
+                    state['after_repo'] = batch[-1].get('name')
+        except GitHub__Secrets__Inventory__Rate_Limited as e:
+            yield interrupted(str(e))
+        except Exception as e:
+            if not self.is_rate_limit_error(e):                                 # repo listing itself failed: nothing more can be crawled
+                raise
+            yield interrupted(str(e))
+
+    def iter_repo_batches(self, org        : str           ,
+                                after_repo : Optional[str]
+                          ) -> Iterator[List[Dict[str, Any]]]:                  # Batches of max_workers repos, skipping everything up to after_repo
+        batch = []
+        for repo in self.iter_org_repos(org):
+            if after_repo is not None and repo.get('name').lower() <= after_repo.lower():   # GitHub's full_name sort is case-insensitive
+                continue
+            batch.append(repo)
+            if len(batch) >= max(1, self.max_workers):
+                yield batch
+                batch = []
+        if batch:
+            yield batch
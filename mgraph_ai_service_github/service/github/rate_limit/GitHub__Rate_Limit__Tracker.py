@@ -0,0 +1,77 @@
+import threading
+import time
+from collections                                                            import OrderedDict
+from typing                                                                 import Dict, Optional, Any
+from osbot_utils.type_safe.Type_Safe                                        import Type_Safe
+from mgraph_ai_service_github.config                                        import GITHUB_API__RATE_LIMIT_TRACKER__MAX_ENTRIES
+from mgraph_ai_service_github.schemas.github.base.Schema__GitHub__Rate_Limit import Schema__GitHub__Rate_Limit
+from mgraph_ai_service_github.utils.Token__Fingerprint                      import token_fingerprint
+
+RATE_LIMIT__DEFAULT_RESOURCE = 'core'
+RATE_LIMIT__HEADERS          = dict(limit     = 'X-RateLimit-Limit'     ,
+                                    remaining = 'X-RateLimit-Remaining' ,
+                                    reset     = 'X-RateLimit-Reset'     ,
+                                    used      = 'X-RateLimit-Used'      )
+RATE_LIMIT__HEADER__RESOURCE = 'X-RateLimit-Resource'
+
+_tracker_lock = threading.Lock()
+
+
+def rate_limit_from_headers(headers : Dict[str, str]                            # Response headers (case-insensitive mapping)
+                            ) -> Optional[Dict[str, Any]]:                      # X-RateLimit-* values (None when GitHub didn't send them)
+    if not headers or headers.get(RATE_LIMIT__HEADERS['limit']) is None:
+        return None
+    rate_limit = {}
+    for field, header in RATE_LIMIT__HEADERS.items():
+        value             = headers.get(header)
+        rate_limit[field] = int(value) if value is not None else None
+    rate_limit['resource'] = headers.get(RATE_LIMIT__HEADER__RESOURCE) or RATE_LIMIT__DEFAULT_RESOURCE
+    return rate_limit
+
+
+class GitHub__Rate_Limit__Tracker(Type_Safe):                                   # Process-wide rate-limit snapshots, updated from every GitHub response
+    max_entries : int = GITHUB_API__RATE_LIMIT_TRACKER__MAX_ENTRIES
+    snapshots   : OrderedDict                                                   # (token fingerprint, resource) -> latest snapshot (LRU order)
+
+    def token_fingerprint(self, api_token : str) -> str:                        # Tokens are never used as keys directly
+        return token_fingerprint(api_token)
+
+    def update(self, api_token  : str            ,                              # Token the request was made with
+                     rate_limit : Dict[str, Any]                                # limit/remaining/reset/used/resource values
+                ) -> Optional[Schema__GitHub__Rate_Limit]:
+        if not rate_limit:
+            return None
+        resource = rate_limit.get('resource') or RATE_LIMIT__DEFAULT_RESOURCE
+        snapshot = Schema__GitHub__Rate_Limit(limit     = rate_limit.get('limit'    ) ,
+                                              remaining = rate_limit.get('remaining') ,
+                                              reset     = rate_limit.get('reset'    ) ,
+                                              used      = rate_limit.get('used'     ) )
+        key      = (self.token_fingerprint(api_token), resource)
+        with _tracker_lock:
+            self.snapshots[key] = snapshot
+            self.snapshots.move_to_end(key)
+            while len(self.snapshots) > self.max_entries:
+                self.snapshots.popitem(last=False)
+        return snapshot
+
+    def get(self, api_token : str                                ,              # Token to look up
+                  resource  : str = RATE_LIMIT__DEFAULT_RESOURCE                # Rate limit bucket
+             ) -> Optional[Schema__GitHub__Rate_Limit]:                         # Latest snapshot (None if no response seen yet, or its window has reset)
+        key = (self.token_fingerprint(api_token), resource)
+        with _tracker_lock:
+            snapshot = self.snapshots.get(key)
+            if snapshot is None:
+                return None
+            if snapshot.reset and time.time() >= snapshot.reset:                # past reset: remaining no longer describes the current window
+                del self.snapshots[key]
+                return None
+            self.snapshots.move_to_end(key)
+            return snapshot
+
+    def clear(self) -> 'GitHub__Rate_Limit__Tracker':
+        with _tracker_lock:
+            self.snapshots.clear()
+        return self
+
+
+github_rate_limit_tracker = GitHub__Rate_Limit__Tracker()                       # module-level singleton shared by GitHub__API and GitHub__API__Async
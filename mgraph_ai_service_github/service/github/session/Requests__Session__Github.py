@@ -1,39 +1,44 @@
 import requests
-from osbot_utils.decorators.methods.cache_on_self                                          import cache_on_self
 from mgraph_ai_service_github.service.github.session.Requests__Session                     import Requests__Session
+from mgraph_ai_service_github.service.github.session.Requests__Session__Pool               import Requests__Session__Pool, requests_session_pool
 from mgraph_ai_service_github.service.github.session.Requests__Session__Response           import Requests__Session__Response
 from mgraph_ai_service_github.service.github.session.Requests__Session__Response__Requests import Requests__Session__Response__Requests
 
 
-class Requests__Session__Github(Requests__Session):                             # Real GitHub API session using requests
-    api_token : str = None
+class Requests__Session__Github(Requests__Session):                             # Real GitHub API session using requests (connections come from the shared pool)
+    api_token : str                     = None
+    pool      : Requests__Session__Pool = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if self.pool is None:
+            self.pool = requests_session_pool
 
     @property
-    def headers(self) -> dict:
-        return self.requests_session().headers
+    def headers(self) -> dict:                                                  # Headers sent on every request (shared defaults + this token)
+        return {**self.requests_session().headers, **self.auth_headers()}
 
-    @cache_on_self
-    def requests_session(self) -> requests.Session:                             # Create and cache requests.Session
+    def auth_headers(self) -> dict:                                             # Authorization is applied per request, never stored on the shared session
         if self.api_token is None:
             raise ValueError('GitHub Access Token not setup')
-        session = requests.Session()
-        session.headers.update({ 'Authorization'        : f'token {self.api_token}'       ,
-                                 'Accept'               : 'application/vnd.github.v3+json',
-                                 'X-GitHub-Api-Version' : '2022-11-28'                    })
-        return session
+        return {'Authorization': f'token {self.api_token}'}
 
-    def get(self, url: str, **kwargs) -> Requests__Session__Response:
-        response = self.requests_session().get(url, **kwargs)
+    def requests_session(self) -> requests.Session:                             # Shared, thread-safe requests.Session from the pool
+        return self.pool.requests_session()
+
+    def request(self, method: str, url: str, **kwargs) -> Requests__Session__Response:
+        headers  = {**self.auth_headers(), **(kwargs.pop('headers', None) or {})}
+        response = self.requests_session().request(method, url, headers=headers, **kwargs)
         return Requests__Session__Response__Requests(response)
 
+    def get(self, url: str, **kwargs) -> Requests__Session__Response:
+        return self.request('GET', url, **kwargs)
+
     def put(self, url: str, **kwargs) -> Requests__Session__Response:
-        response = self.requests_session().put(url, **kwargs)
-        return Requests__Session__Response__Requests(response)
+        return self.request('PUT', url, **kwargs)
 
     def delete(self, url: str, **kwargs) -> Requests__Session__Response:
-        response = self.requests_session().delete(url, **kwargs)
-        return Requests__Session__Response__Requests(response)
+        return self.request('DELETE', url, **kwargs)
 
     def post(self, url: str, **kwargs) -> Requests__Session__Response:
-        response = self.requests_session().post(url, **kwargs)
-        return Requests__Session__Response__Requests(response)
\ No newline at end of file
+        return self.request('POST', url, **kwargs)
@@ -0,0 +1,66 @@
+import asyncio
+import threading
+import weakref
+import httpx
+from mgraph_ai_service_github.config                                                    import GITHUB_API__POOL_MAXSIZE, GITHUB_API__KEEP_ALIVE
+from mgraph_ai_service_github.service.github.session.Requests__Session__Async           import Requests__Session__Async
+from mgraph_ai_service_github.service.github.session.Requests__Session__Pool            import GITHUB_API__DEFAULT_HEADERS
+from mgraph_ai_service_github.service.github.session.Requests__Session__Response        import Requests__Session__Response
+from mgraph_ai_service_github.service.github.session.Requests__Session__Response__Httpx import Requests__Session__Response__Httpx
+
+GITHUB_API__ASYNC__TIMEOUT = 30.0                                               # seconds, per request
+
+_async_clients      = weakref.WeakKeyDictionary()                               # event loop -> shared httpx.AsyncClient (clients can't cross loops)
+_async_clients_lock = threading.Lock()
+
+
+def async_client() -> httpx.AsyncClient:                                        # Shared AsyncClient for the running event loop
+    loop = asyncio.get_running_loop()
+    with _async_clients_lock:
+        client = _async_clients.get(loop)
+        if client is None or client.is_closed:
+            limits = httpx.Limits(max_connections           = GITHUB_API__POOL_MAXSIZE                              ,
+                                  max_keepalive_connections = GITHUB_API__POOL_MAXSIZE if GITHUB_API__KEEP_ALIVE else 0)
+            client = httpx.AsyncClient(headers = GITHUB_API__DEFAULT_HEADERS ,
+                                       limits  = limits                      ,
+                                       timeout = GITHUB_API__ASYNC__TIMEOUT  )
+            _async_clients[loop] = client
+        return client
+
+
+async def close_async_client():                                                 # Close the running loop's client (e.g. on app shutdown)
+    loop = asyncio.get_running_loop()
+    with _async_clients_lock:
+        client = _async_clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+
+
+class Requests__Session__Github__Async(Requests__Session__Async):               # Real GitHub API session using httpx.AsyncClient (one pooled client per event loop)
+    api_token : str = None
+
+    @property
+    def headers(self) -> dict:                                                  # Headers sent on every request (shared defaults + this token)
+        return {**GITHUB_API__DEFAULT_HEADERS, **self.auth_headers()}
+
+    def auth_headers(self) -> dict:                                             # Authorization is applied per request, never stored on the shared client
+        if self.api_token is None:
+            raise ValueError('GitHub Access Token not setup')
+        return {'Authorization': f'token {self.api_token}'}
+
+    async def request(self, method: str, url: str, **kwargs) -> Requests__Session__Response:
+        headers  = {**self.auth_headers(), **(kwargs.pop('headers', None) or {})}
+        response = await async_client().request(method, url, headers=headers, **kwargs)
+        return Requests__Session__Response__Httpx(response)
+
+    async def get(self, url: str, **kwargs) -> Requests__Session__Response:
+        return await self.request('GET', url, **kwargs)
+
+    async def put(self, url: str, **kwargs) -> Requests__Session__Response:
+        return await self.request('PUT', url, **kwargs)
+
+    async def delete(self, url: str, **kwargs) -> Requests__Session__Response:
+        return await self.request('DELETE', url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> Requests__Session__Response:
+        return await self.request('POST', url, **kwargs)
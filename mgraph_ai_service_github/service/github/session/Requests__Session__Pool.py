@@ -0,0 +1,64 @@
+import threading
+import requests
+from http.cookiejar                                     import DefaultCookiePolicy
+from requests.adapters                                  import HTTPAdapter
+from osbot_utils.type_safe.Type_Safe                    import Type_Safe
+from mgraph_ai_service_github.config                    import GITHUB_API__POOL_CONNECTIONS, GITHUB_API__POOL_MAXSIZE, GITHUB_API__POOL_BLOCK, GITHUB_API__KEEP_ALIVE
+
+GITHUB_API__DEFAULT_HEADERS = { 'Accept'               : 'application/vnd.github.v3+json',
+                                'X-GitHub-Api-Version' : '2022-11-28'                    }
+
+GITHUB_API__COOKIE_POLICY   = DefaultCookiePolicy(allowed_domains=[])         # accepts and sends no cookies: the session is shared by every PAT (tenant)
+
+_pool_lock = threading.Lock()                                                   # guards lazy creation / reset of the shared session
+
+
+class Requests__Session__Pool(Type_Safe):                                       # Process-wide pooled transport shared by all Requests__Session__Github instances
+    pool_connections : int              = GITHUB_API__POOL_CONNECTIONS
+    pool_maxsize     : int              = GITHUB_API__POOL_MAXSIZE
+    pool_block       : bool             = GITHUB_API__POOL_BLOCK
+    keep_alive       : bool             = GITHUB_API__KEEP_ALIVE
+    _session         : requests.Session = None
+
+    def requests_session(self) -> requests.Session:                             # Shared requests.Session (no Authorization header, that is applied per request)
+        session = self._session
+        if session is None:
+            with _pool_lock:
+                if self._session is None:                                       # double-checked so only one thread builds the session
+                    self._session = self.create_session()
+                session = self._session
+        return session
+
+    def create_session(self) -> requests.Session:                               # Build session with a shared HTTPAdapter mounted for http and https
+        adapter = HTTPAdapter(pool_connections = self.pool_connections ,
+                              pool_maxsize     = self.pool_maxsize     ,
+                              pool_block       = self.pool_block       )
+        session = requests.Session()
+        session.cookies.set_policy(GITHUB_API__COOKIE_POLICY)
+        session.mount('https://', adapter)
+        session.mount('http://' , adapter)
+        session.headers.update(GITHUB_API__DEFAULT_HEADERS)
+        if not self.keep_alive:
+            session.headers['Connection'] = 'close'
+        return session
+
+    def configure(self, pool_connections : int  = None ,                        # Change pool settings (closes current connections)
+                        pool_maxsize     : int  = None ,
+                        pool_block       : bool = None ,
+                        keep_alive       : bool = None
+                   ) -> 'Requests__Session__Pool':
+        if pool_connections is not None: self.pool_connections = pool_connections
+        if pool_maxsize     is not None: self.pool_maxsize     = pool_maxsize
+        if pool_block       is not None: self.pool_block       = pool_block
+        if keep_alive       is not None: self.keep_alive       = keep_alive
+        return self.reset()
+
+    def reset(self) -> 'Requests__Session__Pool':                               # Close all pooled connections, next call creates a fresh session
+        with _pool_lock:
+            if self._session is not None:
+                self._session.close()
+            self._session = None
+        return self
+
+
+requests_session_pool = Requests__Session__Pool()                               # module-level singleton used by Requests__Session__Github
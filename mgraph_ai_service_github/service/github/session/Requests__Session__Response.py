@@ -1,5 +1,6 @@
-from typing                                  import Dict, Any
-from osbot_utils.type_safe.Type_Safe         import Type_Safe
+from typing                                                                         import Dict, Any, Optional
+from osbot_utils.type_safe.Type_Safe                                                import Type_Safe
+from mgraph_ai_service_github.service.github.rate_limit.GitHub__Rate_Limit__Tracker import rate_limit_from_headers
 
 class Requests__Session__Response(Type_Safe):                                   # Abstract response interface
     status_code : int = 0
@@ -12,4 +13,11 @@ class Requests__Session__Response(Type_Safe):
 
     @property
     def content(self) -> bytes:                                                 # Raw response content
-        raise NotImplementedError()
\ No newline at end of file
+        raise NotImplementedError()
+
+    @property
+    def headers(self) -> Dict[str, str]:                                        # Response headers (case-insensitive mapping)
+        raise NotImplementedError()
+
+    def rate_limit_headers(self) -> Optional[Dict[str, Any]]:                   # X-RateLimit-* values (None when GitHub didn't send them)
+        return rate_limit_from_headers(self.headers)
@@ -0,0 +1,28 @@
+import json
+from typing                                                                      import Dict, Any
+from mgraph_ai_service_github.service.github.session.Requests__Session__Response import Requests__Session__Response
+
+
+class Requests__Session__Response__Cached(Requests__Session__Response):         # Response rebuilt from the conditional-request cache (served on 304)
+    _content : bytes = b''
+    _headers : dict
+
+    def __init__(self, content: bytes, headers: Dict[str, str], status_code: int = 200, **kwargs):
+        super().__init__(**kwargs)
+        self._content    = content
+        self._headers    = dict(headers or {})
+        self.status_code = status_code
+
+    def json(self) -> Dict[str, Any]:
+        return json.loads(self._content)                                        # parsed per call, so callers can't mutate the cached body
+
+    def raise_for_status(self):
+        pass
+
+    @property
+    def content(self) -> bytes:
+        return self._content
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return self._headers
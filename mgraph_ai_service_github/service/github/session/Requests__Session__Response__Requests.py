@@ -21,4 +21,6 @@ class Requests__Session__Response__Requests(Requests__Session__Response):
     def content(self) -> bytes:
         return self._response.content
 
-
+    @property
+    def headers(self) -> Dict[str, str]:
+        return self._response.headers
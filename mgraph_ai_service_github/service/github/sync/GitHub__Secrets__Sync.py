@@ -0,0 +1,177 @@
+import time
+from datetime                                                                         import datetime
+from concurrent.futures                                                              import ThreadPoolExecutor
+from typing                                                                          import Dict, Any, List
+from osbot_utils.type_safe.Type_Safe                                                 import Type_Safe
+from mgraph_ai_service_github.config                                                 import GITHUB_API__BULK_WRITE__MAX_WORKERS
+from mgraph_ai_service_github.schemas.github.sync.Enum__GitHub__Secrets__Sync__Action import Enum__GitHub__Secrets__Sync__Action
+from mgraph_ai_service_github.service.github.GitHub__API                             import GitHub__API
+from mgraph_ai_service_github.service.github.GitHub__Secrets                         import GitHub__Secrets
+from mgraph_ai_service_github.service.github.sync.GitHub__Secrets__Sync__Fingerprints import GitHub__Secrets__Sync__Fingerprints, github_secrets_sync_fingerprints
+
+# a scope is a dict: { owner, repo, environment (optional), secrets: {name: plain value}, delete_extras (optional),
+#                     fingerprints (optional): {name: fingerprint returned by an earlier sync} }
+
+
+def sync_scope_id(owner : str, repo : str, environment : str = None) -> str:   # owner/repo or owner/repo/environment
+    scope_id = f"{owner}/{repo}"
+    if environment:
+        scope_id += f"/{environment}"
+    return scope_id
+
+
+def updated_after(updated_at : str, previous : str = None) -> bool:           # GitHub's updated_at strictly later than the one seen before a write (None: no previous)
+    if not updated_at:
+        return False
+    if not previous:
+        return True
+    try:
+        return datetime.fromisoformat(updated_at) > datetime.fromisoformat(previous)
+    except ValueError:
+        return False
+
+
+def duplicate_scope_ids(scope_ids : List[str]) -> List[str]:                    # Scopes listed more than once (GitHub names are case-insensitive)
+    seen, duplicates = set(), []
+    for scope_id in scope_ids:
+        key = scope_id.lower()
+        if key in seen and scope_id not in duplicates:
+            duplicates.append(scope_id)
+        seen.add(key)
+    return duplicates
+
+
+class GitHub__Secrets__Sync(Type_Safe):                                         # Declarative sync: plan from one listing per scope, apply only what changed
+    api_token    : str
+    api          : GitHub__API                         = None
+    fingerprints : GitHub__Secrets__Sync__Fingerprints = None
+    max_workers  : int                                 = GITHUB_API__BULK_WRITE__MAX_WORKERS
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if not self.api:
+            self.api = GitHub__API(api_token=self.api_token)
+        if not self.fingerprints:
+            self.fingerprints = github_secrets_sync_fingerprints
+
+    def scope_id(self, scope : Dict[str, Any]) -> str:                          # owner/repo or owner/repo/environment
+        return sync_scope_id(scope['owner'], scope['repo'], scope.get('environment'))
+
+    def check_scopes(self, scopes : List[Dict[str, Any]]) -> None:              # Raises ValueError if a scope is listed twice (its desired states would conflict)
+        duplicates = duplicate_scope_ids([self.scope_id(scope) for scope in scopes])
+        if duplicates:
+            raise ValueError(f"Duplicate scopes: {', '.join(duplicates)}")
+
+    def github_secrets(self, scope : Dict[str, Any]) -> GitHub__Secrets:
+        return GitHub__Secrets(api_token = self.api_token                          ,
+                               repo_name = f"{scope['owner']}/{scope['repo']}"     ,
+                               api       = self.api                                )
+
+    def list_scope(self, scope : Dict[str, Any]                                 # One paginated listing (raises on GitHub errors)
+                   ) -> Dict[str, Dict[str, Any]]:                              # secret_name -> {name, created_at, updated_at}
+        github_secrets = self.github_secrets(scope)
+        if scope.get('environment'):
+            secrets = github_secrets.iter_environment_secrets(scope['environment'])
+        else:
+            secrets = github_secrets.iter_secrets()
+        return {secret['name']: secret for secret in secrets}
+
+    def list_scopes(self, scopes : List[Dict[str, Any]]) -> List[Dict[str, Dict[str, Any]]]:
+        if not scopes:
+            return []
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(scopes)))) as executor:
+            return list(executor.map(self.list_scope, scopes))
+
+    def plan(self, scopes : List[Dict[str, Any]]                                # Desired state
+             ) -> List[Dict[str, Any]]:                                         # [{owner, repo, environment, secret_name, action, fingerprint}]
+        self.check_scopes(scopes)
+        actions = []
+        for scope, existing in zip(scopes, self.list_scopes(scopes)):
+            scope_id = self.scope_id(scope)
+            desired  = scope.get('secrets'     ) or {}
+            known    = scope.get('fingerprints') or {}
+            for secret_name, secret_value in desired.items():
+                current     = existing.get(secret_name)
+                updated_at  = current.get('updated_at') if current else None
+                fingerprint = None
+                if current is None:
+                    action = Enum__GitHub__Secrets__Sync__Action.CREATE
+                elif self.fingerprints.matches(self.api.api_url, self.api_token, scope_id, secret_name, secret_value, updated_at, known=known.get(secret_name)):
+                    action      = Enum__GitHub__Secrets__Sync__Action.UNCHANGED
+                    fingerprint = self.fingerprints.fingerprint(self.api.api_url, self.api_token, scope_id, secret_name, secret_value, updated_at)
+                else:
+                    action = Enum__GitHub__Secrets__Sync__Action.UPDATE
+                actions.append(self.action(scope, secret_name, action, fingerprint, updated_at))
+            if scope.get('delete_extras'):
+                for secret_name in sorted(set(existing) - set(desired)):
+                    actions.append(self.action(scope, secret_name, Enum__GitHub__Secrets__Sync__Action.DELETE, updated_at=existing[secret_name].get('updated_at')))
+        return actions
+
+    def action(self, scope       : Dict[str, Any]                      ,
+                     secret_name : str                                 ,
+                     action      : Enum__GitHub__Secrets__Sync__Action ,
+                     fingerprint : str = None                           ,       # Set for unchanged (and, after apply, written) secrets
+                     updated_at  : str = None                                   # GitHub's updated_at when planned (None for creates)
+               ) -> Dict[str, Any]:
+        return { 'owner'       : scope['owner']           ,
+                 'repo'        : scope['repo']            ,
+                 'environment' : scope.get('environment') ,
+                 'secret_name' : secret_name              ,
+                 'action'      : action                   ,
+                 'fingerprint' : fingerprint              ,
+                 'updated_at'  : updated_at               }
+
+    def apply(self, scopes : List[Dict[str, Any]]     ,                         # Desired state
+                    plan   : List[Dict[str, Any]] = None                        # Precomputed plan (computed here when None)
+              ) -> List[Dict[str, Any]]:                                        # Plan entries with success / duration / error added
+        self.check_scopes(scopes)
+        plan       = self.plan(scopes) if plan is None else plan
+        by_id      = {self.scope_id(scope): scope for scope in scopes}
+        pending    = [entry for entry in plan if entry['action'] != Enum__GitHub__Secrets__Sync__Action.UNCHANGED]
+        for entry in plan:
+            entry.update(success=True, duration=0.0, error=None)
+        if pending:
+            with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(pending)))) as executor:
+                list(executor.map(lambda entry: self.apply_action(by_id, entry), pending))
+        self.record_fingerprints(by_id, pending)
+        return plan
+
+    def apply_action(self, by_id : Dict[str, Dict[str, Any]], entry : Dict[str, Any]) -> Dict[str, Any]:
+        scope = by_id[self.scope_id(entry)]
+        start = time.perf_counter()
+        try:
+            github_secrets = self.github_secrets(scope)
+            if entry['action'] == Enum__GitHub__Secrets__Sync__Action.DELETE:
+                if not github_secrets.delete_secret_by_scope(entry['secret_name'], environment=entry['environment']):
+                    raise ValueError(f"Failed to delete secret '{entry['secret_name']}'")
+                self.fingerprints.forget(self.api.api_url, self.scope_id(entry), entry['secret_name'])
+            else:
+                github_secrets.write_secret(entry['secret_name'], scope['secrets'][entry['secret_name']], environment=entry['environment'])
+        except Exception as e:
+            entry['success'] = False
+            entry['error'  ] = str(e)
+        entry['duration'] = time.perf_counter() - start
+        return entry
+
+    def record_fingerprints(self, by_id   : Dict[str, Dict[str, Any]] ,        # Store fingerprint + GitHub's new updated_at for every write that visibly landed
+                                  applied : List[Dict[str, Any]]
+                            ) -> None:
+        written = {}
+        for entry in applied:
+            if entry['success'] and entry['action'] != Enum__GitHub__Secrets__Sync__Action.DELETE:
+                written.setdefault(self.scope_id(entry), []).append(entry)
+        if not written:
+            return
+        scopes = [by_id[scope_id] for scope_id in written]
+        try:
+            listings = self.list_scopes(scopes)                                 # one extra listing per written scope (PUTs don't return updated_at)
+        except Exception:
+            return                                                              # fingerprints are an optimisation: next sync will just rewrite
+        for scope, listing in zip(scopes, listings):
+            scope_id = self.scope_id(scope)
+            for entry in written[scope_id]:
+                secret_name = entry['secret_name']
+                updated_at  = (listing.get(secret_name) or {}).get('updated_at')
+                if updated_after(updated_at, entry.get('updated_at')):          # not newer than the plan's listing: what we see may be another writer's value, so record nothing
+                    entry['fingerprint'] = self.fingerprints.record(self.api.api_url, self.api_token, scope_id, secret_name, scope['secrets'][secret_name], updated_at)
+                    entry['updated_at' ] = updated_at
@@ -0,0 +1,90 @@
+import hashlib
+import hmac
+import os
+import threading
+from collections                                import OrderedDict
+from typing                                     import Optional
+from osbot_utils.type_safe.Type_Safe            import Type_Safe
+from osbot_utils.utils.Env                      import get_env
+from mgraph_ai_service_github.config            import GITHUB_API__SYNC__FINGERPRINTS__MAX_ENTRIES, ENV_VAR__SERVICE__AUTH__SESSION_KEY, ENV_VAR__SERVICE__AUTH__PRIVATE_KEY
+
+SYNC__FINGERPRINT__DIGEST_SIZE = 16                                             # bytes of keyed BLAKE2b kept per secret
+SYNC__FINGERPRINT__CONTEXT     = b'osbot-github/sync-fingerprint/v1'            # domain separation for the key derived from the deploy's key material
+
+
+class GitHub__Secrets__Sync__Fingerprints(Type_Safe):                           # Keyed fingerprints of the values last written (GitHub never returns values)
+    max_entries  : int = GITHUB_API__SYNC__FINGERPRINTS__MAX_ENTRIES
+    key_material : str = None                                                   # hex; defaults to the session key (kept across deploys), then the service private key
+    _hmac_key    : bytes = None                                                 # same on every instance of a deploy, so fingerprints returned to clients verify anywhere
+    _entries     : OrderedDict                                                  # (api_url, scope_id, secret_name) -> fingerprint
+    _lock        : object = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._lock = threading.Lock()
+
+    def hmac_key(self) -> bytes:                                                # Resolved on first use (module singleton is created before test / local env vars are set)
+        if self._hmac_key is None:
+            key_material = self.key_material or get_env(ENV_VAR__SERVICE__AUTH__SESSION_KEY, '') or get_env(ENV_VAR__SERVICE__AUTH__PRIVATE_KEY, '')
+            if key_material:
+                self._hmac_key = hashlib.blake2b(SYNC__FINGERPRINT__CONTEXT, key=bytes.fromhex(key_material), digest_size=32).digest()
+            else:
+                self._hmac_key = os.urandom(32)                                 # no deploy keys (local use): fingerprints only verify in this process
+        return self._hmac_key
+
+    def fingerprint(self, api_url      : str ,                                  # HMAC-BLAKE2b (hex) of the plain value, bound to where it lives, GitHub's updated_at and the writer's token
+                          api_token    : str ,
+                          scope_id     : str ,
+                          secret_name  : str ,
+                          secret_value : str ,
+                          updated_at   : str
+                    ) -> str:
+        message = '\0'.join([api_url, api_token, scope_id, secret_name, updated_at, secret_value]).encode('utf-8')
+        return hashlib.blake2b(message, key=self.hmac_key(), digest_size=SYNC__FINGERPRINT__DIGEST_SIZE).hexdigest()
+
+    def record(self, api_url      : str ,                                       # GitHub host
+                     api_token    : str ,                                       # Token that made the write (only it can match the fingerprint later)
+                     scope_id     : str ,                                       # owner/repo or owner/repo/environment
+                     secret_name  : str ,
+                     secret_value : str ,                                       # Value just written
+                     updated_at   : str                                         # GitHub's updated_at after the write
+                ) -> str:                                                       # Returns the fingerprint (handed back to clients)
+        key         = (api_url, scope_id, secret_name)
+        fingerprint = self.fingerprint(api_url, api_token, scope_id, secret_name, secret_value, updated_at)
+        with self._lock:
+            self._entries[key] = fingerprint
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return fingerprint
+
+    def get(self, api_url : str, scope_id : str, secret_name : str) -> Optional[str]:
+        return self._entries.get((api_url, scope_id, secret_name))
+
+    def matches(self, api_url      : str ,
+                      api_token    : str ,                                      # Token asking: a token that never wrote the value can't use this as an equality oracle
+                      scope_id     : str ,
+                      secret_name  : str ,
+                      secret_value : str ,                                      # Desired value
+                      updated_at   : str ,                                      # updated_at from the current listing
+                      known        : str = None                                 # Fingerprint a client kept from an earlier sync (checked as well as this process's own)
+                 ) -> bool:                                                     # True only if this token wrote this exact value and nobody changed it since
+        if updated_at is None:
+            return False
+        expected = self.fingerprint(api_url, api_token, scope_id, secret_name, secret_value, updated_at)
+        for candidate in (self.get(api_url, scope_id, secret_name), known):
+            if candidate and hmac.compare_digest(str(candidate), expected):
+                return True
+        return False
+
+    def forget(self, api_url : str, scope_id : str, secret_name : str) -> bool:
+        with self._lock:
+            return self._entries.pop((api_url, scope_id, secret_name), None) is not None
+
+    def clear(self) -> 'GitHub__Secrets__Sync__Fingerprints':
+        with self._lock:
+            self._entries.clear()
+        return self
+
+
+github_secrets_sync_fingerprints = GitHub__Secrets__Sync__Fingerprints()        # module-level singleton used by GitHub__Secrets__Sync
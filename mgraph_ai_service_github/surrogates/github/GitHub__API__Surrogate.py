@@ -6,37 +6,51 @@ from mgraph_ai_service_github.service.github.GitHub__API
 from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__State      import GitHub__API__Surrogate__State
 from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__PATs       import GitHub__API__Surrogate__PATs
 from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Keys       import GitHub__API__Surrogate__Keys
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Rate_Limiter import GitHub__API__Surrogate__Rate_Limiter
 from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Session    import GitHub__API__Surrogate__Session
 from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Routes     import GitHub__API__Surrogate__Routes
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Dispatcher import GitHub__API__Surrogate__Dispatcher
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Generator  import GitHub__API__Surrogate__Generator
+from mgraph_ai_service_github.surrogates.github.schemas.Schema__Surrogate__Bulk__Spec import Schema__Surrogate__Bulk__Spec
 
 
 class GitHub__API__Surrogate(Type_Safe):                                        # Main surrogate orchestrator - creates FastAPI app mocking api.github.com
 
-    state   : GitHub__API__Surrogate__State
-    pats    : GitHub__API__Surrogate__PATs
-    keys    : GitHub__API__Surrogate__Keys
-    routes  : GitHub__API__Surrogate__Routes
-    _app    : FastAPI                        = None
-    _client : TestClient                     = None
+    state        : GitHub__API__Surrogate__State
+    pats         : GitHub__API__Surrogate__PATs
+    keys         : GitHub__API__Surrogate__Keys
+    routes       : GitHub__API__Surrogate__Routes
+    rate_limiter : GitHub__API__Surrogate__Rate_Limiter                         # per-PAT quota, X-RateLimit-* headers and secondary limits
+    _app        : FastAPI                            = None
+    _client     : TestClient                         = None
+    _dispatcher : GitHub__API__Surrogate__Dispatcher = None
 
     # ═══════════════════════════════════════════════════════════════════════════════
     # Lifecycle
     # ═══════════════════════════════════════════════════════════════════════════════
 
     def setup(self) -> 'GitHub__API__Surrogate':                                # Initialize all components and create FastAPI app
-        self.state  = GitHub__API__Surrogate__State ()
-        self.pats   = GitHub__API__Surrogate__PATs  ().setup()
-        self.keys   = GitHub__API__Surrogate__Keys  ().setup()
-        self.routes = GitHub__API__Surrogate__Routes(state = self.state ,
-                                                     pats  = self.pats  ,
-                                                     keys  = self.keys  )
+        self.state        = GitHub__API__Surrogate__State ()
+        self.pats         = GitHub__API__Surrogate__PATs  ().setup()
+        self.keys         = GitHub__API__Surrogate__Keys  ().setup()
+        self.rate_limiter = GitHub__API__Surrogate__Rate_Limiter(state = self.state ,
+                                                                 pats  = self.pats  )
+        self.routes       = GitHub__API__Surrogate__Routes(state        = self.state        ,
+                                                           pats         = self.pats         ,
+                                                           keys         = self.keys         ,
+                                                           rate_limiter = self.rate_limiter )
         self._app    = self.routes.create_app()
-        self._client = TestClient(self._app, raise_server_exceptions=False)
+        self._client     = TestClient(self._app, raise_server_exceptions=False)
+        self._dispatcher = GitHub__API__Surrogate__Dispatcher(state        = self.state        ,
+                                                              pats         = self.pats         ,
+                                                              keys         = self.keys         ,
+                                                              rate_limiter = self.rate_limiter ).setup(self.routes.fast_api.routes_objects)
         return self
 
     def reset(self) -> 'GitHub__API__Surrogate':                                # Reset all state for test isolation
         self.state.reset()
         self.keys.reset()
+        self.rate_limiter.reset()
         return self
 
     def app(self) -> FastAPI:                                                   # Get the FastAPI application
@@ -45,6 +59,9 @@ class GitHub__API__Surrogate(Type_Safe):
     def test_client(self) -> TestClient:                                        # Get TestClient for the app
         return self._client
 
+    def dispatcher(self) -> GitHub__API__Surrogate__Dispatcher:                 # Get the direct (no TestClient) dispatcher for the same handlers
+        return self._dispatcher
+
     # ═══════════════════════════════════════════════════════════════════════════════
     # Injection Methods
     # ═══════════════════════════════════════════════════════════════════════════════
@@ -156,6 +173,12 @@ class GitHub__API__Surrogate(Type_Safe):
         self.state.set_org_secret(org, name, encrypted_value, key_id, visibility)
         return self
 
+    def generate(self, spec: Schema__Surrogate__Bulk__Spec = None, **kwargs    # Seed orgs, repos, environments and secrets in bulk (kwargs: spec fields)
+                 ) -> 'GitHub__API__Surrogate':
+        spec = spec or Schema__Surrogate__Bulk__Spec(**kwargs)
+        GitHub__API__Surrogate__Generator(state=self.state, keys=self.keys).generate(spec)
+        return self
+
     # ═══════════════════════════════════════════════════════════════════════════════
     # Convenience methods for encryption
     # ═══════════════════════════════════════════════════════════════════════════════
@@ -0,0 +1,147 @@
+import inspect
+import json
+from typing                                                                                import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse                                                                          import parse_qsl, unquote
+import httpx
+from fastapi                                                                               import params as fastapi_params
+from fastapi.responses                                                                     import Response
+from osbot_utils.type_safe.Type_Safe                                                       import Type_Safe
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__State              import GitHub__API__Surrogate__State
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__PATs               import GitHub__API__Surrogate__PATs
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Keys               import GitHub__API__Surrogate__Keys
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Rate_Limiter       import GitHub__API__Surrogate__Rate_Limiter
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Fast_API           import SURROGATE__ROUTES_CLASSES
+
+DISPATCH__SOURCE__PATH   = 'path'
+DISPATCH__SOURCE__HEADER = 'header'
+DISPATCH__SOURCE__BODY   = 'body'
+DISPATCH__SOURCE__QUERY  = 'query'
+DISPATCH__REQUIRED       = inspect.Parameter.empty
+DISPATCH__BASE_URL       = 'http://testserver'                                  # what TestClient requests are addressed to
+
+# A compiled route:  (path regex, bound handler, ((param name, source, key, default, converter), ...))
+# Handlers are the same Routes__GitHub__* methods the FastAPI app serves, sharing its state/pats/keys,
+# so responses match the TestClient path without HTTP serialization, the anyio portal or header parsing
+
+
+def json_response(request : httpx.Request, status_code : int, content : Any) -> httpx.Response:     # Same bytes Starlette's JSONResponse renders
+    body = json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(',', ':')).encode('utf-8')
+    return httpx.Response(status_code, content=body, headers={'content-type': 'application/json'}, request=request)
+
+
+def convert_bool(value : str) -> bool:
+    return value.lower() in ('1', 'true', 'on', 'yes')
+
+
+class GitHub__API__Surrogate__Dispatcher(Type_Safe):                            # In-process method+path -> surrogate handler dispatch (no TestClient)
+    state        : GitHub__API__Surrogate__State        = None
+    pats         : GitHub__API__Surrogate__PATs         = None
+    keys         : GitHub__API__Surrogate__Keys         = None
+    rate_limiter : GitHub__API__Surrogate__Rate_Limiter = None                  # same accounting the app's rate limit middleware does
+    _routes      : Dict[str, List[Tuple]]                                       # HTTP method -> compiled routes, in registration order
+
+    def setup(self, routes_objects : list = None                                # Route instances already registered on the app (built here when None)
+              ) -> 'GitHub__API__Surrogate__Dispatcher':                        # Compile the route table from the surrogate route classes
+        if routes_objects is None:
+            routes_objects = []
+            for routes_class in SURROGATE__ROUTES_CLASSES:
+                routes = routes_class(state = self.state ,
+                                      pats  = self.pats  ,
+                                      keys  = self.keys  )
+                routes.setup_routes()                                           # registers on the class's own APIRouter, no app needed
+                routes_objects.append(routes)
+        self._routes = {}
+        for routes in routes_objects:
+            for route in routes.router.routes:
+                handler = getattr(routes, route.name)
+                for method in route.methods:
+                    self._routes.setdefault(method, []).append((route.path_regex, handler, self.compile_params(handler, route.param_convertors)))
+        return self
+
+    def compile_params(self, handler          : Callable       ,                # Resolve where each handler argument comes from, once
+                             path_convertors  : Dict[str, Any]
+                       ) -> Tuple:
+        compiled = []
+        for name, parameter in inspect.signature(handler).parameters.items():
+            default   = parameter.default
+            converter = {int: int, bool: convert_bool, float: float}.get(parameter.annotation)
+            if name in path_convertors:
+                compiled.append((name, DISPATCH__SOURCE__PATH  , name                   , DISPATCH__REQUIRED, converter))
+            elif isinstance(default, fastapi_params.Header):
+                compiled.append((name, DISPATCH__SOURCE__HEADER, name.replace('_', '-') , default.default   , converter))
+            elif parameter.annotation is dict or isinstance(default, fastapi_params.Body):
+                compiled.append((name, DISPATCH__SOURCE__BODY  , name                   , DISPATCH__REQUIRED, None     ))
+            else:
+                if isinstance(default, fastapi_params.Query):
+                    default = default.default
+                compiled.append((name, DISPATCH__SOURCE__QUERY , name                   , default           , converter))
+        return tuple(compiled)
+
+    def match(self, method : str, path : str                                    # Returns (handler, compiled params, path values), or None
+              ) -> Optional[Tuple[Callable, Tuple, Dict[str, str]]]:
+        for path_regex, handler, compiled in self._routes.get(method, ()):
+            path_match = path_regex.match(path)
+            if path_match:
+                return handler, compiled, path_match.groupdict()
+        return None
+
+    def dispatch(self, method  : str                      ,                     # HTTP method
+                       path    : str                      ,                     # Path, optionally with a query string
+                       headers : Dict[str, str]  = None   ,
+                       params  : Dict[str, Any]  = None   ,                     # Extra query parameters (requests' params=)
+                       json    : Any             = None                         # JSON body (requests' json=)
+                  ) -> httpx.Response:                                          # Same status / body / headers the TestClient would return
+        request               = httpx.Request(method, f'{DISPATCH__BASE_URL}{path}')     # HTTPError(response=...) reads response.request
+        path, _, query_string = path.partition('?')
+        path                  = unquote(path)
+        query                 = dict(parse_qsl(query_string))
+        if params:
+            query.update({key: str(value) for key, value in params.items()})
+        headers = {key.lower(): value for key, value in (headers or {}).items()}
+        if self.rate_limiter is None:
+            return self.dispatch_route(request, method, path, headers, query, json)
+        pat, status, error, limit_headers = self.rate_limiter.acquire(path, headers.get('authorization'))
+        if status is not None:
+            response = json_response(request, status, error)
+        else:
+            try:
+                response = self.dispatch_route(request, method, path, headers, query, json)
+            finally:
+                self.rate_limiter.release(pat)
+        response.headers.update(limit_headers)
+        return response
+
+    def dispatch_route(self, request : httpx.Request  ,                         # Run the matching handler (no rate limiting)
+                             method  : str            ,
+                             path    : str            ,                         # Unquoted path, without the query string
+                             headers : Dict[str, str] ,                         # Lower-cased header names
+                             query   : Dict[str, str] ,
+                             json    : Any
+                       ) -> httpx.Response:
+        matched = self.match(method.upper(), path)
+        if matched is None:
+            if any(self.match(other, path) for other in self._routes if other != method.upper()):
+                return json_response(request, 405, {'detail': 'Method Not Allowed'})
+            return json_response(request, 404, {'detail': 'Not Found'})
+        handler, compiled, path_values = matched
+        kwargs = {}
+        for name, source, key, default, converter in compiled:
+            if   source == DISPATCH__SOURCE__PATH  : value = path_values.get(key)
+            elif source == DISPATCH__SOURCE__HEADER: value = headers.get(key, default)
+            elif source == DISPATCH__SOURCE__BODY  : value = json
+            else                                   : value = query.get(key, default)
+            if value is DISPATCH__REQUIRED or (source == DISPATCH__SOURCE__BODY and not isinstance(value, dict)):
+                return json_response(request, 422, {'detail': [{'type': 'missing', 'loc': [source, key], 'msg': 'Field required'}]})
+            if converter is not None and isinstance(value, str):
+                try:
+                    value = converter(value)
+                except ValueError:
+                    return json_response(request, 422, {'detail': [{'type': 'parsing', 'loc': [source, key], 'msg': 'Invalid value'}]})
+            kwargs[name] = value
+        try:
+            result = handler(**kwargs)
+        except Exception:                                                       # TestClient(raise_server_exceptions=False) behaviour
+            return httpx.Response(500, content=b'Internal Server Error', headers={'content-type': 'text/plain; charset=utf-8'}, request=request)
+        if isinstance(result, Response):
+            return httpx.Response(result.status_code, content=result.body, headers=result.raw_headers, request=request)
+        return json_response(request, 200, result)
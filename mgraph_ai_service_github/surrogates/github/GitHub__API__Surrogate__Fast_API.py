@@ -2,18 +2,28 @@ from osbot_fast_api.api.Fast_API
 from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__State              import GitHub__API__Surrogate__State
 from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__PATs               import GitHub__API__Surrogate__PATs
 from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Keys               import GitHub__API__Surrogate__Keys
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Rate_Limiter       import GitHub__API__Surrogate__Rate_Limiter
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Rate_Limit__Middleware import GitHub__API__Surrogate__Rate_Limit__Middleware
 from mgraph_ai_service_github.surrogates.github.routes.Routes__GitHub__User                import Routes__GitHub__User
 from mgraph_ai_service_github.surrogates.github.routes.Routes__GitHub__Repo_Secrets        import Routes__GitHub__Repo_Secrets
 from mgraph_ai_service_github.surrogates.github.routes.Routes__GitHub__Env_Secrets         import Routes__GitHub__Env_Secrets
 from mgraph_ai_service_github.surrogates.github.routes.Routes__GitHub__Org_Secrets         import Routes__GitHub__Org_Secrets
+from mgraph_ai_service_github.surrogates.github.routes.Routes__GitHub__Repos               import Routes__GitHub__Repos
 from mgraph_ai_service_github.utils.Version                                                import version__mgraph_ai_service_github
 
+SURROGATE__ROUTES_CLASSES = (Routes__GitHub__User        ,                      # served by the FastAPI app and by GitHub__API__Surrogate__Dispatcher
+                             Routes__GitHub__Repo_Secrets,
+                             Routes__GitHub__Env_Secrets ,
+                             Routes__GitHub__Org_Secrets ,
+                             Routes__GitHub__Repos       )
 
 class GitHub__API__Surrogate__Fast_API(Fast_API):                               # FastAPI application for GitHub API surrogate
 
-    state : GitHub__API__Surrogate__State  = None                               # In-memory state (set externally)
-    pats  : GitHub__API__Surrogate__PATs   = None                               # PAT manager (set externally)
-    keys  : GitHub__API__Surrogate__Keys   = None                               # Key manager (set externally)
+    state          : GitHub__API__Surrogate__State  = None                      # In-memory state (set externally)
+    pats           : GitHub__API__Surrogate__PATs   = None                      # PAT manager (set externally)
+    keys           : GitHub__API__Surrogate__Keys   = None                      # Key manager (set externally)
+    rate_limiter   : GitHub__API__Surrogate__Rate_Limiter = None                # Per-PAT rate limits (set externally, None = no X-RateLimit-* accounting)
+    routes_objects : list                                                       # registered route instances (reused by GitHub__API__Surrogate__Dispatcher)
 
     def setup(self):                                                                        # Configure FastAPI application settings
         with self.config as _:
@@ -22,17 +32,22 @@ class GitHub__API__Surrogate__Fast_API(Fast_API):
 
         return super().setup()
 
+    def setup_middlewares(self):                                                # Rate limiting is added last, so it runs first
+        super().setup_middlewares()
+        if self.rate_limiter is not None:
+            self.app().add_middleware(GitHub__API__Surrogate__Rate_Limit__Middleware, rate_limiter=self.rate_limiter)
+        return self
+
     def add_routes_with_deps(self, routes_class):                               # Add routes with injected dependencies
         routes = routes_class(app   = self.app() ,
                               state = self.state ,
                               pats  = self.pats  ,
                               keys  = self.keys  )
         routes.setup()
+        self.routes_objects.append(routes)
         return self
 
     def setup_routes(self):                                                     # Register all route classes
-        self.add_routes_with_deps(Routes__GitHub__User        )
-        self.add_routes_with_deps(Routes__GitHub__Repo_Secrets)
-        self.add_routes_with_deps(Routes__GitHub__Env_Secrets )
-        self.add_routes_with_deps(Routes__GitHub__Org_Secrets )
+        for routes_class in SURROGATE__ROUTES_CLASSES:
+            self.add_routes_with_deps(routes_class)
         return self
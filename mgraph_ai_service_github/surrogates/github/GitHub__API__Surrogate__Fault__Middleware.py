@@ -0,0 +1,39 @@
+import asyncio
+import socket
+import struct
+from http                                                                   import HTTPStatus
+from fastapi.responses                                                      import JSONResponse
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Faults import GitHub__API__Surrogate__Faults, FAULT__ACTION__ERROR, FAULT__ACTION__RESET
+
+
+class GitHub__API__Surrogate__Fault__Middleware:                                # ASGI middleware applying GitHub__API__Surrogate__Faults before the surrogate app
+
+    def __init__(self, app, faults : GitHub__API__Surrogate__Faults):
+        self.app    = app
+        self.faults = faults
+
+    async def __call__(self, scope, receive, send):
+        if scope.get('type') != 'http':
+            return await self.app(scope, receive, send)
+        delay, action, profile = self.faults.decide(scope.get('method', 'GET'), scope.get('path', '/'))
+        if delay:
+            await asyncio.sleep(delay)
+        if action == FAULT__ACTION__RESET:
+            return await self.reset_connection(receive)
+        if action == FAULT__ACTION__ERROR:
+            response = JSONResponse(content     = dict(message           = f'{HTTPStatus(profile.error_status).phrase} (injected fault)',
+                                                       documentation_url = 'https://docs.github.com/rest'                           ),
+                                    status_code = profile.error_status)
+            return await response(scope, receive, send)
+        return await self.app(scope, receive, send)
+
+    async def reset_connection(self, receive):                                        # RST the client's TCP connection (uvicorn keeps the transport on the receive callable's cycle)
+        transport = getattr(getattr(receive, '__self__', None), 'transport', None)
+        if transport is None:
+            raise ConnectionResetError('Injected connection reset (transport not reachable)')
+        sock = transport.get_extra_info('socket')
+        if sock is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))       # linger 0: close sends RST instead of FIN
+        transport.abort()
+        while (await receive()).get('type') != 'http.disconnect':                # wait for uvicorn to see the disconnect (else it logs and tries a 500)
+            pass
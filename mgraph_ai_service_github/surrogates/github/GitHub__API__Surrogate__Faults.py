@@ -0,0 +1,73 @@
+import random
+import re
+import threading
+from typing                                                                                 import Dict, Optional, Tuple
+from osbot_utils.type_safe.Type_Safe                                                        import Type_Safe
+from mgraph_ai_service_github.surrogates.github.schemas.Enum__Surrogate__Latency__Distribution import Enum__Surrogate__Latency__Distribution
+from mgraph_ai_service_github.surrogates.github.schemas.Schema__Surrogate__Fault__Profile   import Schema__Surrogate__Fault__Profile
+
+FAULT__ACTION__OK        = 'ok'
+FAULT__ACTION__ERROR     = 'error'
+FAULT__ACTION__RESET     = 'reset'
+FAULT__LONG_TAIL__ALPHA  = 1.5                                                  # Pareto shape: lower = heavier tail
+
+
+class GitHub__API__Surrogate__Faults(Type_Safe):                                # Per-endpoint latency / error / reset decisions for the HTTP surrogate server
+    default  : Schema__Surrogate__Fault__Profile                                # used when no rule matches
+    seed     : int = None                                                       # set for reproducible runs
+    requests : int
+    errors   : int
+    resets   : int
+    _rules   : list                                                             # (method or None, compiled path regex, profile), first match wins
+    _random  : random.Random = None
+    _lock    : object        = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._random = random.Random(self.seed)
+        self._lock   = threading.Lock()
+
+    def add_rule(self, path_pattern : str                               ,       # Regex matched against the whole request path
+                       profile      : Schema__Surrogate__Fault__Profile ,
+                       method       : Optional[str] = None                      # None matches every method
+                 ) -> 'GitHub__API__Surrogate__Faults':
+        self._rules.append((method.upper() if method else None, re.compile(path_pattern), profile))
+        return self
+
+    def profile_for(self, method : str, path : str) -> Schema__Surrogate__Fault__Profile:
+        for rule_method, path_regex, profile in self._rules:
+            if (rule_method is None or rule_method == method) and path_regex.fullmatch(path):
+                return profile
+        return self.default
+
+    def latency_seconds(self, profile : Schema__Surrogate__Fault__Profile) -> float:
+        distribution = profile.distribution
+        delay_ms     = profile.latency_ms
+        if distribution == Enum__Surrogate__Latency__Distribution.NORMAL:
+            delay_ms = self._random.gauss(profile.latency_ms, profile.stddev_ms)
+        elif distribution == Enum__Surrogate__Latency__Distribution.LONG_TAIL:
+            if self._random.random() < profile.tail_probability:
+                delay_ms = profile.tail_ms * self._random.paretovariate(FAULT__LONG_TAIL__ALPHA)
+        if profile.jitter_ms:
+            delay_ms += self._random.uniform(-profile.jitter_ms, profile.jitter_ms)
+        return min(max(0.0, delay_ms), profile.max_ms) / 1000
+
+    def decide(self, method : str, path : str                                   # Returns (delay seconds, action, profile) for one request
+               ) -> Tuple[float, str, Schema__Surrogate__Fault__Profile]:
+        profile = self.profile_for(method, path)
+        with self._lock:                                                        # the server may run handlers on several threads
+            delay = self.latency_seconds(profile)
+            roll  = self._random.random()
+            self.requests += 1
+            if roll < profile.reset_rate:
+                self.resets += 1
+                return delay, FAULT__ACTION__RESET, profile
+            if roll < profile.reset_rate + profile.error_rate:
+                self.errors += 1
+                return delay, FAULT__ACTION__ERROR, profile
+        return delay, FAULT__ACTION__OK, profile
+
+    def stats(self) -> Dict[str, int]:
+        return dict(requests = self.requests ,
+                    errors   = self.errors   ,
+                    resets   = self.resets   )
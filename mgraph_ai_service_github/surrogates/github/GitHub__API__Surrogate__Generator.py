@@ -0,0 +1,140 @@
+import random
+from functools                                                                      import lru_cache
+from datetime                                                                       import datetime, timedelta, timezone
+from typing                                                                         import Any, Dict, List, Type, TypeVar
+from osbot_utils.type_safe.Type_Safe                                                import Type_Safe
+from osbot_utils.type_safe.type_safe_core.collections.Type_Safe__Dict               import Type_Safe__Dict
+from osbot_utils.type_safe.type_safe_core.collections.Type_Safe__List               import Type_Safe__List
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__State      import GitHub__API__Surrogate__State
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Keys       import GitHub__API__Surrogate__Keys
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Ordered_Index import GitHub__API__Surrogate__Ordered_Index
+from mgraph_ai_service_github.surrogates.github.schemas.Schema__Surrogate__Bulk__Spec import Schema__Surrogate__Bulk__Spec
+from mgraph_ai_service_github.surrogates.github.schemas.Schema__Surrogate__Repo    import Schema__Surrogate__Repo
+from mgraph_ai_service_github.surrogates.github.schemas.Schema__Surrogate__Secret  import Schema__Surrogate__Secret, Schema__Surrogate__Org__Secret
+
+GENERATOR__PLACEHOLDER__CIPHERTEXT = 'c3Vycm9nYXRlLXBsYWNlaG9sZGVy'             # base64('surrogate-placeholder'): not a SealedBox, never decrypted
+GENERATOR__PLACEHOLDER__KEY_ID     = 'placeholder'
+GENERATOR__ENVIRONMENTS            = ('production', 'staging', 'development', 'qa', 'preview')
+GENERATOR__SECRET_WORDS            = ('API_KEY', 'DB_PASSWORD', 'AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY', 'NPM_TOKEN',
+                                      'DOCKER_PASSWORD', 'SLACK_WEBHOOK', 'SENTRY_DSN', 'STRIPE_KEY', 'DEPLOY_KEY')
+GENERATOR__ORG_VISIBILITIES        = ('all', 'private', 'selected')
+GENERATOR__EPOCH                   = datetime(2023, 1, 1, tzinfo=timezone.utc)  # generated timestamps fall in the two years after this
+GENERATOR__TIMESTAMPS              = 256                                        # distinct timestamps drawn per run (formatting each secret's would dominate)
+
+T = TypeVar('T')
+
+
+@lru_cache(maxsize=None)
+def collection_fields(schema_class : Type[Type_Safe]                            # Schema class
+                      ) -> Dict[str, Any]:                                      # field -> empty Type_Safe container the constructor would create (built once per class)
+    prototype = schema_class()
+    return {name: value for name, value in vars(prototype).items() if isinstance(value, (Type_Safe__List, Type_Safe__Dict))}
+
+
+def record(schema_class : Type[T], **values) -> T:                             # Schema instance without the constructor's cost (values are generated, so already valid)
+    instance = object.__new__(schema_class)
+    instance.__dict__.update(values)
+    for name, prototype in collection_fields(schema_class).items():             # collections still get Type_Safe containers, so later updates are checked like hand-added state
+        instance.__dict__[name] = type(prototype)(**vars(prototype), initial_data=values.get(name))
+    return instance
+
+
+def numbered(prefix : str, index : int, count : int) -> str:                   # zero padded so name order == creation order
+    return f'{prefix}-{index:0{len(str(max(count - 1, 0)))}}'
+
+
+class GitHub__API__Surrogate__Generator(Type_Safe):                             # Seeds surrogate state in bulk (orgs, repos, environments, secrets) from a compact spec
+    state : GitHub__API__Surrogate__State = None
+    keys  : GitHub__API__Surrogate__Keys  = None
+
+    def generate(self, spec : Schema__Surrogate__Bulk__Spec                     # What to create
+                 ) -> Dict[str, int]:                                           # Counts of what was created
+        rng        = random.Random(spec.seed)
+        timestamps = [(GENERATOR__EPOCH + timedelta(seconds=rng.randrange(2 * 365 * 24 * 3600))).strftime('%Y-%m-%dT%H:%M:%SZ')
+                      for _ in range(GENERATOR__TIMESTAMPS)]
+        stats      = dict(orgs=0, repos=0, environments=0, secrets__repo=0, secrets__env=0, secrets__org=0)
+        for org_index in range(spec.orgs):
+            org = numbered(spec.org_prefix, org_index, spec.orgs)
+            self.state.add_org(org)
+            stats['orgs']        += 1
+            stats['secrets__org']+= self.add_org_secrets(spec, rng, timestamps, org)
+            for repo_index in range(spec.repos_per_org):
+                repo         = numbered(spec.repo_prefix, repo_index, spec.repos_per_org)
+                environments = list(GENERATOR__ENVIRONMENTS[:spec.environments_per_repo])
+                environments+= [f'env-{index}' for index in range(len(environments), spec.environments_per_repo)]
+                self.add_repo(org, repo, rng.random() < spec.private_ratio, environments)
+                stats['repos']        += 1
+                stats['environments'] += len(environments)
+                repo_key      = f'{org}/{repo}'
+                scope_id      = self.keys.scope_id_for_repo(org, repo)
+                stats['secrets__repo'] += self.add_secrets(spec, rng, timestamps, self.state.secrets__repo[repo_key], scope_id, spec.secrets_per_repo)
+                for environment in environments:
+                    scope_id = self.keys.scope_id_for_env(org, repo, environment)
+                    stats['secrets__env'] += self.add_secrets(spec, rng, timestamps, self.state.secrets__env[repo_key][environment], scope_id, spec.secrets_per_environment)
+        return stats
+
+    def add_repo(self, owner        : str       ,                               # Same result as state.add_repo + add_environment, without the validation cost
+                       repo         : str       ,
+                       private      : bool      ,
+                       environments : List[str]
+                 ) -> None:
+        repo_key                     = f'{owner}/{repo}'
+        self.state.repos[repo_key]   = record(Schema__Surrogate__Repo, owner        = owner        ,
+                                                                       name         = repo         ,
+                                                                       full_name    = repo_key     ,
+                                                                       private      = private      ,
+                                                                       environments = environments )
+        self.state.secrets__repo[repo_key] = GitHub__API__Surrogate__Ordered_Index()
+        self.state.secrets__env [repo_key] = {}
+        env_secrets                        = self.state.secrets__env[repo_key]
+        for environment in environments:
+            env_secrets[environment] = GitHub__API__Surrogate__Ordered_Index()
+
+    def add_secrets(self, spec       : Schema__Surrogate__Bulk__Spec ,
+                          rng        : random.Random                 ,
+                          timestamps : List[str]                     ,
+                          secrets    : Dict[str, Any]                ,          # Scope's secrets index (filled in place)
+                          scope_id   : str                           ,          # Key scope (only used for real ciphertext)
+                          count      : int
+                    ) -> int:
+        for index in range(count):
+            name                 = f'{rng.choice(GENERATOR__SECRET_WORDS)}_{index}'
+            created_at           = rng.choice(timestamps)
+            encrypted_value, key_id = self.ciphertext(spec, scope_id, name)
+            secrets[name]        = record(Schema__Surrogate__Secret, name            = name                                ,
+                                                                     created_at      = created_at                          ,
+                                                                     updated_at      = max(created_at, rng.choice(timestamps)),
+                                                                     encrypted_value = encrypted_value                     ,
+                                                                     key_id          = key_id                              )
+        return count
+
+    def add_org_secrets(self, spec       : Schema__Surrogate__Bulk__Spec ,
+                              rng        : random.Random                 ,
+                              timestamps : List[str]                     ,
+                              org        : str
+                        ) -> int:
+        secrets  = self.state.secrets__org[org]
+        scope_id = self.keys.scope_id_for_org(org)
+        for index in range(spec.secrets_per_org):
+            name       = f'{rng.choice(GENERATOR__SECRET_WORDS)}_{index}'
+            visibility = rng.choice(GENERATOR__ORG_VISIBILITIES)
+            created_at = rng.choice(timestamps)
+            encrypted_value, key_id = self.ciphertext(spec, scope_id, name)
+            selected_repositories_url = f'https://api.github.com/orgs/{org}/actions/secrets/{name}/repositories' if visibility == 'selected' else None
+            secrets[name] = record(Schema__Surrogate__Org__Secret, name                      = name                                    ,
+                                                                   created_at                = created_at                              ,
+                                                                   updated_at                = max(created_at, rng.choice(timestamps)) ,
+                                                                   visibility                = visibility                              ,
+                                                                   selected_repositories_url = selected_repositories_url               ,
+                                                                   encrypted_value           = encrypted_value                         ,
+                                                                   key_id                    = key_id                                  )
+        return spec.secrets_per_org
+
+    def ciphertext(self, spec     : Schema__Surrogate__Bulk__Spec ,
+                         scope_id : str                           ,
+                         name     : str                                         # Secret name (the plaintext of real values is f'secret_value_for_{name}', like add_secret)
+                   ) -> tuple:                                                  # (encrypted_value, key_id)
+        if spec.placeholder_ciphertext:
+            return GENERATOR__PLACEHOLDER__CIPHERTEXT, GENERATOR__PLACEHOLDER__KEY_ID
+        encrypted_value = self.keys.encrypt_secret(scope_id, f'secret_value_for_{name}')
+        return encrypted_value, self.keys.get_key_id(scope_id)
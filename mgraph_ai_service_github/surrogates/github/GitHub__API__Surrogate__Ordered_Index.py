@@ -0,0 +1,67 @@
+from itertools                                                                      import islice
+from typing                                                                         import Any, Dict, List
+
+
+class GitHub__API__Surrogate__Ordered_Index(dict):                              # name -> item dict (state serialises as before) with O(page) slicing for paginated listings
+    __slots__ = ('_keys', '_positions', '_deleted')                             # built on the first slice: names in insertion order (None = deleted, until compacted)
+
+    def __setitem__(self, name : str, item : Any) -> None:                      # updates keep their position, new names go last
+        if name not in self and getattr(self, '_keys', None) is not None:
+            self._positions[name] = len(self._keys)
+            self._keys.append(name)
+        super().__setitem__(name, item)
+
+    def __delitem__(self, name : str) -> None:
+        super().__delitem__(name)
+        if getattr(self, '_keys', None) is not None:
+            self._keys[self._positions.pop(name)] = None
+            self._deleted += 1
+
+    def pop(self, name : str, *default) -> Any:
+        if name in self:
+            item = self[name]
+            del self[name]
+            return item
+        return super().pop(name, *default)
+
+    def setdefault(self, name : str, default : Any = None) -> Any:
+        if name not in self:
+            self[name] = default
+        return self[name]
+
+    def update(self, *args, **kwargs) -> None:
+        for name, item in dict(*args, **kwargs).items():
+            self[name] = item
+
+    def popitem(self):
+        self._keys = None                                                       # rebuilt on the next slice
+        return super().popitem()
+
+    def clear(self) -> None:
+        self._keys = None
+        super().clear()
+
+    def __getstate__(self):                                                     # copies / pickles carry the items only, the index is rebuilt on demand
+        return None
+
+    def slice(self, start : int, count : int) -> List[Any]:                     # items [start, start + count) without building the full list
+        keys = self.ordered_keys()
+        return [self[name] for name in keys[start:start + count]]
+
+    def ordered_keys(self) -> List[str]:
+        keys = getattr(self, '_keys', None)
+        if keys is None:                                                        # first slice
+            keys = list(self)
+        elif self._deleted:                                                     # drop tombstones (amortised over the deletes that left them)
+            keys = [name for name in keys if name is not None]
+        else:
+            return keys
+        self._keys, self._deleted = keys, 0
+        self._positions           = {name: position for position, name in enumerate(keys)}
+        return keys
+
+
+def slice_items(items : Dict[str, Any], start : int, count : int) -> List[Any]:  # Page of any name -> item dict (O(page) for an ordered index)
+    if isinstance(items, GitHub__API__Surrogate__Ordered_Index):
+        return items.slice(start, count)
+    return list(islice(items.values(), start, start + count))
@@ -0,0 +1,31 @@
+from fastapi.responses                                                              import JSONResponse
+from starlette.datastructures                                                       import Headers
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Rate_Limiter import GitHub__API__Surrogate__Rate_Limiter
+
+
+class GitHub__API__Surrogate__Rate_Limit__Middleware:                           # ASGI middleware applying GitHub__API__Surrogate__Rate_Limiter to every surrogate request
+
+    def __init__(self, app, rate_limiter : GitHub__API__Surrogate__Rate_Limiter):
+        self.app          = app
+        self.rate_limiter = rate_limiter
+
+    async def __call__(self, scope, receive, send):
+        if scope.get('type') != 'http':
+            return await self.app(scope, receive, send)
+        authorization                = Headers(scope=scope).get('authorization')
+        pat, status, error, headers  = self.rate_limiter.acquire(scope.get('path', '/'), authorization)
+        if status is not None:
+            return await JSONResponse(content=error, status_code=status, headers=headers)(scope, receive, send)
+        if not headers:
+            return await self.app(scope, receive, send)
+        raw_headers = [(name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in headers.items()]
+
+        async def send_with_headers(message):
+            if message['type'] == 'http.response.start':
+                message = {**message, 'headers': list(message.get('headers', [])) + raw_headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            self.rate_limiter.release(pat)
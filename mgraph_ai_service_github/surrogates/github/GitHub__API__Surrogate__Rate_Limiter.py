@@ -0,0 +1,117 @@
+import math
+import threading
+import time
+from collections                                                                    import deque
+from typing                                                                         import Any, Dict, Optional, Tuple
+from osbot_utils.type_safe.Type_Safe                                                import Type_Safe
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__State      import GitHub__API__Surrogate__State
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__PATs       import GitHub__API__Surrogate__PATs
+from mgraph_ai_service_github.surrogates.github.routes.Routes__GitHub__Base        import extract_pat
+
+RATE_LIMITER__EXEMPT_PATHS      = ('/rate_limit',)                              # GitHub doesn't count /rate_limit against the primary limit
+RATE_LIMITER__SECONDARY__WINDOW = 60                                            # seconds covered by secondary_max_per_minute
+RATE_LIMITER__HEADER__RETRY     = 'Retry-After'
+RATE_LIMITER__PRIMARY__STATUS   = 403                                           # GitHub answers an exhausted primary limit with 403 (or 429) and X-RateLimit-Remaining: 0
+RATE_LIMITER__SECONDARY__STATUS = 403
+
+# acquire() returns (pat, status, error, headers):
+#   status None  -> let the request through, add headers to its response, then call release(pat)
+#   status set   -> answer with status / error / headers instead (nothing to release)
+
+
+class GitHub__API__Surrogate__Rate_Limiter(Type_Safe):                          # Per-PAT primary quota (X-RateLimit-*) and secondary (concurrency / per-minute) limits
+    state                    : GitHub__API__Surrogate__State = None
+    pats                     : GitHub__API__Surrogate__PATs  = None
+    enabled                  : bool = True
+    limit                    : int  = 5000                                      # primary requests per window
+    window_seconds           : int  = 3600                                      # primary window (X-RateLimit-Reset = window start + this)
+    secondary_max_concurrent : int  = 0                                         # requests in flight per PAT (0 = no limit)
+    secondary_max_per_minute : int  = 0                                         # requests per PAT per minute (0 = no limit)
+    secondary_retry_after    : int  = 60                                        # Retry-After sent on concurrency rejections
+    primary_rejections       : int
+    secondary_rejections     : int
+    _in_flight               : Dict[str, int]                                   # PAT -> requests being served
+    _recent                  : dict                                             # PAT -> deque of monotonic request times (per-minute limit)
+    _lock                    : object = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._lock = threading.Lock()
+
+    def pat_for(self, authorization : str) -> Optional[str]:                    # Only known, valid PATs are counted (the routes answer 401/429 for the others)
+        pat = extract_pat(authorization)
+        if pat and self.pats.is_known_pat(pat) and self.pats.is_valid_pat(pat) and not self.pats.is_rate_limited(pat):
+            return pat
+        return None
+
+    def acquire(self, path          : str ,                                     # Request path (no query string)
+                      authorization : str                                       # Authorization header value
+                ) -> Tuple[Optional[str], Optional[int], Optional[Dict[str, Any]], Dict[str, str]]:
+        pat = self.pat_for(authorization) if self.enabled else None
+        if pat is None:
+            return None, None, None, {}
+        now = time.time()
+        with self._lock:
+            rate_limit = self.state.get_rate_limit(pat)
+            if path in RATE_LIMITER__EXEMPT_PATHS:
+                if rate_limit.reset and now >= rate_limit.reset:
+                    rate_limit.start_window(self.limit, int(now) + self.window_seconds)
+                return None, None, None, rate_limit.to_github_headers()
+            if now >= rate_limit.reset:
+                rate_limit.start_window(self.limit, int(now) + self.window_seconds)
+            if rate_limit.remaining <= 0:
+                self.primary_rejections += 1
+                return None, RATE_LIMITER__PRIMARY__STATUS, self.primary_error(), rate_limit.to_github_headers()
+            retry_after = self.secondary_retry_after_for(pat)
+            if retry_after:
+                self.secondary_rejections += 1
+                headers = {**rate_limit.to_github_headers(), RATE_LIMITER__HEADER__RETRY: str(retry_after)}
+                return None, RATE_LIMITER__SECONDARY__STATUS, self.secondary_error(), headers
+            rate_limit.decrement()
+            self._in_flight[pat] = self._in_flight.get(pat, 0) + 1
+            if self.secondary_max_per_minute:
+                self._recent.setdefault(pat, deque()).append(time.monotonic())
+            return pat, None, None, rate_limit.to_github_headers()
+
+    def release(self, pat : Optional[str]) -> None:                             # Request finished (pat as returned by acquire)
+        if pat is None:
+            return
+        with self._lock:
+            in_flight = self._in_flight.get(pat, 0) - 1
+            if in_flight > 0:
+                self._in_flight[pat] = in_flight
+            else:
+                self._in_flight.pop(pat, None)
+
+    def secondary_retry_after_for(self, pat : str) -> int:                      # Seconds to wait (0 = within the secondary limits); call with the lock held
+        if self.secondary_max_concurrent and self._in_flight.get(pat, 0) >= self.secondary_max_concurrent:
+            return self.secondary_retry_after
+        if self.secondary_max_per_minute:
+            now    = time.monotonic()
+            recent = self._recent.setdefault(pat, deque())
+            while recent and now - recent[0] >= RATE_LIMITER__SECONDARY__WINDOW:
+                recent.popleft()
+            if len(recent) >= self.secondary_max_per_minute:
+                return max(1, math.ceil(RATE_LIMITER__SECONDARY__WINDOW - (now - recent[0])))
+        return 0
+
+    def primary_error(self) -> Dict[str, Any]:
+        return dict(message           = 'API rate limit exceeded for user'                                         ,
+                    documentation_url = 'https://docs.github.com/rest/overview/rate-limits-for-the-rest-api'       )
+
+    def secondary_error(self) -> Dict[str, Any]:
+        return dict(message           = 'You have exceeded a secondary rate limit. Please wait a few minutes before you try again.',
+                    documentation_url = 'https://docs.github.com/rest/overview/rate-limits-for-the-rest-api#about-secondary-rate-limits')
+
+    def stats(self) -> Dict[str, int]:
+        return dict(primary_rejections   = self.primary_rejections         ,
+                    secondary_rejections = self.secondary_rejections       ,
+                    in_flight            = sum(self._in_flight.values())   )
+
+    def reset(self) -> 'GitHub__API__Surrogate__Rate_Limiter':                  # Forget in-flight / recent requests (quotas live in state.rate_limits)
+        with self._lock:
+            self._in_flight.clear()
+            self._recent.clear()
+            self.primary_rejections   = 0
+            self.secondary_rejections = 0
+        return self
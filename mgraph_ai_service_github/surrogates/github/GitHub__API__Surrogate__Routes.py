@@ -3,19 +3,24 @@ from osbot_utils.type_safe.Type_Safe
 from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__State              import GitHub__API__Surrogate__State
 from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__PATs               import GitHub__API__Surrogate__PATs
 from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Keys               import GitHub__API__Surrogate__Keys
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Rate_Limiter       import GitHub__API__Surrogate__Rate_Limiter
 from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Fast_API           import GitHub__API__Surrogate__Fast_API
 
 
 class GitHub__API__Surrogate__Routes(Type_Safe):                                # FastAPI route definitions for GitHub API surrogate
     
-    state : GitHub__API__Surrogate__State
-    pats  : GitHub__API__Surrogate__PATs
-    keys  : GitHub__API__Surrogate__Keys
+    state        : GitHub__API__Surrogate__State
+    pats         : GitHub__API__Surrogate__PATs
+    keys         : GitHub__API__Surrogate__Keys
+    rate_limiter : GitHub__API__Surrogate__Rate_Limiter = None                  # applied as middleware when set
+    fast_api     : GitHub__API__Surrogate__Fast_API     = None                          # set by create_app (its routes_objects feed the dispatcher)
 
     def create_app(self) -> FastAPI:                                            # Create FastAPI app with all routes
         with GitHub__API__Surrogate__Fast_API() as fast_api:
-            fast_api.state = self.state
-            fast_api.pats  = self.pats
-            fast_api.keys  = self.keys
+            fast_api.state        = self.state
+            fast_api.pats         = self.pats
+            fast_api.keys         = self.keys
+            fast_api.rate_limiter = self.rate_limiter
             fast_api.setup()
+            self.fast_api = fast_api
             return fast_api.app()
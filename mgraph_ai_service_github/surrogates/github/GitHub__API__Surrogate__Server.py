@@ -0,0 +1,48 @@
+from uvicorn                                                                    import Config
+from osbot_fast_api.utils.Fast_API_Server                                       import Fast_API_Server, FAST_API__HOST, FAST_API__LOG_LEVEL
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from osbot_utils.utils.Misc                                                     import random_port
+from mgraph_ai_service_github.service.github.GitHub__API                        import GitHub__API
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate          import GitHub__API__Surrogate
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Faults  import GitHub__API__Surrogate__Faults
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Fault__Middleware import GitHub__API__Surrogate__Fault__Middleware
+
+
+class GitHub__API__Surrogate__Server(Type_Safe):                                # Surrogate app served by uvicorn on a local port (background thread), with injected latency and faults
+    surrogate : GitHub__API__Surrogate = None                                   # created (and set up) on start when not given
+    faults    : GitHub__API__Surrogate__Faults
+    port      : int                    = 0                                      # 0 = random free port
+    server    : Fast_API_Server        = None
+
+    def start(self) -> 'GitHub__API__Surrogate__Server':
+        if self.server is not None and self.server.running:
+            return self
+        if self.surrogate is None:
+            self.surrogate = GitHub__API__Surrogate().setup()
+        if not self.port:
+            self.port = random_port()
+        app         = GitHub__API__Surrogate__Fault__Middleware(self.surrogate.app(), self.faults)
+        config      = Config(app=app, host=FAST_API__HOST, port=self.port, log_level=FAST_API__LOG_LEVEL)
+        self.server = Fast_API_Server(app=self.surrogate.app(), port=self.port, config=config)
+        self.server.start()
+        return self
+
+    def stop(self) -> bool:
+        if self.server is None or not self.server.running:
+            return False
+        return self.server.stop()
+
+    def api_url(self) -> str:                                                   # Value for GitHub__API.api_url
+        return f'http://{FAST_API__HOST}:{self.port}'
+
+    def create_api(self, pat : str = None                                       # PAT to use. If None, uses admin PAT.
+                   ) -> GitHub__API:                                            # GitHub__API talking real HTTP to this server (no session factory must be set)
+        return GitHub__API(api_token = pat or self.surrogate.pats.admin_pat() ,
+                           api_url   = self.api_url()                         )
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+        return False
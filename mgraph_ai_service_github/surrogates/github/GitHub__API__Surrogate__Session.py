@@ -22,7 +22,7 @@ class GitHub__API__Surrogate__Session(Type_Safe):
             # Extract path from full URL
             from urllib.parse import urlparse
             parsed = urlparse(url)
-            return parsed.path
+            return f'{parsed.path}?{parsed.query}' if parsed.query else parsed.path   # keep the query (e.g. Link rel="next" urls)
         return url
     
     def _prepare_headers(self, kwargs: dict) -> dict:                           # Merge instance headers with request headers
@@ -35,7 +35,7 @@ class GitHub__API__Surrogate__Session(Type_Safe):
         path    = self._convert_url_to_path(url)
         headers = self._prepare_headers(kwargs)
         
-        response = self.test_client.get(path, headers=headers)
+        response = self.test_client.get(path, headers=headers, params=kwargs.get('params'))
         return SurrogateResponse(response)
     
     def put(self, url: str, json: dict = None, **kwargs) -> 'SurrogateResponse': # Execute PUT request via TestClient
@@ -4,6 +4,7 @@ from mgraph_ai_service_github.surrogates.github.schemas.Schema__Surrogate__Repo
 from mgraph_ai_service_github.surrogates.github.schemas.Schema__Surrogate__Secret     import Schema__Surrogate__Secret, Schema__Surrogate__Org__Secret
 from mgraph_ai_service_github.surrogates.github.schemas.Schema__Surrogate__Public_Key import Schema__Surrogate__Public_Key
 from mgraph_ai_service_github.surrogates.github.schemas.Schema__Surrogate__Rate_Limit import Schema__Surrogate__Rate_Limit
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Ordered_Index import GitHub__API__Surrogate__Ordered_Index
 
 
 class GitHub__API__Surrogate__State(Type_Safe):                                 # In-memory state for the GitHub API surrogate
@@ -11,7 +12,7 @@ class GitHub__API__Surrogate__State(Type_Safe):
     repos          : Dict[str, Schema__Surrogate__Repo]                         # Repository data indexed by "owner/repo"
     
     # Secrets by scope
-    secrets__repo  : Dict[str, Dict[str, Schema__Surrogate__Secret]]            # "owner/repo" -> {name -> secret}
+    secrets__repo  : Dict[str, Dict[str, Schema__Surrogate__Secret]]            # "owner/repo" -> {name -> secret}   (GitHub__API__Surrogate__Ordered_Index values)
     secrets__env   : Dict[str, Dict[str, Dict[str, Schema__Surrogate__Secret]]] # "owner/repo" -> {env -> {name -> secret}}
     secrets__org   : Dict[str, Dict[str, Schema__Surrogate__Org__Secret]]       # "org" -> {name -> secret}
     
@@ -49,7 +50,7 @@ class GitHub__API__Surrogate__State(Type_Safe):
                                             private      = private                 ,
                                             environments = environments or []      )
         self.repos[repo_key]         = repo_data
-        self.secrets__repo[repo_key] = {}                                       # Initialize empty secrets dict
+        self.secrets__repo[repo_key] = GitHub__API__Surrogate__Ordered_Index()  # Initialize empty secrets index
         self.secrets__env[repo_key]  = {}                                       # Initialize empty env secrets dict
         return self
     
@@ -59,6 +60,14 @@ class GitHub__API__Surrogate__State(Type_Safe):
     def repo_exists(self, owner: str, repo: str) -> bool:                       # Check if repository exists
         return self._repo_key(owner, repo) in self.repos
     
+    def list_owner_repos(self, owner: str                                       # List repositories of an owner (sorted by full_name, case-insensitive like GitHub)
+                         ) -> List[Schema__Surrogate__Repo]:
+        repos = [repo for repo in self.repos.values() if repo.owner == owner]
+        return sorted(repos, key=lambda repo: repo.full_name.lower())
+
+    def owner_exists(self, owner: str) -> bool:                                 # Owner is known if it is an org or owns at least one repo
+        return self.org_exists(owner) or any(repo.owner == owner for repo in self.repos.values())
+
     def add_environment(self, owner: str,
                               repo: str,
                               environment: str           # Add an environment to a repository
@@ -68,7 +77,7 @@ class GitHub__API__Surrogate__State(Type_Safe):
         if repo_data and environment not in repo_data.environments:
             repo_data.environments.append(environment)
             if environment not in self.secrets__env[repo_key]:
-                self.secrets__env[repo_key][environment] = {}
+                self.secrets__env[repo_key][environment] = GitHub__API__Surrogate__Ordered_Index()
         return self
     
     def environment_exists(self, owner: str, repo: str, environment: str) -> bool:
@@ -85,6 +94,10 @@ class GitHub__API__Surrogate__State(Type_Safe):
         secrets  = self.secrets__repo.get(repo_key, {})
         return list(secrets.values())
     
+    def repo_secrets_index(self, owner: str, repo: str                          # Insertion-ordered repository secrets (for paginated listings)
+                           ) -> Dict[str, Schema__Surrogate__Secret]:
+        return self.secrets__repo.get(self._repo_key(owner, repo), {})
+
     def get_repo_secret(self, owner: str, repo: str, name: str                  # Get a repository secret
                         ) -> Optional[Schema__Surrogate__Secret]:
         repo_key = self._repo_key(owner, repo)
@@ -99,7 +112,7 @@ class GitHub__API__Surrogate__State(Type_Safe):
                         ) -> bool:
         repo_key = self._repo_key(owner, repo)
         if repo_key not in self.secrets__repo:
-            self.secrets__repo[repo_key] = {}
+            self.secrets__repo[repo_key] = GitHub__API__Surrogate__Ordered_Index()
         
         existing = self.secrets__repo[repo_key].get(name)
         now      = '2024-01-15T10:30:00Z'                                       # Fixed timestamp for testing
@@ -136,6 +149,10 @@ class GitHub__API__Surrogate__State(Type_Safe):
         env_secrets = self.secrets__env.get(repo_key, {}).get(environment, {})
         return list(env_secrets.values())
     
+    def env_secrets_index(self, owner: str, repo: str, environment: str         # Insertion-ordered environment secrets (for paginated listings)
+                          ) -> Dict[str, Schema__Surrogate__Secret]:
+        return self.secrets__env.get(self._repo_key(owner, repo), {}).get(environment, {})
+
     def get_env_secret(self, owner: str, repo: str, environment: str, name: str # Get an environment secret
                        ) -> Optional[Schema__Surrogate__Secret]:
         repo_key    = self._repo_key(owner, repo)
@@ -153,7 +170,7 @@ class GitHub__API__Surrogate__State(Type_Safe):
         if repo_key not in self.secrets__env:
             self.secrets__env[repo_key] = {}
         if environment not in self.secrets__env[repo_key]:
-            self.secrets__env[repo_key][environment] = {}
+            self.secrets__env[repo_key][environment] = GitHub__API__Surrogate__Ordered_Index()
         
         existing = self.secrets__env[repo_key][environment].get(name)
         now      = '2024-01-15T10:30:00Z'
@@ -186,7 +203,7 @@ class GitHub__API__Surrogate__State(Type_Safe):
     
     def add_org(self, org: str) -> 'GitHub__API__Surrogate__State':             # Add an organization
         if org not in self.secrets__org:
-            self.secrets__org[org] = {}
+            self.secrets__org[org] = GitHub__API__Surrogate__Ordered_Index()
         return self
     
     def org_exists(self, org: str) -> bool:                                     # Check if organization exists
@@ -197,6 +214,10 @@ class GitHub__API__Surrogate__State(Type_Safe):
         secrets = self.secrets__org.get(org, {})
         return list(secrets.values())
     
+    def org_secrets_index(self, org: str                                        # Insertion-ordered organization secrets (for paginated listings)
+                          ) -> Dict[str, Schema__Surrogate__Org__Secret]:
+        return self.secrets__org.get(org, {})
+
     def get_org_secret(self, org: str, name: str                                # Get an organization secret
                        ) -> Optional[Schema__Surrogate__Org__Secret]:
         secrets = self.secrets__org.get(org, {})
@@ -209,7 +230,7 @@ class GitHub__API__Surrogate__State(Type_Safe):
                              visibility      : str   = 'private'
                        ) -> bool:
         if org not in self.secrets__org:
-            self.secrets__org[org] = {}
+            self.secrets__org[org] = GitHub__API__Surrogate__Ordered_Index()
         
         existing = self.secrets__org[org].get(name)
         now      = '2024-01-15T10:30:00Z'
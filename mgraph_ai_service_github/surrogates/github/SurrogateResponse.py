@@ -8,7 +8,7 @@ class SurrogateResponse:
         self.status_code  = response.status_code
         self.content      = response.content
         self.text         = response.text
-        self.headers      = dict(response.headers)
+        self.headers      = response.headers                                    # case-insensitive (Link, X-RateLimit-*)
 
     def json(self) -> Dict[str, Any]:                                           # Parse JSON response
         return self._response.json()
@@ -1,6 +1,21 @@
 from typing                                                                        import Dict, Any, Tuple, Optional
 from fastapi.responses                                                             import JSONResponse
 from osbot_fast_api.api.routes.Fast_API__Routes                                    import Fast_API__Routes
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Ordered_Index import slice_items
+
+SURROGATE__PER_PAGE__DEFAULT = 30                                               # GitHub's defaults for list endpoints
+SURROGATE__PER_PAGE__MAX     = 100
+SURROGATE__HOST__DEFAULT     = 'testserver'                                     # used in Link urls when the request carried no Host header
+
+
+def extract_pat(authorization: str) -> Optional[str]:                           # PAT from an Authorization header ('token x', 'Bearer x' or bare)
+    if not authorization:
+        return None
+    if authorization.startswith('token '):
+        return authorization[6:]
+    if authorization.startswith('Bearer '):
+        return authorization[7:]
+    return authorization
 
 
 class Routes__GitHub__Base(Fast_API__Routes):                                   # Base class for GitHub surrogate routes with shared auth helpers
@@ -14,13 +29,7 @@ class Routes__GitHub__Base(Fast_API__Routes):
     # ═══════════════════════════════════════════════════════════════════════════════
 
     def extract_pat(self, authorization: str) -> Optional[str]:                 # Extract PAT from Authorization header
-        if not authorization:
-            return None
-        if authorization.startswith('token '):
-            return authorization[6:]
-        if authorization.startswith('Bearer '):
-            return authorization[7:]
-        return authorization
+        return extract_pat(authorization)
 
     def validate_auth(self, authorization: str                                  # Validate authorization and return (valid, status_code, error_response, pat)
                       ) -> Tuple[bool, int, Dict[str, Any], str]:
@@ -102,5 +111,29 @@ class Routes__GitHub__Base(Fast_API__Routes):
             return (False, JSONResponse(content=error, status_code=status))
         return (True, None)
 
+    def paginated_response(self, index     : Dict,                              # name -> item with to_github_response() (O(page) for GitHub__API__Surrogate__Ordered_Index)
+                                 items_key : str ,                              # e.g. 'secrets'
+                                 path      : str ,                              # Endpoint path (for the Link urls)
+                                 page      : int ,                              # 1-based page number
+                                 per_page  : int ,                              # Clamped to 1..100 like GitHub
+                                 host      : str                                # Host header (for the Link urls)
+                           ) -> JSONResponse:                                   # {'total_count': n, items_key: [...]} + Link header when there is more than one page
+        per_page   = min(max(per_page, 1), SURROGATE__PER_PAGE__MAX)
+        page       = max(page, 1)
+        total      = len(index)
+        items      = [item.to_github_response() for item in slice_items(index, (page - 1) * per_page, per_page)]
+        last_page  = max(1, -(-total // per_page))
+        url        = f'http://{host or SURROGATE__HOST__DEFAULT}{path}?per_page={per_page}&page='
+        links      = []
+        if page > 1:
+            links.append(f'<{url}{min(page - 1, last_page)}>; rel="prev"')
+        if page < last_page:
+            links.append(f'<{url}{page + 1}>; rel="next"')
+            links.append(f'<{url}{last_page}>; rel="last"')
+        if page > 1:
+            links.append(f'<{url}1>; rel="first"')
+        headers    = {'Link': ', '.join(links)} if links else None
+        return JSONResponse(content={'total_count': total, items_key: items}, headers=headers)
+
     def not_found_response(self) -> JSONResponse:                               # Return 404 Not Found response
         return JSONResponse(content=self._error_response("Not Found", 404), status_code=404)
@@ -2,7 +2,7 @@ from typing
 from fastapi                                                                                   import Header, Request
 from fastapi.responses                                                                         import JSONResponse
 from osbot_fast_api.api.decorators.route_path                                                  import route_path
-from mgraph_ai_service_github.surrogates.github.routes.Routes__GitHub__Base                    import Routes__GitHub__Base
+from mgraph_ai_service_github.surrogates.github.routes.Routes__GitHub__Base                    import Routes__GitHub__Base, SURROGATE__PER_PAGE__DEFAULT
 
 
 class Routes__GitHub__Env_Secrets(Routes__GitHub__Base):                        # Routes for environment secrets endpoints
@@ -36,7 +36,10 @@ class Routes__GitHub__Env_Secrets(Routes__GitHub__Base):
     def list_env_secrets(self, owner         : str              ,               # GET /repos/{owner}/{repo}/environments/{environment}/secrets
                                repo          : str              ,
                                environment   : str              ,
-                               authorization : str = Header(None)
+                               authorization : str = Header(None)                 ,
+                               per_page      : int = SURROGATE__PER_PAGE__DEFAULT ,
+                               page          : int = 1                            ,
+                               host          : str = Header(None)                   # Link urls point back at the host that was called
                          ) -> Dict[str, Any]:
         valid, error_response, pat = self.auth_error_response(authorization)
         if not valid:
@@ -52,11 +55,12 @@ class Routes__GitHub__Env_Secrets(Routes__GitHub__Base):
         if not self.state.environment_exists(owner, repo, environment):
             return self.not_found_response()
 
-        secrets      = self.state.list_env_secrets(owner, repo, environment)
-        secrets_list = [s.to_github_response() for s in secrets]
-
-        return dict(total_count = len(secrets_list) ,
-                    secrets     = secrets_list      )
+        return self.paginated_response(index     = self.state.env_secrets_index(owner, repo, environment)      ,
+                                       items_key = 'secrets'                                                   ,
+                                       path      = f'/repos/{owner}/{repo}/environments/{environment}/secrets' ,
+                                       page      = page                                                        ,
+                                       per_page  = per_page                                                    ,
+                                       host      = host                                                        )
 
     @route_path('/repos/{owner}/{repo}/environments/{environment}/secrets/{secret_name}')
     def get_env_secret(self, owner         : str              ,                 # GET /repos/{owner}/{repo}/environments/{environment}/secrets/{secret_name}
@@ -2,7 +2,7 @@ from typing
 from fastapi                                                                                   import Header, Request
 from fastapi.responses                                                                         import JSONResponse
 from osbot_fast_api.api.decorators.route_path                                                  import route_path
-from mgraph_ai_service_github.surrogates.github.routes.Routes__GitHub__Base                    import Routes__GitHub__Base
+from mgraph_ai_service_github.surrogates.github.routes.Routes__GitHub__Base                    import Routes__GitHub__Base, SURROGATE__PER_PAGE__DEFAULT
 
 
 class Routes__GitHub__Org_Secrets(Routes__GitHub__Base):                        # Routes for organization secrets endpoints
@@ -29,7 +29,10 @@ class Routes__GitHub__Org_Secrets(Routes__GitHub__Base):
 
     @route_path('/orgs/{org}/actions/secrets')
     def list_org_secrets(self, org           : str              ,               # GET /orgs/{org}/actions/secrets
-                               authorization : str = Header(None)
+                               authorization : str = Header(None)                 ,
+                               per_page      : int = SURROGATE__PER_PAGE__DEFAULT ,
+                               page          : int = 1                            ,
+                               host          : str = Header(None)                   # Link urls point back at the host that was called
                          ) -> Dict[str, Any]:
         valid, error_response, pat = self.auth_error_response(authorization)
         if not valid:
@@ -42,11 +45,12 @@ class Routes__GitHub__Org_Secrets(Routes__GitHub__Base):
         if not self.state.org_exists(org):
             return self.not_found_response()
 
-        secrets      = self.state.list_org_secrets(org)
-        secrets_list = [s.to_github_response() for s in secrets]
-
-        return dict(total_count = len(secrets_list) ,
-                    secrets     = secrets_list      )
+        return self.paginated_response(index     = self.state.org_secrets_index(org) ,
+                                       items_key = 'secrets'                         ,
+                                       path      = f'/orgs/{org}/actions/secrets'    ,
+                                       page      = page                              ,
+                                       per_page  = per_page                          ,
+                                       host      = host                              )
 
     @route_path('/orgs/{org}/actions/secrets/{secret_name}')
     def get_org_secret(self, org           : str              ,                 # GET /orgs/{org}/actions/secrets/{secret_name}
@@ -2,7 +2,7 @@ from typing
 from fastapi                                                                                   import Header, Request
 from fastapi.responses                                                                         import JSONResponse
 from osbot_fast_api.api.decorators.route_path                                                  import route_path
-from mgraph_ai_service_github.surrogates.github.routes.Routes__GitHub__Base                    import Routes__GitHub__Base
+from mgraph_ai_service_github.surrogates.github.routes.Routes__GitHub__Base                    import Routes__GitHub__Base, SURROGATE__PER_PAGE__DEFAULT
 
 
 class Routes__GitHub__Repo_Secrets(Routes__GitHub__Base):                       # Routes for repository secrets endpoints
@@ -31,7 +31,10 @@ class Routes__GitHub__Repo_Secrets(Routes__GitHub__Base):
     @route_path('/repos/{owner}/{repo}/actions/secrets')
     def list_repo_secrets(self, owner         : str              ,              # GET /repos/{owner}/{repo}/actions/secrets
                                 repo          : str              ,
-                                authorization : str = Header(None)
+                                authorization : str = Header(None)                 ,
+                                per_page      : int = SURROGATE__PER_PAGE__DEFAULT ,
+                                page          : int = 1                            ,
+                                host          : str = Header(None)                   # Link urls point back at the host that was called
                           ) -> Dict[str, Any]:
         valid, error_response, pat = self.auth_error_response(authorization)
         if not valid:
@@ -44,11 +47,12 @@ class Routes__GitHub__Repo_Secrets(Routes__GitHub__Base):
         if not self.state.repo_exists(owner, repo):
             return self.not_found_response()
 
-        secrets      = self.state.list_repo_secrets(owner, repo)
-        secrets_list = [s.to_github_response() for s in secrets]
-
-        return dict(total_count = len(secrets_list) ,
-                    secrets     = secrets_list      )
+        return self.paginated_response(index     = self.state.repo_secrets_index(owner, repo) ,
+                                       items_key = 'secrets'                                  ,
+                                       path      = f'/repos/{owner}/{repo}/actions/secrets'   ,
+                                       page      = page                                       ,
+                                       per_page  = per_page                                   ,
+                                       host      = host                                       )
 
     @route_path('/repos/{owner}/{repo}/actions/secrets/{secret_name}')
     def get_repo_secret(self, owner         : str              ,                # GET /repos/{owner}/{repo}/actions/secrets/{secret_name}
@@ -0,0 +1,50 @@
+from typing                                                                                    import Dict, Any, List
+from fastapi                                                                                   import Header
+from osbot_fast_api.api.decorators.route_path                                                  import route_path
+from mgraph_ai_service_github.surrogates.github.routes.Routes__GitHub__Base                    import Routes__GitHub__Base
+
+
+class Routes__GitHub__Repos(Routes__GitHub__Base):                              # Routes for repository and environment listing endpoints
+
+    @route_path('/orgs/{org}/repos')
+    def list_org_repos(self, org           : str              ,                 # GET /orgs/{org}/repos
+                             authorization : str = Header(None)
+                       ) -> List[Dict[str, Any]]:
+        valid, error_response, pat = self.auth_error_response(authorization)
+        if not valid:
+            return error_response
+
+        can_read, error_response = self.repo_read_error_response(pat)
+        if not can_read:
+            return error_response
+
+        if not self.state.owner_exists(org):
+            return self.not_found_response()
+
+        return [repo.to_github_response() for repo in self.state.list_owner_repos(org)]
+
+    @route_path('/repos/{owner}/{repo}/environments')
+    def list_repo_environments(self, owner         : str              ,         # GET /repos/{owner}/{repo}/environments
+                                     repo          : str              ,
+                                     authorization : str = Header(None)
+                               ) -> Dict[str, Any]:
+        valid, error_response, pat = self.auth_error_response(authorization)
+        if not valid:
+            return error_response
+
+        can_read, error_response = self.repo_read_error_response(pat)
+        if not can_read:
+            return error_response
+
+        repo_data = self.state.get_repo(owner, repo)
+        if repo_data is None:
+            return self.not_found_response()
+
+        environments = [dict(name=environment) for environment in repo_data.environments]
+        return dict(total_count  = len(environments) ,
+                    environments = environments      )
+
+    def setup_routes(self):                                                     # Register all routes
+        self.add_route_get(self.list_org_repos        )
+        self.add_route_get(self.list_repo_environments)
+        return self
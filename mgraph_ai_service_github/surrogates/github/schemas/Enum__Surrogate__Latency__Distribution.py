@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class Enum__Surrogate__Latency__Distribution(Enum):                             # How the HTTP surrogate server picks each response's delay
+    FIXED     = 'fixed'                                                         # always latency_ms
+    NORMAL    = 'normal'                                                        # gauss(latency_ms, stddev_ms)
+    LONG_TAIL = 'long_tail'                                                     # latency_ms, or a Pareto-distributed tail_ms delay with tail_probability
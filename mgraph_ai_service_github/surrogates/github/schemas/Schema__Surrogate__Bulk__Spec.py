@@ -0,0 +1,15 @@
+from osbot_utils.type_safe.Type_Safe                                                        import Type_Safe
+
+
+class Schema__Surrogate__Bulk__Spec(Type_Safe):                                 # Shape of the synthetic state seeded by GitHub__API__Surrogate__Generator
+    seed                    : int   = 0                                         # same spec + seed -> same orgs / repos / secrets / timestamps
+    orgs                    : int   = 1
+    repos_per_org           : int   = 10
+    environments_per_repo   : int   = 0
+    secrets_per_repo        : int   = 5
+    secrets_per_environment : int   = 0
+    secrets_per_org         : int   = 0
+    private_ratio           : float = 0.5                                       # share of private repos
+    org_prefix              : str   = 'org'
+    repo_prefix             : str   = 'repo'
+    placeholder_ciphertext  : bool  = True                                      # False: real SealedBox values (one encryption per secret, much slower)
@@ -0,0 +1,15 @@
+from osbot_utils.type_safe.Type_Safe                                                        import Type_Safe
+from mgraph_ai_service_github.surrogates.github.schemas.Enum__Surrogate__Latency__Distribution import Enum__Surrogate__Latency__Distribution
+
+
+class Schema__Surrogate__Fault__Profile(Type_Safe):                             # Latency and fault model for one group of surrogate endpoints
+    distribution     : Enum__Surrogate__Latency__Distribution = Enum__Surrogate__Latency__Distribution.FIXED
+    latency_ms       : float = 0.0                                              # fixed delay / normal mean / long-tail body
+    stddev_ms        : float = 0.0                                              # normal: standard deviation
+    tail_probability : float = 0.0                                              # long_tail: share of requests that land in the tail
+    tail_ms          : float = 0.0                                              # long_tail: tail scale (minimum tail delay)
+    jitter_ms        : float = 0.0                                              # uniform +/- jitter added to every delay
+    max_ms           : float = 10_000.0                                         # cap on any single delay (the Pareto tail is unbounded)
+    error_rate       : float = 0.0                                              # share of requests answered with error_status
+    error_status     : int   = 503
+    reset_rate       : float = 0.0                                              # share of requests whose TCP connection is reset (no response)
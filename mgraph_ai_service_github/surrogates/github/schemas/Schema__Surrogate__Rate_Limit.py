@@ -1,5 +1,6 @@
-from typing                              import Dict, Any
-from osbot_utils.type_safe.Type_Safe     import Type_Safe
+from typing                                                                          import Dict, Any
+from osbot_utils.type_safe.Type_Safe                                                 import Type_Safe
+from mgraph_ai_service_github.service.github.rate_limit.GitHub__Rate_Limit__Tracker import RATE_LIMIT__HEADERS, RATE_LIMIT__HEADER__RESOURCE, RATE_LIMIT__DEFAULT_RESOURCE
 
 
 class Schema__Surrogate__Rate_Limit(Type_Safe):                                 # GitHub rate limit tracking for surrogate
@@ -14,6 +15,18 @@ class Schema__Surrogate__Rate_Limit(Type_Safe):
                                 reset     = self.reset     ,
                                 used      = self.used      ))
 
+    def to_github_headers(self) -> Dict[str, str]:                              # X-RateLimit-* headers GitHub sends on every authenticated response
+        headers = {header: str(getattr(self, field)) for field, header in RATE_LIMIT__HEADERS.items()}
+        headers[RATE_LIMIT__HEADER__RESOURCE] = RATE_LIMIT__DEFAULT_RESOURCE
+        return headers
+
+    def start_window(self, limit : int, reset : int) -> 'Schema__Surrogate__Rate_Limit':     # Full quota until the reset timestamp
+        self.limit     = limit
+        self.remaining = limit
+        self.reset     = reset
+        self.used      = 0
+        return self
+
     def decrement(self) -> 'Schema__Surrogate__Rate_Limit':                     # Record a request
         self.remaining = max(0, self.remaining - 1)
         self.used     += 1
@@ -1,4 +1,4 @@
-from typing                              import Optional, List
+from typing                              import Optional, List, Dict, Any
 from osbot_utils.type_safe.Type_Safe     import Type_Safe
 
 
@@ -11,3 +11,9 @@ class Schema__Surrogate__Repo(Type_Safe):
 
     def repo_key(self) -> str:                                                  # Get unique key for this repo
         return self.full_name
+
+    def to_github_response(self) -> Dict[str, Any]:                             # Convert to GitHub API response format (subset of fields)
+        return dict(name      = self.name             ,
+                    full_name = self.full_name        ,
+                    owner     = dict(login=self.owner),
+                    private   = self.private          )
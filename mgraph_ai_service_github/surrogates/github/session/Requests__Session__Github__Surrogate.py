@@ -18,10 +18,11 @@ class Requests__Session__Github__Surrogate(Requests__Session):
     def _headers(self) -> Dict[str, str]:                                       # Build headers with current api_token
         return {'Authorization': f'token {self.api_token}'}
 
-    def _path_from_url(self, url: str) -> str:                                  # Extract path from full URL
+    def _path_from_url(self, url: str) -> str:                                  # Extract path (and query, e.g. from Link headers) from full URL
         if url.startswith('http'):
             from urllib.parse import urlparse
-            return urlparse(url).path
+            parsed = urlparse(url)
+            return f'{parsed.path}?{parsed.query}' if parsed.query else parsed.path
         return url
 
     def get(self, url: str, **kwargs) -> Requests__Session__Response:
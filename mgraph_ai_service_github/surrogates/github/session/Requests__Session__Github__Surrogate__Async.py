@@ -0,0 +1,40 @@
+import httpx
+from fastapi                                                                                    import FastAPI
+from mgraph_ai_service_github.service.github.session.Requests__Session__Async                   import Requests__Session__Async
+from mgraph_ai_service_github.service.github.session.Requests__Session__Response                import Requests__Session__Response
+from mgraph_ai_service_github.surrogates.github.session.Requests__Session__Response__Surrogate  import Requests__Session__Response__Surrogate
+
+
+class Requests__Session__Github__Surrogate__Async(Requests__Session__Async):    # Async surrogate session, calls the surrogate app in-process via httpx.ASGITransport
+    api_token : str     = None
+    app       : FastAPI = None
+
+    def _headers(self) -> dict:                                                 # Build headers with current api_token
+        return {'Authorization': f'token {self.api_token}'}
+
+    def _path_from_url(self, url: str) -> str:                                  # Extract path (and query, e.g. from Link headers) from full URL
+        if url.startswith('http'):
+            from urllib.parse import urlparse
+            parsed = urlparse(url)
+            return f'{parsed.path}?{parsed.query}' if parsed.query else parsed.path
+        return url
+
+    async def request(self, method: str, url: str, **kwargs) -> Requests__Session__Response:
+        path      = self._path_from_url(url)
+        headers   = {**self._headers(), **(kwargs.pop('headers', None) or {})}
+        transport = httpx.ASGITransport(app=self.app)                           # client per call: cheap in-process and never bound to a stale event loop
+        async with httpx.AsyncClient(transport=transport, base_url='http://testserver') as client:
+            response = await client.request(method, path, headers=headers, **kwargs)
+        return Requests__Session__Response__Surrogate(response)
+
+    async def get(self, url: str, **kwargs) -> Requests__Session__Response:
+        return await self.request('GET', url, **kwargs)
+
+    async def put(self, url: str, **kwargs) -> Requests__Session__Response:
+        return await self.request('PUT', url, **kwargs)
+
+    async def delete(self, url: str, **kwargs) -> Requests__Session__Response:
+        return await self.request('DELETE', url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> Requests__Session__Response:
+        return await self.request('POST', url, **kwargs)
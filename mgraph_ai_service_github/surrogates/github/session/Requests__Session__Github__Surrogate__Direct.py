@@ -0,0 +1,29 @@
+from mgraph_ai_service_github.service.github.session.Requests__Session__Response                import Requests__Session__Response
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Dispatcher              import GitHub__API__Surrogate__Dispatcher
+from mgraph_ai_service_github.surrogates.github.session.Requests__Session__Github__Surrogate    import Requests__Session__Github__Surrogate
+from mgraph_ai_service_github.surrogates.github.session.Requests__Session__Response__Surrogate  import Requests__Session__Response__Surrogate
+
+
+class Requests__Session__Github__Surrogate__Direct(Requests__Session__Github__Surrogate):   # Surrogate session calling the route handlers directly (no TestClient)
+    dispatcher : GitHub__API__Surrogate__Dispatcher = None
+
+    def request(self, method: str, url: str, **kwargs) -> Requests__Session__Response:
+        headers  = {**self._headers(), **(kwargs.pop('headers', None) or {})}
+        response = self.dispatcher.dispatch(method                           ,
+                                            self._path_from_url(url)         ,
+                                            headers = headers                ,
+                                            params  = kwargs.get('params')   ,
+                                            json    = kwargs.get('json'  )   )
+        return Requests__Session__Response__Surrogate(response)
+
+    def get(self, url: str, **kwargs) -> Requests__Session__Response:
+        return self.request('GET', url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> Requests__Session__Response:
+        return self.request('PUT', url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> Requests__Session__Response:
+        return self.request('DELETE', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> Requests__Session__Response:
+        return self.request('POST', url, **kwargs)
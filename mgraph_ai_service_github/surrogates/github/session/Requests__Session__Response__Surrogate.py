@@ -23,4 +23,6 @@ class Requests__Session__Response__Surrogate(Requests__Session__Response):
     def content(self) -> bytes:
         return self._response.content
 
-
+    @property
+    def headers(self) -> Dict[str, str]:
+        return self._response.headers
@@ -1,26 +1,58 @@
 from osbot_utils.type_safe.Type_Safe                                                        import Type_Safe
 from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate                      import GitHub__API__Surrogate
 from mgraph_ai_service_github.service.github.GitHub__API                                    import set_session_factory, clear_session_factory
+from mgraph_ai_service_github.service.github.GitHub__API__Async                             import set_async_session_factory, clear_async_session_factory
+from mgraph_ai_service_github.service.auth.Service__Auth__PAT__Cache                        import service_auth_pat_cache
+from mgraph_ai_service_github.service.auth.Service__Auth__Validation__Cache                 import service_auth_validation_cache
+from mgraph_ai_service_github.service.github.cache.GitHub__API__Response_Cache              import github_api_response_cache
+from mgraph_ai_service_github.service.github.cache.GitHub__Public_Key__Cache                import github_public_key_cache
+from mgraph_ai_service_github.service.github.sync.GitHub__Secrets__Sync__Fingerprints      import github_secrets_sync_fingerprints
+from mgraph_ai_service_github.service.github.rate_limit.GitHub__Rate_Limit__Tracker        import github_rate_limit_tracker
 from mgraph_ai_service_github.surrogates.github.session.Requests__Session__Github__Surrogate import Requests__Session__Github__Surrogate
+from mgraph_ai_service_github.surrogates.github.session.Requests__Session__Github__Surrogate__Direct import Requests__Session__Github__Surrogate__Direct
+from mgraph_ai_service_github.surrogates.github.session.Requests__Session__Github__Surrogate__Async import Requests__Session__Github__Surrogate__Async
 
 
 class GitHub__API__Surrogate__Test_Context(Type_Safe):                          # Helper to wire GitHub__API to use surrogate in tests
 
     surrogate : GitHub__API__Surrogate = None
+    direct    : bool                   = True                                   # GitHub__API calls go straight to the handlers (False: through TestClient)
 
     def setup(self) -> 'GitHub__API__Surrogate__Test_Context':                  # Initialize surrogate and wire into GitHub__API
         self.surrogate   = GitHub__API__Surrogate().setup()
         test_client      = self.surrogate.test_client()
+        dispatcher       = self.surrogate.dispatcher()
 
         def session_factory(api_token: str):
+            if self.direct:
+                return Requests__Session__Github__Surrogate__Direct(api_token  = api_token  ,
+                                                                    dispatcher = dispatcher )
             return Requests__Session__Github__Surrogate(api_token   = api_token   ,
                                                         test_client = test_client )
 
-        set_session_factory(session_factory)
+        def async_session_factory(api_token: str):
+            return Requests__Session__Github__Surrogate__Async(api_token = api_token            ,
+                                                               app       = self.surrogate.app() )
+
+        set_session_factory      (session_factory      )
+        set_async_session_factory(async_session_factory)
+        github_public_key_cache.clear()                                         # each surrogate generates its own key pairs
+        github_secrets_sync_fingerprints.clear()                                # and uses a fixed updated_at, so stale fingerprints would look current
+        service_auth_pat_cache.clear()                                          # cached GitHub__API instances hold the session they were created with
+        service_auth_validation_cache.clear()                                   # surrogate users differ from the ones a real (or previous) GitHub returned
+        github_rate_limit_tracker.clear()                                       # the surrogate sends its own X-RateLimit-* headers
+        github_api_response_cache.clear()                                       # ETags / bodies from another surrogate (or GitHub) describe different state
         return self
 
     def teardown(self) -> 'GitHub__API__Surrogate__Test_Context':               # Clear surrogate wiring
-        clear_session_factory()
+        clear_session_factory      ()
+        clear_async_session_factory()
+        github_public_key_cache.clear()
+        github_secrets_sync_fingerprints.clear()
+        service_auth_pat_cache.clear()
+        service_auth_validation_cache.clear()
+        github_rate_limit_tracker.clear()
+        github_api_response_cache.clear()
         return self
 
     def __enter__(self):                                                        # Context manager support
@@ -65,6 +97,11 @@ class GitHub__API__Surrogate__Test_Context(Type_Safe):
         self.surrogate.add_org_secret(org, name, value, visibility)
         return self
 
+    def generate(self, spec=None, **kwargs                                      # Seed bulk synthetic data (see Schema__Surrogate__Bulk__Spec)
+                 ) -> 'GitHub__API__Surrogate__Test_Context':
+        self.surrogate.generate(spec, **kwargs)
+        return self
+
     # ═══════════════════════════════════════════════════════════════════════════════
     # PAT accessors (delegates to surrogate.pats)
     # ═══════════════════════════════════════════════════════════════════════════════
@@ -0,0 +1,8 @@
+import hashlib
+
+TOKEN_FINGERPRINT__SIZE = 16                                                    # hex chars kept (64 bits, plenty to key per-token caches)
+
+
+def token_fingerprint(api_token : str                                           # Secret value (e.g. a GitHub PAT)
+                      ) -> str:                                                 # Stable, non-reversible key safe to keep in memory/logs
+    return hashlib.sha256((api_token or '').encode()).hexdigest()[:TOKEN_FINGERPRINT__SIZE]
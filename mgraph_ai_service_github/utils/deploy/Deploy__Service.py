@@ -2,9 +2,12 @@ from osbot_aws.aws.lambda_.dependencies.Lambda__Dependency
 from osbot_aws.aws.lambda_.schemas.Schema__Lambda__Dependency__Local_Install__Data  import Schema__Lambda__Dependency__Local_Install__Data
 from osbot_fast_api_serverless.deploy.Deploy__Serverless__Fast_API                  import Deploy__Serverless__Fast_API
 from osbot_utils.helpers.duration.decorators.capture_duration                       import capture_duration
-from mgraph_ai_service_github.config                                                import SERVICE_NAME, LAMBDA_DEPENDENCIES__SERVICE__GITHUB, ENV_VAR__SERVICE__AUTH__PRIVATE_KEY, ENV_VAR__SERVICE__AUTH__PUBLIC_KEY
+from nacl.secret                                                                    import SecretBox
+from nacl.utils                                                                     import random as nacl_random
+from mgraph_ai_service_github.config                                                import SERVICE_NAME, LAMBDA_DEPENDENCIES__SERVICE__GITHUB, ENV_VAR__SERVICE__AUTH__PRIVATE_KEY, ENV_VAR__SERVICE__AUTH__PUBLIC_KEY, ENV_VAR__SERVICE__AUTH__PREVIOUS_PRIVATE_KEYS, ENV_VAR__SERVICE__AUTH__SESSION_KEY
 from mgraph_ai_service_github.fast_api.lambda_handler                               import run
 from mgraph_ai_service_github.service.encryption.NaCl__Key_Management               import NaCl__Key_Management
+from mgraph_ai_service_github.service.encryption.NaCl__Keyring                      import rotated_previous_private_keys
 
 RUNTIME_TO_ABI = {
         "3.13": ("313", "cp313"),
@@ -22,11 +25,34 @@ class Deploy__Service(Deploy__Serverless__Fast_API):
             nacl_manager = NaCl__Key_Management()
             nacl_keys    = nacl_manager.generate_nacl_keys()
 
+            # Keep the live key (and the newest previous ones) so tokens encrypted before this deploy keep working
+            previous_keys = self.previous_private_keys(_)
+
+            # One session key for every instance (kept across deploys, so session tokens survive them too)
+            session_key   = self.session_key(_)
+
             # Set encryption keys as Lambda environment variables
-            _.set_env_variable(ENV_VAR__SERVICE__AUTH__PUBLIC_KEY , nacl_keys.public_key )
-            _.set_env_variable(ENV_VAR__SERVICE__AUTH__PRIVATE_KEY, nacl_keys.private_key)
+            _.set_env_variable(ENV_VAR__SERVICE__AUTH__PUBLIC_KEY           , nacl_keys.public_key )
+            _.set_env_variable(ENV_VAR__SERVICE__AUTH__PRIVATE_KEY          , nacl_keys.private_key)
+            _.set_env_variable(ENV_VAR__SERVICE__AUTH__PREVIOUS_PRIVATE_KEYS, previous_keys        )
+            _.set_env_variable(ENV_VAR__SERVICE__AUTH__SESSION_KEY          , session_key          )
             return _
 
+    def deployed_env_variables(self, deploy_lambda) -> dict:                    # Environment of the currently deployed Lambda ({} on first deploy)
+        if not deploy_lambda.exists():
+            return {}
+        configuration = deploy_lambda.lambda_function().configuration() or {}
+        return configuration.get('Environment', {}).get('Variables', {})
+
+    def previous_private_keys(self, deploy_lambda) -> str:                      # Keys the currently deployed Lambda accepts, rotated one step
+        variables = self.deployed_env_variables(deploy_lambda)
+        return rotated_previous_private_keys(variables.get(ENV_VAR__SERVICE__AUTH__PRIVATE_KEY          ),
+                                             variables.get(ENV_VAR__SERVICE__AUTH__PREVIOUS_PRIVATE_KEYS))
+
+    def session_key(self, deploy_lambda) -> str:                                # Live session key, or a new one on first deploy
+        variables = self.deployed_env_variables(deploy_lambda)
+        return variables.get(ENV_VAR__SERVICE__AUTH__SESSION_KEY) or nacl_random(SecretBox.KEY_SIZE).hex()
+
     def handler(self):
         return run
 
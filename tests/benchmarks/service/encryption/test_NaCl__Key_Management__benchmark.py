@@ -0,0 +1,55 @@
+import base64
+from unittest                                                                    import TestCase
+from nacl.public                                                                 import PrivateKey, PublicKey, SealedBox
+from osbot_utils.helpers.duration.decorators.capture_duration                    import capture_duration
+from mgraph_ai_service_github.service.encryption.NaCl__Key_Management            import NaCl__Key_Management
+from mgraph_ai_service_github.service.encryption.NaCl__Sealed_Box__Cache         import NaCl__Sealed_Box__Cache
+
+BENCHMARK__CALLS  = 2000
+BENCHMARK__SECRET = b'ghp_' + b'x' * 36                                          # PAT-sized value
+
+
+class test_NaCl__Key_Management__benchmark(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.keys      = NaCl__Key_Management().generate_nacl_keys()
+        cls.encrypted = base64.b64encode(SealedBox(PublicKey(bytes.fromhex(cls.keys.public_key))).encrypt(BENCHMARK__SECRET)).decode()
+
+    def decrypt__rebuild_every_call(self):                                      # Old behaviour: hex -> PrivateKey -> SealedBox on every call
+        private_key = PrivateKey(bytes.fromhex(self.keys.private_key))
+        return SealedBox(private_key).decrypt(base64.b64decode(self.encrypted))
+
+    def encrypt__rebuild_every_call(self):
+        public_key = PublicKey(bytes.fromhex(self.keys.public_key))
+        return SealedBox(public_key).encrypt(BENCHMARK__SECRET)
+
+    def test__per_call_savings(self):
+        nacl_manager = NaCl__Key_Management(sealed_box_cache=NaCl__Sealed_Box__Cache())
+
+        with capture_duration() as decrypt__rebuilt:
+            for _ in range(BENCHMARK__CALLS):
+                assert self.decrypt__rebuild_every_call() == BENCHMARK__SECRET
+        with capture_duration() as decrypt__cached:
+            for _ in range(BENCHMARK__CALLS):
+                assert nacl_manager.decrypt_with_private_key_base64(self.encrypted, self.keys.private_key) == BENCHMARK__SECRET
+        with capture_duration() as encrypt__rebuilt:
+            for _ in range(BENCHMARK__CALLS):
+                self.encrypt__rebuild_every_call()
+        with capture_duration() as encrypt__cached:
+            for _ in range(BENCHMARK__CALLS):
+                nacl_manager.encrypt_with_public_key(BENCHMARK__SECRET, self.keys.public_key)
+
+        def per_call(duration):
+            return duration.seconds / BENCHMARK__CALLS * 1_000_000
+
+        print(f'\n{BENCHMARK__CALLS} x {len(BENCHMARK__SECRET)} byte secret (µs per call)')
+        print(f'   decrypt  rebuilt SealedBox : {per_call(decrypt__rebuilt):8.1f}')
+        print(f'   decrypt  cached SealedBox  : {per_call(decrypt__cached ):8.1f}')
+        print(f'   encrypt  rebuilt SealedBox : {per_call(encrypt__rebuilt):8.1f}')
+        print(f'   encrypt  cached SealedBox  : {per_call(encrypt__cached ):8.1f}')
+
+        assert nacl_manager.sealed_box_cache.stats() == dict(entries   = 2                        ,
+                                                             hits      = 2 * BENCHMARK__CALLS - 2 ,
+                                                             misses    = 2                        ,
+                                                             evictions = 0                        )
@@ -0,0 +1,103 @@
+import json
+import threading
+import requests
+from http.server                                                                 import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest                                                                    import TestCase
+from osbot_utils.helpers.duration.decorators.capture_duration                    import capture_duration
+from mgraph_ai_service_github.service.github.GitHub__API                         import GitHub__API, clear_session_factory, get_session_factory, set_session_factory
+from mgraph_ai_service_github.service.github.session.Requests__Session__Pool     import Requests__Session__Pool
+from mgraph_ai_service_github.service.github.session.Requests__Session__Github   import Requests__Session__Github
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__PATs     import GitHub__API__Surrogate__PATs
+
+BENCHMARK__REQUESTS = 200
+
+
+class Local__GitHub__Handler(BaseHTTPRequestHandler):                           # Minimal keep-alive HTTP/1.1 server answering /user like the surrogate does
+    protocol_version        = 'HTTP/1.1'
+    disable_nagle_algorithm = True                                              # otherwise delayed ACKs add ~40ms per keep-alive round trip
+    pats                    = GitHub__API__Surrogate__PATs().setup()
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1                                        # one call per accepted TCP connection (i.e. per handshake)
+
+    def do_GET(self):
+        pat  = (self.headers.get('Authorization') or '').replace('token ', '')
+        user = self.pats.get_user(pat)
+        body = json.dumps(user.to_github_response() if user else {'message': 'Bad credentials'}).encode()
+        self.send_response(200 if user else 401)
+        self.send_header('Content-Type'  , 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class test_Requests__Session__Pool__benchmark(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.session_factory    = get_session_factory()                          # restored in tearDownClass (e.g. a surrogate wired by an earlier test)
+        clear_session_factory()
+        cls.server             = ThreadingHTTPServer(('127.0.0.1', 0), Local__GitHub__Handler)
+        cls.server.lock        = threading.Lock()
+        cls.server.connections = 0
+        cls.api_url            = f'http://127.0.0.1:{cls.server.server_address[1]}'
+        cls.pat                = GitHub__API__Surrogate__PATs.PAT__ADMIN
+        cls.thread             = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        set_session_factory(cls.session_factory)
+
+    def setUp(self):
+        self.server.connections = 0
+
+    def call_user__new_session_per_request(self):                               # Old behaviour: every GitHub__API instance built its own requests.Session (and socket)
+        pool = Requests__Session__Pool()
+        try:
+            return self.call_user__pooled(pool)
+        finally:
+            pool.reset()
+
+    def call_user__pooled(self, pool):                                          # New behaviour: every GitHub__API instance draws from the shared pool
+        github_api = GitHub__API(api_token=self.pat, api_url=self.api_url)
+        github_api.session().pool = pool
+        return github_api.get('/user')
+
+    def test__handshake_savings(self):
+        with capture_duration() as duration__unpooled:
+            for _ in range(BENCHMARK__REQUESTS):
+                assert self.call_user__new_session_per_request()['login'] == 'surrogate-admin'
+        connections__unpooled   = self.server.connections
+
+        self.server.connections = 0
+        pool                    = Requests__Session__Pool()
+        with capture_duration() as duration__pooled:
+            for _ in range(BENCHMARK__REQUESTS):
+                assert self.call_user__pooled(pool)['login'] == 'surrogate-admin'
+        connections__pooled     = self.server.connections
+        pool.reset()
+
+        print(f'\n{BENCHMARK__REQUESTS} x GET /user')
+        print(f'   new session per request : {duration__unpooled.seconds:.3f}s , {connections__unpooled} TCP connections')
+        print(f'   shared connection pool  : {duration__pooled  .seconds:.3f}s , {connections__pooled} TCP connections')
+
+        assert connections__unpooled == BENCHMARK__REQUESTS                     # one handshake per request
+        assert connections__pooled   == 1                                       # connection kept alive and reused
+
+    def test__pooled__concurrent_requests(self):                                # Concurrent callers never open more sockets than pool_maxsize
+        from concurrent.futures import ThreadPoolExecutor
+        pool = Requests__Session__Pool(pool_maxsize=4, pool_block=True)
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(lambda _: self.call_user__pooled(pool), range(BENCHMARK__REQUESTS)))
+        pool.reset()
+        assert len(results)           == BENCHMARK__REQUESTS
+        assert self.server.connections <= 4
+        assert type(Requests__Session__Github(api_token=self.pat).requests_session()) is requests.Session
@@ -0,0 +1,33 @@
+from unittest                                                                                       import TestCase
+from osbot_utils.helpers.duration.decorators.capture_duration                                      import capture_duration
+from mgraph_ai_service_github.service.github.GitHub__API                                            import GitHub__API
+from mgraph_ai_service_github.surrogates.github.testing.GitHub__API__Surrogate__Test_Context       import GitHub__API__Surrogate__Test_Context
+
+BENCHMARK__REQUESTS = 500
+
+
+class test_GitHub__API__Surrogate__Dispatcher__benchmark(TestCase):
+
+    def run_calls(self, direct : bool) -> float:                                # Same GET/PUT/DELETE mix through one session type, returns seconds
+        with GitHub__API__Surrogate__Test_Context(direct=direct) as context:
+            context.add_repo('bench-owner', 'bench-repo')
+            github_api = GitHub__API(api_token=context.admin_pat(), response_cache=None)
+            public_key = github_api.get('/repos/bench-owner/bench-repo/actions/secrets/public-key')
+            with capture_duration() as duration:
+                for index in range(BENCHMARK__REQUESTS):
+                    name = f'SECRET_{index % 10}'
+                    assert github_api.get('/user')['login'] == 'surrogate-admin'
+                    github_api.put(f'/repos/bench-owner/bench-repo/actions/secrets/{name}', dict(encrypted_value='abc', key_id=public_key['key_id']))
+                    assert github_api.get(f'/repos/bench-owner/bench-repo/actions/secrets/{name}')['name'] == name
+                    assert github_api.delete(f'/repos/bench-owner/bench-repo/actions/secrets/{name}') is True
+            return duration.seconds
+
+    def test__direct_dispatch_vs_test_client(self):
+        seconds__test_client = self.run_calls(direct=False)
+        seconds__direct      = self.run_calls(direct=True )
+
+        print(f'\n{BENCHMARK__REQUESTS} x (GET /user, PUT + GET + DELETE secret)')
+        print(f'   TestClient      : {seconds__test_client:.3f}s')
+        print(f'   direct dispatch : {seconds__direct     :.3f}s  ({seconds__test_client / seconds__direct:.1f}x faster)')
+
+        assert seconds__direct < seconds__test_client
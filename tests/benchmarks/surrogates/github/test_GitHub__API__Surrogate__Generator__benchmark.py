@@ -0,0 +1,36 @@
+from unittest                                                                                       import TestCase
+from osbot_utils.helpers.duration.decorators.capture_duration                                      import capture_duration
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate                             import GitHub__API__Surrogate
+from mgraph_ai_service_github.surrogates.github.schemas.Schema__Surrogate__Bulk__Spec              import Schema__Surrogate__Bulk__Spec
+
+BENCHMARK__ORGS             = 10
+BENCHMARK__REPOS_PER_ORG    = 1_000
+BENCHMARK__SECRETS_PER_REPO = 20
+BENCHMARK__SAMPLE_REPOS     = 20                                                # add_repo + add_secret is timed on a sample and extrapolated
+
+
+class test_GitHub__API__Surrogate__Generator__benchmark(TestCase):
+
+    def test__generate_vs_add_secret(self):
+        secrets = BENCHMARK__ORGS * BENCHMARK__REPOS_PER_ORG * BENCHMARK__SECRETS_PER_REPO
+        spec    = Schema__Surrogate__Bulk__Spec(orgs=BENCHMARK__ORGS, repos_per_org=BENCHMARK__REPOS_PER_ORG, secrets_per_repo=BENCHMARK__SECRETS_PER_REPO)
+
+        surrogate = GitHub__API__Surrogate().setup()
+        with capture_duration() as duration:
+            for repo_index in range(BENCHMARK__SAMPLE_REPOS):
+                surrogate.add_repo('org', f'repo-{repo_index}')
+                for secret_index in range(BENCHMARK__SECRETS_PER_REPO):
+                    surrogate.add_secret('org', f'repo-{repo_index}', f'SECRET_{secret_index}')
+        seconds__add_secret = duration.seconds * BENCHMARK__ORGS * BENCHMARK__REPOS_PER_ORG / BENCHMARK__SAMPLE_REPOS
+
+        surrogate = GitHub__API__Surrogate().setup()
+        with capture_duration() as duration:
+            surrogate.generate(spec)
+        seconds__generate = duration.seconds
+
+        print(f'\n{BENCHMARK__ORGS * BENCHMARK__REPOS_PER_ORG} repos with {secrets} secrets')
+        print(f'   add_repo + add_secret (extrapolated) : {seconds__add_secret:.1f}s')
+        print(f'   generate (placeholder ciphertext)    : {seconds__generate  :.1f}s  ({seconds__add_secret / seconds__generate:.0f}x faster)')
+
+        assert sum(len(items) for items in surrogate.state.secrets__repo.values()) == secrets
+        assert seconds__generate < seconds__add_secret
@@ -0,0 +1,29 @@
+from unittest                                                                                       import TestCase
+from osbot_utils.helpers.duration.decorators.capture_duration                                      import capture_duration
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Ordered_Index              import GitHub__API__Surrogate__Ordered_Index
+
+BENCHMARK__SECRETS  = 20_000
+BENCHMARK__PER_PAGE = 100
+
+
+class test_GitHub__API__Surrogate__Ordered_Index__benchmark(TestCase):
+
+    def walk_pages(self, page_of) -> float:                                     # Read every page once, returns seconds
+        with capture_duration() as duration:
+            for start in range(0, BENCHMARK__SECRETS, BENCHMARK__PER_PAGE):
+                assert len(page_of(start)) == BENCHMARK__PER_PAGE
+        return duration.seconds
+
+    def test__ordered_index_vs_full_list(self):
+        index = GitHub__API__Surrogate__Ordered_Index()
+        for i in range(BENCHMARK__SECRETS):
+            index[f'SECRET_{i:05}'] = i
+
+        seconds__full_list = self.walk_pages(lambda start: list(index.values())[start:start + BENCHMARK__PER_PAGE])
+        seconds__index     = self.walk_pages(lambda start: index.slice(start, BENCHMARK__PER_PAGE))
+
+        print(f'\n{BENCHMARK__SECRETS // BENCHMARK__PER_PAGE} pages of {BENCHMARK__PER_PAGE} from {BENCHMARK__SECRETS} secrets')
+        print(f'   list(values())[page] : {seconds__full_list:.3f}s')
+        print(f'   ordered index slice  : {seconds__index    :.3f}s  ({seconds__full_list / seconds__index:.1f}x faster)')
+
+        assert seconds__index < seconds__full_list
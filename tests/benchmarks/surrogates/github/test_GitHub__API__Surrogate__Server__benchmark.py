@@ -0,0 +1,52 @@
+from concurrent.futures                                                                     import ThreadPoolExecutor
+from unittest                                                                               import TestCase
+from osbot_utils.helpers.duration.decorators.capture_duration                              import capture_duration
+from mgraph_ai_service_github.service.github.GitHub__API                                    import clear_session_factory
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Server              import GitHub__API__Surrogate__Server
+from mgraph_ai_service_github.surrogates.github.schemas.Enum__Surrogate__Latency__Distribution import Enum__Surrogate__Latency__Distribution
+from mgraph_ai_service_github.surrogates.github.schemas.Schema__Surrogate__Fault__Profile  import Schema__Surrogate__Fault__Profile
+
+BENCHMARK__REQUESTS = 200
+BENCHMARK__WORKERS  = 8
+
+
+class test_GitHub__API__Surrogate__Server__benchmark(TestCase):                 # Service network stack (pooling, concurrency) against a real HTTP surrogate with GitHub-like latency
+
+    @classmethod
+    def setUpClass(cls):
+        clear_session_factory()
+        cls.server = GitHub__API__Surrogate__Server().start()
+        cls.server.faults.default = Schema__Surrogate__Fault__Profile(distribution     = Enum__Surrogate__Latency__Distribution.LONG_TAIL ,
+                                                                      latency_ms       = 20                                               ,
+                                                                      jitter_ms        = 5                                                ,
+                                                                      tail_probability = 0.02                                             ,
+                                                                      tail_ms          = 100                                              ,
+                                                                      max_ms           = 500                                              )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def get_user(self, _index = None) -> str:
+        return self.server.create_api().get('/user')['login']
+
+    def test__throughput__serial_vs_concurrent(self):
+        with capture_duration() as duration__serial:
+            logins = [self.get_user() for _ in range(BENCHMARK__REQUESTS)]
+        with capture_duration() as duration__concurrent:
+            with ThreadPoolExecutor(max_workers=BENCHMARK__WORKERS) as executor:
+                logins += list(executor.map(self.get_user, range(BENCHMARK__REQUESTS)))
+
+        print(f'\n{BENCHMARK__REQUESTS} x GET /user over HTTP (~20ms long-tail latency)')
+        print(f'   serial                  : {duration__serial    .seconds:.3f}s , {BENCHMARK__REQUESTS / duration__serial    .seconds:7.1f} req/s')
+        print(f'   {BENCHMARK__WORKERS} concurrent workers    : {duration__concurrent.seconds:.3f}s , {BENCHMARK__REQUESTS / duration__concurrent.seconds:7.1f} req/s')
+
+        assert set(logins)                  == {'surrogate-admin'}
+        assert duration__concurrent.seconds <  duration__serial.seconds          # latency overlaps across pooled connections
+
+    def test__error_rate__retries_visible(self):                                # Injected 5xx are reported to callers, not swallowed
+        self.server.faults.add_rule('/rate_limit', Schema__Surrogate__Fault__Profile(error_rate=0.25))
+        api      = self.server.create_api()
+        statuses = [api.session().get(f'{self.server.api_url()}/rate_limit').status_code for _ in range(BENCHMARK__REQUESTS)]
+        print(f'\n{BENCHMARK__REQUESTS} x GET /rate_limit with 25% injected errors: {statuses.count(503)} x 503')
+        assert 20 < statuses.count(503) < 80
@@ -10,6 +10,7 @@ from mgraph_ai_service_github.schemas.encryption.Schema__Encryption__Request
 from mgraph_ai_service_github.service.auth.Service__Auth                        import Service__Auth
 from mgraph_ai_service_github.service.encryption.Service__Encryption            import Service__Encryption
 from mgraph_ai_service_github.service.github.GitHub__API                        import GitHub__API
+from mgraph_ai_service_github.service.github.GitHub__API__Async                 import GitHub__API__Async
 from mgraph_ai_service_github.service.encryption.NaCl__Key_Management           import NaCl__Key_Management
 from mgraph_ai_service_github.surrogates.github.testing.GitHub__API__Surrogate__Test_Context import GitHub__API__Surrogate__Test_Context
 
@@ -104,10 +105,22 @@ class test_GitHub__API__From__Header(TestCase):
             with self.assertRaises(Exception):
                 _.get_api('')
 
-    def test__get_api__reusable(self):                                                          # Test that factory can create multiple instances
+    def test__get_api__reusable(self):                                                          # Test that the same encrypted PAT reuses the cached instance
         with self.api_factory as _:
             api1 = _.get_api(self.encrypted_pat)
             api2 = _.get_api(self.encrypted_pat)
 
             assert api1.api_token == api2.api_token
-            assert api1 is not api2                                                             # Different instances
\ No newline at end of file
+            assert api1 is api2                                                                 # Same instance (decrypted once, cached by ciphertext digest)
+
+    def test__get_async_api__can_make_api_calls(self):                                          # Test returned GitHub__API__Async can make calls via the async surrogate
+        import asyncio
+        api = self.api_factory.get_async_api(self.encrypted_pat)
+        assert type(api)      is GitHub__API__Async
+        assert api.api_token  == self.github_pat
+        loop = asyncio.new_event_loop()                                                         # private loop: asyncio.run would leave MainThread without one (breaks Mangum in test_lambda_handler)
+        try:
+            user = loop.run_until_complete(api.get('/user'))
+        finally:
+            loop.close()
+        assert user['login']  == 'surrogate-admin'
@@ -6,6 +6,7 @@ from osbot_utils.utils.Objects
 from mgraph_ai_service_github.fast_api.routes.Routes__Auth                          import Routes__Auth, TAG__ROUTES_AUTH, ROUTES_PATHS__AUTH
 from mgraph_ai_service_github.schemas.encryption.Schema__Public_Key__Response       import Schema__Public_Key__Response
 from mgraph_ai_service_github.service.auth.Service__Auth                            import Service__Auth
+from mgraph_ai_service_github.service.auth.Service__Auth__PAT__Cache                import Service__Auth__PAT__Cache
 from mgraph_ai_service_github.service.encryption.NaCl__Key_Management               import NaCl__Key_Management
 
 
@@ -35,8 +36,10 @@ class test_Routes__Auth(TestCase):
                                        '/auth/token-create'   ,
                                        '/auth/token-validate' ,
                                        '/auth/test'           ,
-                                       '/auth/test-api-key'   ]
-        assert len(ROUTES_PATHS__AUTH) == 5
+                                       '/auth/test-api-key'   ,
+                                       '/auth/pat-cache-stats',
+                                       '/auth/session-create' ]
+        assert len(ROUTES_PATHS__AUTH) == 7
 
     # ═══════════════════════════════════════════════════════════════════════════════
     # public_key Tests
@@ -213,6 +216,46 @@ class test_Routes__Auth(TestCase):
     #         assert result['success']         is True
     #         assert result['auth_configured'] is False
 
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # pat_cache Tests
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test__pat_cache_stats(self):                                                            # Test cached PATs are counted (there is no purge route)
+        service_auth  = Service__Auth(private_key_hex = self.test_keys.private_key ,
+                                      public_key_hex  = self.test_keys.public_key  ,
+                                      pat_cache       = Service__Auth__PAT__Cache())
+        routes_auth   = Routes__Auth(service_auth = service_auth)
+        encrypted_pat = service_auth.encrypt_pat('ghp_cached_token')
+        for _ in range(3):
+            assert service_auth.decrypt_pat(encrypted_pat) == 'ghp_cached_token'
+
+        assert routes_auth.pat_cache_stats()        == dict(entries=1, hits=2, misses=1, evictions=0)
+        assert hasattr(routes_auth, 'pat_cache_purge') is False
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # session_create Tests
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test__session_create(self):                                                             # Test session token works in place of the encrypted PAT
+        encrypted_pat = self.service_auth.encrypt_pat('ghp_session_token')
+        result        = self.routes_auth.session_create(x_osbot_github_pat=encrypted_pat)
+        assert result['success']                                          is True
+        assert result['expires_in']                                       == self.service_auth.session.ttl
+        assert self.service_auth.decrypt_pat(result['session_token'])     == 'ghp_session_token'
+
+    def test__session_create__missing_header(self):                                             # Test session_create without encrypted PAT
+        result = self.routes_auth.session_create(x_osbot_github_pat=None)
+        assert result == { "success"    : False                              ,
+                           "error"      : "Missing X-OSBot-GitHub-PAT header" ,
+                           "error_type" : "MISSING_HEADER"                   }
+
+    def test__session_create__from_session_token(self):                                         # Test session tokens can't be renewed into new ones
+        encrypted_pat = self.service_auth.encrypt_pat('ghp_session_token')
+        session_token = self.routes_auth.session_create(x_osbot_github_pat=encrypted_pat)['session_token']
+        result        = self.routes_auth.session_create(x_osbot_github_pat=session_token)
+        assert result['success']    is False
+        assert result['error_type'] == 'DECRYPTION_FAILED'
+
     # ═══════════════════════════════════════════════════════════════════════════════
     # setup_routes Tests
     # ═══════════════════════════════════════════════════════════════════════════════
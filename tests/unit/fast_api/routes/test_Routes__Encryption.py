@@ -1,9 +1,11 @@
 import json
 import base64
 from unittest                                                                                   import TestCase
+from fastapi                                                                                    import Response
 from osbot_fast_api.api.routes.Fast_API__Routes                                                 import Fast_API__Routes
 from osbot_utils.type_safe.Type_Safe                                                            import Type_Safe
 from osbot_utils.utils.Objects                                                                  import base_classes
+from mgraph_ai_service_github.fast_api.dependencies.GitHub__API__From__Header                    import GitHub__API__From__Header
 from mgraph_ai_service_github.fast_api.routes.Routes__Encryption                                import Routes__Encryption, TAG__ROUTES_ENCRYPTION, ROUTES_PATHS__ENCRYPTION
 from mgraph_ai_service_github.schemas.encryption.Const__Encryption                              import NCCL__ALGORITHM
 from mgraph_ai_service_github.schemas.encryption.Enum__Encryption_Type                          import Enum__Encryption_Type
@@ -17,6 +19,10 @@ from mgraph_ai_service_github.schemas.encryption.Schema__Encryption__Request
 from mgraph_ai_service_github.schemas.encryption.Schema__Encryption__Response                   import Schema__Encryption__Response
 from mgraph_ai_service_github.schemas.encryption.Schema__Key_Generation__Response               import Schema__Key_Generation__Response
 from mgraph_ai_service_github.schemas.encryption.Schema__Public_Key__Response                   import Schema__Public_Key__Response
+from mgraph_ai_service_github.schemas.encryption.Schema__Encryption__Batch__Request             import Schema__Encryption__Batch__Request
+from mgraph_ai_service_github.schemas.encryption.Schema__Encryption__Batch__Response            import Schema__Encryption__Batch__Response
+from mgraph_ai_service_github.schemas.encryption.Schema__Decryption__Batch__Request             import Schema__Decryption__Batch__Request
+from mgraph_ai_service_github.schemas.encryption.Schema__Decryption__Batch__Response            import Schema__Decryption__Batch__Response
 from mgraph_ai_service_github.service.encryption.NaCl__Key_Management                           import NaCl__Key_Management
 from mgraph_ai_service_github.service.encryption.Service__Encryption                            import Service__Encryption
 
@@ -46,14 +52,22 @@ class test_Routes__Encryption(TestCase):
             assert base_classes(_)           == [Fast_API__Routes, Type_Safe, object]
             assert _.tag                     == TAG__ROUTES_ENCRYPTION
             assert type(_.service_encryption) is Service__Encryption
+            assert type(_.github_api_factory) is GitHub__API__From__Header
 
     def test__routes_paths(self):                                                               # Test route paths constant
         assert ROUTES_PATHS__ENCRYPTION == [ '/encryption/public-key'    ,
                                              '/encryption/generate-keys' ,
                                              '/encryption/encrypt'       ,
                                              '/encryption/decrypt'       ,
-                                             '/encryption/validate'      ]
-        assert len(ROUTES_PATHS__ENCRYPTION) == 5
+                                             '/encryption/validate'      ,
+                                             '/encryption/encrypt-batch' ,
+                                             '/encryption/decrypt-batch' ,
+                                             '/encryption/encrypt-raw'   ,
+                                             '/encryption/decrypt-raw'   ,
+                                             '/encryption/encrypt-stream',
+                                             '/encryption/decrypt-stream',
+                                             '/encryption/transcrypt'    ]
+        assert len(ROUTES_PATHS__ENCRYPTION) == 12
 
     # ═══════════════════════════════════════════════════════════════════════════════
     # public_key Tests
@@ -320,6 +334,39 @@ class test_Routes__Encryption(TestCase):
             assert decrypt_result.success   is True
             assert decrypt_result.decrypted == special_text
 
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # encrypt_batch / decrypt_batch Tests
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test__encrypt_batch__decrypt_batch__round_trip(self):                                   # Test batch results come back in request order
+        items          = [Schema__Encryption__Request(value=Safe_Str__Decrypted_Value(f'value-{index}'), encryption_type=Enum__Encryption_Type.TEXT) for index in range(5)]
+        encrypt_result = self.routes_encryption.encrypt_batch(Schema__Encryption__Batch__Request(items=items), Response())
+
+        assert type(encrypt_result)     is Schema__Encryption__Batch__Response
+        assert encrypt_result.success   is True
+        assert encrypt_result.succeeded == 5
+        assert [result.index for result in encrypt_result.results] == [0, 1, 2, 3, 4]
+
+        decrypt_items  = [Schema__Decryption__Request(encrypted=result.encrypted, encryption_type=Enum__Encryption_Type.TEXT) for result in encrypt_result.results]
+        decrypt_result = self.routes_encryption.decrypt_batch(Schema__Decryption__Batch__Request(items=decrypt_items), Response())
+
+        assert type(decrypt_result)     is Schema__Decryption__Batch__Response
+        assert decrypt_result.success   is True
+        assert [result.decrypted for result in decrypt_result.results] == [f'value-{index}' for index in range(5)]
+
+    def test__encrypt_batch__per_item_errors(self):                                             # Test one bad item does not fail the batch
+        items  = [Schema__Encryption__Request(value=Safe_Str__Decrypted_Value('ok'          ), encryption_type=Enum__Encryption_Type.TEXT),
+                  Schema__Encryption__Request(value=Safe_Str__Decrypted_Value('{not json'   ), encryption_type=Enum__Encryption_Type.JSON),
+                  Schema__Encryption__Request(value=Safe_Str__Decrypted_Value('{"a":1}'     ), encryption_type=Enum__Encryption_Type.JSON)]
+        result = self.routes_encryption.encrypt_batch(Schema__Encryption__Batch__Request(items=items), Response())
+
+        assert result.success                        is False
+        assert result.error                          is None
+        assert (result.succeeded, result.failed)     == (2, 1)
+        assert [item.success for item in result.results] == [True, False, True]
+        assert result.results[1].encrypted           is None
+        assert result.results[1].error               is not None
+
     # ═══════════════════════════════════════════════════════════════════════════════
     # setup_routes Tests
     # ═══════════════════════════════════════════════════════════════════════════════
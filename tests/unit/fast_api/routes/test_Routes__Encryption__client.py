@@ -3,9 +3,11 @@ import base64
 from unittest                                                               import TestCase
 from osbot_utils.utils.Env                                                  import env_var_set
 from starlette.testclient                                                   import TestClient
-from mgraph_ai_service_github.config                                        import ENV_VAR__SERVICE__AUTH__PUBLIC_KEY, ENV_VAR__SERVICE__AUTH__PRIVATE_KEY
+from mgraph_ai_service_github.config                                        import ENV_VAR__SERVICE__AUTH__PUBLIC_KEY, ENV_VAR__SERVICE__AUTH__PRIVATE_KEY, ENCRYPTION__RAW__MAX_BYTES, ENCRYPTION__BATCH__MAX_ITEMS, ENCRYPTION__BATCH__MAX_BYTES
 from mgraph_ai_service_github.fast_api.GitHub__Service__Fast_API            import GitHub__Service__Fast_API
 from mgraph_ai_service_github.schemas.encryption.Const__Encryption          import NCCL__ALGORITHM
+from mgraph_ai_service_github.service.encryption.NaCl__Keyring              import ENCRYPTION_ENVELOPE__HEADER_SIZE
+from mgraph_ai_service_github.surrogates.github.testing.GitHub__API__Surrogate__Test_Context import GitHub__API__Surrogate__Test_Context
 from tests.unit.GitHub__Service__Fast_API__Test_Objs                        import setup__github_service_fast_api_test_objs, TEST_API_KEY__NAME, TEST_API_KEY__VALUE, GitHub__Service__Fast_API__Test_Objs
 
 
@@ -53,6 +55,7 @@ class test_Routes__Encryption__client(TestCase):
         assert response.status_code     == 200
         assert result.get('algorithm')  == NCCL__ALGORITHM
         assert result.get('timestamp')  is not None
+        assert len(result.get('key_id')) == 8                                                   # fingerprint that prefixes envelopes sealed to this key
 
         public_key = result.get('public_key')
         assert public_key                                       is not None                     # Key must be configured
@@ -374,6 +377,143 @@ class test_Routes__Encryption__client(TestCase):
         assert decrypt_result.get('success')   is True
         assert decrypt_result.get('decrypted') == large_text
 
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # POST /encryption/encrypt-batch and /encryption/decrypt-batch Tests
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test__encryption_batch__round_trip(self):                                               # Test encrypt-batch -> decrypt-batch keeps order and reports per-item errors
+        items    = [{'value': self.test_text         , 'encryption_type': 'text'},
+                    {'value': '{not json'            , 'encryption_type': 'json'},
+                    {'value': self.test_json_str     , 'encryption_type': 'json'}]
+        response = self.client.post('/encryption/encrypt-batch', json={'items': items})
+        result   = response.json()
+
+        assert response.status_code == 200
+        assert result['algorithm']  == NCCL__ALGORITHM
+        assert result['success']    is False
+        assert result['succeeded']  == 2
+        assert result['failed']     == 1
+        assert [item['index'  ] for item in result['results']] == [0, 1, 2]
+        assert [item['success'] for item in result['results']] == [True, False, True]
+
+        decrypt_items = [{'encrypted': result['results'][0]['encrypted'], 'encryption_type': 'text'},
+                         {'encrypted': result['results'][2]['encrypted'], 'encryption_type': 'json'}]
+        response      = self.client.post('/encryption/decrypt-batch', json={'items': decrypt_items})
+        result        = response.json()
+
+        assert response.status_code == 200
+        assert result['success']    is True
+        assert [item['decrypted'] for item in result['results']] == [self.test_text, self.test_json_str]
+
+    def test__encryption_batch__rejected(self):                                                 # Test a batch rejected whole is not a 200
+        items    = [{'value': 'x', 'encryption_type': 'text'}] * (ENCRYPTION__BATCH__MAX_ITEMS + 1)
+        response = self.client.post('/encryption/encrypt-batch', json={'items': items})
+        assert response.status_code        == 400
+        assert 'Too many items'            in response.json()['error']
+
+        items    = [{'value': 'x' * (ENCRYPTION__BATCH__MAX_BYTES // 2 + 1), 'encryption_type': 'text'}] * 2
+        response = self.client.post('/encryption/encrypt-batch', json={'items': items})
+        assert response.status_code        == 413
+        assert response.json()['results']  == []
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # POST /encryption/encrypt-raw and /encryption/decrypt-raw Tests
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test__encryption_raw__round_trip(self):                                                 # Test octet-stream in, octet-stream out (no base64 / JSON)
+        headers  = {'content-type': 'application/octet-stream'}
+        response = self.client.post('/encryption/encrypt-raw', content=self.test_binary, headers=headers)
+
+        assert response.status_code             == 200
+        assert response.headers['content-type'] == 'application/octet-stream'
+        assert len(response.content)            == ENCRYPTION_ENVELOPE__HEADER_SIZE + len(self.test_binary) + 48     # key fingerprint envelope + SealedBox
+
+        response = self.client.post('/encryption/decrypt-raw', content=response.content, headers=headers)
+        assert response.status_code             == 200
+        assert response.content                 == self.test_binary
+
+    def test__encryption_raw__interop_with_base64_routes(self):                                 # Test raw ciphertext opens via /encryption/decrypt (DATA)
+        encrypted = self.client.post('/encryption/encrypt-raw', content=self.test_binary).content
+        response  = self.client.post('/encryption/decrypt', json={'encrypted'      : base64.b64encode(encrypted).decode(),
+                                                                  'encryption_type': 'data'                            })
+        assert response.json().get('decrypted') == base64.b64encode(self.test_binary).decode()
+
+    def test__encryption_raw__errors(self):                                                     # Test empty, undecryptable and oversized bodies
+        response = self.client.post('/encryption/encrypt-raw', content=b'')
+        assert response.status_code == 400
+        assert response.json()      == {'success': False, 'error': 'Empty request body'}
+
+        response = self.client.post('/encryption/decrypt-raw', content=b'x' * 64)
+        assert response.status_code == 400
+        assert response.json()['success'] is False
+
+        response = self.client.post('/encryption/encrypt-raw', content=b'x' * (ENCRYPTION__RAW__MAX_BYTES + 1))
+        assert response.status_code == 413
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # POST /encryption/encrypt-stream and /encryption/decrypt-stream Tests
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test__encryption_stream__round_trip(self):                                              # Test multi-MB body (well past the 64KB JSON limit) streamed both ways
+        payload  = bytes(range(256)) * 8192                                                     # 2MB
+        response = self.client.post('/encryption/encrypt-stream', content=(payload[index:index + 100_000] for index in range(0, len(payload), 100_000)))
+
+        assert response.status_code             == 200
+        assert response.headers['content-type'] == 'application/octet-stream'
+        assert len(response.content)            >  len(payload)
+
+        response = self.client.post('/encryption/decrypt-stream', content=response.content)
+        assert response.status_code             == 200
+        assert response.content                 == payload
+
+    def test__encryption_stream__errors(self):                                                  # Test header problems are reported before streaming starts
+        response = self.client.post('/encryption/decrypt-stream', content=b'x' * 200)
+        assert response.status_code == 400
+        assert response.json()      == {'success': False, 'error': 'Not an encrypted stream'}
+
+        response = self.client.post('/encryption/decrypt-stream', content=b'')
+        assert response.status_code == 400
+        assert response.json()      == {'success': False, 'error': 'Encrypted stream too short'}
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # POST /encryption/transcrypt Tests
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def encrypt_text(self, value : str) -> str:
+        return self.client.post('/encryption/encrypt', json={'value': value, 'encryption_type': 'text'}).json()['encrypted']
+
+    def test__encryption_transcrypt(self):                                                      # Test service-encrypted values come back sealed to the repo's GitHub key
+        with GitHub__API__Surrogate__Test_Context() as context:
+            context.add_repo('test-owner', 'test-repo')
+            response = self.client.post('/encryption/transcrypt', json={'encrypted_pat'   : self.encrypt_text(context.admin_pat()),
+                                                                         'owner'           : 'test-owner'                          ,
+                                                                         'repo'            : 'test-repo'                           ,
+                                                                         'encrypted_values': [self.encrypt_text('value-1'),
+                                                                                              self.encrypt_text('value-2')]       })
+            result   = response.json()
+            scope    = 'repo:test-owner/test-repo'
+
+            assert response.status_code == 200
+            assert result['success']    is True
+            assert result['scope']      == scope
+            assert result['key_id']     == context.surrogate.keys.get_key_id(scope)
+            assert [context.surrogate.keys.decrypt_secret(scope, item['encrypted_value']) for item in result['results']] == ['value-1', 'value-2']
+            assert [item['key_id'] for item in result['results']]                                                       == [result['key_id']] * 2
+
+    def test__encryption_transcrypt__errors(self):                                              # Test bad PAT, bad scope and unknown repo get matching status codes
+        with GitHub__API__Surrogate__Test_Context() as context:
+            request  = {'encrypted_pat': self.encrypt_text(context.admin_pat()), 'owner': 'test-owner', 'repo': 'missing', 'encrypted_values': []}
+            response = self.client.post('/encryption/transcrypt', json=request)
+            assert response.status_code      == 404
+            assert response.json()['success'] is False
+
+            response = self.client.post('/encryption/transcrypt', json={**request, 'repo': None})
+            assert response.status_code      == 400
+            assert 'Transcrypt needs'        in response.json()['error']
+
+            response = self.client.post('/encryption/transcrypt', json={**request, 'encrypted_pat': base64.b64encode(b'x' * 64).decode()})
+            assert response.status_code      == 401
+
     # ═══════════════════════════════════════════════════════════════════════════════
     # Authentication Tests
     # ═══════════════════════════════════════════════════════════════════════════════
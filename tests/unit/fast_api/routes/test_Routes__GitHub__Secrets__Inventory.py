@@ -0,0 +1,125 @@
+import base64
+import asyncio
+import json
+from unittest                                                                                           import TestCase
+from fastapi.responses                                                                                  import JSONResponse, StreamingResponse
+from osbot_fast_api.api.routes.Fast_API__Routes                                                         import Fast_API__Routes
+from osbot_utils.type_safe.Type_Safe                                                                    import Type_Safe
+from osbot_utils.utils.Objects                                                                          import base_classes
+from mgraph_ai_service_github.fast_api.dependencies.GitHub__API__From__Header                           import GitHub__API__From__Header
+from mgraph_ai_service_github.fast_api.routes.Routes__GitHub__Secrets__Inventory                        import Routes__GitHub__Secrets__Inventory, TAG__ROUTES_GITHUB_SECRETS_INVENTORY, ROUTES_PATHS__GITHUB_SECRETS_INVENTORY, INVENTORY__MEDIA_TYPE
+from mgraph_ai_service_github.schemas.encryption.Enum__Encryption_Type                                  import Enum__Encryption_Type
+from mgraph_ai_service_github.schemas.encryption.Schema__Encryption__Request                            import Schema__Encryption__Request
+from mgraph_ai_service_github.schemas.github.inventory.Schema__GitHub__Data__Request__Secrets__Inventory import Schema__GitHub__Data__Request__Secrets__Inventory
+from mgraph_ai_service_github.schemas.github.inventory.Schema__GitHub__Request__Secrets__Inventory      import Schema__GitHub__Request__Secrets__Inventory
+from mgraph_ai_service_github.service.auth.Service__Auth                                                import Service__Auth
+from mgraph_ai_service_github.service.encryption.NaCl__Key_Management                                   import NaCl__Key_Management
+from mgraph_ai_service_github.service.encryption.Service__Encryption                                    import Service__Encryption
+from mgraph_ai_service_github.service.github.inventory.GitHub__Secrets__Inventory                       import encode_inventory_checkpoint
+from mgraph_ai_service_github.service.github.rate_limit.GitHub__Rate_Limit__Tracker                     import github_rate_limit_tracker
+from mgraph_ai_service_github.surrogates.github.testing.GitHub__API__Surrogate__Test_Context            import GitHub__API__Surrogate__Test_Context
+
+
+class test_Routes__GitHub__Secrets__Inventory(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.test_keys          = NaCl__Key_Management().generate_nacl_keys()
+        cls.service_auth       = Service__Auth              (private_key_hex = cls.test_keys.private_key ,
+                                                             public_key_hex  = cls.test_keys.public_key  )
+        cls.service_encryption = Service__Encryption        (private_key_hex = cls.test_keys.private_key ,
+                                                             public_key_hex  = cls.test_keys.public_key  )
+        cls.github_api_factory = GitHub__API__From__Header  (service_auth = cls.service_auth)
+        cls.routes             = Routes__GitHub__Secrets__Inventory(github_api_factory = cls.github_api_factory)
+        cls.surrogate_context  = GitHub__API__Surrogate__Test_Context().setup()
+        cls.surrogate_context.add_org         ('inv-route-org')
+        cls.surrogate_context.add_org_secret  ('inv-route-org', 'ORG_SECRET')
+        for repo in ('repo-a', 'repo-b', 'repo-c'):
+            cls.surrogate_context.add_repo    ('inv-route-org', repo)
+            cls.surrogate_context.add_secret  ('inv-route-org', repo, 'REPO_SECRET')
+        cls.surrogate_context.add_environment ('inv-route-org', 'repo-a', 'production')
+        cls.surrogate_context.add_env_secret  ('inv-route-org', 'repo-a', 'production', 'ENV_SECRET')
+        cls.encrypted_pat      = cls.encrypt(cls.surrogate_context.admin_pat())
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.surrogate_context.teardown()
+
+    def setUp(self):
+        github_rate_limit_tracker.clear()
+
+    @classmethod
+    def encrypt(cls, value):
+        return cls.service_encryption.encrypt(Schema__Encryption__Request(value=value, encryption_type=Enum__Encryption_Type.TEXT)).encrypted
+
+    def inventory_request(self, org='inv-route-org', checkpoint=None, encrypted_pat=None):
+        request_data = Schema__GitHub__Data__Request__Secrets__Inventory(org=org, checkpoint=checkpoint, rate_limit_reserve=0)
+        return Schema__GitHub__Request__Secrets__Inventory(encrypted_pat = encrypted_pat or self.encrypted_pat ,
+                                                           request_data  = request_data                        )
+
+    def read_lines(self, streaming_response):                                   # Drain a StreamingResponse (private loop, leaves the main thread's loop alone)
+        async def read():
+            return [chunk async for chunk in streaming_response.body_iterator]
+        loop = asyncio.new_event_loop()
+        try:
+            chunks = loop.run_until_complete(read())
+        finally:
+            loop.close()
+        return [json.loads(line) for line in ''.join(chunks).splitlines()]
+
+    def test__init__(self):
+        with self.routes as _:
+            assert type(_)         is Routes__GitHub__Secrets__Inventory
+            assert base_classes(_) == [Fast_API__Routes, Type_Safe, object]
+            assert _.tag           == TAG__ROUTES_GITHUB_SECRETS_INVENTORY
+
+    def test__routes_paths(self):
+        assert ROUTES_PATHS__GITHUB_SECRETS_INVENTORY == ['/github-secrets-inventory/crawl']
+
+    def test_crawl(self):
+        response = self.routes.crawl(self.inventory_request())
+        assert type(response)      is StreamingResponse
+        assert response.media_type == INVENTORY__MEDIA_TYPE
+        lines   = self.read_lines(response)
+        summary = lines[-1]['summary']
+        assert [line['type'] for line in lines[:-1]] == ['org_secret',
+                                                         'repo', 'repo_secret', 'environment_secret',
+                                                         'repo', 'repo_secret',
+                                                         'repo', 'repo_secret']
+        assert summary['org']                                  == 'inv-route-org'
+        assert (summary['repos'], summary['org_secrets'])      == (3, 1)
+        assert (summary['repo_secrets'], summary['environment_secrets'], summary['errors']) == (3, 1, 0)
+        assert summary['complete']                             is True
+        assert summary['checkpoint']                           is None
+
+    def test_crawl__resume_from_checkpoint(self):
+        checkpoint = encode_inventory_checkpoint('inv-route-org', 'repo-a', True)
+        lines      = self.read_lines(self.routes.crawl(self.inventory_request(checkpoint=checkpoint)))
+        assert [line['repo'] for line in lines if line.get('type') == 'repo'] == ['repo-b', 'repo-c']
+        assert lines[-1]['summary']['org_secrets']                            == 0
+
+    def test_crawl__rate_limited(self):                                         # stream ends with a checkpoint the caller can resume from
+        encrypted_pat = self.encrypt(self.surrogate_context.rate_limited_pat())
+        lines         = self.read_lines(self.routes.crawl(self.inventory_request(encrypted_pat=encrypted_pat)))
+        summary       = lines[-1]['summary']
+        assert lines[0]['type']       == 'checkpoint'
+        assert summary['complete']    is False
+        assert summary['checkpoint']  == lines[0]['checkpoint']
+
+    def test_crawl__unknown_org(self):                                          # errors after the stream started are reported in-band
+        lines = self.read_lines(self.routes.crawl(self.inventory_request(org='no-such-org')))
+        assert lines[-2]['type']               == 'error'
+        assert '404'                           in lines[-2]['error']
+        assert lines[-1]['summary']['complete'] is False
+
+    def test_crawl__checkpoint_for_other_org(self):
+        checkpoint = encode_inventory_checkpoint('other-org', None, False)
+        response   = self.routes.crawl(self.inventory_request(checkpoint=checkpoint))
+        assert type(response)        is JSONResponse
+        assert response.status_code  == 400
+
+    def test_crawl__undecryptable_pat(self):
+        encrypted_pat = base64.b64encode(b'\0' * 64).decode()                   # valid base64, not a NaCl box for our key
+        response      = self.routes.crawl(self.inventory_request(encrypted_pat=encrypted_pat))
+        assert type(response)       is JSONResponse
+        assert response.status_code == 401
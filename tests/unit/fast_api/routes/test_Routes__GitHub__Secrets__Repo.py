@@ -1,11 +1,15 @@
+import asyncio
+import json
 import pytest
 from unittest                                                                                       import TestCase
+from unittest.mock                                                                                  import patch
 from fastapi                                                                                        import Response
 from osbot_fast_api.api.routes.Fast_API__Routes                                                     import Fast_API__Routes
 from osbot_utils.helpers.duration.decorators.print_duration                                         import print_duration
 from osbot_utils.testing.__                                                                         import __, __SKIP__
 from osbot_utils.type_safe.Type_Safe                                                                import Type_Safe
 from osbot_utils.utils.Objects                                                                      import base_classes
+from osbot_utils.utils.Threads                                                                      import invoke_in_new_event_loop
 from mgraph_ai_service_github.fast_api.dependencies.GitHub__API__From__Header                       import GitHub__API__From__Header
 from mgraph_ai_service_github.fast_api.routes.Routes__GitHub__Secrets__Repo                         import Routes__GitHub__Secrets__Repo, TAG__ROUTES_GITHUB_SECRETS_REPO, ROUTES_PATHS__GITHUB_SECRETS_REPO
 from mgraph_ai_service_github.schemas.base.Enum__HTTP__Status                                       import Enum__HTTP__Status
@@ -27,12 +31,23 @@ from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Response__S
 from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Response__Secret__Create       import Schema__GitHub__Response__Secret__Create
 from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Response__Secret__Update       import Schema__GitHub__Response__Secret__Update
 from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Response__Secret__Delete       import Schema__GitHub__Response__Secret__Delete
+from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Secret__Bulk_Item              import Schema__GitHub__Secret__Bulk_Item
+from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Request__Secrets__Bulk_Set     import Schema__GitHub__Request__Secrets__Bulk_Set
+from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Response__Secrets__Bulk_Set    import Schema__GitHub__Response__Secrets__Bulk_Set
+from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Data__Request__Secrets__Bulk_Set import Schema__GitHub__Data__Request__Secrets__Bulk_Set
+from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Secret__Fan_Out__Target        import Schema__GitHub__Secret__Fan_Out__Target
+from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Request__Secret__Fan_Out       import Schema__GitHub__Request__Secret__Fan_Out
+from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Data__Request__Secret__Fan_Out import Schema__GitHub__Data__Request__Secret__Fan_Out
+from mgraph_ai_service_github.config                                                                import GITHUB_API__BULK_WRITE__MAX_SECRETS, GITHUB_API__FAN_OUT__MAX_TARGETS
+from mgraph_ai_service_github.service.github.GitHub__API                                            import GitHub__API
 from mgraph_ai_service_github.service.auth.Service__Auth                                            import Service__Auth
 from mgraph_ai_service_github.service.encryption.Service__Encryption                                import Service__Encryption
 from mgraph_ai_service_github.service.encryption.NaCl__Key_Management                               import NaCl__Key_Management
 from mgraph_ai_service_github.surrogates.github.testing.GitHub__API__Surrogate__Test_Context import GitHub__API__Surrogate__Test_Context
 from mgraph_ai_service_github.utils.testing.Create_GitHub_Test_Data                                 import TESTING__REPO__SECRETS__NAMES, Create_GitHub_Test_Data
 
+INVALID__ENCRYPTED_VALUE = 'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA=='       # well-formed base64 that the server key cannot decrypt
+
 
 class test_Routes__GitHub__Secrets__Repo(TestCase):
 
@@ -89,8 +104,10 @@ class test_Routes__GitHub__Secrets__Repo(TestCase):
                                                       '/github-secrets-repo/get'    ,
                                                       '/github-secrets-repo/create' ,
                                                       '/github-secrets-repo/update' ,
-                                                      '/github-secrets-repo/delete' ]
-        assert len(ROUTES_PATHS__GITHUB_SECRETS_REPO) == 5
+                                                      '/github-secrets-repo/delete' ,
+                                                      '/github-secrets-repo/bulk-set',
+                                                      '/github-secrets-repo/fan-out' ]
+        assert len(ROUTES_PATHS__GITHUB_SECRETS_REPO) == 7
 
     # ═══════════════════════════════════════════════════════════════════════════════
     # list Tests
@@ -105,7 +122,7 @@ class test_Routes__GitHub__Secrets__Repo(TestCase):
 
         with self.routes as _:
             with print_duration():
-                result = _.list(request, response)
+                result = invoke_in_new_event_loop(_.list_secrets(request, response))
 
             assert type(result)                        is Schema__GitHub__Response__Secrets__List
             assert result.response_context.success     is True
@@ -129,6 +146,30 @@ class test_Routes__GitHub__Secrets__Repo(TestCase):
                                                        duration    = __SKIP__ ,
                                                        error_type  = 'none'   )
 
+    def test__list__pages(self):                                                                # One page per call, next_page points at the rest
+        def list_page(page, per_page):
+            request_data = Schema__GitHub__Data__Request__Secrets__List(owner    = self.repo_owner ,
+                                                                        repo     = self.repo_name  ,
+                                                                        page     = page            ,
+                                                                        per_page = per_page        )
+            request      = Schema__GitHub__Request__Secrets__List(encrypted_pat = self.encrypted_pat ,
+                                                                  request_data  = request_data       )
+            return invoke_in_new_event_loop(self.routes.list_secrets(request, Response())).response_data
+
+        all_secrets = list_page(1, 100)
+        assert all_secrets.next_page is None                                                    # everything fits in GitHub's largest page
+
+        names, page = [], 1
+        while page:
+            response_data = list_page(page, 1)
+            assert response_data.page         == page
+            assert len(response_data.secrets) == 1
+            names.append(response_data.secrets[0].name)
+            page = response_data.next_page
+        assert names == [secret.name for secret in all_secrets.secrets]
+
+        assert list_page(0, 1000).page == 1                                                     # page and per_page are clamped
+
     def test__list__invalid_repo(self):                                                         # Test list with nonexistent repo
         request_data = Schema__GitHub__Data__Request__Secrets__List(owner = self.repo_owner       ,
                                                                     repo  = 'nonexistent-repo-xyz')
@@ -137,7 +178,7 @@ class test_Routes__GitHub__Secrets__Repo(TestCase):
         response = Response()
 
         with self.routes as _:
-            result = _.list(request, response)
+            result = invoke_in_new_event_loop(_.list_secrets(request, response))
 
             assert result.response_context.success     is False
             assert result.response_context.status_code == Enum__HTTP__Status.NOT_FOUND_404
@@ -167,6 +208,22 @@ class test_Routes__GitHub__Secrets__Repo(TestCase):
                                                                          created_at = __SKIP__    ,
                                                                          updated_at = __SKIP__    ))
 
+    def test__get__reuses_cached_github_api(self):                                             # The PAT cache's GitHub__API is handed to GitHub__Secrets, no new instance per call
+        request_data = Schema__GitHub__Data__Request__Secret__Get(owner       = self.repo_owner                 ,
+                                                                  repo        = self.repo_name                  ,
+                                                                  secret_name = TESTING__REPO__SECRETS__NAMES[0])
+        request      = Schema__GitHub__Request__Secret__Get(encrypted_pat = self.encrypted_pat ,
+                                                            request_data  = request_data       )
+        self.github_api_factory.get_api(self.encrypted_pat)                                     # warm the PAT cache
+        created      = []
+        init         = GitHub__API.__init__
+        def tracked_init(api, **kwargs):
+            created.append(api)
+            init(api, **kwargs)
+        with patch.object(GitHub__API, '__init__', tracked_init):
+            assert self.routes.get(request, Response()).response_context.success is True
+        assert created == []
+
     def test__get__not_found(self):                                                             # Test get with nonexistent secret
         request_data = Schema__GitHub__Data__Request__Secret__Get(owner       = self.repo_owner          ,
                                                                   repo        = self.repo_name           ,
@@ -201,7 +258,7 @@ class test_Routes__GitHub__Secrets__Repo(TestCase):
         response = Response()
 
         with self.routes as _:
-            result = _.create(request, response)
+            result = invoke_in_new_event_loop(_.create_secret(request, response))
 
             assert type(result)                        is Schema__GitHub__Response__Secret__Create
             assert result.response_context.success     is True
@@ -255,7 +312,7 @@ class test_Routes__GitHub__Secrets__Repo(TestCase):
                                                                             encrypted_value = encrypted_value  )
         create_request  = Schema__GitHub__Request__Secret__Create(encrypted_pat = self.encrypted_pat    ,
                                                                   request_data  = create_request_data   )
-        self.routes.create(create_request, Response())
+        invoke_in_new_event_loop(self.routes.create_secret(create_request, Response()))
 
         # Now delete it
         delete_request_data = Schema__GitHub__Data__Request__Secret__Delete(owner       = self.repo_owner ,
@@ -288,6 +345,180 @@ class test_Routes__GitHub__Secrets__Repo(TestCase):
             assert result.response_context.status_code == Enum__HTTP__Status.NOT_FOUND_404
             assert result.response_data.deleted        is False
 
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # bulk_set Tests
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def bulk_set_request(self, secrets: dict, max_workers: int = 4):                            # secret_name -> plain value (None = invalid ciphertext)
+        items = []
+        for secret_name, value in secrets.items():
+            if value is None:
+                encrypted_value = INVALID__ENCRYPTED_VALUE
+            else:
+                encrypted_value = self.service_encryption.encrypt(
+                    Schema__Encryption__Request(value=value, encryption_type=Enum__Encryption_Type.TEXT)).encrypted
+            items.append(Schema__GitHub__Secret__Bulk_Item(secret_name=secret_name, encrypted_value=encrypted_value))
+        request_data = Schema__GitHub__Data__Request__Secrets__Bulk_Set(owner       = self.repo_owner ,
+                                                                        repo        = self.repo_name  ,
+                                                                        secrets     = items           ,
+                                                                        max_workers = max_workers     )
+        return Schema__GitHub__Request__Secrets__Bulk_Set(encrypted_pat = self.encrypted_pat ,
+                                                          request_data  = request_data       )
+
+    def test__bulk_set__success(self):                                                          # Test setting many secrets in one call
+        secrets  = {f'TEST_BULK_SECRET_{i}': f'bulk_value_{i}' for i in range(12)}
+        response = Response()
+
+        with self.routes as _:
+            result = _.bulk_set(self.bulk_set_request(secrets), response)
+
+            assert type(result)                          is Schema__GitHub__Response__Secrets__Bulk_Set
+            assert result.response_context.success       is True
+            assert result.response_context.status_code   == Enum__HTTP__Status.OK_200
+            assert response.status_code                  == 200
+            assert result.response_data.succeeded        == 12
+            assert result.response_data.failed           == 0
+            assert [r.secret_name for r in result.response_data.results] == list(secrets)          # request order preserved
+            assert all(r.success and r.error is None for r in result.response_data.results)
+            assert result.response_context.rate_limit.limit == 5000
+
+        state = self.surrogate_context.surrogate.state
+        for secret_name in secrets:
+            assert state.delete_repo_secret(self.repo_owner, self.repo_name, secret_name) is True
+
+    def test__bulk_set__partial_failure(self):                                                  # Undecryptable values fail individually, others are written
+        response = Response()
+        with self.routes as _:
+            result = _.bulk_set(self.bulk_set_request({'TEST_BULK_OK': 'value', 'TEST_BULK_BAD': None}), response)
+
+            assert result.response_context.success       is False
+            assert result.response_context.status_code   == Enum__HTTP__Status.OK_200
+            assert result.response_context.error_type    == Enum__Error__Type.GITHUB_API_ERROR
+            assert result.response_data.succeeded        == 1
+            assert result.response_data.failed           == 1
+            assert result.response_data.results[1].error == 'Failed to decrypt secret value'
+
+        state = self.surrogate_context.surrogate.state
+        assert state.delete_repo_secret(self.repo_owner, self.repo_name, 'TEST_BULK_OK' ) is True
+        assert state.delete_repo_secret(self.repo_owner, self.repo_name, 'TEST_BULK_BAD') is False
+
+    def test__bulk_set__invalid_repo(self):                                                     # Missing repo fails on the public key fetch
+        request = self.bulk_set_request({'TEST_BULK_X': 'x'})
+        request.request_data.repo = 'nonexistent-repo-xyz'
+        with self.routes as _:
+            result = _.bulk_set(request, Response())
+            assert result.response_context.success     is False
+            assert result.response_context.status_code == Enum__HTTP__Status.NOT_FOUND_404
+            assert result.response_data.results        == []
+
+    def test__bulk_set__too_many_secrets(self):
+        secrets = {f'TEST_BULK_{i}': 'x' for i in range(GITHUB_API__BULK_WRITE__MAX_SECRETS + 1)}
+        request = self.bulk_set_request({})
+        request.request_data.secrets = [Schema__GitHub__Secret__Bulk_Item(secret_name=name, encrypted_value=INVALID__ENCRYPTED_VALUE) for name in secrets]
+        with self.routes as _:
+            result = _.bulk_set(request, Response())
+            assert result.response_context.status_code == Enum__HTTP__Status.BAD_REQUEST_400
+            assert result.response_context.error_type  == Enum__Error__Type.INVALID_INPUT
+
+    def test__bulk_set__all_undecryptable(self):                                                # Nothing decrypts: 400 with per-item errors, GitHub is never written to
+        response = Response()
+        with self.routes as _:
+            result = _.bulk_set(self.bulk_set_request({'TEST_BULK_BAD_1': None, 'TEST_BULK_BAD_2': None}), response)
+
+            assert result.response_context.success       is False
+            assert result.response_context.status_code   == Enum__HTTP__Status.BAD_REQUEST_400
+            assert result.response_context.error_type    == Enum__Error__Type.DECRYPTION_FAILED
+            assert response.status_code                  == 400
+            assert result.response_data.succeeded        == 0
+            assert result.response_data.failed           == 2
+            assert [r.error for r in result.response_data.results] == ['Failed to decrypt secret value'] * 2
+            assert len(result.response_context.errors)   == 2
+
+        state = self.surrogate_context.surrogate.state
+        assert state.delete_repo_secret(self.repo_owner, self.repo_name, 'TEST_BULK_BAD_1') is False
+
+    def test__bulk_set__duplicate_secret_names(self):                                           # Same name twice (case-insensitive) is rejected before anything is written
+        request = self.bulk_set_request({'TEST_BULK_DUP': 'a', 'TEST_BULK_OTHER': 'b'})
+        request.request_data.secrets.append(Schema__GitHub__Secret__Bulk_Item(secret_name     = 'test_bulk_dup'          ,
+                                                                              encrypted_value = INVALID__ENCRYPTED_VALUE ))
+        response = Response()
+        with self.routes as _:
+            result = _.bulk_set(request, response)
+
+            assert result.response_context.status_code == Enum__HTTP__Status.BAD_REQUEST_400
+            assert result.response_context.error_type  == Enum__Error__Type.INVALID_INPUT
+            assert response.status_code                == 400
+            assert result.response_context.errors      == ['Duplicate secrets: test_bulk_dup']
+            assert result.response_data.results        == []
+
+        state = self.surrogate_context.surrogate.state
+        assert state.delete_repo_secret(self.repo_owner, self.repo_name, 'TEST_BULK_DUP') is False
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # fan_out Tests
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def read_stream(self, streaming_response):                                                  # Drain a StreamingResponse (private loop, leaves the main thread's loop alone)
+        async def read():
+            return [chunk async for chunk in streaming_response.body_iterator]
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(read())
+        finally:
+            loop.close()
+
+    def fan_out_request(self, targets, encrypted_pat=None, encrypted_value=None):
+        encrypted_value = encrypted_value or self.service_encryption.encrypt(
+            Schema__Encryption__Request(value='rotated-credential', encryption_type=Enum__Encryption_Type.TEXT)).encrypted
+        request_data = Schema__GitHub__Data__Request__Secret__Fan_Out(secret_name     = 'TEST_FAN_OUT_SECRET'                                         ,
+                                                                      encrypted_value = encrypted_value                                               ,
+                                                                      targets         = [Schema__GitHub__Secret__Fan_Out__Target(**t) for t in targets],
+                                                                      max_workers     = 4                                                             ,
+                                                                      rate_limit_reserve = 0                                                          )
+        return Schema__GitHub__Request__Secret__Fan_Out(encrypted_pat = encrypted_pat or self.encrypted_pat ,
+                                                        request_data  = request_data                        )
+
+    def test__fan_out__streams_ndjson(self):                                                    # One line per target, then a summary line
+        self.surrogate_context.add_repo       (self.repo_owner, 'fan-out-repo')
+        self.surrogate_context.add_environment(self.repo_owner, self.repo_name, 'staging')
+        targets = [dict(owner=self.repo_owner, repo=self.repo_name                       ),
+                   dict(owner=self.repo_owner, repo='fan-out-repo'                       ),
+                   dict(owner=self.repo_owner, repo=self.repo_name, environment='staging'),
+                   dict(owner=self.repo_owner, repo='missing-fan-out-repo'               )]
+        with self.routes as _:
+            result = invoke_in_new_event_loop(_.fan_out_secret(self.fan_out_request(targets), Response()))
+            assert result.media_type  == 'application/x-ndjson'
+            assert result.status_code == 200
+            lines = [json.loads(line) for line in self.read_stream(result)]
+
+        summary = lines.pop()['summary']
+        assert len(lines)                                                   == 4
+        assert sorted(line['repo'] for line in lines if line['success'])    == sorted([self.repo_name, self.repo_name, 'fan-out-repo'])
+        assert [line['repo'] for line in lines if not line['success']]      == ['missing-fan-out-repo']
+        assert (summary['targets'], summary['succeeded'])                   == (4, 3)
+        assert (summary['failed'], summary['skipped'])                      == (1, 0)
+        assert summary['rate_limit']['limit']                               == 5000
+
+        state = self.surrogate_context.surrogate.state
+        assert state.delete_repo_secret(self.repo_owner, self.repo_name, 'TEST_FAN_OUT_SECRET')            is True
+        assert state.delete_repo_secret(self.repo_owner, 'fan-out-repo', 'TEST_FAN_OUT_SECRET')            is True
+        assert state.delete_env_secret (self.repo_owner, self.repo_name, 'staging', 'TEST_FAN_OUT_SECRET') is True
+
+    def test__fan_out__invalid_value(self):                                                     # Decryption errors are returned before any write
+        with self.routes as _:
+            result = invoke_in_new_event_loop(_.fan_out_secret(self.fan_out_request([dict(owner=self.repo_owner, repo=self.repo_name)],
+                                                                                    encrypted_value = INVALID__ENCRYPTED_VALUE), Response()))
+            body   = json.loads(result.body)
+            assert result.status_code                      == 401
+            assert body['response_context']['error_type']  == 'decryption_failed'
+
+    def test__fan_out__too_many_targets(self):
+        targets = [dict(owner=self.repo_owner, repo=self.repo_name)] * (GITHUB_API__FAN_OUT__MAX_TARGETS + 1)
+        with self.routes as _:
+            result = invoke_in_new_event_loop(_.fan_out_secret(self.fan_out_request(targets), Response()))
+            assert result.status_code                                    == 400
+            assert json.loads(result.body)['response_context']['error_type'] == 'invalid_input'
+
     # ═══════════════════════════════════════════════════════════════════════════════
     # setup_routes Tests
     # ═══════════════════════════════════════════════════════════════════════════════
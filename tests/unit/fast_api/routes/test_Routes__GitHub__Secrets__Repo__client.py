@@ -0,0 +1,101 @@
+import json
+from unittest                                                                               import TestCase
+from mgraph_ai_service_github.schemas.encryption.Enum__Encryption_Type                      import Enum__Encryption_Type
+from mgraph_ai_service_github.schemas.encryption.Schema__Encryption__Request                import Schema__Encryption__Request
+from mgraph_ai_service_github.service.encryption.Service__Encryption                        import Service__Encryption
+from mgraph_ai_service_github.surrogates.github.testing.GitHub__API__Surrogate__Test_Context import GitHub__API__Surrogate__Test_Context
+from tests.unit.GitHub__Service__Fast_API__Test_Objs                                        import setup__github_service_fast_api_test_objs, TEST_API_KEY__NAME, TEST_API_KEY__VALUE
+
+
+class test_Routes__GitHub__Secrets__Repo__client(TestCase):                                     # list / create / fan-out through the service app (async, Request-typed routes)
+
+    @classmethod
+    def setUpClass(cls):
+        cls.surrogate_context = GitHub__API__Surrogate__Test_Context().setup()
+        cls.repo_owner        = 'client-owner'
+        cls.repo_name         = 'client-repo'
+        cls.surrogate_context.add_repo(cls.repo_owner, cls.repo_name)
+        cls.surrogate_context.add_secret(cls.repo_owner, cls.repo_name, 'CLIENT_EXISTING_SECRET')
+
+        with setup__github_service_fast_api_test_objs() as _:
+            cls.client             = _.fast_api__client
+            cls.service_encryption = Service__Encryption(private_key_hex = _.nacl_keys.private_key ,
+                                                         public_key_hex  = _.nacl_keys.public_key  )
+            cls.client.headers[TEST_API_KEY__NAME] = TEST_API_KEY__VALUE
+
+        cls.encrypted_pat = cls.encrypt(cls.surrogate_context.admin_pat())
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.surrogate_context.teardown()
+
+    @classmethod
+    def encrypt(cls, value):
+        return str(cls.service_encryption.encrypt(Schema__Encryption__Request(value           = value                     ,
+                                                                              encryption_type = Enum__Encryption_Type.TEXT)).encrypted)
+
+    def post(self, route, request_data, encrypted_pat=None):
+        return self.client.post(f'/github-secrets-repo/{route}', json=dict(encrypted_pat = encrypted_pat or self.encrypted_pat ,
+                                                                           request_data  = request_data                        ))
+
+    def test__list(self):
+        response = self.post('list', dict(owner=self.repo_owner, repo=self.repo_name))
+        result   = response.json()
+        assert response.status_code                              == 200
+        assert result['response_context']['success']             is True
+        assert result['response_context']['rate_limit']['limit'] == 5000
+        assert result['response_data']['page']                   == 1
+        assert result['response_data']['next_page']              is None
+        assert 'CLIENT_EXISTING_SECRET'                          in [secret['name'] for secret in result['response_data']['secrets']]
+
+    def test__list__errors(self):                                                               # GitHub, PAT and body errors keep their status codes
+        assert self.post('list', dict(owner=self.repo_owner, repo='no-such-repo')).status_code == 404
+
+        response = self.post('list', dict(owner=self.repo_owner, repo=self.repo_name), encrypted_pat=self.encrypt('not-a-known-pat'))
+        assert response.status_code                              == 401
+        assert response.json()['response_context']['error_type'] == 'invalid_pat'
+
+        response = self.post('list', dict(owner=self.repo_owner, repo=self.repo_name, page='first'))
+        assert response.status_code                              == 400
+        assert response.json()['response_context']['error_type'] == 'invalid_input'
+
+        response = self.client.post('/github-secrets-repo/list', content=b'{not json')
+        assert response.status_code                              == 400
+
+    def test__create(self):
+        response = self.post('create', dict(owner           = self.repo_owner             ,
+                                            repo            = self.repo_name              ,
+                                            secret_name     = 'CLIENT_CREATED_SECRET'     ,
+                                            encrypted_value = self.encrypt('client-value')))
+        result   = response.json()
+        assert response.status_code                   == 201
+        assert result['response_data']['created']     is True
+        assert result['response_context']['messages'] == ["Secret 'CLIENT_CREATED_SECRET' created"]
+
+        state = self.surrogate_context.surrogate.state
+        assert state.delete_repo_secret(self.repo_owner, self.repo_name, 'CLIENT_CREATED_SECRET') is True
+
+    def test__create__missing_repo(self):                                                       # GitHub's 404 is mapped, not reported as a generic 500
+        response = self.post('create', dict(owner           = self.repo_owner       ,
+                                            repo            = 'no-such-repo'        ,
+                                            secret_name     = 'CLIENT_NEVER_WRITTEN',
+                                            encrypted_value = self.encrypt('value') ))
+        assert response.status_code                               == 404
+        assert response.json()['response_data']['created']        is False
+        assert response.json()['response_context']['error_type']  == 'not_found'
+
+    def test__fan_out(self):
+        targets  = [dict(owner=self.repo_owner, repo=self.repo_name), dict(owner=self.repo_owner, repo='no-such-repo')]
+        response = self.post('fan-out', dict(secret_name        = 'CLIENT_FAN_OUT_SECRET'   ,
+                                             encrypted_value    = self.encrypt('fan-value') ,
+                                             targets            = targets                   ,
+                                             rate_limit_reserve = 0                         ))
+        assert response.status_code             == 200
+        assert response.headers['content-type'] == 'application/x-ndjson'
+        lines   = [json.loads(line) for line in response.text.splitlines()]
+        summary = lines.pop()['summary']
+        assert sorted((line['repo'], line['success']) for line in lines) == [('client-repo', True), ('no-such-repo', False)]
+        assert (summary['targets'], summary['succeeded'], summary['failed']) == (2, 1, 1)
+
+        state = self.surrogate_context.surrogate.state
+        assert state.delete_repo_secret(self.repo_owner, self.repo_name, 'CLIENT_FAN_OUT_SECRET') is True
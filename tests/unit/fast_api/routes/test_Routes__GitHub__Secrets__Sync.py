@@ -0,0 +1,118 @@
+from unittest                                                                                       import TestCase
+from fastapi                                                                                        import Response
+from osbot_fast_api.api.routes.Fast_API__Routes                                                     import Fast_API__Routes
+from osbot_utils.type_safe.Type_Safe                                                                import Type_Safe
+from osbot_utils.utils.Objects                                                                      import base_classes
+from mgraph_ai_service_github.config                                                                import GITHUB_API__SYNC__MAX_SCOPES
+from mgraph_ai_service_github.fast_api.dependencies.GitHub__API__From__Header                       import GitHub__API__From__Header
+from mgraph_ai_service_github.fast_api.routes.Routes__GitHub__Secrets__Sync                         import Routes__GitHub__Secrets__Sync, TAG__ROUTES_GITHUB_SECRETS_SYNC, ROUTES_PATHS__GITHUB_SECRETS_SYNC
+from mgraph_ai_service_github.schemas.base.Enum__Error__Type                                        import Enum__Error__Type
+from mgraph_ai_service_github.schemas.base.Enum__HTTP__Status                                       import Enum__HTTP__Status
+from mgraph_ai_service_github.schemas.encryption.Enum__Encryption_Type                              import Enum__Encryption_Type
+from mgraph_ai_service_github.schemas.encryption.Schema__Encryption__Request                        import Schema__Encryption__Request
+from mgraph_ai_service_github.schemas.github.secrets.Schema__GitHub__Secret__Bulk_Item              import Schema__GitHub__Secret__Bulk_Item
+from mgraph_ai_service_github.schemas.github.sync.Enum__GitHub__Secrets__Sync__Action               import Enum__GitHub__Secrets__Sync__Action
+from mgraph_ai_service_github.schemas.github.sync.Schema__GitHub__Data__Request__Secrets__Sync      import Schema__GitHub__Data__Request__Secrets__Sync
+from mgraph_ai_service_github.schemas.github.sync.Schema__GitHub__Request__Secrets__Sync            import Schema__GitHub__Request__Secrets__Sync
+from mgraph_ai_service_github.schemas.github.sync.Schema__GitHub__Response__Secrets__Sync           import Schema__GitHub__Response__Secrets__Sync
+from mgraph_ai_service_github.schemas.github.sync.Schema__GitHub__Secrets__Sync__Scope              import Schema__GitHub__Secrets__Sync__Scope
+from mgraph_ai_service_github.service.auth.Service__Auth                                            import Service__Auth
+from mgraph_ai_service_github.service.encryption.NaCl__Key_Management                               import NaCl__Key_Management
+from mgraph_ai_service_github.service.encryption.Service__Encryption                                import Service__Encryption
+from mgraph_ai_service_github.surrogates.github.testing.GitHub__API__Surrogate__Test_Context        import GitHub__API__Surrogate__Test_Context
+
+
+class test_Routes__GitHub__Secrets__Sync(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.test_keys          = NaCl__Key_Management().generate_nacl_keys()
+        cls.service_auth       = Service__Auth              (private_key_hex = cls.test_keys.private_key ,
+                                                             public_key_hex  = cls.test_keys.public_key  )
+        cls.service_encryption = Service__Encryption        (private_key_hex = cls.test_keys.private_key ,
+                                                             public_key_hex  = cls.test_keys.public_key  )
+        cls.github_api_factory = GitHub__API__From__Header  (service_auth = cls.service_auth)
+        cls.routes             = Routes__GitHub__Secrets__Sync(github_api_factory = cls.github_api_factory ,
+                                                               service_encryption = cls.service_encryption )
+        cls.surrogate_context  = GitHub__API__Surrogate__Test_Context().setup()
+        cls.surrogate_context.add_repo  ('sync-owner', 'sync-route-repo')
+        cls.surrogate_context.add_secret('sync-owner', 'sync-route-repo', 'LEGACY_SECRET')
+        cls.encrypted_pat      = cls.encrypt(cls.surrogate_context.admin_pat())
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.surrogate_context.teardown()
+
+    @classmethod
+    def encrypt(cls, value):
+        return cls.service_encryption.encrypt(Schema__Encryption__Request(value=value, encryption_type=Enum__Encryption_Type.TEXT)).encrypted
+
+    def sync_request(self, secrets: dict, delete_extras=False):
+        items = [Schema__GitHub__Secret__Bulk_Item(secret_name=name, encrypted_value=self.encrypt(value)) for name, value in secrets.items()]
+        scope = Schema__GitHub__Secrets__Sync__Scope(owner='sync-owner', repo='sync-route-repo', secrets=items, delete_extras=delete_extras)
+        return Schema__GitHub__Request__Secrets__Sync(encrypted_pat = self.encrypted_pat                                        ,
+                                                      request_data  = Schema__GitHub__Data__Request__Secrets__Sync(scopes=[scope]))
+
+    def test__init__(self):
+        with self.routes as _:
+            assert type(_)         is Routes__GitHub__Secrets__Sync
+            assert base_classes(_) == [Fast_API__Routes, Type_Safe, object]
+            assert _.tag           == TAG__ROUTES_GITHUB_SECRETS_SYNC
+
+    def test__routes_paths(self):
+        assert ROUTES_PATHS__GITHUB_SECRETS_SYNC == ['/github-secrets-sync/plan', '/github-secrets-sync/apply']
+
+    def test__plan__apply__plan(self):                                          # plan shows changes, apply writes them, next plan is a no-op
+        request  = self.sync_request({'SYNC_ROUTE_A': 'a', 'SYNC_ROUTE_B': 'b'}, delete_extras=True)
+        response = Response()
+        with self.routes as _:
+            plan = _.plan(request, response)
+            assert type(plan)                                 is Schema__GitHub__Response__Secrets__Sync
+            assert plan.response_context.success              is True
+            assert response.status_code                       == 200
+            assert plan.response_data.applied                 is False
+            assert (plan.response_data.creates, plan.response_data.deletes) == (2, 1)
+            assert [a.action for a in plan.response_data.actions] == [Enum__GitHub__Secrets__Sync__Action.CREATE,
+                                                                      Enum__GitHub__Secrets__Sync__Action.CREATE,
+                                                                      Enum__GitHub__Secrets__Sync__Action.DELETE]
+            assert plan.response_data.actions[0].success      is None
+
+            applied = _.apply(request, Response())
+            assert applied.response_context.success           is True
+            assert applied.response_data.applied              is True
+            assert applied.response_data.failed               == 0
+            assert all(a.success is True for a in applied.response_data.actions)
+            assert all(a.fingerprint for a in applied.response_data.actions if a.action != Enum__GitHub__Secrets__Sync__Action.DELETE)
+
+            again = _.plan(request, Response())
+            assert again.response_data.unchanged              == 2
+            assert (again.response_data.creates, again.response_data.updates, again.response_data.deletes) == (0, 0, 0)
+
+        state = self.surrogate_context.surrogate.state
+        assert state.get_repo_secret   ('sync-owner', 'sync-route-repo', 'LEGACY_SECRET') is None
+        assert state.delete_repo_secret('sync-owner', 'sync-route-repo', 'SYNC_ROUTE_A')  is True
+        assert state.delete_repo_secret('sync-owner', 'sync-route-repo', 'SYNC_ROUTE_B')  is True
+
+    def test__plan__invalid_repo(self):
+        request = self.sync_request({'SYNC_X': 'x'})
+        request.request_data.scopes[0].repo = 'no-such-repo'
+        with self.routes as _:
+            result = _.plan(request, Response())
+            assert result.response_context.status_code == Enum__HTTP__Status.NOT_FOUND_404
+
+    def test__plan__too_many_scopes(self):
+        request = self.sync_request({})
+        request.request_data.scopes = request.request_data.scopes * (GITHUB_API__SYNC__MAX_SCOPES + 1)
+        with self.routes as _:
+            result = _.plan(request, Response())
+            assert result.response_context.status_code == Enum__HTTP__Status.BAD_REQUEST_400
+            assert result.response_context.error_type  == Enum__Error__Type.INVALID_INPUT
+
+    def test__plan__duplicate_scopes(self):
+        request = self.sync_request({'SYNC_X': 'x'})
+        request.request_data.scopes = request.request_data.scopes * 2
+        with self.routes as _:
+            result = _.plan(request, Response())
+            assert result.response_context.status_code == Enum__HTTP__Status.BAD_REQUEST_400
+            assert result.response_context.error_type  == Enum__Error__Type.INVALID_INPUT
+            assert 'Duplicate scopes: sync-owner:sync-route-repo' in result.response_context.errors[0]
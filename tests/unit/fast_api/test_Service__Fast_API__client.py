@@ -10,6 +10,8 @@ from mgraph_ai_service_github.fast_api.routes.Routes__Auth                  impo
 from mgraph_ai_service_github.fast_api.routes.Routes__Encryption            import ROUTES_PATHS__ENCRYPTION
 from mgraph_ai_service_github.fast_api.routes.Routes__GitHub__Secrets__Env  import ROUTES_PATHS__GITHUB_SECRETS_ENV
 from mgraph_ai_service_github.fast_api.routes.Routes__GitHub__Secrets__Org  import ROUTES_PATHS__GITHUB_SECRETS_ORG
+from mgraph_ai_service_github.fast_api.routes.Routes__GitHub__Secrets__Sync      import ROUTES_PATHS__GITHUB_SECRETS_SYNC
+from mgraph_ai_service_github.fast_api.routes.Routes__GitHub__Secrets__Inventory import ROUTES_PATHS__GITHUB_SECRETS_INVENTORY
 from mgraph_ai_service_github.fast_api.routes.Routes__GitHub__Secrets__Repo import ROUTES_PATHS__GITHUB_SECRETS_REPO
 from tests.unit.GitHub__Service__Fast_API__Test_Objs                        import setup__github_service_fast_api_test_objs, GitHub__Service__Fast_API__Test_Objs, TEST_API_KEY__NAME
 
@@ -59,4 +61,6 @@ class test_Service__Fast_API__client(TestCase):
                                                       EXPECTED_ROUTES__SET_COOKIE       +
                                                       ROUTES_PATHS__GITHUB_SECRETS_REPO +
                                                       ROUTES_PATHS__GITHUB_SECRETS_ENV  +
+                                                      ROUTES_PATHS__GITHUB_SECRETS_SYNC +
+                                                      ROUTES_PATHS__GITHUB_SECRETS_INVENTORY +
                                                       ROUTES_PATHS__GITHUB_SECRETS_ORG  )
\ No newline at end of file
@@ -12,6 +12,8 @@ from mgraph_ai_service_github.fast_api.routes.Routes__Auth
 from mgraph_ai_service_github.fast_api.routes.Routes__Encryption                 import ROUTES_PATHS__ENCRYPTION
 from mgraph_ai_service_github.fast_api.routes.Routes__GitHub__Secrets__Env       import ROUTES_PATHS__GITHUB_SECRETS_ENV
 from mgraph_ai_service_github.fast_api.routes.Routes__GitHub__Secrets__Org       import ROUTES_PATHS__GITHUB_SECRETS_ORG
+from mgraph_ai_service_github.fast_api.routes.Routes__GitHub__Secrets__Sync      import ROUTES_PATHS__GITHUB_SECRETS_SYNC
+from mgraph_ai_service_github.fast_api.routes.Routes__GitHub__Secrets__Inventory import ROUTES_PATHS__GITHUB_SECRETS_INVENTORY
 from mgraph_ai_service_github.fast_api.routes.Routes__GitHub__Secrets__Repo      import ROUTES_PATHS__GITHUB_SECRETS_REPO
 from mgraph_ai_service_github.schemas.encryption.Const__Encryption               import NCCL__ALGORITHM
 from mgraph_ai_service_github.schemas.encryption.Schema__Public_Key__Response    import Schema__Public_Key__Response
@@ -30,6 +32,8 @@ class test_Service__Fast_API__with_type_safe_routes(TestCase):
                                       EXPECTED_ROUTES__SET_COOKIE       +
                                       ROUTES_PATHS__GITHUB_SECRETS_REPO +
                                       ROUTES_PATHS__GITHUB_SECRETS_ENV  +
+                                      ROUTES_PATHS__GITHUB_SECRETS_SYNC +
+                                      ROUTES_PATHS__GITHUB_SECRETS_INVENTORY +
                                       ROUTES_PATHS__GITHUB_SECRETS_ORG  +
                                       ['/type_safe/ping']              )
 
@@ -86,5 +90,6 @@ class test_Service__Fast_API__with_type_safe_routes(TestCase):
             response            = _.client().post('/type_safe/ping', headers=self.headers, json=post_data)
             assert response.status_code == 200
             assert response.json()      == {'pong': {'public_key_response': {'public_key': public_key      ,
+                                                                             'key_id'    : None            ,
                                                                              'algorithm' : NCCL__ALGORITHM ,
                                                                              'timestamp' : timestamp       }}}
\ No newline at end of file
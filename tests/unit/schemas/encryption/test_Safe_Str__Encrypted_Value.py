@@ -0,0 +1,56 @@
+import base64
+import pytest
+from unittest                                                                       import TestCase
+from unittest.mock                                                                  import patch
+from osbot_utils.type_safe.Type_Safe__Primitive                                     import Type_Safe__Primitive
+from osbot_utils.utils.Objects                                                      import base_classes
+from mgraph_ai_service_github.schemas.encryption                                    import Safe_Str__Encrypted_Value as encrypted_value_module
+from mgraph_ai_service_github.schemas.encryption.Safe_Str__Encrypted_Value          import Safe_Str__Encrypted_Value, decode_encrypted_value
+from mgraph_ai_service_github.schemas.encryption.Schema__Decryption__Request        import Schema__Decryption__Request
+from mgraph_ai_service_github.service.encryption.NaCl__Key_Management               import NaCl__Key_Management
+from mgraph_ai_service_github.service.encryption.Service__Encryption                import Service__Encryption
+
+ENCRYPTED_BYTES = bytes(range(64))
+ENCRYPTED_VALUE = base64.b64encode(ENCRYPTED_BYTES).decode()
+
+
+class test_Safe_Str__Encrypted_Value(TestCase):
+
+    def test__init__(self):
+        with Safe_Str__Encrypted_Value(ENCRYPTED_VALUE) as _:
+            assert type(_)           is Safe_Str__Encrypted_Value
+            assert base_classes(_)   == [Type_Safe__Primitive, str, object, object]
+            assert _                 == ENCRYPTED_VALUE
+            assert _.decoded_bytes() == ENCRYPTED_BYTES
+
+    def test__init____with_empty(self):
+        with Safe_Str__Encrypted_Value('') as _:
+            assert _                 == ''
+            assert _.decoded_bytes() == b''
+
+    def test__init____invalid(self):
+        with pytest.raises(ValueError, match="Invalid base64"):
+            Safe_Str__Encrypted_Value('not base64!')
+        with pytest.raises(ValueError, match="too short"):
+            Safe_Str__Encrypted_Value(base64.b64encode(b'x' * 47).decode())
+
+    def test_decoded_bytes__decoded_once(self):                                 # validation decodes, decryption reuses it
+        calls          = []
+        real_b64decode = base64.b64decode
+        def b64decode(*args, **kwargs):
+            calls.append(args[0])
+            return real_b64decode(*args, **kwargs)
+        with patch.object(encrypted_value_module.base64, 'b64decode', b64decode):
+            value = Safe_Str__Encrypted_Value(ENCRYPTED_VALUE)
+            assert Safe_Str__Encrypted_Value(value).decoded_bytes() is value.decoded_bytes()    # re-wrapping keeps the bytes
+            assert decode_encrypted_value(value)                    is value.decoded_bytes()
+            assert decode_encrypted_value(ENCRYPTED_VALUE)          == ENCRYPTED_BYTES          # plain str still works
+        assert len(calls) == 2
+
+    def test_decoded_bytes__decrypt_paths(self):                                # Service__Encryption.decrypt consumes the cached bytes
+        nacl_keys          = NaCl__Key_Management().generate_nacl_keys()
+        service_encryption = Service__Encryption(private_key_hex=nacl_keys.private_key, public_key_hex=nacl_keys.public_key)
+        encrypted          = Safe_Str__Encrypted_Value(str(service_encryption.encrypt_text('secret').encrypted))
+        request            = Schema__Decryption__Request(encrypted=encrypted, encryption_type='text')
+        with patch.object(encrypted_value_module.base64, 'b64decode', side_effect=AssertionError('decoded twice')):
+            assert service_encryption.decrypt(request).decrypted == 'secret'
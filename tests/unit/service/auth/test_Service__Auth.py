@@ -1,11 +1,15 @@
 import base64
 from unittest                                                               import TestCase
+from unittest.mock                                                          import Mock, patch
 from nacl.public                                                            import PrivateKey, PublicKey, SealedBox
 from osbot_utils.testing.Temp_Env_Vars                                      import Temp_Env_Vars
 from osbot_utils.utils.Env                                                  import get_env, load_dotenv, env_var_set
 from mgraph_ai_service_github.config                                        import ENV_VAR__SERVICE__AUTH__PUBLIC_KEY, ENV_VAR__SERVICE__AUTH__PRIVATE_KEY
 from mgraph_ai_service_github.service.auth.Service__Auth                    import Service__Auth
+from mgraph_ai_service_github.service.auth.Service__Auth__Validation__Cache import Service__Auth__Validation__Cache
 from mgraph_ai_service_github.service.encryption.NaCl__Key_Management       import NaCl__Key_Management
+from mgraph_ai_service_github.service.encryption.NaCl__Keyring              import ENCRYPTION_ENVELOPE__MAGIC, ENCRYPTION_ENVELOPE__HEADER_SIZE, key_fingerprint
+from mgraph_ai_service_github.service.github.GitHub__API                    import GitHub__API
 from mgraph_ai_service_github.surrogates.github.testing.GitHub__API__Surrogate__Test_Context import GitHub__API__Surrogate__Test_Context
 from tests.unit.GitHub__Service__Fast_API__Test_Objs                        import create_and_set_nacl_keys
 
@@ -208,6 +212,22 @@ class test_Service__Auth(TestCase):
 
             assert "Decryption failed" in str(context.exception)
 
+    def test_decrypt_pat__after_key_rotation(self):                                             # Test PATs encrypted before a deploy rotated the keys still decrypt
+        new_keys     = self.nacl_manager.generate_nacl_keys()
+        rotated_auth = Service__Auth(private_key_hex       = new_keys.private_key      ,
+                                     public_key_hex        = new_keys.public_key       ,
+                                     previous_private_keys = self.nacl_keys.private_key)
+        encrypted    = self.auth_service.encrypt_pat(self.test_pat)                                 # tagged with the old key's fingerprint
+
+        assert base64.b64decode(encrypted)[:ENCRYPTION_ENVELOPE__HEADER_SIZE] == ENCRYPTION_ENVELOPE__MAGIC + key_fingerprint(self.nacl_keys.public_key)
+        assert rotated_auth._decrypt_pat(encrypted              ) == self.test_pat
+        assert rotated_auth._decrypt_pat(self.encrypted_test_pat) == self.test_pat                  # untagged (client-side SealedBox) PATs too
+        assert rotated_auth._decrypt_pat(rotated_auth.encrypt_pat('ghp_new')) == 'ghp_new'
+
+        with self.assertRaises(ValueError) as context:
+            Service__Auth(private_key_hex=new_keys.private_key, public_key_hex=new_keys.public_key, previous_private_keys='')._decrypt_pat(encrypted)
+        assert "Decryption failed" in str(context.exception)
+
     # ═══════════════════════════════════════════════════════════════════════════════
     # Test Method - Missing Header Tests
     # ═══════════════════════════════════════════════════════════════════════════════
@@ -279,6 +299,53 @@ class test_Service__Auth(TestCase):
             assert "Bad credentials"     in result["error"]
             assert result["user"]        is None
 
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Validation Tests (Surrogate GitHub)
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test_test__surrogate_pat__cached(self):                                                 # Test repeated validations are served from the validation cache
+        admin_pat     = self.surrogate_context.admin_pat()
+        encrypted_pat = self._encrypt_pat(admin_pat, self.nacl_keys.public_key)
+        with Service__Auth(validation_cache=Service__Auth__Validation__Cache()) as _:
+            result = _.test(encrypted_pat)
+            assert result["success"]          is True
+            assert result["user"]["login"]    == "surrogate-admin"
+            assert result["rate_limit"]       == dict(limit=5000, remaining=4999, reset=result["rate_limit"]["reset"], used=1)
+            with patch.object(Service__Auth, 'github_user_and_rate_limit') as mock_lookup:
+                assert _.test(encrypted_pat)          == result
+                assert _.test_github_pat(admin_pat)   == result                                 # same PAT, same cache entry
+                mock_lookup.assert_not_called()
+            assert _.validation_cache.stats() == dict(entries=1, hits=2, misses=1)
+
+    def test_github_user_and_rate_limit__prefers_headers(self):                                 # Test /user X-RateLimit-* headers win, and /rate_limit is not called
+        user_response = Mock(headers = { 'X-RateLimit-Limit'    : '5000' ,
+                                         'X-RateLimit-Remaining': '4321' ,
+                                         'X-RateLimit-Reset'    : '1700000000',
+                                         'X-RateLimit-Used'     : '679'  })
+        user_response.json.return_value = {'login': 'octocat'}
+        with patch.object(GitHub__API, 'get_response', return_value=user_response) as mock_get_response, \
+             patch.object(GitHub__API, 'get'                                   ) as mock_get:
+            user_data, rate_limit = self.auth_service.github_user_and_rate_limit('ghp_headers')
+        assert user_data  == {'login': 'octocat'}
+        assert rate_limit == dict(limit=5000, remaining=4321, reset=1700000000, used=679, resource='core')
+        mock_get_response.assert_called_once_with('/user')
+        mock_get.assert_not_called()
+
+    def test_github_user_and_rate_limit__falls_back_to_rate_limit(self):                        # Test /rate_limit is only called when /user has no X-RateLimit-* headers
+        user_response = Mock(headers={})
+        user_response.json.return_value = {'login': 'octocat'}
+        with patch.object(GitHub__API, 'get_response', return_value=user_response                           ), \
+             patch.object(GitHub__API, 'get'         , return_value={'rate': {'limit': 60, 'remaining': 59}}) as mock_get:
+            user_data, rate_limit = self.auth_service.github_user_and_rate_limit('ghp_no_headers')
+        assert user_data  == {'login': 'octocat'}
+        assert rate_limit == {'limit': 60, 'remaining': 59}
+        mock_get.assert_called_once_with('/rate_limit')
+
+    def test_test__surrogate_pat__failures_not_cached(self):                                    # Test failed validations always go back to GitHub
+        with Service__Auth(validation_cache=Service__Auth__Validation__Cache()) as _:
+            assert _.test_github_pat(self.surrogate_context.expired_pat())["success"] is False
+            assert _.validation_cache.stats()["entries"]                               == 0
+
     # ═══════════════════════════════════════════════════════════════════════════════
     # Test GitHub PAT Tests (Real GitHub Calls)
     # ═══════════════════════════════════════════════════════════════════════════════
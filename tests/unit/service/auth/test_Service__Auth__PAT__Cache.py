@@ -0,0 +1,124 @@
+import time
+import pytest
+from unittest                                                               import TestCase
+from mgraph_ai_service_github.service.auth.Service__Auth                    import Service__Auth
+from mgraph_ai_service_github.service.auth.Service__Auth__PAT__Cache        import Service__Auth__PAT__Cache, Service__Auth__PAT__Cache__Entry, service_auth_pat_cache
+from mgraph_ai_service_github.service.encryption.NaCl__Key_Management       import NaCl__Key_Management
+from mgraph_ai_service_github.service.github.GitHub__API                    import GitHub__API
+
+KEY_ID = b'k' * 32
+
+
+class test_Service__Auth__PAT__Cache(TestCase):
+
+    def setUp(self):
+        self.cache = Service__Auth__PAT__Cache()
+
+    def test__init__(self):
+        with self.cache as _:
+            assert _.stats()                       == dict(entries=0, hits=0, misses=0, evictions=0)
+            assert service_auth_pat_cache.max_entries > 0
+            assert len(_.cache_key(KEY_ID, 'abc')) == 32
+            assert _.cache_key(KEY_ID, 'abc')      == _.cache_key(KEY_ID, 'abc')
+            assert _.cache_key(KEY_ID, 'abc')      != _.cache_key(b'x' * 32, 'abc')       # same ciphertext under another service key
+            assert _.cache_key(KEY_ID, 'abc')      != Service__Auth__PAT__Cache().cache_key(KEY_ID, 'abc')    # per-process hash key
+
+    def test_get__put(self):
+        with self.cache as _:
+            assert _.get(KEY_ID, 'encrypted') is None
+            entry = _.put(KEY_ID, 'encrypted', 'ghp_token')
+            assert type(entry)                     is Service__Auth__PAT__Cache__Entry
+            assert type(entry.github_api)          is GitHub__API
+            assert entry.github_api.api_token      == 'ghp_token'
+            assert _.get(KEY_ID, 'encrypted')      is entry
+            assert _.stats()                       == dict(entries=1, hits=1, misses=1, evictions=0)
+
+    def test_get_or_decrypt(self):
+        calls = []
+        def decrypt(encrypted_pat):
+            calls.append(encrypted_pat)
+            return 'ghp_token'
+        entry_1 = self.cache.get_or_decrypt(KEY_ID, 'encrypted', decrypt)
+        entry_2 = self.cache.get_or_decrypt(KEY_ID, 'encrypted', decrypt)
+        assert entry_1 is entry_2
+        assert calls   == ['encrypted']
+
+    def test_get_or_decrypt__errors_not_cached(self):
+        def decrypt(encrypted_pat):
+            raise ValueError('Decryption failed')
+        with pytest.raises(ValueError):
+            self.cache.get_or_decrypt(KEY_ID, 'bad', decrypt)
+        assert self.cache.stats()['entries'] == 0
+
+    def test_get__ttl_expired__releases_entry(self):
+        with Service__Auth__PAT__Cache(ttl=60) as _:
+            entry           = _.put(KEY_ID, 'encrypted', 'ghp_token')
+            entry.stored_at = time.monotonic() - 61
+            assert _.get(KEY_ID, 'encrypted') is None
+            assert entry.github_api           is None
+            assert _.stats()                  == dict(entries=0, hits=0, misses=1, evictions=1)
+
+    def test_put__lru_eviction(self):
+        with Service__Auth__PAT__Cache(max_entries=2) as _:
+            entry_a = _.put(KEY_ID, 'a', 'token-a')
+            _.put(KEY_ID, 'b', 'token-b')
+            _.get(KEY_ID, 'a')                                                  # a is now most recently used
+            _.put(KEY_ID, 'c', 'token-c')
+            assert _.get(KEY_ID, 'a') is entry_a
+            assert _.get(KEY_ID, 'b') is None
+            assert _.stats()['evictions'] == 1
+
+    def test_purge__and__clear(self):
+        with self.cache as _:
+            entries = [_.put(KEY_ID, f'encrypted-{i}', f'token-{i}') for i in range(3)]
+            assert _.purge()                  == 3
+            assert all(entry.github_api is None for entry in entries)
+            assert _.stats()                  == dict(entries=0, hits=0, misses=0, evictions=3)
+            assert _.clear().stats()          == dict(entries=0, hits=0, misses=0, evictions=0)
+
+
+class test_Service__Auth__PAT__Cache__Service__Auth(TestCase):                  # Integration with Service__Auth.decrypt_pat / github_api
+
+    @classmethod
+    def setUpClass(cls):
+        cls.keys = NaCl__Key_Management().generate_nacl_keys()
+
+    def setUp(self):
+        self.cache        = Service__Auth__PAT__Cache()
+        self.service_auth = Service__Auth(private_key_hex = self.keys.private_key ,
+                                          public_key_hex  = self.keys.public_key  ,
+                                          pat_cache       = self.cache            )
+
+    def test__decrypt_pat__sealed_box_only_on_miss(self):
+        encrypted_pat = self.service_auth.encrypt_pat('ghp_hot_path')
+        decrypts      = []
+        decrypt       = self.service_auth._decrypt_pat
+        self.service_auth._decrypt_pat = lambda value: decrypts.append(value) or decrypt(value)
+        for _ in range(5):
+            assert self.service_auth.decrypt_pat(encrypted_pat) == 'ghp_hot_path'
+        assert decrypts                                         == [encrypted_pat]
+        assert self.cache.stats()                               == dict(entries=1, hits=4, misses=1, evictions=0)
+
+    def test__github_api__shared_instance(self):
+        encrypted_pat = self.service_auth.encrypt_pat('ghp_shared')
+        assert self.service_auth.github_api(encrypted_pat) is self.service_auth.github_api(encrypted_pat)
+
+    def test__github_api__after_purge(self):                                    # a purged entry is rebuilt on the next request
+        encrypted_pat = self.service_auth.encrypt_pat('ghp_purged')
+        api_1         = self.service_auth.github_api(encrypted_pat)
+        self.cache.purge()
+        api_2         = self.service_auth.github_api(encrypted_pat)
+        assert api_1     is not api_2
+        assert api_2.api_token == 'ghp_purged'
+
+    def test__other_service_key__not_served_from_cache(self):                   # a ciphertext cached under one key never decrypts under another
+        encrypted_pat = self.service_auth.encrypt_pat('ghp_key_a')
+        self.service_auth.decrypt_pat(encrypted_pat)
+        other_keys    = NaCl__Key_Management().generate_nacl_keys()
+        other_auth    = Service__Auth(private_key_hex=other_keys.private_key, public_key_hex=other_keys.public_key, pat_cache=self.cache)
+        with pytest.raises(ValueError, match='Decryption failed'):
+            other_auth.decrypt_pat(encrypted_pat)
+
+    def test__missing_pat(self):
+        with pytest.raises(ValueError, match='Missing encrypted PAT'):
+            self.service_auth.decrypt_pat('')
@@ -0,0 +1,106 @@
+import base64
+import time
+import pytest
+from unittest                                                               import TestCase
+from nacl.secret                                                            import SecretBox
+from osbot_utils.testing.Temp_Env_Vars                                      import Temp_Env_Vars
+from mgraph_ai_service_github.config                                        import ENV_VAR__SERVICE__AUTH__SESSION_KEY, ENV_VAR__SERVICE__AUTH__PRIVATE_KEY
+from mgraph_ai_service_github.fast_api.dependencies.GitHub__API__From__Header import GitHub__API__From__Header
+from mgraph_ai_service_github.service.auth.Service__Auth                    import Service__Auth
+from mgraph_ai_service_github.service.auth.Service__Auth__PAT__Cache        import Service__Auth__PAT__Cache
+from mgraph_ai_service_github.service.auth.Service__Auth__Session           import Service__Auth__Session, SESSION_TOKEN__MAGIC, derive_session_key
+from mgraph_ai_service_github.service.encryption.NaCl__Key_Management       import NaCl__Key_Management
+
+
+class test_Service__Auth__Session(TestCase):
+
+    def setUp(self):
+        self.keys    = NaCl__Key_Management().generate_nacl_keys()
+        self.session = Service__Auth__Session(private_key_hex=self.keys.private_key)
+
+    def test__init__(self):
+        key_hex = bytes(SecretBox.KEY_SIZE).hex()
+        with Temp_Env_Vars(env_vars={ENV_VAR__SERVICE__AUTH__SESSION_KEY: key_hex, ENV_VAR__SERVICE__AUTH__PRIVATE_KEY: self.keys.private_key}):
+            assert Service__Auth__Session().session_key_hex == key_hex
+            assert Service__Auth__Session().private_key_hex == self.keys.private_key
+
+    def test_secret_box__provisioned_or_derived(self):                          # every instance sharing the deploy's keys opens every other's tokens
+        token, _ = self.session.create('ghp_session')
+        assert Service__Auth__Session(private_key_hex=self.keys.private_key).open(token) == 'ghp_session'
+        assert derive_session_key(self.keys.private_key)                                    not in (self.keys.private_key, '')
+        key_hex     = bytes(SecretBox.KEY_SIZE).hex()
+        provisioned = Service__Auth__Session(session_key_hex=key_hex, private_key_hex=self.keys.private_key)
+        assert Service__Auth__Session(session_key_hex=key_hex).open(provisioned.create('ghp_session')[0]) == 'ghp_session'   # provisioned key wins over the derived one
+        with pytest.raises(ValueError, match='decryption failed'):
+            provisioned.open(token)
+
+    def test_secret_box__fails_closed(self):                                    # no key material: no tokens (never a per-process key)
+        with Temp_Env_Vars(env_vars={ENV_VAR__SERVICE__AUTH__SESSION_KEY: '', ENV_VAR__SERVICE__AUTH__PRIVATE_KEY: ''}):
+            session = Service__Auth__Session()
+            with pytest.raises(ValueError, match='Session key not configured'):
+                session.create('ghp_session')
+
+    def test_create__open(self):
+        token, expires_at = self.session.create('ghp_session')
+        assert base64.b64decode(token).startswith(SESSION_TOKEN__MAGIC)
+        assert expires_at - int(time.time())          in (self.session.ttl, self.session.ttl - 1)
+        assert self.session.is_session_token(token)  is True
+        assert self.session.open(token)              == 'ghp_session'
+        assert self.session.create('ghp_session')[0] != token                   # random nonce per token
+
+    def test_open__expired(self):
+        session  = Service__Auth__Session(private_key_hex=self.keys.private_key, ttl=-1)
+        token, _ = session.create('ghp_session')
+        with pytest.raises(ValueError, match='Session token expired'):
+            session.open(token)
+
+    def test_open__wrong_key(self):
+        token, _ = self.session.create('ghp_session')
+        other    = Service__Auth__Session(session_key_hex=bytes(SecretBox.KEY_SIZE).hex())
+        with pytest.raises(ValueError, match='decryption failed'):
+            other.open(token)
+
+    def test_open__tampered(self):
+        token, _ = self.session.create('ghp_session')
+        decoded  = bytearray(base64.b64decode(token))
+        decoded[-1] ^= 1
+        with pytest.raises(ValueError, match='decryption failed'):
+            self.session.open(base64.b64encode(bytes(decoded)).decode())
+
+    def test_is_session_token(self):
+        keys         = NaCl__Key_Management().generate_nacl_keys()
+        service_auth = Service__Auth(private_key_hex=keys.private_key, public_key_hex=keys.public_key)
+        assert self.session.is_session_token(service_auth.encrypt_pat('ghp_x')) is False
+        assert self.session.is_session_token('not base64 !!')                   is False
+        assert self.session.is_session_token('')                                is False
+        with pytest.raises(ValueError, match='Not a session token'):
+            self.session.open(service_auth.encrypt_pat('ghp_x'))
+
+
+class test_Service__Auth__Session__GitHub__API__From__Header(TestCase):         # Either form is accepted by the API factory
+
+    @classmethod
+    def setUpClass(cls):
+        keys             = NaCl__Key_Management().generate_nacl_keys()
+        cls.service_auth = Service__Auth(private_key_hex = keys.private_key           ,
+                                         public_key_hex  = keys.public_key            ,
+                                         pat_cache       = Service__Auth__PAT__Cache())
+        cls.api_factory  = GitHub__API__From__Header(service_auth=cls.service_auth)
+
+    def test_session__derived_from_service_key(self):
+        assert self.service_auth.session.private_key_hex == self.service_auth.private_key_hex
+
+    def test_get_api__either_form(self):
+        encrypted_pat = self.service_auth.encrypt_pat('ghp_either_form')
+        session_token = self.service_auth.session_create(encrypted_pat)['session_token']
+        assert self.api_factory.get_api      (encrypted_pat).api_token == 'ghp_either_form'
+        assert self.api_factory.get_api      (session_token).api_token == 'ghp_either_form'
+        assert self.api_factory.get_async_api(session_token).api_token == 'ghp_either_form'
+
+    def test_session_token__skips_sealed_box(self):
+        encrypted_pat = self.service_auth.encrypt_pat('ghp_fast_path')
+        session_token = self.service_auth.session_create(encrypted_pat)['session_token']
+        misses        = self.service_auth.pat_cache.misses
+        for _ in range(3):
+            self.api_factory.get_api(session_token)
+        assert self.service_auth.pat_cache.misses == misses                     # never reaches the PAT cache / SealedBox path
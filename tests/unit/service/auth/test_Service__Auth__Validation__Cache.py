@@ -0,0 +1,77 @@
+import time
+from unittest                                                               import TestCase
+from mgraph_ai_service_github.service.auth.Service__Auth                    import Service__Auth
+from mgraph_ai_service_github.service.auth.Service__Auth__Validation__Cache import Service__Auth__Validation__Cache, service_auth_validation_cache
+
+SUCCESS = dict(success=True , error=None          , user={'login': 'octocat'}, rate_limit={'limit': 5000, 'remaining': 4999})
+FAILURE = dict(success=False, error='Bad credentials', user=None           , rate_limit=None                               )
+
+
+class test_Service__Auth__Validation__Cache(TestCase):
+
+    def setUp(self):
+        self.cache = Service__Auth__Validation__Cache()
+
+    def test__init__(self):
+        with self.cache as _:
+            assert _.stats()                      == dict(entries=0, hits=0, misses=0)
+            assert _.ttl                          > 0
+            assert len(_.cache_key('ghp_token'))  == 32
+            assert _.cache_key('ghp_token')       == _.cache_key('ghp_token')
+            assert _.cache_key('ghp_token')       != Service__Auth__Validation__Cache().cache_key('ghp_token')     # per-process hash key
+            assert Service__Auth().validation_cache is service_auth_validation_cache
+
+    def test_get__put(self):
+        with self.cache as _:
+            assert _.get('ghp_token')             is None
+            assert _.put('ghp_token', SUCCESS)    is SUCCESS
+            cached = _.get('ghp_token')
+            assert cached                         == SUCCESS
+            cached['user']['login'] = 'changed'                                 # callers get copies
+            assert _.get('ghp_token')             == SUCCESS
+            assert _.stats()                      == dict(entries=1, hits=2, misses=1)
+
+    def test_put__failures_not_cached(self):
+        with self.cache as _:
+            _.put('ghp_bad', FAILURE)
+            assert _.get('ghp_bad')               is None
+            assert _.stats()['entries']           == 0
+
+    def test_get_or_validate(self):
+        calls = []
+        def validate(github_pat):
+            calls.append(github_pat)
+            return dict(SUCCESS)
+        assert self.cache.get_or_validate('ghp_token', validate) == SUCCESS
+        assert self.cache.get_or_validate('ghp_token', validate) == SUCCESS
+        assert calls                                             == ['ghp_token']
+
+    def test_get__ttl_expired(self):
+        with Service__Auth__Validation__Cache(ttl=60) as _:
+            _.put('ghp_token', SUCCESS)
+            key = _.cache_key('ghp_token')
+            _._entries[key] = (time.monotonic() - 61, _._entries[key][1])
+            assert _.get('ghp_token')             is None
+            assert _.stats()['entries']           == 0
+
+    def test_ttl_zero__disables_cache(self):
+        with Service__Auth__Validation__Cache(ttl=0) as _:
+            _.put('ghp_token', SUCCESS)
+            assert _.get('ghp_token')             is None
+
+    def test_max_entries__lru(self):
+        with Service__Auth__Validation__Cache(max_entries=2) as _:
+            _.put('a', SUCCESS)
+            _.put('b', SUCCESS)
+            _.get('a')                                                          # 'a' is now the most recently used
+            _.put('c', SUCCESS)
+            assert _.get('b')                     is None
+            assert _.get('a')                     == SUCCESS
+            assert _.get('c')                     == SUCCESS
+
+    def test_clear(self):
+        with self.cache as _:
+            _.put('ghp_token', SUCCESS)
+            _.get('ghp_token')
+            assert _.clear()                      is _
+            assert _.stats()                      == dict(entries=0, hits=0, misses=0)
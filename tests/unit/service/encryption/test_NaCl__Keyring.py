@@ -0,0 +1,82 @@
+import pytest
+from unittest                                                                       import TestCase
+from nacl.exceptions                                                                import CryptoError
+from nacl.public                                                                    import PrivateKey, SealedBox
+from mgraph_ai_service_github.service.encryption.NaCl__Key_Management               import NaCl__Key_Management
+from mgraph_ai_service_github.service.encryption.NaCl__Keyring                      import NaCl__Keyring, key_fingerprint, envelope, envelope_split, parse_private_keys, rotated_previous_private_keys, ENCRYPTION_ENVELOPE__MAGIC, ENCRYPTION_ENVELOPE__HEADER_SIZE
+
+
+class test_NaCl__Keyring(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        nacl_manager  = NaCl__Key_Management()
+        cls.current   = nacl_manager.generate_nacl_keys()
+        cls.previous  = nacl_manager.generate_nacl_keys()
+        cls.keyring   = NaCl__Keyring().add(cls.current.private_key, cls.current.public_key).add_previous(cls.previous.private_key)
+
+    def seal(self, keys, message : bytes) -> bytes:
+        return SealedBox(PrivateKey(bytes.fromhex(keys.private_key)).public_key).encrypt(message)
+
+    def opener(self, calls : list):
+        def open_with(keys, sealed):
+            calls.append(str(keys.public_key))
+            return SealedBox(PrivateKey(bytes.fromhex(keys.private_key))).decrypt(sealed)
+        return open_with
+
+    def test_key_fingerprint(self):
+        fingerprint = key_fingerprint(self.current.public_key)
+        assert len(fingerprint)                          == 4
+        assert fingerprint                               == key_fingerprint(self.current.public_key)
+        assert fingerprint                               != key_fingerprint(self.previous.public_key)
+        assert self.keyring.current                      == fingerprint
+        assert self.keyring.fingerprints()               == [fingerprint.hex(), key_fingerprint(self.previous.public_key).hex()]
+        assert self.keyring.keys_for(fingerprint).json() == self.current.json()
+        assert self.keyring.current_keys().public_key    == self.current.public_key
+        assert self.keyring.keys_for(b'\x00' * 4)        is None
+
+    def test_add_previous__derives_public_key(self):
+        keys = self.keyring.keys_for(key_fingerprint(self.previous.public_key))
+        assert keys.public_key == self.previous.public_key
+
+    def test_envelope_split(self):
+        sealed = self.seal(self.current, b'value')
+        tagged = self.keyring.envelope(sealed)
+        assert tagged[:ENCRYPTION_ENVELOPE__HEADER_SIZE]    == ENCRYPTION_ENVELOPE__MAGIC + self.keyring.current
+        assert envelope_split(tagged)                       == (self.keyring.current, sealed)
+        assert envelope_split(sealed)                       == (None, sealed)
+        assert envelope_split(ENCRYPTION_ENVELOPE__MAGIC + b'1234')  == (None, ENCRYPTION_ENVELOPE__MAGIC + b'1234')      # too short to hold a SealedBox
+
+    def test_open__tagged_uses_one_key(self):                                   # previous-key envelope: no trial decryption with the current key
+        previous_fingerprint = key_fingerprint(self.previous.public_key)
+        tagged               = envelope(previous_fingerprint, self.seal(self.previous, b'old token'))
+        calls                = []
+        assert self.keyring.open(tagged, self.opener(calls)) == b'old token'
+        assert calls                                         == [self.previous.public_key]
+
+    def test_open__untagged_tries_every_key(self):                              # values sealed before envelopes existed still open after a rotation
+        calls = []
+        assert self.keyring.open(self.seal(self.previous, b'legacy'), self.opener(calls)) == b'legacy'
+        assert calls                                                                      == [self.current.public_key, self.previous.public_key]
+
+    def test_open__unknown_key(self):
+        other  = NaCl__Key_Management().generate_nacl_keys()
+        tagged = envelope(key_fingerprint(other.public_key), self.seal(other, b'foreign'))
+        with pytest.raises(CryptoError):
+            self.keyring.open(tagged, self.opener([]))
+        with pytest.raises(CryptoError, match="No keys in keyring"):
+            NaCl__Keyring().open(tagged, self.opener([]))
+        with pytest.raises(ValueError, match="Keyring is empty"):
+            NaCl__Keyring().current_keys()
+
+    def test_parse_private_keys(self):
+        assert parse_private_keys(None      ) == []
+        assert parse_private_keys(''        ) == []
+        assert parse_private_keys(' a, ,b ,') == ['a', 'b']
+
+    def test_rotated_previous_private_keys(self):
+        assert rotated_previous_private_keys(None, None)                         == ''
+        assert rotated_previous_private_keys('k3', ''  )                         == 'k3'
+        assert rotated_previous_private_keys('k3', 'k2,k1')                      == 'k3,k2'          # default keeps two previous keys
+        assert rotated_previous_private_keys('k3', 'k2,k1', max_previous_keys=3) == 'k3,k2,k1'
+        assert rotated_previous_private_keys('k2', 'k2,k1')                      == 'k2,k1'          # redeploy with the same key doesn't duplicate it
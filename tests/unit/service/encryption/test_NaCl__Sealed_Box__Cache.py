@@ -0,0 +1,60 @@
+import pytest
+from unittest                                                               import TestCase
+from nacl.public                                                            import SealedBox
+from mgraph_ai_service_github.service.encryption.NaCl__Key_Management       import NaCl__Key_Management
+from mgraph_ai_service_github.service.encryption.NaCl__Sealed_Box__Cache    import NaCl__Sealed_Box__Cache, nacl_sealed_box_cache
+
+
+class test_NaCl__Sealed_Box__Cache(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.keys = NaCl__Key_Management().generate_nacl_keys()
+
+    def setUp(self):
+        self.cache = NaCl__Sealed_Box__Cache()
+
+    def test__init__(self):
+        with self.cache as _:
+            assert _.stats()                                   == dict(entries=0, hits=0, misses=0, evictions=0)
+            assert nacl_sealed_box_cache.max_entries           > 0
+            assert NaCl__Key_Management().sealed_box_cache     is nacl_sealed_box_cache
+
+    def test_for_public_key__for_private_key(self):
+        with self.cache as _:
+            public_box  = _.for_public_key (self.keys.public_key )
+            private_box = _.for_private_key(self.keys.private_key)
+            assert type(public_box)                             is SealedBox
+            assert _.for_public_key (self.keys.public_key )     is public_box
+            assert _.for_private_key(self.keys.private_key)     is private_box
+            assert private_box.decrypt(public_box.encrypt(b'x')) == b'x'
+            assert _.stats()                                    == dict(entries=2, hits=2, misses=2, evictions=0)
+
+    def test_cache_key__private_key_not_stored(self):
+        kind, digest = self.cache.cache_key('private', self.keys.private_key)
+        assert kind                                     == 'private'
+        assert len(digest)                              == 32
+        assert self.keys.private_key.encode()           not in digest
+
+    def test_invalid_key__not_cached(self):
+        with pytest.raises(ValueError):
+            self.cache.for_public_key('not-hex')
+        assert self.cache.stats()['entries'] == 0
+
+    def test_lru_eviction(self):
+        with NaCl__Sealed_Box__Cache(max_entries=2) as _:
+            keys = [NaCl__Key_Management().generate_nacl_keys() for _ in range(3)]
+            box_0 = _.for_public_key(keys[0].public_key)
+            _.for_public_key(keys[1].public_key)
+            _.for_public_key(keys[0].public_key)                                # key 0 is now most recently used
+            _.for_public_key(keys[2].public_key)
+            assert _.for_public_key(keys[0].public_key) is box_0
+            assert _.stats()['evictions']               == 1
+            assert _.clear().stats()                    == dict(entries=0, hits=0, misses=0, evictions=0)
+
+    def test__nacl_key_management__uses_cache(self):
+        nacl_manager = NaCl__Key_Management(sealed_box_cache=self.cache)
+        for index in range(5):
+            encrypted = nacl_manager.encrypt_string(f'secret-{index}', self.keys.public_key)
+            assert nacl_manager.decrypt_string(encrypted, self.keys.private_key) == f'secret-{index}'
+        assert self.cache.stats() == dict(entries=2, hits=8, misses=2, evictions=0)
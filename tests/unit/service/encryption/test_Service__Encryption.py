@@ -1,11 +1,13 @@
 import base64
 import json
 from unittest                                                                                   import TestCase
+from nacl.exceptions                                                                            import CryptoError
 from osbot_utils.type_safe.primitives.domains.cryptography.safe_str.Safe_Str__NaCl__Private_Key import Safe_Str__NaCl__Private_Key
 from osbot_utils.type_safe.primitives.domains.cryptography.safe_str.Safe_Str__NaCl__Public_Key  import Safe_Str__NaCl__Public_Key
 from osbot_utils.type_safe.primitives.domains.cryptography.schemas.Schema__NaCl__Keys           import Schema__NaCl__Keys
 from mgraph_ai_service_github.service.encryption.NaCl__Key_Management                           import NaCl__Key_Management
 from mgraph_ai_service_github.service.encryption.Service__Encryption                            import Service__Encryption
+from mgraph_ai_service_github.service.encryption.NaCl__Keyring                                  import ENCRYPTION_ENVELOPE__MAGIC, ENCRYPTION_ENVELOPE__HEADER_SIZE, key_fingerprint, rotated_previous_private_keys
 from mgraph_ai_service_github.schemas.encryption.Const__Encryption                              import NCCL__ALGORITHM
 from mgraph_ai_service_github.schemas.encryption.Enum__Encryption_Type                          import Enum__Encryption_Type
 from mgraph_ai_service_github.schemas.encryption.Safe_Str__Decrypted_Value                      import Safe_Str__Decrypted_Value
@@ -73,6 +75,7 @@ class test_Service__Encryption(TestCase):
             assert type(response)            is Schema__Public_Key__Response
             assert type(response.public_key) is Safe_Str__NaCl__Public_Key
             assert response.public_key       == self.test_public_key_hex
+            assert response.key_id           == key_fingerprint(self.test_public_key_hex).hex()
             assert response.algorithm        == NCCL__ALGORITHM
             assert response.timestamp        is not None
 
@@ -361,6 +364,47 @@ class test_Service__Encryption(TestCase):
                 decrypted = _.decrypt_text(encrypted.encrypted)
                 assert decrypted.decrypted == test_string
 
+    def test_encrypt_raw__decrypt_raw(self):                                    # raw bytes round trip (no base64 either way)
+        with self.service_encryption as _:
+            encrypted = _.encrypt_raw(memoryview(self.test_binary))
+            assert type(encrypted)                    is memoryview
+            assert bytes(_.decrypt_raw(encrypted))    == self.test_binary
+            assert _.decrypt_data(base64.b64encode(encrypted).decode()).decrypted == self.test_data_b64     # same format as the base64 routes
+
+    def test_encrypt__envelope(self):                                           # output is tagged with the fingerprint of the key it was sealed to
+        with self.service_encryption as _:
+            encrypted = base64.b64decode(str(_.encrypt_text(self.test_text).encrypted))
+            assert encrypted[:ENCRYPTION_ENVELOPE__HEADER_SIZE] == ENCRYPTION_ENVELOPE__MAGIC + key_fingerprint(self.test_public_key_hex)
+
+    def test_decrypt__after_key_rotation(self):                                 # values sealed to the previous key (tagged or not) still decrypt
+        new_keys    = NaCl__Key_Management().generate_nacl_keys()
+        rotated     = Service__Encryption(private_key_hex       = new_keys.private_key      ,
+                                          public_key_hex        = new_keys.public_key       ,
+                                          previous_private_keys = self.test_private_key_hex )
+        tagged      = self.service_encryption.encrypt_text(self.test_text).encrypted
+        untagged    = self.service_encryption.nacl_manager.encrypt_with_public_key_base64(b'legacy', self.test_public_key_hex)
+        assert rotated.keyring().fingerprints()           == [key_fingerprint(new_keys.public_key).hex(), key_fingerprint(self.test_public_key_hex).hex()]
+        assert rotated.decrypt_text(tagged  ).decrypted   == self.test_text
+        assert rotated.decrypt_text(untagged).decrypted   == 'legacy'
+        assert rotated.validate(Schema__Decryption__Validate__Request(encrypted       = tagged                     ,
+                                                                      encryption_type = Enum__Encryption_Type.TEXT )).can_decrypt is True
+
+        not_rotated = Service__Encryption(private_key_hex=new_keys.private_key, public_key_hex=new_keys.public_key, previous_private_keys='')
+        assert not_rotated.decrypt_text(tagged).success   is False
+
+    def test_decrypt_raw__after_key_rotation(self):                             # raw output carries the same envelope, so it survives a deploy's key rotation
+        encrypted = self.service_encryption.encrypt_raw(memoryview(self.test_binary))
+        untagged  = self.service_encryption.nacl_manager.encrypt_with_public_key(b'legacy', self.test_public_key_hex)
+        new_keys  = NaCl__Key_Management().generate_nacl_keys()
+        rotated   = Service__Encryption(private_key_hex       = new_keys.private_key                                              ,
+                                        public_key_hex        = new_keys.public_key                                               ,
+                                        previous_private_keys = rotated_previous_private_keys(self.test_private_key_hex, ''))
+        assert bytes(encrypted[:ENCRYPTION_ENVELOPE__HEADER_SIZE]) == ENCRYPTION_ENVELOPE__MAGIC + key_fingerprint(self.test_public_key_hex)
+        assert bytes(rotated.decrypt_raw(encrypted))               == self.test_binary
+        assert bytes(rotated.decrypt_raw(untagged ))               == b'legacy'
+        with self.assertRaises(CryptoError):                                    # the old key can't open values sealed to the new one
+            self.service_encryption.decrypt_raw(rotated.encrypt_raw(memoryview(b'new')))
+
     def test_performance__validate_timing(self):
         with self.service_encryption as _:
             # Create encrypted data
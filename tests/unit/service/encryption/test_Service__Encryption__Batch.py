@@ -0,0 +1,112 @@
+import base64
+from unittest                                                                           import TestCase
+from mgraph_ai_service_github.config                                                    import ENCRYPTION__BATCH__MAX_ITEMS, ENCRYPTION__BATCH__PROCESS_POOL_THRESHOLD
+from mgraph_ai_service_github.schemas.base.Enum__HTTP__Status                           import Enum__HTTP__Status
+from mgraph_ai_service_github.schemas.encryption.Enum__Encryption_Type                  import Enum__Encryption_Type
+from mgraph_ai_service_github.schemas.encryption.Safe_Str__Decrypted_Value              import Safe_Str__Decrypted_Value
+from mgraph_ai_service_github.schemas.encryption.Schema__Decryption__Batch__Request     import Schema__Decryption__Batch__Request
+from mgraph_ai_service_github.schemas.encryption.Schema__Decryption__Request            import Schema__Decryption__Request
+from mgraph_ai_service_github.schemas.encryption.Schema__Encryption__Batch__Request     import Schema__Encryption__Batch__Request
+from mgraph_ai_service_github.schemas.encryption.Schema__Encryption__Request            import Schema__Encryption__Request
+from mgraph_ai_service_github.service.encryption.NaCl__Key_Management                   import NaCl__Key_Management
+from mgraph_ai_service_github.service.encryption.Service__Encryption                    import Service__Encryption
+from mgraph_ai_service_github.service.encryption                                         import Service__Encryption__Batch as batch_module
+from mgraph_ai_service_github.service.encryption.Service__Encryption__Batch             import Service__Encryption__Batch, BATCH__OPERATION__ENCRYPT, run_batch_chunk, run_batch_item, shutdown_encryption_batch_process_pool
+
+
+class test_Service__Encryption__Batch(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.nacl_keys          = NaCl__Key_Management().generate_nacl_keys()
+        cls.service_encryption = Service__Encryption(private_key_hex = cls.nacl_keys.private_key ,
+                                                     public_key_hex  = cls.nacl_keys.public_key  )
+        cls.batch              = Service__Encryption__Batch(service_encryption = cls.service_encryption)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutdown_encryption_batch_process_pool()
+
+    def encrypt_request(self, values, encryption_type=Enum__Encryption_Type.TEXT):
+        return Schema__Encryption__Batch__Request(items=[Schema__Encryption__Request(value=Safe_Str__Decrypted_Value(value), encryption_type=encryption_type)
+                                                         for value in values])
+
+    def decrypt_request(self, encrypted_values, encryption_type=Enum__Encryption_Type.TEXT):
+        return Schema__Decryption__Batch__Request(items=[Schema__Decryption__Request(encrypted=encrypted, encryption_type=encryption_type)
+                                                         for encrypted in encrypted_values])
+
+    def test__init__(self):
+        with self.batch as _:
+            assert _.max_items              == ENCRYPTION__BATCH__MAX_ITEMS
+            assert _.process_pool_threshold == ENCRYPTION__BATCH__PROCESS_POOL_THRESHOLD
+            assert _.use_process_pool(ENCRYPTION__BATCH__PROCESS_POOL_THRESHOLD    ) is True
+            assert _.use_process_pool(ENCRYPTION__BATCH__PROCESS_POOL_THRESHOLD - 1) is False
+
+    def test_encrypt_batch__decrypt_batch(self):
+        values   = [f'secret-{index}' for index in range(10)]
+        response = self.batch.encrypt_batch(self.encrypt_request(values))
+        assert response.success                        is True
+        assert (response.succeeded, response.failed)   == (10, 0)
+        assert [result.index for result in response.results] == list(range(10))
+
+        response = self.batch.decrypt_batch(self.decrypt_request([result.encrypted for result in response.results]))
+        assert response.success                        is True
+        assert [result.decrypted for result in response.results] == values
+
+    def test_decrypt_batch__per_item_errors(self):
+        encrypted = self.service_encryption.encrypt_text('plain text').encrypted
+        foreign   = base64.b64encode(b'x' * 64).decode()                        # valid base64, not a sealed box for our key
+        response  = self.batch.decrypt_batch(self.decrypt_request([encrypted, foreign, encrypted]))
+        assert [result.success for result in response.results] == [True, False, True]
+        assert response.results[1].error                       is not None
+        assert response.results[1].decrypted                   is None
+        assert (response.succeeded, response.failed)           == (2, 1)
+
+    def test_encrypt_batch__too_many_items(self):
+        batch    = Service__Encryption__Batch(service_encryption=self.service_encryption, max_items=2)
+        response = batch.encrypt_batch(self.encrypt_request(['a', 'b', 'c']))
+        assert response.success     is False
+        assert response.results     == []
+        assert 'Too many items'     in response.error
+        assert response.status_code == Enum__HTTP__Status.BAD_REQUEST_400
+
+    def test_encrypt_batch__too_large(self):                                    # total value size is bounded as well as the item count
+        batch    = Service__Encryption__Batch(service_encryption=self.service_encryption, max_bytes=10)
+        response = batch.encrypt_batch(self.encrypt_request(['12345', '123456']))
+        assert response.success     is False
+        assert response.results     == []
+        assert 'Batch too large'    in response.error
+        assert response.status_code == Enum__HTTP__Status.PAYLOAD_TOO_LARGE_413
+        assert batch.encrypt_batch(self.encrypt_request(['12345', '12345'])).status_code == Enum__HTTP__Status.OK_200
+
+    def test_encrypt_batch__keys_not_configured(self):
+        batch    = Service__Encryption__Batch(service_encryption=Service__Encryption(private_key_hex='', public_key_hex=''))
+        batch.service_encryption.private_key_hex = ''                          # '' falls back to the env var in __init__
+        response = batch.encrypt_batch(self.encrypt_request(['a']))
+        assert response.success     is False
+        assert response.results     == []
+        assert 'not configured'     in response.error
+        assert response.status_code == Enum__HTTP__Status.SERVER_ERROR_500
+
+    def test_run_batch_item(self):
+        encrypted, error = run_batch_item(self.service_encryption, BATCH__OPERATION__ENCRYPT, 'text', 'abc')
+        assert error                                                  is None
+        assert self.service_encryption.decrypt_text(encrypted).decrypted == 'abc'
+        assert run_batch_item(self.service_encryption, BATCH__OPERATION__ENCRYPT, 'json', '{bad')[0] is None
+        assert run_batch_item(self.service_encryption, BATCH__OPERATION__ENCRYPT, 'text', None   ) == (None, 'Missing value to encrypt')
+
+    def test_run_batch_chunk(self):                                             # what each worker process runs
+        results = run_batch_chunk(self.nacl_keys.private_key, self.nacl_keys.public_key, BATCH__OPERATION__ENCRYPT, [('text', 'a'), ('json', '{bad')])
+        assert results[0][1] is None
+        assert results[1][0] is None
+
+    def test_encrypt_batch__process_pool(self):                                 # large batches fan out across worker processes, order is preserved
+        batch    = Service__Encryption__Batch(service_encryption=self.service_encryption, process_pool_threshold=4, max_workers=2)
+        values   = [f'pooled-{index}' for index in range(9)]
+        assert batch.use_process_pool(len(values)) is True
+        response = batch.encrypt_batch(self.encrypt_request(values))
+        assert response.success          is True
+        assert batch_module._process_pool is not None                          # ran in the pool (not the in-process fallback)
+        response = batch.decrypt_batch(self.decrypt_request([result.encrypted for result in response.results]))
+        assert response.success is True
+        assert [result.decrypted for result in response.results] == values
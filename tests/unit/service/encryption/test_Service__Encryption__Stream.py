@@ -0,0 +1,116 @@
+import asyncio
+import os
+import pytest
+from unittest                                                                       import TestCase
+from nacl.exceptions                                                                import CryptoError
+from mgraph_ai_service_github.config                                                import ENCRYPTION__STREAM__CHUNK_SIZE
+from mgraph_ai_service_github.service.encryption.NaCl__Key_Management               import NaCl__Key_Management
+from mgraph_ai_service_github.service.encryption.NaCl__Keyring                      import ENCRYPTION_ENVELOPE__MAGIC, key_fingerprint, rotated_previous_private_keys
+from mgraph_ai_service_github.service.encryption.Service__Encryption                import Service__Encryption
+from mgraph_ai_service_github.service.encryption.Service__Encryption__Stream        import Service__Encryption__Stream, ENCRYPTION_STREAM__MAGIC, ENCRYPTION_STREAM__HEADER_SIZE, ENCRYPTION_STREAM__CHUNK_LENGTH, STREAM__ABYTES
+
+CHUNK_SIZE = 1024
+
+
+def split(data : bytes, size : int):                                            # simulate arbitrary network chunk boundaries
+    return [data[index:index + size] for index in range(0, len(data), size)]
+
+
+class test_Service__Encryption__Stream(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        nacl_keys              = NaCl__Key_Management().generate_nacl_keys()
+        cls.service_encryption = Service__Encryption(private_key_hex = nacl_keys.private_key ,
+                                                     public_key_hex  = nacl_keys.public_key  )
+        cls.stream             = Service__Encryption__Stream(service_encryption=cls.service_encryption, chunk_size=CHUNK_SIZE)
+
+    def encrypt(self, data : bytes, size : int = 777) -> bytes:
+        return b''.join(self.stream.encrypt(split(data, size)))
+
+    def decrypt(self, data : bytes, size : int = 333) -> bytes:
+        return b''.join(self.stream.decrypt(split(data, size)))
+
+    def test__init__(self):
+        with Service__Encryption__Stream() as _:
+            assert _.chunk_size == ENCRYPTION__STREAM__CHUNK_SIZE
+
+    def test_encrypt__decrypt(self):
+        for size in [0, 1, CHUNK_SIZE - 1, CHUNK_SIZE, CHUNK_SIZE + 1, CHUNK_SIZE * 5 + 7]:
+            data      = os.urandom(size)
+            encrypted = self.encrypt(data)
+            chunks    = max(1, -(-size // CHUNK_SIZE))                          # the FINAL chunk is never empty unless the payload is
+            assert encrypted.startswith(ENCRYPTION_STREAM__MAGIC)
+            assert len(encrypted) == ENCRYPTION_STREAM__HEADER_SIZE + size + chunks * (ENCRYPTION_STREAM__CHUNK_LENGTH.size + STREAM__ABYTES)
+            assert self.decrypt(encrypted) == data
+
+    def test_encrypt__constant_memory(self):                                    # output is emitted as input arrives, never more than a chunk is held back
+        encryptor = self.stream.encryptor()
+        outputs   = [encryptor.update(b'x' * CHUNK_SIZE) for _ in range(10)]
+        assert outputs[0].startswith(ENCRYPTION_STREAM__MAGIC)
+        assert all(len(output) > 0 for output in outputs[1:])
+        assert len(encryptor._buffer) == CHUNK_SIZE
+        assert len(encryptor.finalize()) == ENCRYPTION_STREAM__CHUNK_LENGTH.size + CHUNK_SIZE + STREAM__ABYTES
+        with pytest.raises(ValueError, match="already finalized"):
+            encryptor.finalize()
+
+    def test_decrypt__each_stream_uses_a_new_key(self):
+        assert self.encrypt(b'same') != self.encrypt(b'same')
+
+    def test_decrypt__truncated(self):
+        encrypted = self.encrypt(os.urandom(CHUNK_SIZE * 3))
+        with pytest.raises(CryptoError, match="truncated"):
+            self.decrypt(encrypted[:-1])
+        with pytest.raises(CryptoError, match="truncated"):                     # whole chunks dropped (FINAL never seen)
+            self.decrypt(encrypted[:ENCRYPTION_STREAM__HEADER_SIZE + ENCRYPTION_STREAM__CHUNK_LENGTH.size + CHUNK_SIZE + STREAM__ABYTES])
+        with pytest.raises(CryptoError, match="too short"):
+            self.decrypt(encrypted[:10])
+
+    def test_decrypt__tampered(self):
+        encrypted      = bytearray(self.encrypt(os.urandom(CHUNK_SIZE * 2)))
+        encrypted[-5] ^= 0x01
+        with pytest.raises(CryptoError):
+            self.decrypt(bytes(encrypted))
+        with pytest.raises(CryptoError, match="Not an encrypted stream"):
+            self.decrypt(b'x' * ENCRYPTION_STREAM__HEADER_SIZE)
+        with pytest.raises(CryptoError, match="after the final chunk"):
+            self.decrypt(self.encrypt(b'data') + self.encrypt(b'more'))
+
+    def test_decrypt__other_key(self):
+        nacl_keys = NaCl__Key_Management().generate_nacl_keys()
+        other     = Service__Encryption__Stream(service_encryption=Service__Encryption(private_key_hex=nacl_keys.private_key, public_key_hex=nacl_keys.public_key))
+        with pytest.raises(CryptoError):
+            b''.join(other.decrypt([self.encrypt(b'secret')]))
+
+    def test_decrypt__after_key_rotation(self):                                 # the sealed stream key is tagged with its key's fingerprint, so old streams survive a deploy
+        data      = os.urandom(CHUNK_SIZE * 2 + 5)
+        encrypted = self.encrypt(data)
+        old_keys  = self.service_encryption.keyring().current_keys()
+        new_keys  = NaCl__Key_Management().generate_nacl_keys()
+        rotated   = Service__Encryption(private_key_hex       = new_keys.private_key                                        ,
+                                        public_key_hex        = new_keys.public_key                                         ,
+                                        previous_private_keys = rotated_previous_private_keys(old_keys.private_key, ''))
+        stream    = Service__Encryption__Stream(service_encryption=rotated, chunk_size=CHUNK_SIZE)
+        start     = len(ENCRYPTION_STREAM__MAGIC)
+        assert encrypted[start:start + len(ENCRYPTION_ENVELOPE__MAGIC) + 4]     == ENCRYPTION_ENVELOPE__MAGIC + key_fingerprint(old_keys.public_key)
+        assert b''.join(stream.decrypt(split(encrypted, 333)))                   == data
+        with pytest.raises(CryptoError):                                        # the old key can't open streams sealed to the new one
+            self.decrypt(b''.join(stream.encrypt([data])))
+
+    def test_encrypt_async__decrypt_async(self):
+        async def source(chunks):
+            for chunk in chunks:
+                yield chunk
+
+        async def collect(chunks):
+            return b''.join([chunk async for chunk in chunks])
+
+        data = os.urandom(CHUNK_SIZE * 4 + 3)
+        loop = asyncio.new_event_loop()
+        try:
+            encrypted = loop.run_until_complete(collect(self.stream.encrypt_async(source(split(data, 500)))))
+            decrypted = loop.run_until_complete(collect(self.stream.decrypt_async(source(split(encrypted, 300)))))
+        finally:
+            loop.close()
+        assert decrypted               == data
+        assert self.decrypt(encrypted) == data                                  # same format as the sync path
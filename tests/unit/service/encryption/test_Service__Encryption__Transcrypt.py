@@ -0,0 +1,113 @@
+import base64
+import pytest
+from unittest                                                                               import TestCase
+from nacl.exceptions                                                                        import CryptoError
+from mgraph_ai_service_github.config                                                        import ENCRYPTION__TRANSCRYPT__MAX_ITEMS
+from mgraph_ai_service_github.schemas.encryption.Safe_Str__Encrypted_Value                  import Safe_Str__Encrypted_Value
+from mgraph_ai_service_github.schemas.encryption.Schema__Encryption__Transcrypt__Request    import Schema__Encryption__Transcrypt__Request
+from mgraph_ai_service_github.service.encryption.NaCl__Key_Management                       import NaCl__Key_Management
+from mgraph_ai_service_github.service.encryption.Service__Encryption                        import Service__Encryption
+from mgraph_ai_service_github.service.encryption.Service__Encryption__Transcrypt            import Service__Encryption__Transcrypt, transcrypt_buffer, TRANSCRYPT__BUFFER_SIZE
+from mgraph_ai_service_github.service.github.GitHub__API                                    import GitHub__API
+from mgraph_ai_service_github.service.github.cache.GitHub__Public_Key__Cache                import github_public_key_cache
+from mgraph_ai_service_github.surrogates.github.testing.GitHub__API__Surrogate__Test_Context import GitHub__API__Surrogate__Test_Context
+
+
+class test_Service__Encryption__Transcrypt(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.context            = GitHub__API__Surrogate__Test_Context().setup()
+        cls.context.add_repo('test-owner', 'test-repo')
+        cls.context.add_environment('test-owner', 'test-repo', 'production')
+        cls.context.add_org('test-org')
+        cls.keys               = cls.context.surrogate.keys
+        cls.github_api         = GitHub__API(api_token=cls.context.admin_pat())
+        nacl_keys              = NaCl__Key_Management().generate_nacl_keys()
+        cls.service_encryption = Service__Encryption(private_key_hex = nacl_keys.private_key ,
+                                                     public_key_hex  = nacl_keys.public_key  )
+        cls.transcrypt         = Service__Encryption__Transcrypt(service_encryption=cls.service_encryption)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.context.teardown()
+
+    def encrypted(self, value : str) -> Safe_Str__Encrypted_Value:
+        return Safe_Str__Encrypted_Value(str(self.service_encryption.encrypt_text(value).encrypted))
+
+    def test__init__(self):
+        with self.transcrypt as _:
+            assert _.public_key_cache is github_public_key_cache
+            assert _.max_items        == ENCRYPTION__TRANSCRYPT__MAX_ITEMS
+
+    def test_scope(self):
+        with self.transcrypt as _:
+            assert _.scope(owner='o', repo='r'                  ) == ('repo:o/r'       , '/repos/o/r/actions/secrets/public-key'              )
+            assert _.scope(owner='o', repo='r', environment='e' ) == ('env:o/r/e'      , '/repos/o/r/environments/e/secrets/public-key'       )
+            assert _.scope(org='my-org'                         ) == ('org:my-org'     , '/orgs/my-org/actions/secrets/public-key'            )
+            for kwargs in [dict(), dict(owner='o'), dict(org='x', owner='o', repo='r'), dict(environment='e')]:
+                with pytest.raises(ValueError, match="Transcrypt needs"):
+                    _.scope(**kwargs)
+
+    def test_transcrypt(self):                                                  # output opens with the scope's private key, the buffer is wiped afterwards
+        scope, endpoint = self.transcrypt.scope(owner='test-owner', repo='test-repo')
+        entry           = self.transcrypt.scope_public_key(self.github_api, scope, endpoint)
+        github_value    = self.transcrypt.transcrypt(self.encrypted('my-secret-value'), entry)
+        assert self.keys.decrypt_secret(scope, github_value) == 'my-secret-value'
+        assert transcrypt_buffer()                           == bytearray(TRANSCRYPT__BUFFER_SIZE)
+
+    def test_transcrypt__wipes_buffer_on_error(self):
+        scope, endpoint = self.transcrypt.scope(org='test-org')
+        entry           = self.transcrypt.scope_public_key(self.github_api, scope, endpoint)
+        with pytest.raises(ValueError, match="Invalid public key"):
+            bad_entry = type(entry)(key_id=entry.key_id, public_key=b'short')
+            self.transcrypt.transcrypt(self.encrypted('leaky'), bad_entry)      # fails after the plaintext was decrypted into the buffer
+        assert transcrypt_buffer() == bytearray(TRANSCRYPT__BUFFER_SIZE)
+        with pytest.raises(CryptoError):
+            self.transcrypt.transcrypt(Safe_Str__Encrypted_Value(base64.b64encode(b'x' * 64).decode()), entry)
+
+    def test_transcrypt_request(self):
+        values   = ['one', 'two', 'three']
+        request  = Schema__Encryption__Transcrypt__Request(encrypted_pat    = self.encrypted('unused')                   ,
+                                                           owner            = 'test-owner'                               ,
+                                                           repo             = 'test-repo'                                ,
+                                                           environment      = 'production'                               ,
+                                                           encrypted_values = [self.encrypted(value) for value in values])
+        response = self.transcrypt.transcrypt_request(self.github_api, request)
+        scope    = 'env:test-owner/test-repo/production'
+        assert response.success                      is True
+        assert response.scope                        == scope
+        assert response.key_id                       == self.keys.get_key_id(scope)
+        assert (response.succeeded, response.failed) == (3, 0)
+        assert [self.keys.decrypt_secret(scope, str(result.encrypted_value)) for result in response.results] == values
+        assert {str(result.key_id) for result in response.results}                                           == {str(response.key_id)}
+
+    def test_transcrypt_request__per_item_errors(self):
+        foreign  = Safe_Str__Encrypted_Value(base64.b64encode(b'x' * 64).decode())       # valid base64, not sealed to the service key
+        request  = Schema__Encryption__Transcrypt__Request(encrypted_pat    = self.encrypted('unused')                      ,
+                                                           org              = 'test-org'                                    ,
+                                                           encrypted_values = [self.encrypted('a'), foreign, self.encrypted('b')])
+        response = self.transcrypt.transcrypt_request(self.github_api, request)
+        assert [result.success for result in response.results] == [True, False, True]
+        assert response.results[1].encrypted_value             is None
+        assert response.results[1].error                       is not None
+        assert (response.succeeded, response.failed)           == (2, 1)
+        assert response.success                                is False
+
+    def test_transcrypt_request__public_key_is_cached(self):
+        request = Schema__Encryption__Transcrypt__Request(encrypted_pat    = self.encrypted('unused'),
+                                                          owner            = 'test-owner'            ,
+                                                          repo             = 'test-repo'             ,
+                                                          encrypted_values = [self.encrypted('a')]   )
+        self.transcrypt.transcrypt_request(self.github_api, request)
+        hits = github_public_key_cache.hits
+        self.transcrypt.transcrypt_request(self.github_api, request)
+        assert github_public_key_cache.hits == hits + 1
+
+    def test_transcrypt_request__too_many_values(self):
+        transcrypt = Service__Encryption__Transcrypt(service_encryption=self.service_encryption, max_items=1)
+        request    = Schema__Encryption__Transcrypt__Request(encrypted_pat    = self.encrypted('unused')                 ,
+                                                             org              = 'test-org'                               ,
+                                                             encrypted_values = [self.encrypted('a'), self.encrypted('b')])
+        with pytest.raises(ValueError, match="Too many values"):
+            transcrypt.transcrypt_request(self.github_api, request)
@@ -0,0 +1,129 @@
+import json
+from unittest                                                                              import TestCase
+from mgraph_ai_service_github.service.github.GitHub__API                                   import GitHub__API
+from mgraph_ai_service_github.service.github.cache.GitHub__API__Response_Cache             import GitHub__API__Response_Cache, github_api_response_cache
+from mgraph_ai_service_github.service.github.session.Requests__Session                     import Requests__Session
+from mgraph_ai_service_github.service.github.session.Requests__Session__Response           import Requests__Session__Response
+from mgraph_ai_service_github.service.github.session.Requests__Session__Response__Cached   import Requests__Session__Response__Cached
+from mgraph_ai_service_github.surrogates.github.testing.GitHub__API__Surrogate__Test_Context import GitHub__API__Surrogate__Test_Context
+
+
+class Fake__ETag__Response(Requests__Session__Response):
+    body         : bytes = b''
+    page_headers : dict
+
+    def json(self):
+        return json.loads(self.body)
+
+    def raise_for_status(self):
+        pass
+
+    @property
+    def content(self):
+        return self.body
+
+    @property
+    def headers(self):
+        return self.page_headers
+
+
+class Fake__ETag__Session(Requests__Session):                                   # Returns 304 when If-None-Match matches the current etag of the url
+    bodies : dict                                                               # url -> json body
+    calls  : list
+
+    def get(self, url, **kwargs):
+        full_url = url + (f"?per_page={kwargs['params']['per_page']}" if kwargs.get('params') else '')
+        headers  = kwargs.get('headers') or {}
+        body     = json.dumps(self.bodies[full_url]).encode()
+        etag     = f'"{hash(body)}"'
+        self.calls.append((full_url, headers.get('If-None-Match')))
+        if headers.get('If-None-Match') == etag:
+            return Fake__ETag__Response(status_code=304, page_headers={'X-RateLimit-Limit': '5000'})
+        return Fake__ETag__Response(status_code=200, body=body, page_headers={'ETag': etag, 'Link': '<https://x>; rel="last"'})
+
+
+class test_GitHub__API__Response_Cache(TestCase):
+
+    def setUp(self):
+        self.cache      = GitHub__API__Response_Cache()
+        self.session    = Fake__ETag__Session(bodies={'https://api.github.com/user': {'login': 'octocat'}})
+        self.github_api = GitHub__API(api_token='token-etag', response_cache=self.cache)
+        self.github_api.session = lambda: self.session
+
+    def test__init__(self):
+        with self.cache as _:
+            assert _.stats() == dict(entries=0, max_entries=1024, hits=0, misses=0, stores=0, evictions=0, expirations=0)
+        assert GitHub__API(api_token='abc').response_cache is github_api_response_cache          # shared by default
+        assert GitHub__API(api_token='abc', response_cache=None).response_cache is None          # opt-out
+
+    def test_get__revalidates_with_etag(self):
+        assert self.github_api.get('/user') == {'login': 'octocat'}
+        etag = self.session.calls[0]
+        assert etag == ('https://api.github.com/user', None)
+
+        user = self.github_api.get('/user')                                     # 304 -> cached body
+        assert user                     == {'login': 'octocat'}
+        assert self.session.calls[1][1] is not None                             # If-None-Match sent
+        assert self.cache.stats()       == dict(entries=1, max_entries=1024, hits=1, misses=1, stores=1, evictions=0, expirations=0)
+
+        user['login'] = 'changed'                                               # callers get a fresh copy each time
+        assert self.github_api.get('/user') == {'login': 'octocat'}
+
+        self.session.bodies['https://api.github.com/user'] = {'login': 'renamed'}
+        assert self.github_api.get('/user') == {'login': 'renamed'}             # etag no longer matches -> 200 and re-store
+        assert self.cache.stores            == 2
+
+    def test_get__per_token(self):
+        self.github_api.get('/user')
+        other = GitHub__API(api_token='token-other', response_cache=self.cache)
+        other.session = lambda: self.session
+        other.get('/user')
+        assert self.session.calls[1] == ('https://api.github.com/user', None)   # no validator reused across tokens
+        assert self.cache.stats()['entries'] == 2
+
+    def test_conditional_get__cached_response(self):
+        self.github_api.get('/user')
+        response = self.github_api.conditional_get('https://api.github.com/user')
+        assert type(response)        is Requests__Session__Response__Cached
+        assert response.status_code  == 200
+        assert response.headers      == {'Link': '<https://x>; rel="last"'}       # Link replayed so pagination keeps working
+
+    def test_paginate__uses_cache(self):
+        self.session.bodies['https://api.github.com/repos/o/r/actions/secrets?per_page=100'] = {'secrets': [{'name': 'A'}]}
+        assert list(self.github_api.paginate('/repos/o/r/actions/secrets', items_key='secrets')) == [{'name': 'A'}]
+        assert list(self.github_api.paginate('/repos/o/r/actions/secrets', items_key='secrets')) == [{'name': 'A'}]
+        assert self.cache.hits == 1
+
+    def test_store__lru_eviction(self):
+        cache = GitHub__API__Response_Cache(max_entries=2)
+        for index in range(3):
+            cache.store('t', f'/url-{index}', Fake__ETag__Response(status_code=200, body=b'{}', page_headers={'ETag': f'"{index}"'}))
+        assert cache.evictions          == 1
+        assert cache.lookup('t', '/url-0') is None                              # oldest evicted
+        assert cache.lookup('t', '/url-1') is not None
+        cache.store('t', '/url-3', Fake__ETag__Response(status_code=200, body=b'{}', page_headers={'ETag': '"3"'}))
+        assert cache.lookup('t', '/url-1') is not None                          # recently used survives
+        assert cache.lookup('t', '/url-2') is None
+
+    def test_store__requires_validator(self):
+        assert self.cache.store('t', '/no-etag', Fake__ETag__Response(status_code=200, body=b'{}')) is None
+        entry = self.cache.store('t', '/last-modified', Fake__ETag__Response(status_code=200, body=b'{}', page_headers={'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'}))
+        assert self.cache.conditional_headers(entry) == {'If-Modified-Since': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+
+    def test_lookup__ttl_expiry(self):
+        cache = GitHub__API__Response_Cache(ttl=-1)
+        cache.store('t', '/url', Fake__ETag__Response(status_code=200, body=b'{}', page_headers={'ETag': '"1"'}))
+        assert cache.lookup('t', '/url') is None
+        assert cache.expirations         == 1
+        assert cache.stats()['entries']  == 0
+
+    def test_clear(self):
+        self.github_api.get('/user')
+        assert self.cache.clear().stats() == dict(entries=0, max_entries=1024, hits=0, misses=0, stores=0, evictions=0, expirations=0)
+
+    def test_clear__by_surrogate_test_context(self):                           # Entries from one surrogate (or real GitHub) never answer another's conditional GETs
+        github_api_response_cache.store('t', '/stale', Fake__ETag__Response(status_code=200, body=b'{}', page_headers={'ETag': '"1"'}))
+        with GitHub__API__Surrogate__Test_Context():
+            assert github_api_response_cache.stats()['entries'] == 0
+            github_api_response_cache.store('t', '/stale', Fake__ETag__Response(status_code=200, body=b'{}', page_headers={'ETag': '"1"'}))
+        assert github_api_response_cache.stats()['entries']     == 0
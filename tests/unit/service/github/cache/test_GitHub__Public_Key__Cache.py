@@ -0,0 +1,167 @@
+import base64
+import time
+import pytest
+import requests
+from unittest                                                                               import TestCase
+from nacl.public                                                                            import PrivateKey, SealedBox
+from mgraph_ai_service_github.service.github.GitHub__API                                    import GitHub__API
+from mgraph_ai_service_github.service.github.GitHub__Secrets                                import GitHub__Secrets
+from mgraph_ai_service_github.service.github.cache.GitHub__Public_Key__Cache                import GitHub__Public_Key__Cache, GitHub__Public_Key__Cache__Entry, github_public_key_cache
+from mgraph_ai_service_github.surrogates.github.testing.GitHub__API__Surrogate__Test_Context import GitHub__API__Surrogate__Test_Context
+
+API_URL = 'https://api.github.com'
+
+
+def new_key_pair(key_id: str):                                                  # (private_key, {key_id, key}) as GitHub returns it
+    private_key = PrivateKey.generate()
+    return private_key, {'key_id': key_id, 'key': base64.b64encode(bytes(private_key.public_key)).decode()}
+
+
+class Fake__Rotating__API(GitHub__API):                                         # Rejects writes with a stale key_id (422) like GitHub does after a key rotation
+    current_key : dict
+    gets        : list
+    puts        : list
+
+    def get(self, endpoint, params=None):
+        self.gets.append(endpoint)
+        return dict(self.current_key)
+
+    def put(self, endpoint, data):
+        self.puts.append((endpoint, data['key_id']))
+        if data['key_id'] != self.current_key['key_id']:
+            response             = requests.Response()
+            response.status_code = 422
+            raise requests.HTTPError('422 Client Error: Unprocessable Entity', response=response)
+        return {}
+
+
+class test_GitHub__Public_Key__Cache(TestCase):
+
+    def setUp(self):
+        self.cache                = GitHub__Public_Key__Cache()
+        self.private_key, self.pk = new_key_pair('key-1')
+
+    def test__init__(self):
+        with self.cache as _:
+            assert _.stats()                        == dict(entries=0, hits=0, misses=0, invalidations=0)
+            assert github_public_key_cache.max_entries > 0
+            assert _.scope_repo('o', 'r')           == 'repo:o/r'
+            assert _.scope_env ('o', 'r', 'prod')   == 'env:o/r/prod'
+            assert _.scope_org ('o')                == 'org:o'
+
+    def test_get__put(self):
+        with self.cache as _:
+            assert _.get(API_URL, 'repo:o/r') is None
+            entry = _.put(API_URL, 'repo:o/r', self.pk)
+            assert type(entry)                      is GitHub__Public_Key__Cache__Entry
+            assert _.get(API_URL, 'repo:o/r')       is entry
+            assert _.get('https://ghe.local/api/v3', 'repo:o/r') is None        # keys are per GitHub host
+            assert entry.public_key_data()          == self.pk
+            assert _.stats()                        == dict(entries=1, hits=1, misses=2, invalidations=0)
+
+    def test_entry__encrypt(self):                                              # prebuilt SealedBox produces values the private key can open
+        entry     = self.cache.put(API_URL, 'repo:o/r', self.pk)
+        encrypted = entry.encrypt('secret-value')
+        assert SealedBox(self.private_key).decrypt(base64.b64decode(encrypted)) == b'secret-value'
+
+    def test_get_or_fetch(self):
+        calls = []
+        def fetch():
+            calls.append(1)
+            return self.pk
+        entry_1 = self.cache.get_or_fetch(API_URL, 'org:o', fetch)
+        entry_2 = self.cache.get_or_fetch(API_URL, 'org:o', fetch)
+        assert entry_1 is entry_2
+        assert calls   == [1]
+
+    def test_get__ttl_expired(self):
+        with GitHub__Public_Key__Cache(ttl=60) as _:
+            entry           = _.put(API_URL, 'repo:o/r', self.pk)
+            entry.stored_at = time.monotonic() - 61
+            assert _.get(API_URL, 'repo:o/r') is None
+            assert _.stats()['entries']       == 0
+
+    def test_put__lru_eviction(self):
+        with GitHub__Public_Key__Cache(max_entries=2) as _:
+            _.put(API_URL, 'repo:o/a', self.pk)
+            _.put(API_URL, 'repo:o/b', self.pk)
+            _.get(API_URL, 'repo:o/a')                                          # a is now most recently used
+            _.put(API_URL, 'repo:o/c', self.pk)
+            assert _.get(API_URL, 'repo:o/a') is not None
+            assert _.get(API_URL, 'repo:o/b') is None
+            assert _.get(API_URL, 'repo:o/c') is not None
+
+    def test_invalidate__and__clear(self):
+        with self.cache as _:
+            _.put(API_URL, 'repo:o/r', self.pk)
+            assert _.invalidate(API_URL, 'repo:o/r') is True
+            assert _.invalidate(API_URL, 'repo:o/r') is False
+            assert _.stats()['invalidations']        == 1
+            _.put(API_URL, 'repo:o/r', self.pk)
+            assert _.clear().stats()                 == dict(entries=0, hits=0, misses=0, invalidations=0)
+
+
+class test_GitHub__Public_Key__Cache__Secrets(TestCase):                        # Integration with GitHub__Secrets writes
+
+    def setUp(self):
+        self.cache                = GitHub__Public_Key__Cache()
+        self.private_key, self.pk = new_key_pair('key-1')
+        self.api                  = Fake__Rotating__API(api_token='token', current_key=self.pk)
+
+    def secrets(self):                                                          # new instance per "request", sharing one cache
+        return GitHub__Secrets(repo_name='o/r', api_token='token', api=self.api, public_key_cache=self.cache)
+
+    def test__key_fetched_once_across_requests(self):
+        for index in range(5):
+            self.secrets().create_or_update_secret            (f'REPO_{index}', 'v')
+            self.secrets().create_or_update_environment_secret('prod', f'ENV_{index}', 'v')
+            self.secrets().create_or_update_org_secret        ('org', f'ORG_{index}', 'v')
+        assert self.api.gets == [ '/repos/o/r/actions/secrets/public-key'                  ,
+                                  '/repos/o/r/environments/prod/secrets/public-key'        ,
+                                  '/orgs/org/actions/secrets/public-key'                   ]
+        assert len(self.api.puts) == 15
+
+    def test__rotated_key__invalidates_and_retries_once(self):
+        assert self.secrets().create_or_update_secret('A', 'v') is True
+        _, self.api.current_key = new_key_pair('key-2')                         # GitHub rotates the repo key
+        assert self.secrets().create_or_update_secret('B', 'v') is True
+        assert self.api.puts                       == [('/repos/o/r/actions/secrets/A', 'key-1'),
+                                                       ('/repos/o/r/actions/secrets/B', 'key-1'),    # rejected
+                                                       ('/repos/o/r/actions/secrets/B', 'key-2')]    # retried with fresh key
+        assert len(self.api.gets)                  == 2
+        assert self.cache.stats()['invalidations'] == 1
+        assert self.secrets().get_public_key()     == self.api.current_key
+
+    def test__fresh_key_rejected__not_retried(self):                            # a key that was just fetched is never retried
+        self.api.current_key = dict(self.pk)
+        def put(endpoint, data):
+            self.api.puts.append((endpoint, data['key_id']))
+            response             = requests.Response()
+            response.status_code = 422
+            raise requests.HTTPError('422', response=response)
+        self.api.put = put
+        with pytest.raises(requests.HTTPError):
+            self.secrets()._put_encrypted_secret('repo:o/r', '/repos/o/r/actions/secrets/public-key', '/repos/o/r/actions/secrets/A', 'v')
+        assert len(self.api.puts) == 1
+
+
+class test_GitHub__Public_Key__Cache__Surrogate(TestCase):                      # Round trip against the surrogate (a fresh surrogate clears the shared cache)
+
+    @classmethod
+    def setUpClass(cls):
+        cls.surrogate_context = GitHub__API__Surrogate__Test_Context().setup()
+        cls.api_token         = cls.surrogate_context.admin_pat()
+        cls.surrogate_context.add_repo('test-owner', 'test-repo')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.surrogate_context.teardown()
+
+    def test__shared_cache_across_instances(self):
+        assert github_public_key_cache.stats()['entries'] == 0
+        secrets_1 = GitHub__Secrets(repo_name='test-owner/test-repo', api_token=self.api_token)
+        secrets_2 = GitHub__Secrets(repo_name='test-owner/test-repo', api_token=self.api_token)
+        assert secrets_1.create_or_update_secret('CACHED_KEY_SECRET', 'value') is True
+        assert secrets_2.get_public_key() == secrets_1.get_public_key()
+        assert github_public_key_cache.stats()['misses'] == 1
+        assert secrets_2.delete_secret('CACHED_KEY_SECRET') is True
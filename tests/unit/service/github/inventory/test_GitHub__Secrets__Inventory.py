@@ -0,0 +1,117 @@
+import pytest
+import requests
+from unittest                                                                               import TestCase
+from mgraph_ai_service_github.service.github.GitHub__API                                    import GitHub__API
+from mgraph_ai_service_github.service.github.inventory.GitHub__Secrets__Inventory           import GitHub__Secrets__Inventory, INVENTORY__RECORD__CHECKPOINT, INVENTORY__RECORD__ERROR, encode_inventory_checkpoint, decode_inventory_checkpoint
+from mgraph_ai_service_github.service.github.rate_limit.GitHub__Rate_Limit__Tracker         import github_rate_limit_tracker
+from mgraph_ai_service_github.surrogates.github.testing.GitHub__API__Surrogate__Test_Context import GitHub__API__Surrogate__Test_Context
+
+
+class test_GitHub__Secrets__Inventory(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.surrogate_context = GitHub__API__Surrogate__Test_Context().setup()
+        cls.api_token         = cls.surrogate_context.admin_pat()
+        cls.repos             = [f'inv-repo-{i}' for i in range(5)]
+        _ = cls.surrogate_context
+        _.add_org       ('inv-org')
+        _.add_org_secret('inv-org', 'ORG_TOKEN', 'v', 'all')
+        for repo in cls.repos:
+            _.add_repo  ('inv-org', repo)
+            _.add_secret('inv-org', repo, f'SECRET_{repo[-1]}', 'v')
+        _.add_environment('inv-org', cls.repos[0], 'production')
+        _.add_env_secret ('inv-org', cls.repos[0], 'production', 'DEPLOY_KEY', 'v')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.surrogate_context.teardown()
+
+    def setUp(self):
+        github_rate_limit_tracker.clear()
+        self.inventory = GitHub__Secrets__Inventory(api_token=self.api_token, max_workers=2, rate_limit_reserve=0)
+
+    def test__init__(self):
+        with self.inventory as _:
+            assert type(_.api)            is GitHub__API
+            assert _.max_workers          == 2
+            assert _.include_environments is True
+
+    def test_checkpoint__round_trip(self):
+        token = encode_inventory_checkpoint('inv-org', 'inv-repo-1', True)
+        assert decode_inventory_checkpoint(token) == dict(org='inv-org', after_repo='inv-repo-1', org_secrets_done=True)
+        with pytest.raises(ValueError, match='Invalid inventory checkpoint'):
+            decode_inventory_checkpoint('not a checkpoint')
+
+    def test_iter_org_repos(self):
+        assert [repo['name'] for repo in self.inventory.iter_org_repos('inv-org')] == self.repos
+
+    def test_crawl(self):
+        records = list(self.inventory.crawl('inv-org'))
+        by_type = {}
+        for record in records:
+            by_type.setdefault(record['type'], []).append(record)
+        assert records[0]                                     == dict(type='org_secret', org='inv-org', name='ORG_TOKEN', created_at='2024-01-15T10:30:00Z',
+                                                                      updated_at='2024-01-15T10:30:00Z', visibility='all')
+        assert [r['repo'] for r in by_type['repo']]           == self.repos           # batches keep repo order
+        assert by_type['repo'][0]['environments']             == ['production']
+        assert sorted(r['name'] for r in by_type['repo_secret']) == [f'SECRET_{i}' for i in range(5)]
+        assert by_type['environment_secret']                  == [dict(type='environment_secret', owner='inv-org', repo='inv-repo-0', environment='production',
+                                                                       name='DEPLOY_KEY', created_at='2024-01-15T10:30:00Z', updated_at='2024-01-15T10:30:00Z')]
+        assert INVENTORY__RECORD__CHECKPOINT                  not in by_type
+
+    def test_crawl__without_environments(self):
+        self.inventory.include_environments = False
+        records = list(self.inventory.crawl('inv-org'))
+        assert [r for r in records if r['type'] == 'environment_secret'] == []
+
+    def test_crawl__interrupted_and_resumed(self):                               # rate limit reserve reached after the first batch
+        calls = []
+        def rate_limit_exhausted():
+            calls.append(1)
+            return len(calls) > 2                                               # first batch (2 repos) passes, the next one stops
+        self.inventory.rate_limit_exhausted = rate_limit_exhausted
+        first_run  = list(self.inventory.crawl('inv-org'))
+        checkpoint = first_run[-1]
+        assert checkpoint['type']                                  == INVENTORY__RECORD__CHECKPOINT
+        assert [r['repo'] for r in first_run if r['type'] == 'repo'] == self.repos[:2]
+        assert decode_inventory_checkpoint(checkpoint['checkpoint'])  == dict(org='inv-org', after_repo='inv-repo-1', org_secrets_done=True)
+
+        resumed    = GitHub__Secrets__Inventory(api_token=self.api_token, max_workers=2, rate_limit_reserve=0)
+        second_run = list(resumed.crawl('inv-org', checkpoint=checkpoint['checkpoint']))
+        assert [r['type'] for r in second_run if r['type'] == 'org_secret']  == []  # not repeated
+        assert [r['repo'] for r in second_run if r['type'] == 'repo']        == self.repos[2:]
+        assert INVENTORY__RECORD__CHECKPOINT not in [r['type'] for r in second_run]
+
+    def test_crawl__checkpoint_for_other_org(self):
+        checkpoint = encode_inventory_checkpoint('other-org', None, False)
+        with pytest.raises(ValueError, match='different org'):
+            list(self.inventory.crawl('inv-org', checkpoint=checkpoint))
+
+    def test_crawl__rate_limited_pat(self):                                     # GitHub answering 429 interrupts the crawl before anything is emitted
+        inventory = GitHub__Secrets__Inventory(api_token=self.surrogate_context.rate_limited_pat(), rate_limit_reserve=0)
+        records   = list(inventory.crawl('inv-org'))
+        assert [r['type'] for r in records] == [INVENTORY__RECORD__CHECKPOINT]
+        assert decode_inventory_checkpoint(records[0]['checkpoint']) == dict(org='inv-org', after_repo=None, org_secrets_done=False)
+
+    def test_crawl__org_secrets_forbidden(self):                                # a repo-only PAT still inventories repos
+        inventory = GitHub__Secrets__Inventory(api_token=self.surrogate_context.repo_read_pat(), rate_limit_reserve=0)
+        records   = list(inventory.crawl('inv-org'))
+        assert records[0]['type']                          == INVENTORY__RECORD__ERROR
+        assert '403'                                       in records[0]['error']
+        assert len([r for r in records if r['type'] == 'repo']) == 5
+
+    def test_crawl__unknown_org(self):
+        with pytest.raises(requests.HTTPError):
+            list(self.inventory.crawl('no-such-org'))
+
+    def test_is_rate_limit_error(self):
+        def http_error(status, message):
+            response             = requests.Response()
+            response.status_code = status
+            return requests.HTTPError(message, response=response)
+        with self.inventory as _:
+            assert _.is_rate_limit_error(http_error(429, '429 Too Many Requests'                    )) is True
+            assert _.is_rate_limit_error(http_error(403, '403 Forbidden: API rate limit exceeded'   )) is True
+            assert _.is_rate_limit_error(http_error(403, '403 Forbidden'                            )) is False
+            assert _.is_rate_limit_error(ValueError('boom'))                                           is False
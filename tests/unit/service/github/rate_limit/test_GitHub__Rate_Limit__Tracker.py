@@ -0,0 +1,71 @@
+import time
+from unittest                                                                       import TestCase
+from requests.structures                                                            import CaseInsensitiveDict
+from mgraph_ai_service_github.schemas.github.base.Schema__GitHub__Rate_Limit        import Schema__GitHub__Rate_Limit
+from mgraph_ai_service_github.service.github.rate_limit.GitHub__Rate_Limit__Tracker import GitHub__Rate_Limit__Tracker, rate_limit_from_headers, github_rate_limit_tracker
+
+RESET__NEXT_HOUR    = int(time.time()) + 3600
+HEADERS__RATE_LIMIT = { 'X-RateLimit-Limit'     : '5000'                ,
+                        'X-RateLimit-Remaining' : '4990'                ,
+                        'X-RateLimit-Reset'     : str(RESET__NEXT_HOUR) ,
+                        'X-RateLimit-Used'      : '10'         ,
+                        'X-RateLimit-Resource'  : 'core'       }
+
+
+class test_GitHub__Rate_Limit__Tracker(TestCase):
+
+    def setUp(self):
+        self.tracker = GitHub__Rate_Limit__Tracker()
+
+    def test_rate_limit_from_headers(self):
+        assert rate_limit_from_headers(HEADERS__RATE_LIMIT) == dict(limit=5000, remaining=4990, reset=RESET__NEXT_HOUR, used=10, resource='core')
+        lower_case = CaseInsensitiveDict({name.lower(): value for name, value in HEADERS__RATE_LIMIT.items()})
+        assert rate_limit_from_headers(lower_case)['remaining'] == 4990
+        assert rate_limit_from_headers({'X-RateLimit-Limit': '60'}) == dict(limit=60, remaining=None, reset=None, used=None, resource='core')
+        assert rate_limit_from_headers({})   is None
+        assert rate_limit_from_headers(None) is None
+
+    def test_update__and__get(self):
+        snapshot = self.tracker.update('token-a', rate_limit_from_headers(HEADERS__RATE_LIMIT))
+        assert type(snapshot)                  is Schema__GitHub__Rate_Limit
+        assert snapshot.json()                 == dict(limit=5000, remaining=4990, reset=RESET__NEXT_HOUR, used=10)
+        assert self.tracker.get('token-a')     is snapshot
+        assert self.tracker.get('token-b')     is None                          # per token
+        assert self.tracker.get('token-a', 'search') is None                    # per resource
+        assert self.tracker.update('token-a', None) is None
+
+        search = self.tracker.update('token-a', {**rate_limit_from_headers(HEADERS__RATE_LIMIT), 'resource': 'search', 'limit': 30})
+        assert self.tracker.get('token-a', 'search') is search
+        assert self.tracker.get('token-a')           is snapshot
+
+    def test_get__stale_after_reset(self):                                      # A snapshot from a finished window is a miss (and dropped)
+        self.tracker.update('token-a', dict(limit=5000, remaining=0, reset=int(time.time()) - 1, used=5000))
+        assert self.tracker.get('token-a')     is None
+        assert len(self.tracker.snapshots)     == 0
+        self.tracker.update('token-a', dict(limit=5000, remaining=7))             # no reset: kept until replaced
+        assert self.tracker.get('token-a').remaining == 7
+
+    def test_update__lru_eviction(self):
+        tracker = GitHub__Rate_Limit__Tracker(max_entries=2)
+        tracker.update('token-1', {'limit': 1})
+        tracker.update('token-2', {'limit': 2})
+        assert tracker.get('token-1').limit    == 1                              # touch token-1
+        tracker.update('token-3', {'limit': 3})
+        assert tracker.get('token-1').limit    == 1                              # recently used survives
+        assert tracker.get('token-2')          is None
+        assert len(tracker.snapshots)          == 2
+
+    def test_token_fingerprint(self):
+        fingerprint = self.tracker.token_fingerprint('ghp_secret')
+        assert len(fingerprint)  == 16
+        assert 'ghp_secret'      not in fingerprint
+        assert fingerprint       == self.tracker.token_fingerprint('ghp_secret')
+        self.tracker.update('ghp_secret', {'limit': 1})
+        assert all('ghp_secret' not in key for key, _ in self.tracker.snapshots.keys())
+
+    def test_clear(self):
+        self.tracker.update('token-a', {'limit': 1})
+        assert self.tracker.clear().snapshots == {}
+
+    def test__singleton(self):
+        assert type(github_rate_limit_tracker) is GitHub__Rate_Limit__Tracker
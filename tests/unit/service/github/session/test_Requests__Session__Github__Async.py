@@ -0,0 +1,56 @@
+import httpx
+from unittest                                                                           import TestCase
+from osbot_utils.utils.Threads                                                          import invoke_in_new_event_loop
+from mgraph_ai_service_github.service.github.session.Requests__Session__Async           import Requests__Session__Async
+from mgraph_ai_service_github.service.github.session.Requests__Session__Github__Async   import Requests__Session__Github__Async, async_client, close_async_client
+from mgraph_ai_service_github.service.github.session.Requests__Session__Pool            import GITHUB_API__DEFAULT_HEADERS
+from mgraph_ai_service_github.service.github.session.Requests__Session__Response__Httpx import Requests__Session__Response__Httpx
+
+
+class test_Requests__Session__Github__Async(TestCase):
+
+    def test__init__(self):
+        with Requests__Session__Github__Async(api_token='abc') as _:
+            assert isinstance(_, Requests__Session__Async)
+            assert _.auth_headers()           == {'Authorization': 'token abc'}
+            assert _.headers['Authorization'] == 'token abc'
+            assert _.headers['Accept']        == GITHUB_API__DEFAULT_HEADERS['Accept']
+
+    def test_auth_headers__no_token(self):
+        with self.assertRaises(ValueError) as context:
+            Requests__Session__Github__Async().auth_headers()
+        assert str(context.exception) == 'GitHub Access Token not setup'
+
+    def test_async_client__one_per_event_loop(self):
+        async def clients():
+            client_1 = async_client()
+            client_2 = async_client()
+            await close_async_client()
+            client_3 = async_client()
+            await close_async_client()
+            return client_1, client_2, client_3
+
+        client_1, client_2, client_3 = invoke_in_new_event_loop(clients())
+        assert type(client_1)  is httpx.AsyncClient
+        assert client_1        is client_2                                      # shared within the loop
+        assert client_1.is_closed
+        assert client_3        is not client_1                                  # recreated after close
+        assert 'Authorization' not in client_1.headers                          # token never stored on the shared client
+
+        client_4, _, _ = invoke_in_new_event_loop(clients())
+        assert client_4 is not client_1                                         # new loop, new client
+
+    def test_abstract_methods(self):
+        session = Requests__Session__Async()
+        for method in (session.get, session.put, session.delete, session.post):
+            with self.assertRaises(NotImplementedError):
+                invoke_in_new_event_loop(method('/user'))
+
+    def test_response__httpx(self):
+        response = Requests__Session__Response__Httpx(httpx.Response(404, json={'message': 'Not Found'}, request=httpx.Request('GET', 'https://api.github.com/x')))
+        assert response.status_code == 404
+        assert response.json()      == {'message': 'Not Found'}
+        from requests.exceptions import HTTPError
+        with self.assertRaises(HTTPError) as context:
+            response.raise_for_status()
+        assert str(context.exception) == '404 Error'
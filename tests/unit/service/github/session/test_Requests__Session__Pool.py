@@ -0,0 +1,82 @@
+import email
+import requests
+from http.client                                                                 import HTTPMessage
+from concurrent.futures                                                          import ThreadPoolExecutor
+from unittest                                                                    import TestCase
+from unittest.mock                                                               import Mock
+from requests.adapters                                                           import HTTPAdapter
+from requests.cookies                                                            import extract_cookies_to_jar
+from mgraph_ai_service_github.config                                             import GITHUB_API__POOL_MAXSIZE, GITHUB_API__POOL_CONNECTIONS
+from mgraph_ai_service_github.service.github.GitHub__API                         import GitHub__API
+from mgraph_ai_service_github.service.github.session.Requests__Session__Github   import Requests__Session__Github
+from mgraph_ai_service_github.service.github.session.Requests__Session__Pool     import Requests__Session__Pool, requests_session_pool, GITHUB_API__DEFAULT_HEADERS
+
+
+class test_Requests__Session__Pool(TestCase):
+
+    def test__init__(self):
+        with Requests__Session__Pool() as _:
+            assert _.pool_connections == GITHUB_API__POOL_CONNECTIONS
+            assert _.pool_maxsize     == GITHUB_API__POOL_MAXSIZE
+            assert _.pool_block       is False
+            assert _.keep_alive       is True
+            assert _._session         is None
+
+    def test_requests_session(self):
+        with Requests__Session__Pool(pool_connections=2, pool_maxsize=7) as _:
+            session = _.requests_session()
+            adapter = session.get_adapter('https://api.github.com')
+            assert type(session)                is requests.Session
+            assert _.requests_session()         is session                          # cached
+            assert type(adapter)                is HTTPAdapter
+            assert adapter._pool_connections   == 2
+            assert adapter._pool_maxsize       == 7
+            assert session.get_adapter('http://localhost') is adapter             # same adapter for http and https
+            assert 'Authorization'          not in session.headers
+            for name, value in GITHUB_API__DEFAULT_HEADERS.items():
+                assert session.headers[name] == value
+
+    def test_requests_session__thread_safe(self):
+        pool = Requests__Session__Pool()
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            sessions = list(executor.map(lambda _: pool.requests_session(), range(64)))
+        assert len({id(session) for session in sessions}) == 1
+
+    def test_configure__and__reset(self):
+        pool    = Requests__Session__Pool()
+        session = pool.requests_session()
+        assert pool.configure(pool_maxsize=3, keep_alive=False) is pool
+        assert pool._session                                   is None
+        new_session = pool.requests_session()
+        assert new_session                                     is not session
+        assert new_session.get_adapter('https://x')._pool_maxsize == 3
+        assert new_session.headers['Connection']               == 'close'
+        assert pool.reset()._session                           is None
+
+    def test__shared_across_sessions_and_apis(self):
+        session_1 = Requests__Session__Github(api_token='token-1')
+        session_2 = Requests__Session__Github(api_token='token-2')
+        api_1     = GitHub__API(api_token='token-3')
+
+        assert session_1.pool               is requests_session_pool
+        assert session_1.requests_session() is session_2.requests_session()
+        assert session_1.auth_headers()     == {'Authorization': 'token token-1'}
+        assert session_2.auth_headers()     == {'Authorization': 'token token-2'}
+        assert session_1.headers['Authorization'] == 'token token-1'
+        if type(api_1.session()) is Requests__Session__Github:                    # only when no session factory (surrogate) is active
+            assert api_1.session().requests_session() is session_1.requests_session()
+
+    def test_requests_session__no_cookies(self):                                # Shared by every PAT, so a cookie set for one tenant must never be sent for another
+        def set_cookie(jar):
+            message = email.message_from_string('Set-Cookie: tenant=pat-1; Path=/\n\n', _class=HTTPMessage)
+            extract_cookies_to_jar(jar, requests.Request('GET', 'https://api.github.com/user'), Mock(_original_response=Mock(msg=message)))
+            return jar
+        session = Requests__Session__Pool().requests_session()
+        assert len(set_cookie(requests.Session().cookies))                     == 1         # a plain session would keep it
+        assert len(set_cookie(session.cookies))                                == 0
+        assert 'Cookie' not in session.prepare_request(requests.Request('GET', 'https://api.github.com/user')).headers
+
+    def test_auth_headers__no_token(self):
+        with self.assertRaises(ValueError) as context:
+            Requests__Session__Github().auth_headers()
+        assert str(context.exception) == 'GitHub Access Token not setup'
@@ -0,0 +1,149 @@
+import pytest
+from unittest                                                                               import TestCase
+from mgraph_ai_service_github.schemas.github.sync.Enum__GitHub__Secrets__Sync__Action       import Enum__GitHub__Secrets__Sync__Action
+from mgraph_ai_service_github.service.github.GitHub__API                                    import GitHub__API
+from mgraph_ai_service_github.service.github.sync.GitHub__Secrets__Sync                     import GitHub__Secrets__Sync
+from mgraph_ai_service_github.service.github.sync.GitHub__Secrets__Sync__Fingerprints       import GitHub__Secrets__Sync__Fingerprints, github_secrets_sync_fingerprints
+from mgraph_ai_service_github.surrogates.github.testing.GitHub__API__Surrogate__Test_Context import GitHub__API__Surrogate__Test_Context
+
+CREATE    = Enum__GitHub__Secrets__Sync__Action.CREATE
+UPDATE    = Enum__GitHub__Secrets__Sync__Action.UPDATE
+DELETE    = Enum__GitHub__Secrets__Sync__Action.DELETE
+UNCHANGED = Enum__GitHub__Secrets__Sync__Action.UNCHANGED
+
+
+class test_GitHub__Secrets__Sync(TestCase):
+
+    def setUp(self):                                                            # fresh surrogate per test: sync tests mutate repo state
+        self.surrogate_context = GitHub__API__Surrogate__Test_Context().setup()
+        self.api_token         = self.surrogate_context.admin_pat()
+        self.surrogate_context.add_repo       ('sync-owner', 'sync-repo')
+        self.surrogate_context.add_environment('sync-owner', 'sync-repo', 'production')
+        self.surrogate_context.add_secret     ('sync-owner', 'sync-repo', 'EXTRA_SECRET')
+        self.state = self.surrogate_context.surrogate.state
+        self.sync  = GitHub__Secrets__Sync(api_token=self.api_token, fingerprints=GitHub__Secrets__Sync__Fingerprints())
+        self.calls = []
+        paginate   = self.sync.api.paginate
+        put        = self.sync.api.put
+        def tracked_paginate(endpoint, **kwargs):
+            self.calls.append(('LIST', endpoint))
+            return paginate(endpoint, **kwargs)
+        def tracked_put(endpoint, data):
+            self.calls.append(('PUT', endpoint))
+            return put(endpoint, data)
+        self.sync.api.paginate = tracked_paginate
+        self.sync.api.put      = tracked_put
+
+    def tearDown(self):
+        self.surrogate_context.teardown()
+
+    def scopes(self, repo_secrets, env_secrets=None, delete_extras=False):
+        scopes = [dict(owner='sync-owner', repo='sync-repo', secrets=repo_secrets, delete_extras=delete_extras)]
+        if env_secrets is not None:
+            scopes.append(dict(owner='sync-owner', repo='sync-repo', environment='production', secrets=env_secrets))
+        return scopes
+
+    def actions(self, plan):
+        return [(entry['environment'], entry['secret_name'], entry['action']) for entry in plan]
+
+    def puts(self):
+        return [endpoint for method, endpoint in self.calls if method == 'PUT']
+
+    def test__init__(self):
+        with GitHub__Secrets__Sync(api_token=self.api_token) as _:
+            assert type(_.api)     is GitHub__API
+            assert _.fingerprints  is github_secrets_sync_fingerprints
+            assert _.scope_id(dict(owner='o', repo='r'))                    == 'o/r'
+            assert _.scope_id(dict(owner='o', repo='r', environment='prod')) == 'o/r/prod'
+
+    def test_plan(self):                                                        # one listing per scope, no writes
+        plan = self.sync.plan(self.scopes({'NEW_SECRET': 'v', 'EXTRA_SECRET': 'v'}, {'ENV_SECRET': 'e'}, delete_extras=True))
+        assert self.actions(plan) == [(None        , 'NEW_SECRET'  , CREATE),
+                                      (None        , 'EXTRA_SECRET', UPDATE),                   # exists, value never written by us
+                                      ('production', 'ENV_SECRET'  , CREATE)]
+        assert self.puts()        == []
+        assert sorted(self.calls) == [('LIST', '/repos/sync-owner/sync-repo/actions/secrets'                    ),
+                                      ('LIST', '/repos/sync-owner/sync-repo/environments/production/secrets')]
+
+    def test_plan__delete_extras(self):
+        plan = self.sync.plan(self.scopes({'NEW_SECRET': 'v'}, delete_extras=True))
+        assert self.actions(plan) == [(None, 'NEW_SECRET', CREATE), (None, 'EXTRA_SECRET', DELETE)]
+
+    def test_apply__then__unchanged(self):                                      # second sync of the same document writes nothing
+        desired = self.scopes({f'SYNC_{i}': f'value-{i}' for i in range(20)}, {'ENV_SECRET': 'e'})
+        applied = self.sync.apply(desired)
+        assert all(entry['success'] is True for entry in applied)
+        assert len(self.puts())     == 21
+        assert self.state.get_repo_secret('sync-owner', 'sync-repo', 'SYNC_0') is not None
+
+        self.calls.clear()
+        desired[0]['secrets']['SYNC_3'] = 'changed'                             # 1 of 21 secrets changed
+        plan = self.sync.apply(desired)
+        assert [entry['secret_name'] for entry in plan if entry['action'] != UNCHANGED] == ['SYNC_3']
+        assert self.puts() == ['/repos/sync-owner/sync-repo/actions/secrets/SYNC_3']
+
+    def test_apply__detects_changes_made_outside_sync(self):                    # updated_at moved on GitHub -> rewrite even if value matches
+        desired = self.scopes({'SYNC_A': 'a', 'SYNC_B': 'b'})
+        self.sync.apply(desired)
+        self.state.get_repo_secret('sync-owner', 'sync-repo', 'SYNC_B').updated_at = '2030-01-01T00:00:00Z'
+        plan = self.sync.plan(desired)
+        assert self.actions(plan) == [(None, 'SYNC_A', UNCHANGED), (None, 'SYNC_B', UPDATE)]
+
+    def test_apply__write_not_visible__no_fingerprint(self):                    # updated_at didn't move past the plan's listing: the value seen may be someone else's
+        self.state.get_repo_secret('sync-owner', 'sync-repo', 'EXTRA_SECRET').updated_at = '2024-01-15T10:30:00Z'   # the surrogate's (fixed) write time
+        desired = self.scopes({'EXTRA_SECRET': 'v', 'SYNC_NEW': 'n'})
+        applied = {entry['secret_name']: entry for entry in self.sync.apply(desired)}
+        assert applied['EXTRA_SECRET']['success'    ] is True
+        assert applied['EXTRA_SECRET']['fingerprint'] is None
+        assert applied['SYNC_NEW'    ]['fingerprint'] is not None                  # created: no earlier updated_at to compare with
+        assert applied['SYNC_NEW'    ]['updated_at' ] == '2024-01-15T10:30:00Z'
+        assert self.actions(self.sync.plan(desired)) == [(None, 'EXTRA_SECRET', UPDATE), (None, 'SYNC_NEW', UNCHANGED)]
+
+    def test_plan__other_token_never_unchanged(self):                           # a token that can only list can't use plan as an equality oracle
+        desired = self.scopes({'SYNC_A': 'a'})
+        self.sync.apply(desired)
+        reader  = GitHub__Secrets__Sync(api_token=self.surrogate_context.repo_read_pat(), fingerprints=self.sync.fingerprints)
+        assert self.actions(self.sync.plan(desired)) == [(None, 'SYNC_A', UNCHANGED)]
+        assert self.actions(reader   .plan(desired)) == [(None, 'SYNC_A', UPDATE   )]
+
+    def test_apply__delete(self):
+        plan = self.sync.apply(self.scopes({}, delete_extras=True))
+        assert self.actions(plan)                                                     == [(None, 'EXTRA_SECRET', DELETE)]
+        assert plan[0]['success']                                                     is True
+        assert self.state.get_repo_secret('sync-owner', 'sync-repo', 'EXTRA_SECRET') is None
+
+    def test_apply__failure_reported_per_entry(self):
+        plan = self.sync.plan(self.scopes({'SYNC_OK': 'v', 'SYNC_FAIL': 'v'}))
+        put  = self.sync.api.put
+        def failing_put(endpoint, data):
+            if endpoint.endswith('SYNC_FAIL'):
+                raise ValueError('boom')
+            return put(endpoint, data)
+        self.sync.api.put = failing_put
+        results = {entry['secret_name']: entry for entry in self.sync.apply(self.scopes({'SYNC_OK': 'v', 'SYNC_FAIL': 'v'}), plan=plan)}
+        assert results['SYNC_OK'  ]['success'] is True
+        assert results['SYNC_FAIL']['success'] is False
+        assert results['SYNC_FAIL']['error'  ] == 'boom'
+        assert self.sync.fingerprints.get(self.sync.api.api_url, 'sync-owner/sync-repo', 'SYNC_FAIL') is None
+        assert self.sync.fingerprints.get(self.sync.api.api_url, 'sync-owner/sync-repo', 'SYNC_OK'  ) is not None
+
+    def test_apply__fingerprints_carried_by_the_client(self):                   # another instance (empty table, same deploy key) skips what the client says was written
+        sync    = GitHub__Secrets__Sync(api_token=self.api_token, fingerprints=GitHub__Secrets__Sync__Fingerprints(key_material='11' * 32))
+        desired = self.scopes({'SYNC_A': 'a', 'SYNC_B': 'b'})
+        applied = sync.apply(desired)
+        assert all(entry['fingerprint'] for entry in applied)
+
+        other   = GitHub__Secrets__Sync(api_token=self.api_token, fingerprints=GitHub__Secrets__Sync__Fingerprints(key_material='11' * 32))
+        assert self.actions(other.plan(desired)) == [(None, 'SYNC_A', UPDATE), (None, 'SYNC_B', UPDATE)]
+        desired[0]['fingerprints'] = {entry['secret_name']: entry['fingerprint'] for entry in applied}
+        desired[0]['secrets']['SYNC_B'] = 'changed'
+        plan    = other.plan(desired)
+        assert self.actions(plan)  == [(None, 'SYNC_A', UNCHANGED), (None, 'SYNC_B', UPDATE)]
+        assert plan[0]['fingerprint'] == applied[0]['fingerprint']
+
+    def test_plan__duplicate_scopes(self):                                      # a by-id lookup would silently keep only one of them
+        scopes = self.scopes({'SYNC_A': 'a'}) + [dict(owner='Sync-Owner', repo='sync-repo', secrets={'SYNC_A': 'b'})]
+        for method in (self.sync.plan, self.sync.apply):
+            with pytest.raises(ValueError, match='Duplicate scopes: Sync-Owner/sync-repo'):
+                method(scopes)
+        assert self.calls == []
@@ -0,0 +1,78 @@
+from unittest                                                                             import TestCase
+from osbot_utils.testing.Temp_Env_Vars                                                    import Temp_Env_Vars
+from mgraph_ai_service_github.config                                                      import ENV_VAR__SERVICE__AUTH__SESSION_KEY, ENV_VAR__SERVICE__AUTH__PRIVATE_KEY
+from mgraph_ai_service_github.service.github.sync.GitHub__Secrets__Sync__Fingerprints     import GitHub__Secrets__Sync__Fingerprints
+
+API_URL      = 'https://api.github.com'
+TOKEN        = 'token-that-wrote'
+KEY_MATERIAL = '11' * 32
+UPDATED_AT   = '2024-01-01T00:00:00Z'
+
+
+class test_GitHub__Secrets__Sync__Fingerprints(TestCase):
+
+    def setUp(self):
+        self.fingerprints = GitHub__Secrets__Sync__Fingerprints(key_material=KEY_MATERIAL)
+
+    def fingerprint(self, fingerprints, value='value', updated_at=UPDATED_AT):
+        return fingerprints.fingerprint(API_URL, TOKEN, 'o/r', 'A', value, updated_at)
+
+    def test__init__(self):
+        with self.fingerprints as _:
+            assert len(_.hmac_key())   == 32
+            assert _.hmac_key()        != bytes.fromhex(KEY_MATERIAL)
+            assert len(_._entries)     == 0
+
+    def test_hmac_key__from_deploy_keys(self):                                  # same key on every instance of a deploy (session key first: it outlives key rotation)
+        with Temp_Env_Vars(env_vars={ENV_VAR__SERVICE__AUTH__SESSION_KEY: KEY_MATERIAL, ENV_VAR__SERVICE__AUTH__PRIVATE_KEY: '22' * 32}):
+            assert GitHub__Secrets__Sync__Fingerprints().hmac_key() == self.fingerprints.hmac_key()
+        with Temp_Env_Vars(env_vars={ENV_VAR__SERVICE__AUTH__SESSION_KEY: '', ENV_VAR__SERVICE__AUTH__PRIVATE_KEY: KEY_MATERIAL}):
+            assert GitHub__Secrets__Sync__Fingerprints().hmac_key() == self.fingerprints.hmac_key()
+        with Temp_Env_Vars(env_vars={ENV_VAR__SERVICE__AUTH__SESSION_KEY: '', ENV_VAR__SERVICE__AUTH__PRIVATE_KEY: ''}):
+            assert GitHub__Secrets__Sync__Fingerprints().hmac_key() != GitHub__Secrets__Sync__Fingerprints().hmac_key()   # local use only: random per process
+
+    def test_fingerprint(self):
+        with self.fingerprints as _:
+            assert self.fingerprint(_)                          == self.fingerprint(_)
+            assert self.fingerprint(_)                          == self.fingerprint(GitHub__Secrets__Sync__Fingerprints(key_material=KEY_MATERIAL))
+            assert self.fingerprint(_)                          != self.fingerprint(_, value='value-2')
+            assert self.fingerprint(_)                          != self.fingerprint(_, updated_at='2024-02-01T00:00:00Z')
+            assert self.fingerprint(_)                          != self.fingerprint(GitHub__Secrets__Sync__Fingerprints(key_material='33' * 32))
+            assert self.fingerprint(_)                          != _.fingerprint(API_URL, 'other-token', 'o/r', 'A', 'value', UPDATED_AT)
+            assert len(self.fingerprint(_))                     == 32
+            assert 'value'                                  not in str(_._entries)
+
+    def test_matches__known(self):                                              # a fingerprint kept by the client verifies on another instance
+        known = self.fingerprints.record(API_URL, TOKEN, 'o/r', 'A', 'v1', UPDATED_AT)
+        other = GitHub__Secrets__Sync__Fingerprints(key_material=KEY_MATERIAL)
+        assert other.matches(API_URL, TOKEN, 'o/r', 'A', 'v1', UPDATED_AT              ) is False
+        assert other.matches(API_URL, TOKEN, 'o/r', 'A', 'v1', UPDATED_AT, known=known ) is True
+        assert other.matches(API_URL, TOKEN, 'o/r', 'A', 'v2', UPDATED_AT, known=known ) is False     # value changed
+        assert other.matches(API_URL, TOKEN, 'o/r', 'B', 'v1', UPDATED_AT, known=known ) is False     # not transferable to another secret
+        assert other.matches(API_URL, TOKEN, 'o/r', 'A', 'v1', '2024-02-01T00:00:00Z', known=known) is False
+
+    def test_matches__other_token(self):                                        # only the token that wrote the value gets a match (no equality oracle for read-only tokens)
+        known = self.fingerprints.record(API_URL, TOKEN, 'o/r', 'A', 'v1', UPDATED_AT)
+        assert self.fingerprints.matches(API_URL, TOKEN        , 'o/r', 'A', 'v1', UPDATED_AT             ) is True
+        assert self.fingerprints.matches(API_URL, 'read-token' , 'o/r', 'A', 'v1', UPDATED_AT             ) is False
+        assert self.fingerprints.matches(API_URL, 'read-token' , 'o/r', 'A', 'v1', UPDATED_AT, known=known) is False
+
+    def test_record__matches(self):
+        with self.fingerprints as _:
+            assert _.matches(API_URL, TOKEN, 'o/r', 'A', 'v1', '2024-01-01T00:00:00Z') is False
+            _.record(API_URL, TOKEN, 'o/r', 'A', 'v1', '2024-01-01T00:00:00Z')
+            assert _.matches(API_URL, TOKEN, 'o/r'     , 'A', 'v1', '2024-01-01T00:00:00Z') is True
+            assert _.matches(API_URL, TOKEN, 'o/r'     , 'A', 'v2', '2024-01-01T00:00:00Z') is False      # value changed
+            assert _.matches(API_URL, TOKEN, 'o/r'     , 'A', 'v1', '2024-02-01T00:00:00Z') is False      # changed outside of sync
+            assert _.matches(API_URL, TOKEN, 'o/r'     , 'A', 'v1', None                  ) is False
+            assert _.matches(API_URL, TOKEN, 'o/r/prod', 'A', 'v1', '2024-01-01T00:00:00Z') is False      # other scope
+
+    def test_forget__clear__lru(self):
+        with GitHub__Secrets__Sync__Fingerprints(max_entries=2) as _:
+            _.record(API_URL, TOKEN, 'o/r', 'A', 'v', 't')
+            _.record(API_URL, TOKEN, 'o/r', 'B', 'v', 't')
+            _.record(API_URL, TOKEN, 'o/r', 'C', 'v', 't')
+            assert _.get(API_URL, 'o/r', 'A') is None
+            assert _.forget(API_URL, 'o/r', 'B') is True
+            assert _.forget(API_URL, 'o/r', 'B') is False
+            assert len(_.clear()._entries)       == 0
@@ -1,10 +1,46 @@
 import pytest
+import time
 from unittest                                                                                import TestCase
 from requests.exceptions                                                                     import HTTPError
-from mgraph_ai_service_github.service.github.GitHub__API                                     import GitHub__API
+from mgraph_ai_service_github.service.github.GitHub__API                                     import GitHub__API, next_page_url
+from mgraph_ai_service_github.service.github.rate_limit.GitHub__Rate_Limit__Tracker          import github_rate_limit_tracker
+from mgraph_ai_service_github.service.github.session.Requests__Session                       import Requests__Session
+from mgraph_ai_service_github.service.github.session.Requests__Session__Response             import Requests__Session__Response
 from mgraph_ai_service_github.surrogates.github.testing.GitHub__API__Surrogate__Test_Context import GitHub__API__Surrogate__Test_Context
 
 
+class Fake__Paged__Response(Requests__Session__Response):                      # Minimal response used to simulate GitHub pagination
+    page_json    : dict
+    page_headers : dict
+
+    def json(self):
+        return self.page_json
+
+    def raise_for_status(self):
+        pass
+
+    @property
+    def headers(self):
+        return self.page_headers
+
+
+class Fake__Paged__Session(Requests__Session):                                  # Serves N pages of 'secrets', linking each page to the next one
+    total    : int  = 250
+    calls    : list
+    api_url  : str  = 'https://api.github.com'
+
+    def get(self, url, **kwargs):
+        self.calls.append((url, kwargs.get('params')))
+        per_page = (kwargs.get('params') or {}).get('per_page') or int(url.split('per_page=')[1].split('&')[0])
+        page     = (kwargs.get('params') or {}).get('page') or (int(url.split('page=')[-1]) if '&page=' in url else 1)
+        start    = (page - 1) * per_page
+        items    = [{'name': f'SECRET_{i}'} for i in range(start, min(start + per_page, self.total))]
+        headers  = {}
+        if start + per_page < self.total:
+            headers['Link'] = f'<{self.api_url}/repos/o/r/actions/secrets?per_page={per_page}&page={page + 1}>; rel="next"'
+        return Fake__Paged__Response(status_code=200, page_json={'total_count': self.total, 'secrets': items}, page_headers=headers)
+
+
 class test_GitHub__API(TestCase):
 
     # @classmethod
@@ -235,3 +271,68 @@ class test_GitHub__API(TestCase):
         assert 'id'                 in result
         assert 'type'               in result
         assert result['type']       == 'User'
+
+    def test_next_page_url(self):
+        link = ('<https://api.github.com/repos/o/r/actions/secrets?per_page=100&page=2>; rel="next", '
+                '<https://api.github.com/repos/o/r/actions/secrets?per_page=100&page=5>; rel="last"')
+        assert next_page_url({'Link': link})  == 'https://api.github.com/repos/o/r/actions/secrets?per_page=100&page=2'
+        assert next_page_url({'Link': '<https://x?page=1>; rel="first"'}) is None
+        assert next_page_url({})              is None
+        assert next_page_url(None)            is None
+
+    def test_paginate(self):                                                   # Follows Link rel="next" until the last page, yielding lazily
+        session    = Fake__Paged__Session()
+        github_api = GitHub__API(api_token='abc')
+        github_api.session = lambda: session
+        items      = github_api.paginate('/repos/o/r/actions/secrets', items_key='secrets')
+
+        assert session.calls == []                                             # generator: nothing fetched yet
+        assert next(items)   == {'name': 'SECRET_0'}
+        assert len(session.calls) == 1
+        assert [item['name'] for item in items] == [f'SECRET_{i}' for i in range(1, 250)]
+        assert session.calls == [('https://api.github.com/repos/o/r/actions/secrets'                    , {'per_page': 100}),
+                                 ('https://api.github.com/repos/o/r/actions/secrets?per_page=100&page=2', None             ),
+                                 ('https://api.github.com/repos/o/r/actions/secrets?per_page=100&page=3', None             )]
+
+    def test_get_page(self):                                                   # One page per call, plus whether another page follows
+        session    = Fake__Paged__Session()
+        github_api = GitHub__API(api_token='abc', response_cache=None)
+        github_api.session = lambda: session
+
+        items, more = github_api.get_page('/repos/o/r/actions/secrets', items_key='secrets', page=2, per_page=100)
+        assert [item['name'] for item in items] == [f'SECRET_{i}' for i in range(100, 200)]
+        assert more                             is True
+        assert session.calls == [('https://api.github.com/repos/o/r/actions/secrets', {'per_page': 100, 'page': 2})]
+
+        items, more = github_api.get_page('/repos/o/r/actions/secrets', items_key='secrets', page=3, per_page=100)
+        assert len(items) == 50
+        assert more       is False
+
+    def test_paginate__surrogate(self):                                        # Single page from the surrogate (no Link header)
+        endpoint = f'/repos/{self.test_repo}/actions/secrets'
+        assert list(self.github_api.paginate(endpoint, items_key='secrets')) == self.github_api.get(endpoint)['secrets']
+
+    def test_rate_limit__from_response_headers(self):                          # Snapshot comes from X-RateLimit-* headers, no extra /rate_limit call
+        reset      = int(time.time()) + 3600                                    # snapshots past their reset are treated as misses
+        headers    = {'X-RateLimit-Limit': '5000', 'X-RateLimit-Remaining': '4321', 'X-RateLimit-Reset': str(reset), 'X-RateLimit-Used': '679'}
+        session    = Fake__Paged__Session(total=1)
+        session.get = lambda url, **kwargs: (session.calls.append(url) or
+                                             Fake__Paged__Response(status_code=200, page_json={'secrets': []}, page_headers=headers))
+        github_api = GitHub__API(api_token='token-rate-limit-headers')
+        github_api.session = lambda: session
+
+        github_api.get('/repos/o/r/actions/secrets')
+        rate_limit = github_api.rate_limit()
+        assert rate_limit.json()  == dict(limit=5000, remaining=4321, reset=reset, used=679)
+        assert session.calls      == ['https://api.github.com/repos/o/r/actions/secrets']       # no /rate_limit request
+        assert GitHub__API(api_token='token-rate-limit-headers').rate_limit() is rate_limit     # shared across instances (per token)
+
+    def test_rate_limit__fallback_and_refresh(self):                           # Surrogate sends no headers: first call fetches /rate_limit, refresh forces it
+        github_rate_limit_tracker.clear()
+        rate_limit = self.github_api.rate_limit()
+        assert rate_limit.limit             == 5000
+        assert self.github_api.rate_limit() is rate_limit                      # cached snapshot
+        refreshed  = self.github_api.rate_limit(refresh=True)
+        assert refreshed                    is not rate_limit
+        assert refreshed.limit              == 5000
+
@@ -0,0 +1,108 @@
+import asyncio
+from unittest                                                                                      import TestCase
+from requests.exceptions                                                                           import HTTPError
+from osbot_utils.utils.Threads                                                                     import invoke_in_new_event_loop
+from mgraph_ai_service_github.service.github.GitHub__API__Async                                    import GitHub__API__Async, set_async_session_factory, clear_async_session_factory
+from mgraph_ai_service_github.service.github.session.Requests__Session__Github__Async              import Requests__Session__Github__Async
+from mgraph_ai_service_github.surrogates.github.session.Requests__Session__Github__Surrogate__Async import Requests__Session__Github__Surrogate__Async
+from mgraph_ai_service_github.surrogates.github.testing.GitHub__API__Surrogate__Test_Context        import GitHub__API__Surrogate__Test_Context
+
+
+class test_GitHub__API__Async(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.surrogate_context = GitHub__API__Surrogate__Test_Context().setup()
+        cls.surrogate_context.add_repo('test-owner', 'test-repo')
+        cls.api_token         = cls.surrogate_context.admin_pat()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.surrogate_context.teardown()
+
+    def test__init__(self):
+        with GitHub__API__Async(api_token=self.api_token) as _:
+            assert _.api_token    == self.api_token
+            assert _.api_url      == 'https://api.github.com'
+            assert type(_.session()) is Requests__Session__Github__Surrogate__Async   # factory set by the test context
+            assert _.session()    is _.session()
+
+    def test_session__without_factory(self):
+        clear_async_session_factory()
+        try:
+            assert type(GitHub__API__Async(api_token='abc').session()) is Requests__Session__Github__Async
+        finally:
+            self.surrogate_context.setup()                                      # restore surrogate wiring (fresh surrogate)
+            self.surrogate_context.add_repo('test-owner', 'test-repo')
+            type(self).api_token = self.surrogate_context.admin_pat()
+
+    def test_get(self):
+        api  = GitHub__API__Async(api_token=self.api_token)
+        user = invoke_in_new_event_loop(api.get('/user'))
+        assert user['login'] == 'surrogate-admin'
+
+    def test_get__bad_credentials(self):
+        api = GitHub__API__Async(api_token=self.surrogate_context.invalid_pat())
+        with self.assertRaises(HTTPError) as context:
+            invoke_in_new_event_loop(api.get('/user'))
+        assert '401' in str(context.exception)
+
+    def test_get__concurrent(self):                                             # many in-flight calls on one event loop
+        api = GitHub__API__Async(api_token=self.api_token)
+        async def run():
+            return await asyncio.gather(*[api.get('/rate_limit') for _ in range(50)])
+        results = invoke_in_new_event_loop(run())
+        assert len(results) == 50
+        assert all('rate' in result for result in results)
+
+    def test_put__and__delete(self):
+        api        = GitHub__API__Async(api_token=self.api_token)
+        async def run():
+            public_key = await api.get('/repos/test-owner/test-repo/actions/secrets/public-key')
+            data       = {'encrypted_value': 'aaaa', 'key_id': public_key['key_id']}
+            await api.put('/repos/test-owner/test-repo/actions/secrets/ASYNC_SECRET', data)
+            secret     = await api.get('/repos/test-owner/test-repo/actions/secrets/ASYNC_SECRET')
+            deleted    = await api.delete('/repos/test-owner/test-repo/actions/secrets/ASYNC_SECRET')
+            return secret, deleted
+        secret, deleted = invoke_in_new_event_loop(run())
+        assert secret['name'] == 'ASYNC_SECRET'
+        assert deleted        is True
+
+    def test_set_async_session_factory(self):
+        calls = []
+        def factory(api_token):
+            calls.append(api_token)
+            return Requests__Session__Github__Async(api_token=api_token)
+        set_async_session_factory(factory)
+        try:
+            assert type(GitHub__API__Async(api_token='xyz').session()) is Requests__Session__Github__Async
+            assert calls == ['xyz']
+        finally:
+            self.surrogate_context.setup()
+            self.surrogate_context.add_repo('test-owner', 'test-repo')
+            type(self).api_token = self.surrogate_context.admin_pat()
+
+    def test_paginate(self):
+        api = GitHub__API__Async(api_token=self.api_token)
+        async def run():
+            await api.put('/repos/test-owner/test-repo/actions/secrets/PAGED_SECRET', {'encrypted_value': 'aaaa', 'key_id': 'x'})
+            return [item async for item in api.paginate('/repos/test-owner/test-repo/actions/secrets', items_key='secrets')]
+        items = invoke_in_new_event_loop(run())
+        assert 'PAGED_SECRET' in [item['name'] for item in items]
+
+
+    def test_get_page(self):                                                    # one page per call, more tells the caller whether to ask for the next
+        api = GitHub__API__Async(api_token=self.api_token)
+        async def run():
+            for name in ('PAGE_SECRET_A', 'PAGE_SECRET_B', 'PAGE_SECRET_C'):
+                await api.put(f'/repos/test-owner/test-repo/actions/secrets/{name}', {'encrypted_value': 'aaaa', 'key_id': 'x'})
+            endpoint = '/repos/test-owner/test-repo/actions/secrets'
+            total    = (await api.get(endpoint))['total_count']
+            first    = await api.get_page(endpoint, items_key='secrets', page=1    , per_page=2)
+            last     = await api.get_page(endpoint, items_key='secrets', page=total, per_page=1)
+            return first, last
+        (items, more), (last_items, last_more) = invoke_in_new_event_loop(run())
+        assert len(items)      == 2
+        assert more            is True
+        assert len(last_items) == 1
+        assert last_more       is False
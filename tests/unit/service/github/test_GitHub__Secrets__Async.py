@@ -0,0 +1,109 @@
+from unittest                                                                               import TestCase
+from requests.exceptions                                                                    import HTTPError
+from osbot_utils.utils.Threads                                                              import invoke_in_new_event_loop
+from mgraph_ai_service_github.service.github.GitHub__API__Async                             import GitHub__API__Async
+from mgraph_ai_service_github.service.github.GitHub__Secrets__Async                         import GitHub__Secrets__Async
+from mgraph_ai_service_github.surrogates.github.testing.GitHub__API__Surrogate__Test_Context import GitHub__API__Surrogate__Test_Context
+
+
+class test_GitHub__Secrets__Async(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.surrogate_context = GitHub__API__Surrogate__Test_Context().setup()
+        cls.api_token         = cls.surrogate_context.admin_pat()
+        cls.surrogate_context.add_repo       ('test-owner', 'test-repo')
+        cls.surrogate_context.add_environment('test-owner', 'test-repo', 'production')
+        cls.surrogate_context.add_org        ('test-org')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.surrogate_context.teardown()
+
+    def setUp(self):
+        self.secrets = GitHub__Secrets__Async(repo_name='test-owner/test-repo', api_token=self.api_token)
+
+    def test__init__(self):
+        with self.secrets as _:
+            assert _.owner         == 'test-owner'
+            assert _.repo          == 'test-repo'
+            assert type(_.api)     is GitHub__API__Async
+            assert _.api.api_token == self.api_token
+
+    def test__init__invalid_repo_name(self):
+        with self.assertRaises(ValueError):
+            GitHub__Secrets__Async(repo_name='invalid', api_token=self.api_token)
+
+    def test_get_public_key__cached(self):
+        async def run():
+            return await self.secrets.get_public_key(), await self.secrets.get_public_key()
+        key_1, key_2 = invoke_in_new_event_loop(run())
+        assert key_1             == key_2                                       # second call served from the shared public key cache
+        assert self.secrets.public_key_cache.stats()['hits'] >= 1
+        assert set(key_1.keys()) == {'key_id', 'key'}
+
+    def test_repo_secrets__round_trip(self):
+        async def run():
+            await self.secrets.write_secret('ASYNC_REPO_SECRET', 'value-1')
+            names    = [secret['name'] for secret in await self.secrets.list_secrets()]
+            secret   = await self.secrets.get_secret('ASYNC_REPO_SECRET')
+            deleted  = await self.secrets.delete_secret('ASYNC_REPO_SECRET')
+            missing  = await self.secrets.get_secret('ASYNC_REPO_SECRET')
+            return names, secret, deleted, missing
+        names, secret, deleted, missing = invoke_in_new_event_loop(run())
+        assert 'ASYNC_REPO_SECRET'        in names
+        assert secret['name']             == 'ASYNC_REPO_SECRET'
+        assert deleted                    is True
+        assert missing                    is None
+
+    def test_write_secret__raises(self):                                        # errors surface to the caller (the routes map them to status codes)
+        secrets = GitHub__Secrets__Async(repo_name='test-owner/no-such-repo', api_token=self.api_token)
+        with self.assertRaises(HTTPError) as context:
+            invoke_in_new_event_loop(secrets.write_secret('ASYNC_MISSING_REPO', 'value'))
+        assert '404' in str(context.exception)
+        with self.assertRaises(HTTPError):
+            invoke_in_new_event_loop(self.secrets.delete_secret('ASYNC_NEVER_WRITTEN'))
+
+    def test_secrets_page(self):                                                # metadata only, one page per call
+        async def run():
+            for name in ('ASYNC_PAGE_A', 'ASYNC_PAGE_B'):
+                await self.secrets.write_secret(name, 'value')
+            page = await self.secrets.secrets_page(page=1, per_page=1)
+            for name in ('ASYNC_PAGE_A', 'ASYNC_PAGE_B'):
+                await self.secrets.delete_secret(name)
+            return page
+        secrets, more = invoke_in_new_event_loop(run())
+        assert len(secrets)           == 1
+        assert more                   is True
+        assert set(secrets[0].keys()) == {'name', 'created_at', 'updated_at'}
+
+    def test_environment_secrets__round_trip(self):
+        async def run():
+            await self.secrets.write_secret('ASYNC_ENV_SECRET', 'value', environment='production')
+            names   = [secret['name'] for secret in await self.secrets.list_environment_secrets('production')]
+            secret  = await self.secrets.get_environment_secret('production', 'ASYNC_ENV_SECRET')
+            deleted = await self.secrets.delete_secret('ASYNC_ENV_SECRET', environment='production')
+            return names, secret, deleted
+        names, secret, deleted = invoke_in_new_event_loop(run())
+        assert 'ASYNC_ENV_SECRET' in names
+        assert secret['name']     == 'ASYNC_ENV_SECRET'
+        assert deleted            is True
+
+    def test_org_secrets__round_trip(self):
+        async def run():
+            await self.secrets.write_org_secret('test-org', 'ASYNC_ORG_SECRET', 'value', visibility='private')
+            secrets = await self.secrets.list_org_secrets('test-org')
+            secret  = await self.secrets.get_org_secret('test-org', 'ASYNC_ORG_SECRET')
+            deleted = await self.secrets.delete_org_secret('test-org', 'ASYNC_ORG_SECRET')
+            return secrets, secret, deleted
+        secrets, secret, deleted = invoke_in_new_event_loop(run())
+        assert 'ASYNC_ORG_SECRET'   in [secret['name'] for secret in secrets]
+        assert secret['visibility'] == 'private'
+        assert deleted              is True
+
+    def test_configure_secrets__concurrent(self):
+        values  = {f'ASYNC_BULK_{i}': f'value-{i}' for i in range(20)}
+        results = invoke_in_new_event_loop(self.secrets.configure_secrets(values))
+        assert results == {f'set_{name}': True for name in values}
+        names   = [secret['name'] for secret in invoke_in_new_event_loop(self.secrets.list_secrets())]
+        assert set(values).issubset(names)
@@ -110,6 +110,22 @@ class test_GitHub__Secrets(TestCase):
             assert 'updated_at'         in secret
             assert type(secret['name']) is str
 
+    def test_iter_secrets(self):                                                # Test lazily iterating repository secrets
+        self.github_secrets.create_or_update_secret(self.test_secret_name, 'value')
+        secrets = self.github_secrets.iter_secrets()
+        assert type(secrets).__name__ == 'generator'
+        assert self.test_secret_name  in [secret['name'] for secret in secrets]
+        assert list(self.github_secrets.iter_secrets()) == self.github_secrets.list_secrets()
+
+    def test_secrets_page(self):                                                # Test fetching one page of repository secrets
+        self.github_secrets.create_or_update_secret(self.test_secret_name, 'value')
+        all_names     = [secret['name'] for secret in self.github_secrets.iter_secrets()]
+        first, more   = self.github_secrets.secrets_page(page=1, per_page=1)
+        assert [secret['name'] for secret in first] == all_names[:1]
+        assert more                                 is (len(all_names) > 1)
+        assert set(first[0])                        == {'name', 'created_at', 'updated_at'}
+        assert self.github_secrets.secrets_page(page=len(all_names) + 1, per_page=1) == ([], False)
+
     def test_get_secret__existing(self):                                        # Test getting existing secret metadata
         # First create a secret
         secret_value = 'test_value_for_get'
@@ -195,6 +211,32 @@ class test_GitHub__Secrets(TestCase):
 
         assert result is False
 
+    def test_create_or_update_secrets(self):                                     # Test concurrent bulk write (one public key fetch)
+        secrets = {f'{self.test_secret_prefix}BULK_{i}': f'value_{i}' for i in range(10)}
+        gets    = []
+        get     = self.github_secrets.api.get
+        def tracked_get(endpoint, params=None):
+            gets.append(endpoint)
+            return get(endpoint, params)
+        self.github_secrets.api.get = tracked_get
+        self.github_secrets.public_key_cache.clear()
+
+        results = self.github_secrets.create_or_update_secrets(secrets, max_workers=4)
+
+        assert list(results)  == list(secrets)
+        assert gets           == [f'/repos/{self.test_repo}/actions/secrets/public-key']
+        for secret_name, result in results.items():
+            assert result['success']  is True
+            assert result['error']    is None
+            assert result['duration'] > 0
+            assert self.github_secrets.secret_exists(secret_name) is True
+        assert self.github_secrets.create_or_update_secrets({}) == {}
+
+    def test_create_or_update_secrets__bad_repo(self):                           # Public key fetch errors surface before any PUT
+        github_secrets = GitHub__Secrets(repo_name='test-owner/nonexistent-repo', api_token=self.api_token)
+        with pytest.raises(HTTPError):
+            github_secrets.create_or_update_secrets({'A': 'b'})
+
     def test_configure_secrets__basic(self):                                    # Test configuring multiple secrets
         secrets = { f'{self.test_secret_prefix}ONE'   : 'value_one'   ,
                    f'{self.test_secret_prefix}TWO'   : 'value_two'   ,
@@ -0,0 +1,107 @@
+import asyncio
+import time
+from unittest                                                                               import TestCase
+from osbot_utils.utils.Threads                                                              import invoke_in_new_event_loop
+from mgraph_ai_service_github.service.github.GitHub__API__Async                             import GitHub__API__Async
+from mgraph_ai_service_github.service.github.GitHub__Secrets__Fan_Out                       import GitHub__Secrets__Fan_Out, FAN_OUT__ERROR__RATE_LIMIT_RESERVE
+from mgraph_ai_service_github.service.github.cache.GitHub__Public_Key__Cache                import github_public_key_cache
+from mgraph_ai_service_github.service.github.rate_limit.GitHub__Rate_Limit__Tracker         import github_rate_limit_tracker
+from mgraph_ai_service_github.surrogates.github.testing.GitHub__API__Surrogate__Test_Context import GitHub__API__Surrogate__Test_Context
+
+
+class Fan_Out__Recording(GitHub__Secrets__Fan_Out):                             # Records which targets were written and the peak number of concurrent writes
+    written   : list
+    in_flight : int = 0
+    peak      : int = 0
+
+    async def write_target(self, target, secret_name, secret_value):
+        self.in_flight += 1
+        self.peak       = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            self.written.append(target['repo'])
+            return await super().write_target(target, secret_name, secret_value)
+        finally:
+            self.in_flight -= 1
+
+
+class test_GitHub__Secrets__Fan_Out(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.surrogate_context = GitHub__API__Surrogate__Test_Context().setup()
+        cls.api_token         = cls.surrogate_context.admin_pat()
+        cls.repos             = [f'fan-out-repo-{i}' for i in range(6)]
+        for repo in cls.repos:
+            cls.surrogate_context.add_repo('fan-owner', repo)
+        cls.surrogate_context.add_environment('fan-owner', cls.repos[0], 'production')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.surrogate_context.teardown()
+
+    def setUp(self):
+        github_rate_limit_tracker.clear()
+        self.fan_out = GitHub__Secrets__Fan_Out(api_token=self.api_token, max_workers=4, rate_limit_reserve=0)
+        self.state   = self.surrogate_context.surrogate.state
+
+    def test__init__(self):
+        with self.fan_out as _:
+            assert type(_.api)     is GitHub__API__Async
+            assert _.api.api_token == self.api_token
+            assert _.max_workers   == 4
+
+    def test_fan_out(self):
+        targets = [dict(owner='fan-owner', repo=repo) for repo in self.repos]
+        targets.append(dict(owner='fan-owner', repo=self.repos[0], environment='production'))
+        github_public_key_cache.clear()
+
+        results = invoke_in_new_event_loop(self.fan_out.fan_out('FAN_OUT_SECRET', 'shared-value', targets))
+
+        assert len(results) == 7
+        assert all(result['success'] is True and result['error'] is None for result in results)
+        assert sorted((r['repo'], r['environment'] or '') for r in results) == sorted((t['repo'], t.get('environment') or '') for t in targets)
+        assert github_public_key_cache.stats()['entries'] == 7                  # one key per target scope, fetched by the workers
+        for repo in self.repos:
+            assert self.state.delete_repo_secret('fan-owner', repo, 'FAN_OUT_SECRET') is True
+        assert self.state.delete_env_secret('fan-owner', self.repos[0], 'production', 'FAN_OUT_SECRET') is True
+
+    def test_fan_out__failed_target(self):                                      # one bad target doesn't stop the others
+        targets = [dict(owner='fan-owner', repo=self.repos[1]), dict(owner='fan-owner', repo='no-such-repo')]
+        results = {r['repo']: r for r in invoke_in_new_event_loop(self.fan_out.fan_out('FAN_OUT_PARTIAL', 'v', targets))}
+        assert results[self.repos[1]]['success'] is True
+        assert results['no-such-repo']['success'] is False
+        assert '404'                              in results['no-such-repo']['error']
+        assert self.state.delete_repo_secret('fan-owner', self.repos[1], 'FAN_OUT_PARTIAL') is True
+
+    def test_fan_out__rate_limit_reserve(self):                                 # writes stop once remaining <= reserve
+        github_rate_limit_tracker.update(self.api_token, dict(limit=5000, remaining=50, reset=int(time.time()) + 3600, used=4950))
+        fan_out = GitHub__Secrets__Fan_Out(api_token=self.api_token, rate_limit_reserve=100)
+        results = invoke_in_new_event_loop(fan_out.fan_out('FAN_OUT_SKIPPED', 'v', [dict(owner='fan-owner', repo=repo) for repo in self.repos]))
+        assert all(result['skipped'] is True for result in results)
+        assert {result['error'] for result in results} == {FAN_OUT__ERROR__RATE_LIMIT_RESERVE}
+        assert invoke_in_new_event_loop(fan_out.fan_out('X', 'v', [])) == []
+
+    def test_iter_fan_out__bounded_window(self):                                # never more than max_workers targets in flight
+        fan_out = Fan_Out__Recording(api_token=self.api_token, max_workers=2, rate_limit_reserve=0)
+        targets = [dict(owner='fan-owner', repo=repo) for repo in self.repos]
+        results = invoke_in_new_event_loop(fan_out.fan_out('FAN_OUT_WINDOW', 'v', targets))
+        assert len(results)             == 6
+        assert fan_out.peak             <= 2
+        assert sorted(fan_out.written)  == sorted(self.repos)
+        for repo in self.repos:
+            assert self.state.delete_repo_secret('fan-owner', repo, 'FAN_OUT_WINDOW') is True
+
+    def test_iter_fan_out__closed_early(self):                                  # consumer goes away (client disconnect): remaining targets are never written
+        fan_out = Fan_Out__Recording(api_token=self.api_token, max_workers=1, rate_limit_reserve=0)
+        targets = [dict(owner='fan-owner', repo=repo) for repo in self.repos]
+        async def run():
+            results = fan_out.iter_fan_out('FAN_OUT_CLOSED', 'v', targets)
+            first   = await results.__anext__()
+            await results.aclose()                                              # raises GeneratorExit inside the generator
+            await asyncio.sleep(0.1)                                            # give a cancelled write the chance to (wrongly) finish
+            return first
+        assert invoke_in_new_event_loop(run())['success'] is True
+        assert fan_out.written == [self.repos[0]]                               # the next target's task was cancelled before it could write
+        for repo in self.repos:
+            self.state.delete_repo_secret('fan-owner', repo, 'FAN_OUT_CLOSED')
@@ -294,4 +294,17 @@ class test__Routes__GitHub__Env_Secrets(TestCase):
         # Verify staging does not have the secret
         response = self.client.get('/repos/test-owner/test-repo/environments/staging/secrets',
                                    headers={'Authorization': f'token {self.pats.admin_pat()}'})
-        assert response.json()['total_count'] == 0
\ No newline at end of file
+        assert response.json()['total_count'] == 0
+    def test__list_env_secrets__pagination(self):
+        self.state.add_repo('test-owner', 'test-repo')
+        self.state.add_environment('test-owner', 'test-repo', 'production')
+        for i in range(3):
+            self.state.set_env_secret('test-owner', 'test-repo', 'production', f'SECRET_{i}', 'encrypted', 'key_id')
+
+        response = self.client.get('/repos/test-owner/test-repo/environments/production/secrets', params=dict(per_page=2),
+                                   headers={'Authorization': f'token {self.pats.admin_pat()}'})
+
+        assert response.json()['total_count']                  == 3
+        assert [s['name'] for s in response.json()['secrets']] == ['SECRET_0', 'SECRET_1']
+        assert response.headers['Link'] == ('<http://testserver/repos/test-owner/test-repo/environments/production/secrets?per_page=2&page=2>; rel="next", '
+                                            '<http://testserver/repos/test-owner/test-repo/environments/production/secrets?per_page=2&page=2>; rel="last"')
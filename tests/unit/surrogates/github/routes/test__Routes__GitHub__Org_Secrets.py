@@ -283,4 +283,16 @@ class test__Routes__GitHub__Org_Secrets(TestCase):
         response = self.client.delete('/orgs/test-org/actions/secrets/SECRET',
                                       headers={'Authorization': f'token {self.pats.repo_write_pat()}'})
 
-        assert response.status_code == 403
\ No newline at end of file
+        assert response.status_code == 403
+    def test__list_org_secrets__pagination(self):
+        self.state.add_org('test-org')
+        for i in range(5):
+            self.state.set_org_secret('test-org', f'SECRET_{i}', 'encrypted', 'key_id')
+        self.state.delete_org_secret('test-org', 'SECRET_1')
+
+        response = self.client.get('/orgs/test-org/actions/secrets', params=dict(per_page=3, page=2),
+                                   headers={'Authorization': f'token {self.pats.org_admin_pat()}'})
+
+        assert response.json()['total_count']                  == 4
+        assert [s['name'] for s in response.json()['secrets']] == ['SECRET_4']
+        assert 'rel="prev"' in response.headers['Link']
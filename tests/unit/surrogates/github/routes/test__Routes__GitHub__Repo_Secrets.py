@@ -269,4 +269,50 @@ class test__Routes__GitHub__Repo_Secrets(TestCase):
         response = self.client.delete('/repos/test-owner/test-repo/actions/secrets/SECRET',
                                       headers={'Authorization': f'token {self.pats.repo_read_pat()}'})
 
-        assert response.status_code == 403
\ No newline at end of file
+        assert response.status_code == 403
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Pagination tests
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def add_secrets(self, count):
+        self.state.add_repo('test-owner', 'test-repo')
+        for i in range(count):
+            self.state.set_repo_secret('test-owner', 'test-repo', f'SECRET_{i:03}', 'encrypted', 'key_id')
+
+    def list_page(self, **params):
+        return self.client.get('/repos/test-owner/test-repo/actions/secrets', params=params,
+                               headers={'Authorization': f'token {self.pats.admin_pat()}'})
+
+    def test__list_repo_secrets__pagination(self):
+        self.add_secrets(5)
+        url      = 'http://testserver/repos/test-owner/test-repo/actions/secrets?per_page=2&page='
+
+        response = self.list_page(per_page=2)
+        assert response.json()['total_count']               == 5
+        assert [s['name'] for s in response.json()['secrets']] == ['SECRET_000', 'SECRET_001']
+        assert response.headers['Link']                     == f'<{url}2>; rel="next", <{url}3>; rel="last"'
+
+        response = self.list_page(per_page=2, page=2)
+        assert [s['name'] for s in response.json()['secrets']] == ['SECRET_002', 'SECRET_003']
+        assert response.headers['Link']                     == f'<{url}1>; rel="prev", <{url}3>; rel="next", <{url}3>; rel="last", <{url}1>; rel="first"'
+
+        response = self.list_page(per_page=2, page=3)
+        assert [s['name'] for s in response.json()['secrets']] == ['SECRET_004']
+        assert response.headers['Link']                     == f'<{url}2>; rel="prev", <{url}1>; rel="first"'
+
+        response = self.list_page(per_page=2, page=9)                          # past the end: empty page, total still reported
+        assert response.json()                              == dict(total_count=5, secrets=[])
+
+    def test__list_repo_secrets__pagination__defaults_and_cap(self):
+        self.add_secrets(150)
+        response = self.list_page()
+        assert len(response.json()['secrets'])              == 30               # GitHub's default page size
+        response = self.list_page(per_page=500)
+        assert len(response.json()['secrets'])              == 100              # capped like GitHub
+        assert response.headers['Link'].endswith('per_page=100&page=2>; rel="last"')
+
+    def test__list_repo_secrets__pagination__single_page(self):
+        self.add_secrets(2)
+        response = self.list_page(per_page=100)
+        assert response.json()['total_count']               == 2
+        assert 'Link' not in response.headers
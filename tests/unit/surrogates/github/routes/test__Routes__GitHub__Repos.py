@@ -0,0 +1,89 @@
+from unittest                                                                              import TestCase
+from fastapi                                                                               import FastAPI
+from starlette.testclient                                                                  import TestClient
+from mgraph_ai_service_github.surrogates.github.routes.Routes__GitHub__Repos               import Routes__GitHub__Repos
+from mgraph_ai_service_github.surrogates.github.routes.Routes__GitHub__Base                import Routes__GitHub__Base
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__State              import GitHub__API__Surrogate__State
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__PATs               import GitHub__API__Surrogate__PATs
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Keys               import GitHub__API__Surrogate__Keys
+
+
+class test__Routes__GitHub__Repos(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.state  = GitHub__API__Surrogate__State()
+        cls.pats   = GitHub__API__Surrogate__PATs().setup()
+        cls.keys   = GitHub__API__Surrogate__Keys().setup()
+        cls.app    = FastAPI()
+        cls.routes = Routes__GitHub__Repos(app   = cls.app   ,
+                                           state = cls.state ,
+                                           pats  = cls.pats  ,
+                                           keys  = cls.keys  )
+        cls.routes.setup()
+        cls.client = TestClient(cls.app, raise_server_exceptions=False)
+
+    def setUp(self):
+        self.state.reset()
+
+    def auth(self, pat=None):
+        return {'Authorization': f'token {pat or self.pats.PAT__ADMIN}'}
+
+    def test__init__(self):
+        with self.routes as _:
+            assert type(_)       is Routes__GitHub__Repos
+            assert isinstance(_, Routes__GitHub__Base)
+
+    def test__setup_routes__registers_repo_routes(self):
+        routes = self.routes.routes_paths()                                     # app.routes also holds an _IncludedRouter (no .path)
+        assert '/orgs/{org}/repos'                  in routes
+        assert '/repos/{owner}/{repo}/environments' in routes
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # GET /orgs/{org}/repos
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test__list_org_repos__sorted_by_full_name(self):
+        self.state.add_repo('acme', 'web'  , private=True)
+        self.state.add_repo('acme', 'api'                )
+        self.state.add_repo('other', 'lib'               )
+        response = self.client.get('/orgs/acme/repos', headers=self.auth())
+        assert response.status_code == 200
+        assert response.json()      == [dict(name='api', full_name='acme/api', owner=dict(login='acme'), private=False),
+                                        dict(name='web', full_name='acme/web', owner=dict(login='acme'), private=True )]
+
+    def test__list_org_repos__org_without_repos(self):
+        self.state.add_org('empty-org')
+        response = self.client.get('/orgs/empty-org/repos', headers=self.auth())
+        assert response.status_code == 200
+        assert response.json()      == []
+
+    def test__list_org_repos__unknown_org(self):
+        response = self.client.get('/orgs/unknown/repos', headers=self.auth())
+        assert response.status_code == 404
+
+    def test__list_org_repos__no_auth(self):
+        response = self.client.get('/orgs/acme/repos')
+        assert response.status_code == 401
+
+    def test__list_org_repos__no_scopes(self):
+        self.state.add_repo('acme', 'api')
+        response = self.client.get('/orgs/acme/repos', headers=self.auth(self.pats.PAT__NO_SCOPES))
+        assert response.status_code == 403
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # GET /repos/{owner}/{repo}/environments
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test__list_repo_environments(self):
+        self.state.add_repo('acme', 'api')
+        self.state.add_environment('acme', 'api', 'production')
+        self.state.add_environment('acme', 'api', 'staging'   )
+        response = self.client.get('/repos/acme/api/environments', headers=self.auth())
+        assert response.status_code == 200
+        assert response.json()      == dict(total_count  = 2                                          ,
+                                            environments = [dict(name='production'), dict(name='staging')])
+
+    def test__list_repo_environments__repo_not_found(self):
+        response = self.client.get('/repos/acme/missing/environments', headers=self.auth())
+        assert response.status_code == 404
@@ -27,3 +27,19 @@ class test__Schema__Surrogate__Rate_Limit(TestCase):
 
         assert response == {'rate': {'limit': 5000, 'remaining': 4500, 'reset': 1234567890, 'used': 500}}
 
+
+    def test_to_github_headers(self):
+        rate_limit = Schema__Surrogate__Rate_Limit(limit=5000, remaining=4500, reset=1234567890, used=500)
+
+        assert rate_limit.to_github_headers() == {'X-RateLimit-Limit'    : '5000'       ,
+                                                  'X-RateLimit-Remaining': '4500'       ,
+                                                  'X-RateLimit-Reset'    : '1234567890' ,
+                                                  'X-RateLimit-Used'     : '500'        ,
+                                                  'X-RateLimit-Resource' : 'core'       }
+
+    def test_start_window(self):
+        rate_limit = Schema__Surrogate__Rate_Limit(limit=5000, remaining=0, reset=100, used=5000)
+
+        rate_limit.start_window(limit=60, reset=3700)
+
+        assert rate_limit.to_github_response() == {'rate': {'limit': 60, 'remaining': 60, 'reset': 3700, 'used': 0}}
@@ -0,0 +1,90 @@
+import pytest
+from unittest                                                                                      import TestCase
+from requests.exceptions                                                                           import HTTPError
+from mgraph_ai_service_github.service.github.GitHub__API                                           import GitHub__API
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate                             import GitHub__API__Surrogate
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Dispatcher                 import GitHub__API__Surrogate__Dispatcher
+from mgraph_ai_service_github.surrogates.github.session.Requests__Session__Github__Surrogate__Direct import Requests__Session__Github__Surrogate__Direct
+from mgraph_ai_service_github.surrogates.github.testing.GitHub__API__Surrogate__Test_Context      import GitHub__API__Surrogate__Test_Context
+
+
+class test__GitHub__API__Surrogate__Dispatcher(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.surrogate = (GitHub__API__Surrogate()
+                            .setup()
+                            .add_repo       ("test-org", "test-repo")
+                            .add_environment("test-org", "test-repo", "production")
+                            .add_secret     ("test-org", "test-repo", "EXISTING_SECRET")
+                            .add_org        ("test-org")
+                            .add_org_secret ("test-org", "ORG_SECRET"))
+        cls.client     = cls.surrogate.test_client()
+        cls.dispatcher = cls.surrogate.dispatcher()
+        cls.pats       = cls.surrogate.pats
+
+    def auth(self, pat : str = None) -> dict:
+        return {'Authorization': f'token {pat or self.pats.admin_pat()}'}
+
+    def assert_same(self, method : str, path : str, headers : dict = None, json : dict = None):      # Direct dispatch answers exactly like the TestClient
+        kwargs   = dict(json=json) if json is not None else {}
+        expected = self.client.request(method, path, headers=headers, **kwargs)
+        actual   = self.dispatcher.dispatch(method, path, headers=headers, json=json)
+        assert (actual.status_code, actual.content) == (expected.status_code, expected.content), f'{method} {path}'
+        assert actual.headers.get('content-type')   == expected.headers.get('content-type')
+        return actual
+
+    def test__init__(self):
+        with self.dispatcher as _:
+            assert type(_)                              is GitHub__API__Surrogate__Dispatcher
+            assert _.state                              is self.surrogate.state
+            assert sorted(_._routes)                    == ['DELETE', 'GET', 'PUT']
+            assert len(_._routes['GET'])                == 13
+
+    def test_dispatch__same_as_test_client(self):
+        read_pat = self.pats.repo_read_pat()
+        for pat in [None, 'invalid', self.pats.expired_pat(), self.pats.rate_limited_pat(), read_pat, self.pats.admin_pat()]:
+            headers = self.auth(pat) if pat else None
+            self.assert_same('GET', '/user'                                                , headers)
+            self.assert_same('GET', '/rate_limit'                                          , headers)
+            self.assert_same('GET', '/repos/test-org/test-repo/actions/secrets'            , headers)
+            self.assert_same('GET', '/repos/test-org/test-repo/actions/secrets/EXISTING_SECRET', headers)
+            self.assert_same('GET', '/repos/test-org/test-repo/actions/secrets/MISSING'   , headers)
+            self.assert_same('GET', '/repos/test-org/test-repo/environments'               , headers)
+            self.assert_same('GET', '/repos/test-org/unknown/actions/secrets'              , headers)
+            self.assert_same('GET', '/orgs/test-org/actions/secrets'                        , headers)
+            self.assert_same('GET', '/orgs/test-org/repos'                                  , headers)
+
+    def test_dispatch__put_delete(self):
+        path = '/repos/test-org/test-repo/actions/secrets/DISPATCHED'
+        body = dict(encrypted_value='abc', key_id='key-1')
+        self.assert_same('PUT', path, self.auth(), dict(key_id='key-1'))                             # 422 from the handler (nothing written)
+        self.assert_same('PUT', path, self.auth(self.pats.repo_read_pat()), body)                    # 403
+        assert self.dispatcher.dispatch('PUT'   , path, headers=self.auth(), json=body).status_code == 201
+        assert self.dispatcher.dispatch('PUT'   , path, headers=self.auth(), json=body).status_code == 204
+        assert self.client    .get     (path, headers=self.auth()).json()['name']                   == 'DISPATCHED'       # same state behind both paths
+        deleted = self.dispatcher.dispatch('DELETE', path, headers=self.auth())
+        assert (deleted.status_code, deleted.content)                                               == (204, b'null')     # what the TestClient returns for JSONResponse(None, 204)
+        self.assert_same('DELETE', path, self.auth())                                                # 404 now
+
+    def test_dispatch__routing_errors(self):
+        self.assert_same('GET', '/not-a-github-path', self.auth())
+        assert self.dispatcher.dispatch('POST', '/user', headers=self.auth()).status_code == 405
+        response = self.dispatcher.dispatch('PUT', '/repos/test-org/test-repo/actions/secrets/X', headers=self.auth())
+        assert response.status_code == 422                                                          # body missing
+
+    def test_dispatch__handler_exception(self):
+        dispatcher = GitHub__API__Surrogate__Dispatcher().setup()                                    # no state/pats: every handler raises
+        response   = dispatcher.dispatch('GET', '/user', headers=self.auth())
+        assert (response.status_code, response.text) == (500, 'Internal Server Error')
+
+    def test_direct_session__github_api(self):
+        with GitHub__API__Surrogate__Test_Context() as context:
+            context.add_repo('test-owner', 'test-repo')
+            github_api = GitHub__API(api_token=context.admin_pat())
+            assert context.direct                                 is True
+            assert type(github_api.session())                     is Requests__Session__Github__Surrogate__Direct
+            assert github_api.get('/user')['login']               == 'surrogate-admin'
+            assert github_api.get('/repos/test-owner/test-repo/actions/secrets', params=dict(per_page=10))['total_count'] == 0
+            with pytest.raises(HTTPError, match='404'):
+                github_api.get('/repos/test-owner/missing/actions/secrets')
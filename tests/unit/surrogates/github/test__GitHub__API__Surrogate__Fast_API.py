@@ -64,6 +64,10 @@ class test__GitHub__API__Surrogate__Fast_API(TestCase):
         assert '/orgs/{org}/actions/secrets'               in routes
         assert '/orgs/{org}/actions/secrets/{secret_name}' in routes
 
+        # Repo listing routes
+        assert '/orgs/{org}/repos'                   in routes
+        assert '/repos/{owner}/{repo}/environments'  in routes
+
     def test__setup_routes__http_methods(self):
         app    = self.fast_api.app()
         routes = [(route.path, route.methods) for route in app.routes if hasattr(route, 'methods')]
@@ -0,0 +1,57 @@
+from unittest                                                                                   import TestCase
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Faults                 import GitHub__API__Surrogate__Faults, FAULT__ACTION__OK, FAULT__ACTION__ERROR, FAULT__ACTION__RESET
+from mgraph_ai_service_github.surrogates.github.schemas.Enum__Surrogate__Latency__Distribution import Enum__Surrogate__Latency__Distribution
+from mgraph_ai_service_github.surrogates.github.schemas.Schema__Surrogate__Fault__Profile      import Schema__Surrogate__Fault__Profile
+
+
+class test__GitHub__API__Surrogate__Faults(TestCase):
+
+    def test__init__(self):
+        with GitHub__API__Surrogate__Faults() as _:
+            assert _.stats()                 == dict(requests=0, errors=0, resets=0)
+            assert _.decide('GET', '/user')  == (0.0, FAULT__ACTION__OK, _.default)                 # no latency, no faults by default
+
+    def test_profile_for(self):
+        slow_put = Schema__Surrogate__Fault__Profile(latency_ms=100)
+        flaky    = Schema__Surrogate__Fault__Profile(error_rate=1.0)
+        with GitHub__API__Surrogate__Faults() as _:
+            _.add_rule('/repos/.*/secrets/.*', slow_put, method='put')
+            _.add_rule('/repos/.*'           , flaky                )
+            assert _.profile_for('PUT', '/repos/o/r/actions/secrets/X') is slow_put
+            assert _.profile_for('GET', '/repos/o/r/actions/secrets/X') is flaky                    # first matching rule wins
+            assert _.profile_for('GET', '/user'                       ) is _.default
+            assert _.profile_for('GET', '/user/repos'                 ) is _.default                # patterns match the whole path
+
+    def test_latency_seconds(self):
+        with GitHub__API__Surrogate__Faults(seed=42) as _:
+            fixed  = Schema__Surrogate__Fault__Profile(latency_ms=20)
+            normal = Schema__Surrogate__Fault__Profile(distribution=Enum__Surrogate__Latency__Distribution.NORMAL, latency_ms=50, stddev_ms=10)
+            tail   = Schema__Surrogate__Fault__Profile(distribution=Enum__Surrogate__Latency__Distribution.LONG_TAIL, latency_ms=10, tail_probability=0.1, tail_ms=200)
+            jitter = Schema__Surrogate__Fault__Profile(latency_ms=20, jitter_ms=5)
+            assert _.latency_seconds(fixed) == 0.02
+            normal_delays = [_.latency_seconds(normal) for _i in range(2000)]
+            assert 0.048 < sum(normal_delays) / len(normal_delays) < 0.052
+            tail_delays   = [_.latency_seconds(tail) for _i in range(2000)]
+            in_tail       = [delay for delay in tail_delays if delay >= 0.2]
+            assert 150 < len(in_tail) < 250                                                         # ~10% of requests land in the tail
+            assert set(tail_delays) - set(in_tail) == {0.01}
+            assert max(tail_delays) > 1.0                                                           # and the tail is long
+            assert all(0.015 <= _.latency_seconds(jitter) <= 0.025 for _i in range(200))
+            assert _.latency_seconds(Schema__Surrogate__Fault__Profile(latency_ms=1, jitter_ms=50)) >= 0    # never negative
+            capped = Schema__Surrogate__Fault__Profile(distribution=Enum__Surrogate__Latency__Distribution.LONG_TAIL, tail_probability=1, tail_ms=200, max_ms=300)
+            assert max(_.latency_seconds(capped) for _i in range(500)) == 0.3
+
+    def test_decide__error_and_reset_rates(self):
+        profile = Schema__Surrogate__Fault__Profile(error_rate=0.2, reset_rate=0.1)
+        with GitHub__API__Surrogate__Faults(default=profile, seed=1) as _:
+            actions = [_.decide('GET', '/user')[1] for _i in range(5000)]
+            assert 850 < actions.count(FAULT__ACTION__ERROR) < 1150
+            assert 400 < actions.count(FAULT__ACTION__RESET) < 600
+            assert _.stats() == dict(requests = 5000                                ,
+                                     errors   = actions.count(FAULT__ACTION__ERROR) ,
+                                     resets   = actions.count(FAULT__ACTION__RESET) )
+
+    def test_decide__seed_is_reproducible(self):
+        profile = Schema__Surrogate__Fault__Profile(distribution=Enum__Surrogate__Latency__Distribution.NORMAL, latency_ms=10, stddev_ms=5, error_rate=0.5)
+        runs    = [[GitHub__API__Surrogate__Faults(default=profile, seed=7).decide('GET', '/user')[:2] for _i in range(1)] for _j in range(2)]
+        assert runs[0] == runs[1]
@@ -0,0 +1,88 @@
+from unittest                                                                                      import TestCase
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate                             import GitHub__API__Surrogate
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Generator                  import GitHub__API__Surrogate__Generator, GENERATOR__PLACEHOLDER__CIPHERTEXT, GENERATOR__PLACEHOLDER__KEY_ID
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Ordered_Index              import GitHub__API__Surrogate__Ordered_Index
+from mgraph_ai_service_github.surrogates.github.schemas.Schema__Surrogate__Bulk__Spec              import Schema__Surrogate__Bulk__Spec
+from mgraph_ai_service_github.surrogates.github.schemas.Schema__Surrogate__Repo                    import Schema__Surrogate__Repo
+from mgraph_ai_service_github.surrogates.github.schemas.Schema__Surrogate__Secret                  import Schema__Surrogate__Secret, Schema__Surrogate__Org__Secret
+from mgraph_ai_service_github.surrogates.github.testing.GitHub__API__Surrogate__Test_Context      import GitHub__API__Surrogate__Test_Context
+
+
+class test__GitHub__API__Surrogate__Generator(TestCase):
+
+    def setUp(self):
+        self.surrogate = GitHub__API__Surrogate().setup()
+        self.generator = GitHub__API__Surrogate__Generator(state=self.surrogate.state, keys=self.surrogate.keys)
+        self.spec      = Schema__Surrogate__Bulk__Spec(orgs=2, repos_per_org=12, environments_per_repo=2,
+                                                       secrets_per_repo=7, secrets_per_environment=3, secrets_per_org=4, seed=42)
+        self.auth      = {'Authorization': f'token {self.surrogate.pats.admin_pat()}'}
+
+    def test_generate__counts(self):
+        stats = self.generator.generate(self.spec)
+        state = self.surrogate.state
+        assert stats == dict(orgs=2, repos=24, environments=48, secrets__repo=168, secrets__env=144, secrets__org=8)
+        assert sorted(state.secrets__org)           == ['org-0', 'org-1']
+        assert list(state.repos)[:3]                == ['org-0/repo-00', 'org-0/repo-01', 'org-0/repo-02']
+        assert state.get_repo('org-1', 'repo-11').environments == ['production', 'staging']
+        assert sum(len(secrets) for secrets in state.secrets__repo.values()) == 168
+        assert 0 < sum(repo.private for repo in state.repos.values()) < 24
+
+    def test_generate__records(self):                                           # real schema instances in the same containers add_repo / set_*_secret use
+        self.generator.generate(self.spec)
+        state   = self.surrogate.state
+        repo    = state.get_repo('org-0', 'repo-03')
+        secrets = state.secrets__repo['org-0/repo-03']
+        secret  = secrets.slice(0, 1)[0]
+        assert type(repo)                                               is Schema__Surrogate__Repo
+        assert type(repo.environments)                                  is type(Schema__Surrogate__Repo().environments)
+        with self.assertRaises(TypeError):
+            repo.environments.append(123)                                   # same checks as state.add_repo / add_environment
+        with self.assertRaises(ValueError):
+            repo.private = 'yes'
+        assert type(secrets)                                            is GitHub__API__Surrogate__Ordered_Index
+        assert type(state.secrets__env['org-0/repo-03']['staging'])     is GitHub__API__Surrogate__Ordered_Index
+        assert type(secret)                                             is Schema__Surrogate__Secret
+        assert (secret.encrypted_value, secret.key_id)                  == (GENERATOR__PLACEHOLDER__CIPHERTEXT, GENERATOR__PLACEHOLDER__KEY_ID)
+        assert secret.created_at                                        <= secret.updated_at
+        assert self.surrogate.keys.get_key_id(self.surrogate.keys.scope_id_for_repo('org-0', 'repo-03')) is None   # placeholders need no key pairs
+        for org_secret in state.secrets__org['org-1'].values():
+            assert type(org_secret)                                     is Schema__Surrogate__Org__Secret
+            assert org_secret.visibility                                in ('all', 'private', 'selected')
+            assert (org_secret.selected_repositories_url is not None)  == (org_secret.visibility == 'selected')
+
+    def test_generate__deterministic(self):
+        def generated(seed):
+            surrogate = GitHub__API__Surrogate().setup()
+            GitHub__API__Surrogate__Generator(state=surrogate.state, keys=surrogate.keys).generate(Schema__Surrogate__Bulk__Spec(seed=seed, secrets_per_org=3))
+            return surrogate.state.json()
+        assert generated(1) == generated(1)
+        assert generated(1) != generated(2)
+
+    def test_generate__real_ciphertext(self):
+        self.generator.generate(Schema__Surrogate__Bulk__Spec(repos_per_org=2, secrets_per_repo=2, placeholder_ciphertext=False))
+        keys     = self.surrogate.keys
+        scope_id = keys.scope_id_for_repo('org-0', 'repo-1')
+        for name, secret in self.surrogate.state.secrets__repo['org-0/repo-1'].items():
+            assert secret.key_id                                        == keys.get_key_id(scope_id)
+            assert keys.decrypt_secret(scope_id, secret.encrypted_value) == f'secret_value_for_{name}'
+
+    def test_generate__served_by_routes(self):
+        self.surrogate.generate(self.spec)
+        client   = self.surrogate.test_client()
+        response = client.get('/repos/org-0/repo-05/actions/secrets?per_page=5&page=2', headers=self.auth)
+        assert response.status_code                                    == 200
+        assert response.json()['total_count']                           == 7
+        assert len(response.json()['secrets'])                          == 2
+        assert 'rel="prev"' in response.headers['link']
+        assert client.get('/repos/org-1/repo-00/environments/production/secrets', headers=self.auth).json()['total_count'] == 3
+        assert client.get('/orgs/org-1/actions/secrets'                          , headers=self.auth).json()['total_count'] == 4
+        repos    = self.surrogate.dispatcher().dispatch('GET', '/orgs/org-1/repos', headers=self.auth).json()
+        assert [repo['full_name'] for repo in repos][:2]                == ['org-1/repo-00', 'org-1/repo-01']
+        assert self.surrogate.dispatcher().dispatch('GET', '/repos/org-1/repo-11/environments', headers=self.auth).json()['total_count'] == 2
+
+    def test_generate__fluent(self):
+        with GitHub__API__Surrogate__Test_Context() as context:
+            assert context.generate(repos_per_org=3, secrets_per_repo=1) is context
+            assert len(context.surrogate.state.repos)                    == 3
+            context.add_secret('org-0', 'repo-0', 'EXTRA')                  # generated repos take normal updates
+            assert len(context.surrogate.state.list_repo_secrets('org-0', 'repo-0')) == 2
@@ -144,3 +144,14 @@ class test__GitHub__API__Surrogate__Integration(TestCase):
         github_secrets = self.surrogate.create_secrets()                             # No repo_name provided
 
         assert github_secrets.repo_name == "test-owner/test-repo"
+
+    def test_paginate__follows_link_headers(self):                              # GitHub__API.paginate walks every surrogate page
+        surrogate = GitHub__API__Surrogate().setup().add_repo('test-org', 'many-secrets')
+        for i in range(250):
+            surrogate.state.set_repo_secret('test-org', 'many-secrets', f'SECRET_{i:03}', 'encrypted', 'key_id')
+        github_api = surrogate.create_api()
+        endpoint   = '/repos/test-org/many-secrets/actions/secrets'
+        names      = [secret['name'] for secret in github_api.paginate(endpoint, items_key='secrets')]
+        assert names                                                       == [f'SECRET_{i:03}' for i in range(250)]
+        assert [secret['name'] for secret in github_api.paginate(endpoint, items_key='secrets', per_page=7)] == names
+        assert surrogate.state.get_rate_limit(surrogate.pats.admin_pat()).used == 3 + 36                          # 3 pages of 100, then 36 pages of 7
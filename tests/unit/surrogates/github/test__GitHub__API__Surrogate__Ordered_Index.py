@@ -0,0 +1,60 @@
+import copy
+import pickle
+from unittest                                                                              import TestCase
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Ordered_Index     import GitHub__API__Surrogate__Ordered_Index, slice_items
+
+
+class test__GitHub__API__Surrogate__Ordered_Index(TestCase):
+
+    def setUp(self):
+        self.index = GitHub__API__Surrogate__Ordered_Index()
+        for name in ['A', 'B', 'C', 'D', 'E']:
+            self.index[name] = name.lower()
+
+    def test__init__(self):
+        assert isinstance(self.index, dict)                                     # state keeps serialising (obj / json) like a plain dict
+        assert self.index                   == dict(A='a', B='b', C='c', D='d', E='e')
+        assert self.index.slice(0, 2)       == ['a', 'b']
+        assert self.index.slice(3, 10)      == ['d', 'e']
+        assert self.index.slice(5, 2)       == []
+
+    def test_slice__updates_keep_position(self):
+        self.index.slice(0, 1)                                                  # index built
+        self.index['B'] = 'b2'
+        self.index['F'] = 'f'
+        assert self.index.slice(0, 10)      == ['a', 'b2', 'c', 'd', 'e', 'f']
+
+    def test_slice__deletes_and_re_adds(self):
+        self.index.slice(0, 1)
+        del self.index['B']
+        del self.index['D']
+        assert self.index._deleted          == 2                                # tombstones until the next slice
+        assert self.index.slice(0, 2)       == ['a', 'c']
+        assert self.index._deleted          == 0
+        self.index['B'] = 'b2'                                                  # re-added names go last
+        assert self.index.slice(0, 10)      == ['a', 'c', 'e', 'b2']
+        assert self.index._positions        == dict(A=0, C=1, E=2, B=3)
+
+    def test_slice__methods_that_bypass_the_index(self):
+        self.index.slice(0, 1)
+        assert self.index.pop('A')          == 'a'
+        assert self.index.pop('X', None)    is None
+        self.index.update(G='g')
+        self.index.setdefault('H', 'h')
+        assert self.index.slice(0, 10)      == ['b', 'c', 'd', 'e', 'g', 'h']
+        assert self.index.popitem()         == ('H', 'h')
+        assert self.index.slice(0, 10)      == ['b', 'c', 'd', 'e', 'g']
+        self.index.clear()
+        assert self.index.slice(0, 10)      == []
+
+    def test_copy(self):
+        self.index.slice(0, 1)
+        copied = copy.deepcopy(self.index)
+        assert type(copied)                 is GitHub__API__Surrogate__Ordered_Index
+        assert copied.slice(0, 10)          == ['a', 'b', 'c', 'd', 'e']
+        assert pickle.loads(pickle.dumps(self.index)).slice(4, 1) == ['e']
+
+    def test_slice_items(self):
+        assert slice_items(self.index                    , 1, 2) == ['b', 'c']
+        assert slice_items(dict(x=1, y=2, z=3)           , 1, 5) == [2, 3]     # plain dicts still page (O(start + page))
+        assert slice_items({}                            , 0, 5) == []
@@ -0,0 +1,106 @@
+import time
+import pytest
+from unittest                                                                                      import TestCase
+from requests.exceptions                                                                           import HTTPError
+from mgraph_ai_service_github.service.github.GitHub__API                                           import GitHub__API
+from mgraph_ai_service_github.service.github.rate_limit.GitHub__Rate_Limit__Tracker                import github_rate_limit_tracker
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate                             import GitHub__API__Surrogate
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Rate_Limiter               import GitHub__API__Surrogate__Rate_Limiter
+from mgraph_ai_service_github.surrogates.github.testing.GitHub__API__Surrogate__Test_Context      import GitHub__API__Surrogate__Test_Context
+
+
+class test__GitHub__API__Surrogate__Rate_Limiter(TestCase):
+
+    def setUp(self):
+        self.surrogate    = GitHub__API__Surrogate().setup().add_repo('test-owner', 'test-repo')
+        self.client       = self.surrogate.test_client()
+        self.dispatcher   = self.surrogate.dispatcher()
+        self.rate_limiter = self.surrogate.rate_limiter
+        self.admin_pat    = self.surrogate.pats.admin_pat()
+        self.auth         = {'Authorization': f'token {self.admin_pat}'}
+
+    def test__init__(self):
+        with self.rate_limiter as _:
+            assert type(_)                  is GitHub__API__Surrogate__Rate_Limiter
+            assert _.state                  is self.surrogate.state
+            assert _.limit                  == 5000
+            assert _.window_seconds         == 3600
+            assert self.dispatcher.rate_limiter is _
+            assert _.stats()                == dict(primary_rejections=0, secondary_rejections=0, in_flight=0)
+
+    def test_headers__consumed_per_request(self):                               # TestClient (middleware) and direct dispatch share one quota
+        response_1 = self.client.get('/user', headers=self.auth)
+        response_2 = self.dispatcher.dispatch('GET', '/user', headers=self.auth)
+        reset      = int(response_1.headers['X-RateLimit-Reset'])
+        assert response_1.headers['X-RateLimit-Limit'    ] == '5000'
+        assert response_1.headers['X-RateLimit-Remaining'] == '4999'
+        assert response_1.headers['X-RateLimit-Used'     ] == '1'
+        assert response_1.headers['X-RateLimit-Resource' ] == 'core'
+        assert response_2.headers['X-RateLimit-Remaining'] == '4998'
+        assert time.time() < reset <= time.time() + 3600
+        assert self.client.get('/rate_limit', headers=self.auth).json() == dict(rate=dict(limit=5000, remaining=4998, reset=reset, used=2))   # /rate_limit is free
+        assert self.client.get('/rate_limit', headers=self.auth).headers['X-RateLimit-Used'] == '2'
+
+    def test_headers__not_for_unauthenticated(self):
+        for headers in [None, {'Authorization': 'token invalid'}, {'Authorization': f'token {self.surrogate.pats.rate_limited_pat()}'}]:
+            response = self.client.get('/user', headers=headers)
+            assert response.status_code                      in (401, 429)
+            assert 'X-RateLimit-Limit' not in response.headers
+        assert self.surrogate.state.rate_limits == {}
+
+    def test_primary_limit__exhausted_then_reset(self):
+        self.rate_limiter.limit = 2
+        assert self.client.get('/user', headers=self.auth).status_code == 200
+        assert self.client.get('/user', headers=self.auth).status_code == 200
+        for response in [self.client.get('/user', headers=self.auth), self.dispatcher.dispatch('GET', '/user', headers=self.auth)]:
+            assert response.status_code                          == 403
+            assert response.headers['X-RateLimit-Remaining']     == '0'
+            assert 'API rate limit exceeded' in response.json()['message']
+        assert self.rate_limiter.primary_rejections == 2
+
+        self.surrogate.state.get_rate_limit(self.admin_pat).reset = int(time.time()) - 1        # window over
+        response = self.client.get('/user', headers=self.auth)
+        assert response.status_code                      == 200
+        assert response.headers['X-RateLimit-Remaining'] == '1'
+
+    def test_secondary_limit__per_minute(self):
+        self.rate_limiter.secondary_max_per_minute = 2
+        assert self.client.get('/user', headers=self.auth).status_code == 200
+        assert self.dispatcher.dispatch('GET', '/user', headers=self.auth).status_code == 200
+        response = self.client.get('/user', headers=self.auth)
+        assert response.status_code                      == 403
+        assert 0 < int(response.headers['Retry-After'])  <= 60
+        assert 'secondary rate limit' in response.json()['message']
+        assert response.headers['X-RateLimit-Remaining'] == '4998'                               # rejected requests don't use primary quota
+        assert self.rate_limiter.stats()['secondary_rejections'] == 1
+
+    def test_secondary_limit__concurrency(self):
+        self.rate_limiter.secondary_max_concurrent = 1
+        authorization          = self.auth['Authorization']
+        pat, status, _, _      = self.rate_limiter.acquire('/user', authorization)
+        assert (pat, status)   == (self.admin_pat, None)
+        assert self.rate_limiter.stats()['in_flight'] == 1
+        _, status, error, headers = self.rate_limiter.acquire('/user', authorization)
+        assert status                 == 403
+        assert headers['Retry-After'] == '60'
+        self.rate_limiter.release(pat)
+        assert self.dispatcher.dispatch('GET', '/user', headers=self.auth).status_code == 200
+        assert self.rate_limiter.stats()['in_flight'] == 0
+
+    def test_disabled(self):
+        self.rate_limiter.enabled = False
+        response = self.client.get('/user', headers=self.auth)
+        assert response.status_code              == 200
+        assert 'X-RateLimit-Limit' not in response.headers
+
+    def test_client_side_tracking(self):                                        # GitHub__API picks the quota up from the headers, no /rate_limit call
+        with GitHub__API__Surrogate__Test_Context() as context:
+            context.surrogate.rate_limiter.limit = 3
+            github_api = GitHub__API(api_token=context.admin_pat())
+            github_api.get('/user')
+            assert github_rate_limit_tracker.get(context.admin_pat()).remaining == 2
+            github_api.get('/user')
+            github_api.get('/user')
+            assert github_api.rate_limit().remaining == 0
+            with pytest.raises(HTTPError, match='403'):
+                github_api.get('/user')
@@ -0,0 +1,53 @@
+import time
+import pytest
+from unittest                                                                               import TestCase
+from requests.exceptions                                                                    import ConnectionError, HTTPError
+from mgraph_ai_service_github.service.github.GitHub__API                                    import clear_session_factory
+from mgraph_ai_service_github.surrogates.github.GitHub__API__Surrogate__Server              import GitHub__API__Surrogate__Server
+from mgraph_ai_service_github.surrogates.github.schemas.Schema__Surrogate__Fault__Profile  import Schema__Surrogate__Fault__Profile
+
+
+class test__GitHub__API__Surrogate__Server(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        clear_session_factory()                                                 # real HTTP, not an in-process surrogate session
+        cls.server = GitHub__API__Surrogate__Server().start()
+        cls.server.surrogate.add_repo('test-owner', 'test-repo')
+        cls.server.faults.add_rule('/user/slow'                           , Schema__Surrogate__Fault__Profile(latency_ms=150                 ))
+        cls.server.faults.add_rule('/rate_limit'                          , Schema__Surrogate__Fault__Profile(reset_rate=1.0                 ))
+        cls.server.faults.add_rule('/repos/test-owner/test-repo/environments', Schema__Surrogate__Fault__Profile(error_rate=1.0, error_status=502))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def test__init__(self):
+        assert self.server.server.running   is True                             # the osbot Fast_API_Server running uvicorn
+        assert self.server.server.port      == self.server.port
+        assert self.server.server.is_port_open()
+        assert self.server.api_url()        == f'http://127.0.0.1:{self.server.port}'
+
+    def test_get__over_http(self):
+        github_api = self.server.create_api()
+        assert github_api.api_url                                                 == self.server.api_url()
+        assert github_api.get('/user')['login']                                   == 'surrogate-admin'
+        assert github_api.get('/repos/test-owner/test-repo/actions/secrets')      == dict(total_count=0, secrets=[])
+
+    def test_latency(self):
+        github_api = self.server.create_api()
+        start      = time.monotonic()
+        with pytest.raises(HTTPError, match='404'):                             # unknown path, but the latency rule still applies
+            github_api.get('/user/slow')
+        assert time.monotonic() - start >= 0.15
+
+    def test_error_injection(self):
+        with pytest.raises(HTTPError, match='502'):
+            self.server.create_api().get('/repos/test-owner/test-repo/environments')
+
+    def test_connection_reset(self):
+        resets = self.server.faults.resets
+        with pytest.raises(ConnectionError):
+            self.server.create_api().get('/rate_limit')
+        assert self.server.faults.resets == resets + 1
+        assert self.server.create_api().get('/user')['login'] == 'surrogate-admin'      # pool recovers on the next request
@@ -139,4 +139,7 @@ class test__GitHub__API__Surrogate__Session(TestCase):
         session._headers = {'X-Header': 'session_value'}
         headers          = session._prepare_headers({'headers': {'X-Header': 'request_value'}})
 
-        assert headers['X-Header'] == 'request_value'
\ No newline at end of file
+        assert headers['X-Header'] == 'request_value'
+    def test_convert_url_to_path_keeps_query(self):
+        path = self.session._convert_url_to_path("http://testserver/repos/o/r/actions/secrets?per_page=2&page=3")
+        assert path == "/repos/o/r/actions/secrets?per_page=2&page=3"
@@ -74,3 +74,7 @@ class test__SurrogateResponse(TestCase):
             response.raise_for_status()
 
         assert "404" in str(exc_info.value)
+
+    def test_headers__case_insensitive(self):
+        response = SurrogateResponse(self.client().get("/success"))
+        assert response.headers['Content-Type'] == response.headers['content-type']
@@ -1,5 +1,7 @@
 import base64
+import pytest
 from unittest                                                                                   import TestCase
+from nacl.exceptions                                                                            import CryptoError
 from nacl.public                                                                                import PrivateKey, PublicKey
 from osbot_utils.type_safe.primitives.domains.cryptography.safe_str.Safe_Str__NaCl__Private_Key import Safe_Str__NaCl__Private_Key
 from osbot_utils.type_safe.primitives.domains.cryptography.safe_str.Safe_Str__NaCl__Public_Key  import Safe_Str__NaCl__Public_Key
@@ -87,6 +89,41 @@ class test_NaCl__Key_Management(TestCase):
 
             assert decrypted == test_message
 
+    def test__sodium_bindings(self):                                            # The raw paths call pynacl's private nacl._sodium module: fail loudly if an upgrade moves it
+        import nacl
+        from nacl._sodium import ffi, lib
+        assert nacl.__version__.startswith('1.6.')                              # pyproject pins ~1.6, re-check the bindings below before widening it
+        for name in ('crypto_box_seal', 'crypto_box_seal_open', 'crypto_box_publickeybytes', 'crypto_box_secretkeybytes', 'sodium_memzero'):
+            assert callable(getattr(lib, name))
+        for name in ('new', 'memmove', 'from_buffer', 'buffer'):
+            assert callable(getattr(ffi, name))
+
+    def test_encrypt_with_public_key_raw(self):                                 # memoryview in, memoryview over the ciphertext out (interoperable with SealedBox)
+        with self.nacl_key_management as _:
+            message   = bytearray(b"raw \x00\x01 message")
+            encrypted = _.encrypt_with_public_key_raw(memoryview(message), self.test_nacl_keys.public_key)
+            assert type(encrypted) is memoryview
+            assert len(encrypted)  == len(message) + 48
+            assert _.decrypt_with_private_key(bytes(encrypted), self.test_nacl_keys.private_key) == bytes(message)
+
+    def test_decrypt_with_private_key_raw(self):
+        with self.nacl_key_management as _:
+            encrypted = _.encrypt_with_public_key(b"sealed elsewhere", self.test_nacl_keys.public_key)
+            decrypted = _.decrypt_with_private_key_raw(memoryview(encrypted), self.test_nacl_keys.private_key, self.test_nacl_keys.public_key)
+            assert type(decrypted)  is memoryview
+            assert bytes(decrypted) == b"sealed elsewhere"
+            empty     = _.encrypt_with_public_key_raw(memoryview(b""), self.test_nacl_keys.public_key)
+            assert bytes(_.decrypt_with_private_key_raw(empty, self.test_nacl_keys.private_key, self.test_nacl_keys.public_key)) == b""
+
+    def test_decrypt_with_private_key_raw__invalid(self):
+        with self.nacl_key_management as _:
+            with pytest.raises(CryptoError):
+                _.decrypt_with_private_key_raw(memoryview(b"x" * 64), self.test_nacl_keys.private_key, self.test_nacl_keys.public_key)
+            with pytest.raises(CryptoError):
+                _.decrypt_with_private_key_raw(memoryview(b"short"), self.test_nacl_keys.private_key, self.test_nacl_keys.public_key)
+            with pytest.raises(ValueError):
+                _.encrypt_with_public_key_raw(memoryview(b"data"), "abcd")
+
     def test_validate_key_pair__valid(self):
         with self.nacl_key_management as _:
             assert _.validate_key_pair(self.test_nacl_keys) is True